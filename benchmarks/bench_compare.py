@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Benchmark: desired / current state comparison on large payloads.
+#
+# Compares the previous first-mismatch default_compare (reproduced below as the baseline)
+# with the structural diff engine in module_utils/azure_rm_diff.py on synthetic network
+# security group and application gateway payloads with 5,000 rules.
+#
+#   python benchmarks/bench_compare.py [--rules 5000]
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import copy
+import random
+
+from benchutils import best_of, load_module_utils, module_arg_spec, report, synthetic_envelope
+
+
+def legacy_compare(new, old, path, result):
+    # default_compare as generated into every module before azure_rm_diff
+    if new is None:
+        return True
+    elif isinstance(new, dict):
+        if not isinstance(old, dict):
+            result['compare'] = 'changed [' + path + '] old dict is null'
+            return False
+        for k in new.keys():
+            if not legacy_compare(new.get(k), old.get(k, None), path + '/' + k, result):
+                return False
+        return True
+    elif isinstance(new, list):
+        if not isinstance(old, list) or len(new) != len(old):
+            result['compare'] = 'changed [' + path + '] length is different or null'
+            return False
+        if isinstance(old[0], dict):
+            key = None
+            if 'id' in old[0] and 'id' in new[0]:
+                key = 'id'
+            elif 'name' in old[0] and 'name' in new[0]:
+                key = 'name'
+            else:
+                key = list(old[0])[0]
+            new = sorted(new, key=lambda x: x.get(key, None))
+            old = sorted(old, key=lambda x: x.get(key, None))
+        else:
+            new = sorted(new)
+            old = sorted(old)
+        for i in range(len(new)):
+            if not legacy_compare(new[i], old[i], path + '/*', result):
+                return False
+        return True
+    else:
+        if new == old:
+            return True
+        else:
+            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
+            return False
+
+
+def nsg_payload(rules):
+    rng = random.Random(rules)
+    security_rules = []
+    for i in range(rules):
+        security_rules.append({
+            'name': 'rule-{0:05d}'.format(i),
+            'protocol': rng.choice(['Tcp', 'Udp', '*']),
+            'source_port_range': '*',
+            'destination_port_range': str(rng.randint(1, 65535)),
+            'source_address_prefixes': ['10.{0}.{1}.0/24'.format(i % 256, j) for j in range(3)],
+            'destination_address_prefix': '*',
+            'access': rng.choice(['Allow', 'Deny']),
+            'priority': 100 + i,
+            'direction': rng.choice(['Inbound', 'Outbound'])
+        })
+    return {'location': 'westeurope', 'security_rules': security_rules}
+
+
+def appgateway_payload(rules):
+    spec = module_arg_spec('azure_rm_appgateway')
+    envelope = synthetic_envelope(spec, 2)
+    template = envelope['request_routing_rules'][0]
+    envelope['request_routing_rules'] = []
+    for i in range(rules):
+        rule = copy.deepcopy(template)
+        rule['name'] = 'rule-{0:05d}'.format(i)
+        rule['id'] = '/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Network/applicationGateways/gw/requestRoutingRules/' + rule['name']
+        envelope['request_routing_rules'].append(rule)
+    return envelope
+
+
+def scenarios(desired):
+    current = copy.deepcopy(desired)
+    key = 'security_rules' if 'security_rules' in desired else 'request_routing_rules'
+    current[key].reverse()
+    one_change = copy.deepcopy(current)
+    one_change[key][0]['priority' if key == 'security_rules' else 'rule_type'] = 'changed'
+    many_changes = copy.deepcopy(current)
+    for rule in many_changes[key][::50]:
+        rule['priority' if key == 'security_rules' else 'rule_type'] = 'changed'
+    return [('no change', current), ('1 change', one_change), ('every 50th rule changed', many_changes)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rules', type=int, default=5000)
+    args = parser.parse_args()
+
+    diff = load_module_utils('azure_rm_diff')
+
+    for title, desired in (('network security group', nsg_payload(args.rules)),
+                           ('application gateway', appgateway_payload(args.rules))):
+        rows = []
+        for name, current in scenarios(desired):
+            legacy_result = {}
+            new_result = {}
+            legacy_compare(desired, current, '', legacy_result)
+            diff.default_compare(desired, current, '', new_result)
+            legacy_ms = best_of(lambda: legacy_compare(desired, current, '', {}), repeat=3, number=3)
+            new_ms = best_of(lambda: diff.default_compare(desired, current, '', {}), repeat=3, number=3)
+            rows.append((name, 'legacy {0:8.2f} ms ({1} reported)   structural {2:8.2f} ms ({3} reported)'.format(
+                legacy_ms, 1 if legacy_result else 0, new_ms, len(new_result.get('compare', [])))))
+        report('{0}, {1} rules'.format(title, args.rules), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Benchmark: module import time.
+#
+# Loads each module the way AnsiballZ does, up to (not including) main(), in a fresh interpreter
+# under `python -X importtime`, and sums the cumulative time of the top level imports. Modules
+# of the working tree are compared with the same modules at a git revision, by default the one
+# before SDK imports were deferred to exec_module.
+#
+#   python benchmarks/bench_import.py [--baseline <git rev>] [--repeat 5] [module ...]
+#
+# Needs Python 3.7+ for -X importtime, Ansible and the Azure SDK packages of the measured modules.
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from benchutils import LIBRARY, MODULE_UTILS, ROOT, report
+
+# commonly used modules, resource modules and their facts modules across the big SDKs
+TOP_MODULES = [
+    'azure_rm_sqlserver', 'azure_rm_sqlserver_facts', 'azure_rm_sqldatabase', 'azure_rm_sqlfirewallrule',
+    'azure_rm_computevirtualmachine', 'azure_rm_computevirtualmachine_facts', 'azure_rm_computedisk',
+    'azure_rm_networkinterface', 'azure_rm_networksecuritygroup', 'azure_rm_networkpublicipaddress',
+    'azure_rm_loadbalancer', 'azure_rm_loadbalancer_facts', 'azure_rm_virtualnetworkgateway',
+    'azure_rm_storageblobcontainer', 'azure_rm_webapp', 'azure_rm_dnszone', 'azure_rm_keyvaultvault',
+    'azure_rm_containerregistry', 'azure_rm_monitoractiongroup', 'azure_rm_apimanagementservice',
+]
+
+BOOTSTRAP = '''
+import runpy, sys
+import ansible.module_utils
+ansible.module_utils.__path__.insert(0, sys.argv[1])
+runpy.run_path(sys.argv[2], run_name='bench_import')
+'''
+
+# last revision with the SDK imports at module level
+DEFAULT_BASELINE = '6d0d867'
+
+
+def export_modules(rev, modules, directory):
+    for module in modules:
+        source = subprocess.check_output(['git', 'show', '{0}:modules/library/{1}.py'.format(rev, module)], cwd=ROOT)
+        with open(os.path.join(directory, module + '.py'), 'wb') as f:
+            f.write(source)
+
+
+def import_time_ms(path):
+    '''
+    Cumulative import time in milliseconds of a module file and everything it imports.
+    '''
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-W', 'ignore', '-c', BOOTSTRAP, MODULE_UTILS, path],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate()
+    total = 0
+    for line in stderr.decode('utf-8', 'replace').splitlines():
+        # import time: self [us] | cumulative | imported package, nested imports are indented
+        match = re.match(r'^import time:\s+\d+ \|\s+(\d+) \| (\S.*)$', line)
+        if match:
+            total += int(match.group(1))
+    return total / 1000.0
+
+
+def best(path, repeat):
+    return min(import_time_ms(path) for i in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time of modules, working tree against a git revision.')
+    parser.add_argument('modules', nargs='*', default=TOP_MODULES)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='git revision to compare with (default %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rev = args.baseline
+    directory = tempfile.mkdtemp()
+    try:
+        export_modules(rev, args.modules, directory)
+        rows = []
+        before_total = after_total = 0
+        for module in args.modules:
+            before = best(os.path.join(directory, module + '.py'), args.repeat)
+            after = best(os.path.join(LIBRARY, module + '.py'), args.repeat)
+            before_total += before
+            after_total += after
+            rows.append((module, '{0:8.1f} ms {1:8.1f} ms {2:+8.1f} ms'.format(before, after, after - before)))
+        rows.append(('total', '{0:8.1f} ms {1:8.1f} ms {2:+8.1f} ms'.format(before_total, after_total, after_total - before_total)))
+    finally:
+        shutil.rmtree(directory)
+    report('import time, best of {0}: before ({1}) / after / change'.format(args.repeat, rev), rows)
+
+
+if __name__ == '__main__':
+    main()
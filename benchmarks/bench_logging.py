@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Benchmark: logging on the no-change path of azure_rm_appgateway.
+#
+# A run that changes nothing gets the gateway, logs it and compares it with the task. The
+# previous log call formatted the SDK model into the message whether logging was enabled or not;
+# the ModuleLogger of module_utils/azure_rm_logging.py formats only enabled messages. Both are
+# timed with logging disabled, next to the conversion to a dictionary the module does anyway, on
+# a synthetic gateway with --size listeners, pools, settings, probes and rules.
+#
+#   python benchmarks/bench_logging.py [--size 100]
+#
+# Needs the azure-mgmt-network package for the ApplicationGateway model.
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+
+from benchutils import best_of, load_module_utils, report
+
+GATEWAY_ID = '/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Network/applicationGateways/gw'
+
+
+class QuietModule(object):
+    '''
+    The parts of AnsibleModule used for logging, with ANSIBLE_DEBUG off.
+    '''
+    _name = 'azure_rm_appgateway'
+    _debug = False
+
+    def debug(self, msg):
+        if self._debug:
+            self.log(msg)
+
+    def log(self, msg):
+        pass
+
+
+def sub_resource(kind, i):
+    return dict(id='{0}/{1}/{2}-{3}'.format(GATEWAY_ID, kind, kind, i))
+
+
+def gateway(size):
+    from azure.mgmt.network.models import ApplicationGateway
+    body = dict(
+        id=GATEWAY_ID,
+        name='gw',
+        location='westeurope',
+        tags=dict(env='bench'),
+        sku=dict(name='Standard_Medium', tier='Standard', capacity=2),
+        gateway_ip_configurations=[dict(name='ipconfig', subnet=dict(id='/subscriptions/sub/resourceGroups/rg/providers/'
+                                                                          'Microsoft.Network/virtualNetworks/vnet/subnets/gw'))],
+        frontend_ip_configurations=[dict(name='frontend', private_ip_allocation_method='Dynamic')],
+        frontend_ports=[dict(name='frontendPorts-{0}'.format(i), port=8000 + i) for i in range(size)],
+        backend_address_pools=[dict(name='backendAddressPools-{0}'.format(i),
+                                    backend_addresses=[dict(ip_address='10.0.{0}.{1}'.format(i % 256, j)) for j in range(4)])
+                               for i in range(size)],
+        backend_http_settings_collection=[dict(name='backendHttpSettingsCollection-{0}'.format(i), port=80, protocol='Http',
+                                               cookie_based_affinity='Disabled', request_timeout=30,
+                                               probe=sub_resource('probes', i))
+                                          for i in range(size)],
+        http_listeners=[dict(name='httpListeners-{0}'.format(i), protocol='Http', host_name='app{0}.example.com'.format(i),
+                             frontend_ip_configuration=sub_resource('frontendIPConfigurations', 0),
+                             frontend_port=sub_resource('frontendPorts', i))
+                        for i in range(size)],
+        request_routing_rules=[dict(name='requestRoutingRules-{0}'.format(i), rule_type='Basic',
+                                    http_listener=sub_resource('httpListeners', i),
+                                    backend_address_pool=sub_resource('backendAddressPools', i),
+                                    backend_http_settings=sub_resource('backendHttpSettingsCollection', i))
+                               for i in range(size)],
+        probes=[dict(name='probes-{0}'.format(i), protocol='Http', host='app{0}.example.com'.format(i), path='/health',
+                     interval=30, timeout=30, unhealthy_threshold=3)
+                for i in range(size)],
+    )
+    return ApplicationGateway.from_dict(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=100)
+    args = parser.parse_args()
+
+    logging = load_module_utils('azure_rm_logging')
+    module = QuietModule()
+    logger = logging.ModuleLogger(module)
+    response = gateway(args.size)
+
+    def eager():
+        # the log calls of get_applicationgateway() before azure_rm_logging
+        module.debug("Checking if the Application Gateway instance {0} is present".format('gw'))
+        module.debug("Response : {0}".format(response))
+        module.debug("Application Gateway instance : {0} found".format(response.name))
+
+    def lazy():
+        logger.log("Checking if the Application Gateway instance {0} is present", ('gw',))
+        logger.log("Response : {0}", (response,))
+        logger.log("Application Gateway instance : {0} found", (response.name,))
+
+    rows = [
+        ('message size', '{0:10d} characters'.format(len("Response : {0}".format(response)))),
+        ('eager format', '{0:10.3f} ms'.format(best_of(eager))),
+        ('lazy format', '{0:10.3f} ms'.format(best_of(lazy))),
+        ('as_dict()', '{0:10.3f} ms (done by the module either way)'.format(best_of(response.as_dict))),
+    ]
+    report('azure_rm_appgateway no-change path, {0} of each sub resource, logging disabled'.format(args.size), rows)
+
+
+if __name__ == '__main__':
+    main()
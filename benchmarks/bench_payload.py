@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Benchmark: module payload, sources against the runtime variants of tools/build_runtime.py.
+#
+# For every module of modules/library: the size of the file and of its deflated zip entry (what
+# AnsiballZ ships), and the time to compile it, which every task pays again because modules run
+# from the zip without a cached .pyc. With --startup, also the wall time of a fresh interpreter
+# loading the module up to main(), best of --repeat; that takes a few minutes over the whole tree.
+#
+#   python benchmarks/bench_payload.py [--startup] [--repeat 3] [module ...]
+#
+# Building needs Python 3.8+; --startup also needs Ansible and the Azure SDK packages.
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import zipfile
+
+from benchutils import LIBRARY, MODULE_UTILS, ROOT, report
+
+sys.path.insert(0, os.path.join(ROOT, 'tools'))
+from build_runtime import all_modules, build  # noqa: E402
+
+BOOTSTRAP = '''
+import runpy, sys
+import ansible.module_utils
+ansible.module_utils.__path__.insert(0, sys.argv[1])
+runpy.run_path(sys.argv[2], run_name='bench_payload')
+'''
+
+
+def deflated_size(path):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.write(path, 'ansible/modules/' + os.path.basename(path))
+    return len(buf.getvalue())
+
+
+def compile_ms(path, repeat):
+    with open(path) as f:
+        source = f.read()
+    try:
+        compile(source, path, 'exec')
+    except SyntaxError:
+        return 0.0
+    return min(timeit.repeat(lambda: compile(source, path, 'exec'), repeat=repeat, number=1)) * 1000
+
+
+def startup_ms(path, repeat):
+    times = []
+    for i in range(repeat):
+        start = time.time()
+        subprocess.call([sys.executable, '-W', 'ignore', '-c', BOOTSTRAP, MODULE_UTILS, path],
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        times.append((time.time() - start) * 1000)
+    return min(times)
+
+
+def measure(directory, modules, repeat, startup):
+    totals = dict(bytes=0, deflated=0, compile_ms=0.0, startup_ms=0.0)
+    for module in modules:
+        path = os.path.join(directory, module + '.py')
+        totals['bytes'] += os.path.getsize(path)
+        totals['deflated'] += deflated_size(path)
+        totals['compile_ms'] += compile_ms(path, repeat)
+        if startup:
+            totals['startup_ms'] += startup_ms(path, repeat)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Payload size and startup time, module sources against runtime variants.')
+    parser.add_argument('modules', nargs='*', help='module names, all of modules/library by default')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--startup', action='store_true', help='also measure interpreter startup up to main()')
+    args = parser.parse_args()
+
+    modules = args.modules or all_modules()
+    directory = tempfile.mkdtemp()
+    try:
+        build(modules, directory)
+        before = measure(LIBRARY, modules, args.repeat, args.startup)
+        after = measure(directory, modules, args.repeat, args.startup)
+    finally:
+        shutil.rmtree(directory)
+
+    count = len(modules)
+    rows = []
+    for key, unit in (('bytes', 'B'), ('deflated', 'B'), ('compile_ms', 'ms'), ('startup_ms', 'ms')):
+        if key == 'startup_ms' and not args.startup:
+            continue
+        rows.append((key, '{0:12.1f} {3:<2} {1:12.1f} {3:<2} {2:6.0%}   per module {4:9.1f} -> {5:9.1f} {3}'.format(
+            before[key], after[key], after[key] / before[key] - 1 if before[key] else 0, unit,
+            before[key] / count, after[key] / count)))
+    report('{0} modules, sum before / after / change'.format(count), rows)
+
+
+if __name__ == '__main__':
+    main()
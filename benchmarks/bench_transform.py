@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Micro-benchmark: parameter envelope transformation for azure_rm_appgateway.
+#
+# Compares the legacy approach (one full walk of the envelope per dict_* rule) with the
+# compiled DictTransform pipeline (one walk for all rules) on a synthetic envelope of
+# roughly 2,000 lines of JSON.
+#
+#   python benchmarks/bench_transform.py [--module azure_rm_appgateway] [--lines 2000]
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import copy
+import json
+
+from benchutils import best_of, load_module_utils, module_arg_spec, report, synthetic_envelope, transform_rules
+
+
+def build_envelope(module, lines):
+    spec = module_arg_spec(module)
+    items = 1
+    while True:
+        envelope = synthetic_envelope(spec, items)
+        if len(json.dumps(envelope, indent=4).splitlines()) >= lines or items >= 1000:
+            return envelope
+        items += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--module', default='azure_rm_appgateway')
+    parser.add_argument('--lines', type=int, default=2000)
+    args = parser.parse_args()
+
+    diff = load_module_utils('azure_rm_diff')
+    rules = transform_rules(args.module)
+    envelope = build_envelope(args.module, args.lines)
+
+    def legacy():
+        d = copy.deepcopy(envelope)
+        for method, rule_args, rule_kwargs in rules:
+            getattr(diff, 'dict_' + method)(d, *rule_args, **rule_kwargs)
+        return d
+
+    def compiled():
+        transform = diff.DictTransform()
+        for method, rule_args, rule_kwargs in rules:
+            getattr(transform, method)(*rule_args, **rule_kwargs)
+        return transform.apply(copy.deepcopy(envelope))
+
+    if legacy() != compiled():
+        raise SystemExit('compiled pipeline output differs from per-rule output')
+
+    baseline = best_of(lambda: copy.deepcopy(envelope))
+    legacy_ms = best_of(legacy) - baseline
+    compiled_ms = best_of(compiled) - baseline
+    report('{0}: {1} rules, {2} envelope lines'.format(args.module, len(rules), len(json.dumps(envelope, indent=4).splitlines())), [
+        ('per-rule walk (ms)', '{0:.3f}'.format(legacy_ms)),
+        ('compiled pipeline (ms)', '{0:.3f}'.format(compiled_ms)),
+        ('speedup', '{0:.1f}x'.format(legacy_ms / compiled_ms if compiled_ms > 0 else float('inf'))),
+    ])
+
+
+if __name__ == '__main__':
+    main()
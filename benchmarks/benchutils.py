@@ -0,0 +1,119 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Helpers shared by the benchmark scripts in this directory.
+
+from __future__ import absolute_import, division, print_function
+
+import ast
+import importlib
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(ROOT, 'modules', 'library')
+MODULE_UTILS = os.path.join(ROOT, 'modules', 'module_utils')
+
+
+def load_module_utils(name):
+    '''
+    Import modules/module_utils/<name>.py as ansible.module_utils.<name>, the way AnsiballZ ships it.
+    '''
+    import ansible.module_utils
+    if MODULE_UTILS not in ansible.module_utils.__path__:
+        ansible.module_utils.__path__.insert(0, MODULE_UTILS)
+    return importlib.import_module('ansible.module_utils.' + name)
+
+
+def module_tree(module_name):
+    with open(os.path.join(LIBRARY, module_name + '.py')) as f:
+        return ast.parse(f.read())
+
+
+def _literal(node, placeholders):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return placeholders.get(ast.dump(node), 'placeholder')
+
+
+def transform_rules(module_name):
+    '''
+    Return the list of (method, args, kwargs) DictTransform rules registered in module exec_module.
+    '''
+    rules = []
+    for node in ast.walk(module_tree(module_name)):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and
+                isinstance(node.func.value, ast.Name) and node.func.value.id == 'transform' and node.func.attr != 'apply'):
+            args = [_literal(a, {}) for a in node.args]
+            kwargs = dict((k.arg, _literal(k.value, {})) for k in node.keywords)
+            rules.append((node.func.attr, args, kwargs))
+    return rules
+
+
+def _spec_from_call(call):
+    spec = {}
+    for kw in call.keywords:
+        if isinstance(kw.value, ast.Call):
+            option = {}
+            for okw in kw.value.keywords:
+                if okw.arg == 'options' and isinstance(okw.value, ast.Call):
+                    option['options'] = _spec_from_call(okw.value)
+                elif okw.arg in ('type', 'choices'):
+                    option[okw.arg] = ast.literal_eval(okw.value)
+            spec[kw.arg] = option
+    return spec
+
+
+def module_arg_spec(module_name):
+    for node in ast.walk(module_tree(module_name)):
+        if (isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Attribute) and
+                node.targets[0].attr == 'module_arg_spec'):
+            return _spec_from_call(node.value)
+    raise ValueError('no module_arg_spec in ' + module_name)
+
+
+def synthetic_envelope(spec, items, depth=0):
+    '''
+    Build a parameter envelope shaped by an arg spec; lists get "items" elements at the top level
+    and two elements below it, leaf strings are snake_case so camelize / map rules have work to do.
+    '''
+    envelope = {}
+    for key, option in spec.items():
+        if key in ('resource_group', 'state'):
+            continue
+        kind = option.get('type', 'str')
+        if option.get('options'):
+            if kind == 'list':
+                count = items if depth == 0 else 2
+                envelope[key] = [synthetic_envelope(option['options'], items, depth + 1) for i in range(count)]
+                for i, element in enumerate(envelope[key]):
+                    element['name'] = '{0}-{1}'.format(key, i)
+            else:
+                envelope[key] = synthetic_envelope(option['options'], items, depth + 1)
+        elif kind == 'list':
+            envelope[key] = ['value_{0}'.format(i) for i in range(2)]
+        elif kind == 'bool':
+            envelope[key] = True
+        elif kind == 'int':
+            envelope[key] = depth
+        elif option.get('choices'):
+            envelope[key] = option['choices'][0]
+        else:
+            envelope[key] = 'standard_small'
+    return envelope
+
+
+def best_of(func, repeat=5, number=20):
+    '''
+    Return the best per-call time of func in milliseconds.
+    '''
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+def report(title, rows):
+    print(title)
+    width = max(len(r[0]) for r in rows)
+    for name, value in rows:
+        print('  {0:<{1}}  {2}'.format(name, width, value))
+    sys.stdout.flush()
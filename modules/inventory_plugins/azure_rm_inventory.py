@@ -0,0 +1,419 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+    name: azure_rm_inventory
+    plugin_type: inventory
+    short_description: Azure virtual machine inventory from parallel listings, cached on disk
+    extends_documentation_fragment:
+      - azure
+      - constructed
+    description:
+        - Builds hosts from the virtual machines of one or more subscriptions, with the addresses of their network
+          interfaces and public IP addresses.
+        - Virtual machines, network interfaces and public IP addresses are each listed once per subscription, all
+          subscriptions in parallel, and joined by resource ID in memory.
+        - With I(cache_path) the inventory is kept on disk. Within I(cache_ttl) it is used as it is; after that only
+          the resources whose C(changedTime) is later than the last refresh are fetched again. C(--flush-cache)
+          refreshes everything.
+        - Requires a YAML configuration file whose name ends with 'azure_rm_inventory.(yml|yaml)'.
+        - Sets C(ansible_host) to the first public IP address (primary network interface and IP configuration first),
+          or the first private IP address when there is none; I(compose) can override it.
+    options:
+        plugin:
+            description: marks this as an instance of the 'azure_rm_inventory' plugin
+            required: true
+            choices: ['azure_rm_inventory']
+        subscriptions:
+            description:
+                - Subscriptions to take virtual machines from. Defaults to the subscription of the credentials.
+            type: list
+            default: []
+        include_vm_scale_sets:
+            description:
+                - Also add the instances of virtual machine scale sets. Scale set instances have no C(changedTime),
+                  they are listed again on every refresh.
+            type: bool
+            default: false
+        concurrency:
+            description:
+                - Maximum number of listings running at the same time.
+            type: int
+            default: 16
+        cache_path:
+            description:
+                - File keeping the inventory between runs. The inventory is not cached when it is not set.
+            type: path
+        cache_ttl:
+            description:
+                - Seconds the cached inventory is used without asking Azure for changes.
+            type: int
+            default: 300
+'''
+
+EXAMPLES = '''
+# The following host variables are always available:
+# id, name, resource_group, subscription_id, location, tags, vm_size, os_type, provisioning_state, vmid,
+# availability_zone, resource_type, private_ipv4_addresses, public_ipv4_addresses, public_dns_hostnames,
+# and vmss (id and name of the scale set) for scale set instances
+
+# sample 'production.azure_rm_inventory.yml'
+plugin: azure_rm_inventory
+subscriptions:
+  - 00000000-0000-0000-0000-000000000000
+  - 11111111-1111-1111-1111-111111111111
+include_vm_scale_sets: yes
+cache_path: ~/.ansible/azure_inventory.json
+cache_ttl: 600
+keyed_groups:
+  - prefix: tag
+    key: tags
+  - prefix: azure_loc
+    key: location
+groups:
+  linux: os_type == 'Linux'
+compose:
+  ansible_host: (public_dns_hostnames + private_ipv4_addresses) | first
+'''
+
+import json
+import os
+import re
+import tempfile
+import time
+from multiprocessing.pool import ThreadPool
+
+import ansible.module_utils
+from ansible.errors import AnsibleError
+from ansible.module_utils.azure_rm_common import AzureRMAuth
+from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+
+# the code shared by the modules lives next to this directory (see README.md)
+MODULE_UTILS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'module_utils')
+if MODULE_UTILS not in ansible.module_utils.__path__:
+    ansible.module_utils.__path__.append(MODULE_UTILS)
+
+from ansible.module_utils.azure_rm_resources import CHANGED_TIME_SKEW, list_resources, parse_time  # noqa: E402
+from ansible.module_utils.azure_rm_throttle import attach, throttle  # noqa: E402
+
+try:
+    from azure.mgmt.compute import ComputeManagementClient
+    from azure.mgmt.network import NetworkManagementClient
+    from msrestazure.azure_exceptions import CloudError
+    from msrestazure.tools import parse_resource_id
+    HAS_AZURE = True
+except ImportError:
+    HAS_AZURE = False
+
+CACHE_VERSION = 1
+
+# resource kinds listed per subscription, and their resource types
+KINDS = dict(vms='Microsoft.Compute/virtualMachines',
+             nics='Microsoft.Network/networkInterfaces',
+             pips='Microsoft.Network/publicIPAddresses')
+
+
+def vm_record(vm, vmss=None):
+    '''
+    The attributes of a virtual machine (or scale set instance) the inventory needs.
+    '''
+    d = vm.as_dict()
+    parts = parse_resource_id(d['id'])
+    return dict(
+        id=d['id'],
+        name=d['name'],
+        resource_group=parts['resource_group'],
+        subscription_id=parts['subscription'],
+        location=d.get('location'),
+        tags=d.get('tags') or {},
+        vm_size=(d.get('hardware_profile') or {}).get('vm_size') or (d.get('sku') or {}).get('name'),
+        os_type=((d.get('storage_profile') or {}).get('os_disk') or {}).get('os_type'),
+        provisioning_state=d.get('provisioning_state'),
+        vmid=d.get('vm_id'),
+        availability_zone=(d.get('zones') or [None])[0],
+        resource_type=d.get('type'),
+        nics=[dict(id=n['id'], primary=n.get('primary')) for n in (d.get('network_profile') or {}).get('network_interfaces') or []],
+        vmss=vmss
+    )
+
+
+def nic_record(nic):
+    d = nic.as_dict()
+    return dict(
+        id=d['id'],
+        ip_configurations=[dict(primary=c.get('primary'),
+                                private_ip_address=c.get('private_ip_address'),
+                                public_ip_id=(c.get('public_ip_address') or {}).get('id'))
+                           for c in d.get('ip_configurations') or []]
+    )
+
+
+def pip_record(pip):
+    d = pip.as_dict()
+    return dict(id=d['id'], ip_address=d.get('ip_address'), fqdn=(d.get('dns_settings') or {}).get('fqdn'))
+
+
+RECORDS = dict(vms=vm_record, nics=nic_record, pips=pip_record)
+
+
+def by_id(records):
+    return dict((r['id'].lower(), r) for r in records)
+
+
+def host_vars(vm, nics, pips):
+    '''
+    Host variables of a virtual machine record, with the addresses of its network interfaces and
+    public IP addresses looked up by id; primary network interfaces and IP configurations first.
+    '''
+    private = []
+    public = []
+    dns = []
+    for ref in sorted(vm['nics'], key=lambda n: not n.get('primary')):
+        nic = nics.get(ref['id'].lower())
+        if nic is None:
+            continue
+        for conf in sorted(nic['ip_configurations'], key=lambda c: not c.get('primary')):
+            if conf['private_ip_address']:
+                private.append(conf['private_ip_address'])
+            pip = pips.get((conf['public_ip_id'] or '').lower())
+            if pip is None:
+                continue
+            if pip['ip_address']:
+                public.append(pip['ip_address'])
+            if pip['fqdn']:
+                dns.append(pip['fqdn'])
+    hostvars = dict((k, v) for k, v in vm.items() if k != 'nics')
+    hostvars.update(private_ipv4_addresses=private, public_ipv4_addresses=public, public_dns_hostnames=dns)
+    if public or private:
+        hostvars['ansible_host'] = (public or private)[0]
+    return hostvars
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable):
+
+    NAME = 'azure_rm_inventory'
+
+    def __init__(self):
+        super(InventoryModule, self).__init__()
+        self.azure_auth = None
+        self._clients = {}
+        self._throttle = throttle()
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            if re.match(r'.{0,}azure_rm_inventory\.y(a)?ml$', path):
+                return True
+        return False
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path)
+        if not HAS_AZURE:
+            raise AnsibleError('The azure_rm_inventory plugin requires the azure-mgmt-compute and azure-mgmt-network packages')
+
+        self._read_config_data(path)
+        self._credential_setup()
+        subscriptions = self.get_option('subscriptions') or [self.azure_auth.subscription_id]
+
+        cache_path = self.get_option('cache_path')
+        cached = self._load_cache(cache_path, subscriptions) if cache_path and cache else None
+        if cached is not None and time.time() - cached['fetched_at'] < self.get_option('cache_ttl'):
+            data = cached
+        else:
+            data = self._refresh(subscriptions, cached)
+            if cache_path:
+                self._write_cache(cache_path, data)
+        self._populate(data)
+
+    def _credential_setup(self):
+        auth_options = dict(
+            auth_source=self.get_option('auth_source'),
+            profile=self.get_option('profile'),
+            subscription_id=self.get_option('subscription_id'),
+            client_id=self.get_option('client_id'),
+            secret=self.get_option('secret'),
+            tenant=self.get_option('tenant'),
+            ad_user=self.get_option('ad_user'),
+            password=self.get_option('password'),
+            cloud_environment=self.get_option('cloud_environment'),
+            cert_validation_mode=self.get_option('cert_validation_mode'),
+            api_profile=self.get_option('api_profile'),
+            adfs_authority_url=self.get_option('adfs_authority_url')
+        )
+        self.azure_auth = AzureRMAuth(**auth_options)
+
+    def _client(self, client_type, subscription_id):
+        '''
+        Management client of a subscription, created once and sent through the rate limiter of the
+        modules (see azure_rm_throttle).
+        '''
+        key = (client_type, subscription_id)
+        if key not in self._clients:
+            client = client_type(self.azure_auth.azure_credentials, subscription_id,
+                                 base_url=self.azure_auth._cloud_environment.endpoints.resource_manager)
+            if self.azure_auth._cert_validation_mode == 'ignore':
+                client.config.session_configuration_callback = self._validation_ignore_callback
+            self._clients[key] = attach(client, self._throttle)
+        return self._clients[key]
+
+    @staticmethod
+    def _validation_ignore_callback(session, global_config, local_config, **kwargs):
+        session.verify = False
+        return kwargs
+
+    def _operations(self, kind, subscription_id):
+        if kind == 'vms':
+            return self._client(ComputeManagementClient, subscription_id).virtual_machines
+        if kind == 'nics':
+            return self._client(NetworkManagementClient, subscription_id).network_interfaces
+        return self._client(NetworkManagementClient, subscription_id).public_ip_addresses
+
+    def _refresh(self, subscriptions, cached):
+        '''
+        Fetch the records of all subscriptions: one job per subscription and kind, then, with
+        include_vm_scale_sets, one job per scale set. Kinds in cached are refreshed incrementally.
+
+        :return: cache document with fetched_at and the records by subscription and kind
+        '''
+        fetched_at = time.time()
+        jobs = [(subscription_id, kind) for subscription_id in subscriptions for kind in sorted(KINDS)]
+        if self.get_option('include_vm_scale_sets'):
+            jobs.extend((subscription_id, 'scale_sets') for subscription_id in subscriptions)
+
+        def run(job):
+            subscription_id, kind = job
+            if kind == 'scale_sets':
+                return list(self._client(ComputeManagementClient, subscription_id).virtual_machine_scale_sets.list_all())
+            previous = cached['subscriptions'].get(subscription_id, {}).get(kind) if cached else None
+            if previous is None:
+                return self._list_kind(subscription_id, kind)
+            return self._update_kind(subscription_id, kind, previous, cached['fetched_at'] - CHANGED_TIME_SKEW)
+
+        results = self._map(run, jobs)
+        data = dict(version=CACHE_VERSION, fetched_at=fetched_at, subscriptions=dict((s, {}) for s in subscriptions))
+        scale_sets = []
+        for (subscription_id, kind), result in zip(jobs, results):
+            if kind == 'scale_sets':
+                scale_sets.extend((subscription_id, scale_set) for scale_set in result)
+            else:
+                data['subscriptions'][subscription_id][kind] = result
+
+        for subscription_id, records in self._map(self._list_scale_set, scale_sets):
+            for kind, found in records.items():
+                data['subscriptions'][subscription_id].setdefault('vmss_' + kind, {}).update(found)
+        return data
+
+    def _map(self, func, jobs):
+        if not jobs:
+            return []
+        pool = ThreadPool(max(1, min(self.get_option('concurrency'), len(jobs))))
+        try:
+            return pool.map(func, jobs)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _list_kind(self, subscription_id, kind):
+        return by_id(RECORDS[kind](item) for item in self._operations(kind, subscription_id).list_all())
+
+    def _update_kind(self, subscription_id, kind, previous, since):
+        '''
+        Records of kind, reusing the previous ones of resources that did not change since since: the
+        resources API lists the ids and changedTime of all resources of the kind, only new and changed
+        ones are fetched. A full listing is used when most resources changed.
+        '''
+        listed = list_resources(self._client(ComputeManagementClient, subscription_id), subscription_id,
+                                odata_filter="resourceType eq '{0}'".format(KINDS[kind]), expand='changedTime')
+        records = {}
+        stale = []
+        for resource in listed:
+            key = resource['id'].lower()
+            changed = resource.get('changedTime')
+            if key in previous and changed and parse_time(changed) < since:
+                records[key] = previous[key]
+            else:
+                stale.append(resource['id'])
+        if len(stale) > len(records):
+            return self._list_kind(subscription_id, kind)
+        self.display.vvv('azure_rm_inventory: {0} {1} unchanged, {2} fetched in {3}'.format(len(records), kind, len(stale), subscription_id))
+        operations = self._operations(kind, subscription_id)
+        for resource_id in stale:
+            parts = parse_resource_id(resource_id)
+            try:
+                item = operations.get(parts['resource_group'], parts['name'])
+            except CloudError:
+                # deleted since the listing
+                continue
+            records[resource_id.lower()] = RECORDS[kind](item)
+        return records
+
+    def _list_scale_set(self, job):
+        subscription_id, scale_set = job
+        parts = parse_resource_id(scale_set.id)
+        vmss = dict(id=scale_set.id, name=scale_set.name)
+        compute = self._client(ComputeManagementClient, subscription_id)
+        network = self._client(NetworkManagementClient, subscription_id)
+        vms = compute.virtual_machine_scale_set_vms.list(parts['resource_group'], scale_set.name)
+        nics = network.network_interfaces.list_virtual_machine_scale_set_network_interfaces(parts['resource_group'], scale_set.name)
+        pips = network.public_ip_addresses.list_virtual_machine_scale_set_public_ip_addresses(parts['resource_group'], scale_set.name)
+        return subscription_id, dict(vms=by_id(vm_record(vm, vmss) for vm in vms),
+                                     nics=by_id(nic_record(nic) for nic in nics),
+                                     pips=by_id(pip_record(pip) for pip in pips))
+
+    def _load_cache(self, path, subscriptions):
+        try:
+            with open(os.path.expanduser(path)) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if data.get('version') != CACHE_VERSION or set(data.get('subscriptions', {})) != set(subscriptions):
+            return None
+        return data
+
+    def _write_cache(self, path, data):
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        # replace the file atomically, concurrent runs never read a partial inventory
+        fd, tmp = tempfile.mkstemp(dir=directory or '.', prefix='.azure-inventory')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.rename(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def _populate(self, data):
+        nics = {}
+        pips = {}
+        vms = []
+        for kinds in data['subscriptions'].values():
+            for prefix in ('', 'vmss_'):
+                nics.update(kinds.get(prefix + 'nics') or {})
+                pips.update(kinds.get(prefix + 'pips') or {})
+                vms.extend((kinds.get(prefix + 'vms') or {}).values())
+
+        # names are only unique per resource group, and resource group names per subscription
+        counts = {}
+        for vm in vms:
+            for key in (vm['name'], (vm['name'], vm['resource_group'].lower())):
+                counts[key] = counts.get(key, 0) + 1
+
+        strict = self.get_option('strict')
+        for vm in sorted(vms, key=lambda v: v['id'].lower()):
+            if counts[vm['name']] == 1:
+                host = vm['name']
+            elif counts[(vm['name'], vm['resource_group'].lower())] == 1:
+                host = '{0}_{1}'.format(vm['name'], vm['resource_group'])
+            else:
+                host = '{0}_{1}_{2}'.format(vm['name'], vm['resource_group'], vm['subscription_id'])
+            self.inventory.add_host(host)
+            hostvars = host_vars(vm, nics, pips)
+            for key, value in hostvars.items():
+                self.inventory.set_variable(host, key, value)
+            self._set_composite_vars(self.get_option('compose'), hostvars, host, strict=strict)
+            self._add_host_to_composed_groups(self.get_option('groups'), hostvars, host, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), hostvars, host, strict=strict)
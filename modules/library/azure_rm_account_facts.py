@@ -31,6 +31,51 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+            - Unless I(name) is given, the first tag is sent to Azure as a server side filter.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    backend:
+        description:
+            - Service used to look up the instances.
+            - C(resource_graph) runs a single Azure Resource Graph query filtered on the resource group, name, location
+              and tags. Lookups using other options fall back to C(sdk).
+        choices:
+            - sdk
+            - resource_graph
+        default: sdk
+    changed_since:
+        description:
+            - Only return the instances created or changed since this time, an ISO 8601 timestamp such as
+              C(2019-03-01T00:00:00Z), according to the C(changedTime) of the resources API.
+            - Can only be combined with the I(resource_group), I(name), I(location) and I(tags) options.
+    snapshot_file:
+        description:
+            - Path of a local snapshot of the instances, kept up to date by each run: only instances created or changed
+              since the previous run (or I(changed_since)) are fetched, the others come from the snapshot. All instances
+              are returned, and a summary of the update in C(snapshot).
+            - Can only be combined with the I(resource_group), I(name), I(location) and I(tags) options.
+        type: path
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -105,20 +150,25 @@ accounts:
                     returned: always
                     type: str
                     sample: Standard
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.maps import MapsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAccountFacts(AzureRMModuleBase):
+class AzureRMAccountFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -140,14 +190,23 @@ class AzureRMAccountFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.tags = None
-        super(AzureRMAccountFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAccountFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_resource_graph=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(MapsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.maps.MapsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['accounts'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
+        response = self.list_filtered(self.mgmt_client.accounts)
+        if response is not None:
+            self.results['accounts'] = [self.format_response(item) for item in response]
+            return self.results
+
         if (self.resource_group is not None and
                 self.name is not None):
             self.results['accounts'] = self.get()
@@ -163,7 +222,7 @@ class AzureRMAccountFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.accounts.get(resource_group_name=self.resource_group,
                                                      account_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Account.')
 
@@ -172,17 +231,25 @@ class AzureRMAccountFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.accounts, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_resource_group(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.accounts.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Account.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 if self.has_tags(item.tags, self.tags):
                     results.append(self.format_response(item))
 
@@ -193,12 +260,12 @@ class AzureRMAccountFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.accounts.list_by_subscription()
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Account.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 if self.has_tags(item.tags, self.tags):
                     results.append(self.format_response(item))
 
@@ -30,6 +30,16 @@ options:
         description:
             - The Canonical support plan type.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -67,18 +77,17 @@ support_plan_types:
             sample: Standard
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.addons import AzureAddonsResourceProvider
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMSupportPlanTypeFacts(AzureRMModuleBase):
+class AzureRMSupportPlanTypeFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -98,14 +107,18 @@ class AzureRMSupportPlanTypeFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.provider_name = None
         self.name = None
-        super(AzureRMSupportPlanTypeFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMSupportPlanTypeFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureAddonsResourceProvider,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.addons.AzureAddonsResourceProvider',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['support_plan_types'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['support_plan_types'] = self.get()
         return self.results
 
@@ -115,7 +128,7 @@ class AzureRMSupportPlanTypeFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.support_plan_types.get(provider_name=self.provider_name,
                                                                plan_type_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Support Plan Type.')
 
@@ -124,6 +137,14 @@ class AzureRMSupportPlanTypeFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.support_plan_types, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
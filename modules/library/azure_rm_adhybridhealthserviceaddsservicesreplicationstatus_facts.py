@@ -26,6 +26,16 @@ options:
         description:
             - The name of the service.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -49,18 +59,17 @@ adds_services_replication_status:
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.adhybridhealthservice import ADHybridHealthService
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAddsServicesReplicationStatusFacts(AzureRMModuleBase):
+class AzureRMAddsServicesReplicationStatusFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -75,14 +84,18 @@ class AzureRMAddsServicesReplicationStatusFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.name = None
-        super(AzureRMAddsServicesReplicationStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAddsServicesReplicationStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ADHybridHealthService,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.adhybridhealthservice.ADHybridHealthService',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['adds_services_replication_status'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['adds_services_replication_status'] = self.get()
         return self.results
 
@@ -91,7 +104,7 @@ class AzureRMAddsServicesReplicationStatusFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.adds_services_replication_status.get(service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Adds Services Replication Status.')
 
@@ -100,6 +113,14 @@ class AzureRMAddsServicesReplicationStatusFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.adds_services_replication_status, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -22,6 +22,16 @@ description:
     - Get facts of Azure Configuration.
 
 options:
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -56,18 +66,17 @@ configuration:
             sample: True
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.adhybridhealthservice import ADHybridHealthService
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMConfigurationFacts(AzureRMModuleBase):
+class AzureRMConfigurationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -77,14 +86,18 @@ class AzureRMConfigurationFacts(AzureRMModuleBase):
             changed=False
         )
         self.mgmt_client = None
-        super(AzureRMConfigurationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMConfigurationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ADHybridHealthService,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.adhybridhealthservice.ADHybridHealthService',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['configuration'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['configuration'] = self.get()
         return self.results
 
@@ -93,7 +106,7 @@ class AzureRMConfigurationFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.configuration.get()
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Configuration.')
 
@@ -102,6 +115,14 @@ class AzureRMConfigurationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.configuration, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -30,6 +30,16 @@ options:
         description:
             - The recommendation ID.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -84,18 +94,17 @@ recommendations:
             sample: Warning
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.advisor import AdvisorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMRecommendationFacts(AzureRMModuleBase):
+class AzureRMRecommendationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -115,14 +124,18 @@ class AzureRMRecommendationFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_uri = None
         self.recommendation_id = None
-        super(AzureRMRecommendationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMRecommendationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AdvisorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.advisor.AdvisorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['recommendations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['recommendations'] = self.get()
         return self.results
 
@@ -132,7 +145,7 @@ class AzureRMRecommendationFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.recommendations.get(resource_uri=self.resource_uri,
                                                             recommendation_id=self.recommendation_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Recommendation.')
 
@@ -141,6 +154,14 @@ class AzureRMRecommendationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.recommendations, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -34,6 +34,16 @@ options:
         description:
             - The name of the suppression.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -77,18 +87,17 @@ suppressions:
             sample: "7.00:00:00"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.advisor import AdvisorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMSuppressionFacts(AzureRMModuleBase):
+class AzureRMSuppressionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -113,14 +122,18 @@ class AzureRMSuppressionFacts(AzureRMModuleBase):
         self.resource_uri = None
         self.recommendation_id = None
         self.name = None
-        super(AzureRMSuppressionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMSuppressionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AdvisorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.advisor.AdvisorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['suppressions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['suppressions'] = self.get()
         return self.results
 
@@ -131,7 +144,7 @@ class AzureRMSuppressionFacts(AzureRMModuleBase):
             response = self.mgmt_client.suppressions.get(resource_uri=self.resource_uri,
                                                          recommendation_id=self.recommendation_id,
                                                          name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Suppression.')
 
@@ -140,6 +153,14 @@ class AzureRMSuppressionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.suppressions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -50,6 +50,29 @@ options:
     issue_id:
         description:
             - Issue identifier. Must be unique in the current API Management service instance.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -114,20 +137,25 @@ api_issue:
             returned: always
             type: str
             sample: open
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMApiIssueFacts(AzureRMModuleBase):
+class AzureRMApiIssueFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -168,14 +196,18 @@ class AzureRMApiIssueFacts(AzureRMModuleBase):
         self.top = None
         self.skip = None
         self.issue_id = None
-        super(AzureRMApiIssueFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMApiIssueFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['api_issue'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.issue_id is not None:
             self.results['api_issue'] = self.get()
         else:
@@ -189,12 +221,12 @@ class AzureRMApiIssueFacts(AzureRMModuleBase):
             response = self.mgmt_client.api_issue.list_by_service(resource_group_name=self.resource_group,
                                                                   service_name=self.name,
                                                                   api_id=self.api_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Issue.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -207,7 +239,7 @@ class AzureRMApiIssueFacts(AzureRMModuleBase):
                                                       service_name=self.name,
                                                       api_id=self.api_id,
                                                       issue_id=self.issue_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Issue.')
 
@@ -216,6 +248,14 @@ class AzureRMApiIssueFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.api_issue, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -59,6 +59,34 @@ options:
         description:
             - "ETag of the Issue Entity. ETag should match the current entity state from the header response of the GET request or it should be * for
                unconditional update."
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Api Issue Attachment.
@@ -98,17 +126,20 @@ id:
     type: str
     sample: "/subscriptions/subid/resourceGroups/rg1/providers/Microsoft.ApiManagement/service/apimService1/apis/57d1f7558aa04f15146d9d8a/issues/57d2ef278aa0
             4f0ad01d6cdc/attachments/57d2ef278aa04f0888cba3f3"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -119,7 +150,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMApiIssueAttachment(AzureRMModuleBase):
+class AzureRMApiIssueAttachment(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Api Issue Attachment resource"""
 
     def __init__(self):
@@ -192,12 +223,10 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_apiissueattachment()
+        old_response = self.cached_get(self.get_apiissueattachment)
 
         if not old_response:
             self.log("Api Issue Attachment instance doesn't exist")
@@ -210,7 +239,7 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -218,6 +247,7 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_apiissueattachment()
@@ -229,12 +259,11 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_apiissueattachment()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_apiissueattachment()
+            self.wait_for_delete(response, self.get_apiissueattachment, 'Api Issue Attachment')
         else:
             self.log("Api Issue Attachment instance unchanged")
             self.results['changed'] = False
@@ -252,7 +281,7 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
 
         :return: deserialized Api Issue Attachment instance state dictionary
         '''
-        self.log("Creating / Updating the Api Issue Attachment instance {0}".format(self.attachment_id))
+        self.log("Creating / Updating the Api Issue Attachment instance {0}", self.attachment_id)
 
         try:
             response = self.mgmt_client.api_issue_attachment.create_or_update(resource_group_name=self.resource_group,
@@ -273,9 +302,9 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
         '''
         Deletes specified Api Issue Attachment instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Api Issue Attachment instance {0}".format(self.attachment_id))
+        self.log("Deleting the Api Issue Attachment instance {0}", self.attachment_id)
         try:
             response = self.mgmt_client.api_issue_attachment.delete(resource_group_name=self.resource_group,
                                                                     service_name=self.name,
@@ -287,7 +316,7 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
             self.log('Error attempting to delete the Api Issue Attachment instance.')
             self.fail("Error deleting the Api Issue Attachment instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_apiissueattachment(self):
         '''
@@ -295,7 +324,7 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
 
         :return: deserialized Api Issue Attachment instance state dictionary
         '''
-        self.log("Checking if the Api Issue Attachment instance {0} is present".format(self.attachment_id))
+        self.log("Checking if the Api Issue Attachment instance {0} is present", self.attachment_id)
         found = False
         try:
             response = self.mgmt_client.api_issue_attachment.get(resource_group_name=self.resource_group,
@@ -304,8 +333,8 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
                                                                  issue_id=self.issue_id,
                                                                  attachment_id=self.attachment_id)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Api Issue Attachment instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Api Issue Attachment instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Api Issue Attachment instance.')
         if found is True:
@@ -314,49 +343,6 @@ class AzureRMApiIssueAttachment(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMApiIssueAttachment()
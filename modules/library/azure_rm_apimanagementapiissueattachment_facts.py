@@ -53,6 +53,29 @@ options:
     attachment_id:
         description:
             - Attachment identifier within an Issue. Must be unique in the current Issue.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -113,20 +136,25 @@ api_issue_attachment:
             returned: always
             type: str
             sample: "https://.../image.jpg"
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMApiIssueAttachmentFacts(AzureRMModuleBase):
+class AzureRMApiIssueAttachmentFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -172,14 +200,18 @@ class AzureRMApiIssueAttachmentFacts(AzureRMModuleBase):
         self.top = None
         self.skip = None
         self.attachment_id = None
-        super(AzureRMApiIssueAttachmentFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMApiIssueAttachmentFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['api_issue_attachment'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.attachment_id is not None:
             self.results['api_issue_attachment'] = self.get()
         else:
@@ -194,12 +226,12 @@ class AzureRMApiIssueAttachmentFacts(AzureRMModuleBase):
                                                                              service_name=self.name,
                                                                              api_id=self.api_id,
                                                                              issue_id=self.issue_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Issue Attachment.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -213,7 +245,7 @@ class AzureRMApiIssueAttachmentFacts(AzureRMModuleBase):
                                                                  api_id=self.api_id,
                                                                  issue_id=self.issue_id,
                                                                  attachment_id=self.attachment_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Issue Attachment.')
 
@@ -222,6 +254,14 @@ class AzureRMApiIssueAttachmentFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.api_issue_attachment, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -38,6 +38,29 @@ options:
     policy_id:
         description:
             - The identifier of the Policy.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -80,20 +103,25 @@ api_policy:
             returned: always
             type: str
             sample: policy
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMApiPolicyFacts(AzureRMModuleBase):
+class AzureRMApiPolicyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -122,14 +150,18 @@ class AzureRMApiPolicyFacts(AzureRMModuleBase):
         self.name = None
         self.api_id = None
         self.policy_id = None
-        super(AzureRMApiPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMApiPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['api_policy'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.policy_id is not None:
             self.results['api_policy'] = self.get()
         else:
@@ -144,7 +176,7 @@ class AzureRMApiPolicyFacts(AzureRMModuleBase):
                                                        service_name=self.name,
                                                        api_id=self.api_id,
                                                        policy_id=self.policy_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Policy.')
 
@@ -153,6 +185,14 @@ class AzureRMApiPolicyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.api_policy, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_api(self):
         response = None
         results = []
@@ -160,12 +200,12 @@ class AzureRMApiPolicyFacts(AzureRMModuleBase):
             response = self.mgmt_client.api_policy.list_by_api(resource_group_name=self.resource_group,
                                                                service_name=self.name,
                                                                api_id=self.api_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Policy.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -38,6 +38,16 @@ options:
         description:
             - Release identifier within an API. Must be unique in the current API Management service instance.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -82,18 +92,17 @@ api_release:
             sample: yahoo
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMApiReleaseFacts(AzureRMModuleBase):
+class AzureRMApiReleaseFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -123,14 +132,18 @@ class AzureRMApiReleaseFacts(AzureRMModuleBase):
         self.name = None
         self.api_id = None
         self.release_id = None
-        super(AzureRMApiReleaseFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMApiReleaseFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['api_release'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['api_release'] = self.get()
         return self.results
 
@@ -142,7 +155,7 @@ class AzureRMApiReleaseFacts(AzureRMModuleBase):
                                                         service_name=self.name,
                                                         api_id=self.api_id,
                                                         release_id=self.release_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Release.')
 
@@ -151,6 +164,14 @@ class AzureRMApiReleaseFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.api_release, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
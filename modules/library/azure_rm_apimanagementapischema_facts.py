@@ -38,6 +38,29 @@ options:
     schema_id:
         description:
             - Schema identifier within an API. Must be unique in the current API Management service instance.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -81,20 +104,25 @@ api_schema:
             returned: always
             type: str
             sample: ec12520d-9d48-4e7b-8f39-698ca2ac63f1
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMApiSchemaFacts(AzureRMModuleBase):
+class AzureRMApiSchemaFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -123,14 +151,18 @@ class AzureRMApiSchemaFacts(AzureRMModuleBase):
         self.name = None
         self.api_id = None
         self.schema_id = None
-        super(AzureRMApiSchemaFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMApiSchemaFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['api_schema'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.schema_id is not None:
             self.results['api_schema'] = self.get()
         else:
@@ -145,7 +177,7 @@ class AzureRMApiSchemaFacts(AzureRMModuleBase):
                                                        service_name=self.name,
                                                        api_id=self.api_id,
                                                        schema_id=self.schema_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Schema.')
 
@@ -154,6 +186,14 @@ class AzureRMApiSchemaFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.api_schema, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_api(self):
         response = None
         results = []
@@ -161,12 +201,12 @@ class AzureRMApiSchemaFacts(AzureRMModuleBase):
             response = self.mgmt_client.api_schema.list_by_api(resource_group_name=self.resource_group,
                                                                service_name=self.name,
                                                                api_id=self.api_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Api Schema.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
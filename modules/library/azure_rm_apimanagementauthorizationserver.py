@@ -109,6 +109,34 @@ options:
     if_match:
         description:
             - ETag of the Entity. Not required when creating an entity, but required when updating an entity.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Authorization Server.
@@ -160,17 +188,20 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -181,7 +212,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMAuthorizationServer(AzureRMModuleBase):
+class AzureRMAuthorizationServer(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Authorization Server resource"""
 
     def __init__(self):
@@ -292,12 +323,10 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_authorizationserver()
+        old_response = self.cached_get(self.get_authorizationserver)
 
         if not old_response:
             self.log("Authorization Server instance doesn't exist")
@@ -310,7 +339,7 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -318,6 +347,7 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_authorizationserver()
@@ -329,12 +359,11 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_authorizationserver()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_authorizationserver()
+            self.wait_for_delete(response, self.get_authorizationserver, 'Authorization Server')
         else:
             self.log("Authorization Server instance unchanged")
             self.results['changed'] = False
@@ -351,7 +380,7 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
 
         :return: deserialized Authorization Server instance state dictionary
         '''
-        self.log("Creating / Updating the Authorization Server instance {0}".format(self.authsid))
+        self.log("Creating / Updating the Authorization Server instance {0}", self.authsid)
 
         try:
             response = self.mgmt_client.authorization_server.create_or_update(resource_group_name=self.resource_group,
@@ -370,9 +399,9 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
         '''
         Deletes specified Authorization Server instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Authorization Server instance {0}".format(self.authsid))
+        self.log("Deleting the Authorization Server instance {0}", self.authsid)
         try:
             response = self.mgmt_client.authorization_server.delete(resource_group_name=self.resource_group,
                                                                     service_name=self.name,
@@ -382,7 +411,7 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
             self.log('Error attempting to delete the Authorization Server instance.')
             self.fail("Error deleting the Authorization Server instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_authorizationserver(self):
         '''
@@ -390,15 +419,15 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
 
         :return: deserialized Authorization Server instance state dictionary
         '''
-        self.log("Checking if the Authorization Server instance {0} is present".format(self.authsid))
+        self.log("Checking if the Authorization Server instance {0} is present", self.authsid)
         found = False
         try:
             response = self.mgmt_client.authorization_server.get(resource_group_name=self.resource_group,
                                                                  service_name=self.name,
                                                                  authsid=self.authsid)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Authorization Server instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Authorization Server instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Authorization Server instance.')
         if found is True:
@@ -407,49 +436,6 @@ class AzureRMAuthorizationServer(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMAuthorizationServer()
@@ -45,6 +45,29 @@ options:
     authsid:
         description:
             - Identifier of the authorization server.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -94,20 +117,25 @@ authorization_server:
             returned: always
             type: str
             sample: test server
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAuthorizationServerFacts(AzureRMModuleBase):
+class AzureRMAuthorizationServerFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -143,14 +171,18 @@ class AzureRMAuthorizationServerFacts(AzureRMModuleBase):
         self.top = None
         self.skip = None
         self.authsid = None
-        super(AzureRMAuthorizationServerFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAuthorizationServerFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['authorization_server'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.authsid is not None:
             self.results['authorization_server'] = self.get()
         else:
@@ -163,12 +195,12 @@ class AzureRMAuthorizationServerFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.authorization_server.list_by_service(resource_group_name=self.resource_group,
                                                                              service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Authorization Server.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -180,7 +212,7 @@ class AzureRMAuthorizationServerFacts(AzureRMModuleBase):
             response = self.mgmt_client.authorization_server.get(resource_group_name=self.resource_group,
                                                                  service_name=self.name,
                                                                  authsid=self.authsid)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Authorization Server.')
 
@@ -189,6 +221,14 @@ class AzureRMAuthorizationServerFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.authorization_server, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -30,6 +30,37 @@ options:
         description:
             - The name of the API Management service.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    backend:
+        description:
+            - Service used to look up the instances.
+            - C(resource_graph) runs a single Azure Resource Graph query filtered on the resource group, name, location
+              and tags. Lookups using other options fall back to C(sdk).
+        choices:
+            - sdk
+            - resource_graph
+        default: sdk
+    changed_since:
+        description:
+            - Only return the instances created or changed since this time, an ISO 8601 timestamp such as
+              C(2019-03-01T00:00:00Z), according to the C(changedTime) of the resources API.
+            - Can only be combined with the I(resource_group), I(name), I(location) and I(tags) options.
+    snapshot_file:
+        description:
+            - Path of a local snapshot of the instances, kept up to date by each run: only instances created or changed
+              since the previous run (or I(changed_since)) are fetched, the others come from the snapshot. All instances
+              are returned, and a summary of the update in C(snapshot).
+            - Can only be combined with the I(resource_group), I(name), I(location) and I(tags) options.
+        type: path
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -85,18 +116,17 @@ delegation_settings:
                     sample: True
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMDelegationSettingFacts(AzureRMModuleBase):
+class AzureRMDelegationSettingFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -116,14 +146,23 @@ class AzureRMDelegationSettingFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.name = None
-        super(AzureRMDelegationSettingFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMDelegationSettingFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_resource_graph=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['delegation_settings'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
+        response = self.list_filtered(self.mgmt_client.delegation_settings)
+        if response is not None:
+            self.results['delegation_settings'] = [self.format_response(item) for item in response]
+            return self.results
+
         self.results['delegation_settings'] = self.get()
         return self.results
 
@@ -133,7 +172,7 @@ class AzureRMDelegationSettingFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.delegation_settings.get(resource_group_name=self.resource_group,
                                                                 service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Delegation Setting.')
 
@@ -142,6 +181,14 @@ class AzureRMDelegationSettingFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.delegation_settings, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -33,6 +33,24 @@ options:
     location_name:
         description:
             - Location in which the API Management service is deployed. This is one of the Azure Regions like West US, East US, South Central US.
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -61,20 +79,25 @@ network_status:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMNetworkStatusFacts(AzureRMModuleBase):
+class AzureRMNetworkStatusFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -98,12 +121,12 @@ class AzureRMNetworkStatusFacts(AzureRMModuleBase):
         self.resource_group = None
         self.service_name = None
         self.location_name = None
-        super(AzureRMNetworkStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMNetworkStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.location_name is not None:
@@ -119,12 +142,12 @@ class AzureRMNetworkStatusFacts(AzureRMModuleBase):
             response = self.mgmt_client.network_status.list_by_location(resource_group_name=self.resource_group,
                                                                         service_name=self.service_name,
                                                                         location_name=self.location_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for NetworkStatus.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_item(item))
 
         return results
@@ -135,12 +158,12 @@ class AzureRMNetworkStatusFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.network_status.list_by_service(resource_group_name=self.resource_group,
                                                                        service_name=self.service_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for NetworkStatus.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_item(item))
 
         return results
@@ -45,6 +45,29 @@ options:
     opid:
         description:
             - Identifier of the OpenID Connect Provider.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -94,20 +117,25 @@ open_id_connect_provider:
             returned: always
             type: str
             sample: open id provider template2
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMOpenIdConnectProviderFacts(AzureRMModuleBase):
+class AzureRMOpenIdConnectProviderFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -143,14 +171,18 @@ class AzureRMOpenIdConnectProviderFacts(AzureRMModuleBase):
         self.top = None
         self.skip = None
         self.opid = None
-        super(AzureRMOpenIdConnectProviderFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMOpenIdConnectProviderFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['open_id_connect_provider'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.opid is not None:
             self.results['open_id_connect_provider'] = self.get()
         else:
@@ -163,12 +195,12 @@ class AzureRMOpenIdConnectProviderFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.open_id_connect_provider.list_by_service(resource_group_name=self.resource_group,
                                                                                  service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Open Id Connect Provider.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -180,7 +212,7 @@ class AzureRMOpenIdConnectProviderFacts(AzureRMModuleBase):
             response = self.mgmt_client.open_id_connect_provider.get(resource_group_name=self.resource_group,
                                                                      service_name=self.name,
                                                                      opid=self.opid)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Open Id Connect Provider.')
 
@@ -189,6 +221,14 @@ class AzureRMOpenIdConnectProviderFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.open_id_connect_provider, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
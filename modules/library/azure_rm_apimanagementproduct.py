@@ -56,6 +56,34 @@ options:
         description:
             - "Whether the number of subscriptions a user can have to this product at the same time. Set to null or omit to allow unlimited per user
                subscriptions. Can be present only if I(subscription_required) property is present and has a value of false."
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
         description:
             - "whether product is C(published) or not. C(published) products are discoverable by users of developer portal. Non C(published) products are
@@ -98,17 +126,21 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -119,7 +151,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMProduct(AzureRMModuleBase):
+class AzureRMProduct(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Product resource"""
 
     def __init__(self):
@@ -193,17 +225,17 @@ class AzureRMProduct(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['state'], True)
-        dict_map(self.parameters, ['state'], {'not_published': 'notPublished'})
+        transform = DictTransform()
+        transform.camelize(['state'], True)
+        transform.map(['state'], {'not_published': 'notPublished'})
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_product()
+        old_response = self.cached_get(self.get_product)
 
         if not old_response:
             self.log("Product instance doesn't exist")
@@ -216,7 +248,7 @@ class AzureRMProduct(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -224,6 +256,7 @@ class AzureRMProduct(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_product()
@@ -235,12 +268,11 @@ class AzureRMProduct(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_product()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_product()
+            self.wait_for_delete(response, self.get_product, 'Product')
         else:
             self.log("Product instance unchanged")
             self.results['changed'] = False
@@ -257,7 +289,7 @@ class AzureRMProduct(AzureRMModuleBase):
 
         :return: deserialized Product instance state dictionary
         '''
-        self.log("Creating / Updating the Product instance {0}".format(self.product_id))
+        self.log("Creating / Updating the Product instance {0}", self.product_id)
 
         try:
             response = self.mgmt_client.product.create_or_update(resource_group_name=self.resource_group,
@@ -276,9 +308,9 @@ class AzureRMProduct(AzureRMModuleBase):
         '''
         Deletes specified Product instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Product instance {0}".format(self.product_id))
+        self.log("Deleting the Product instance {0}", self.product_id)
         try:
             response = self.mgmt_client.product.delete(resource_group_name=self.resource_group,
                                                        service_name=self.name,
@@ -288,7 +320,7 @@ class AzureRMProduct(AzureRMModuleBase):
             self.log('Error attempting to delete the Product instance.')
             self.fail("Error deleting the Product instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_product(self):
         '''
@@ -296,15 +328,15 @@ class AzureRMProduct(AzureRMModuleBase):
 
         :return: deserialized Product instance state dictionary
         '''
-        self.log("Checking if the Product instance {0} is present".format(self.product_id))
+        self.log("Checking if the Product instance {0} is present", self.product_id)
         found = False
         try:
             response = self.mgmt_client.product.get(resource_group_name=self.resource_group,
                                                     service_name=self.name,
                                                     product_id=self.product_id)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Product instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Product instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Product instance.')
         if found is True:
@@ -313,79 +345,6 @@ class AzureRMProduct(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
 def main():
     """Main execution"""
     AzureRMProduct()
@@ -39,6 +39,34 @@ options:
             - "API revision identifier. Must be unique in the current API Management service instance. Non-current revision has ;rev=n as a suffix where n
                is the revision number."
         required: True
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Product Api.
@@ -72,17 +100,20 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.ApiManagement/service/apimService1/apis/5931a75ae4bbd512a88c680b
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -93,7 +124,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMProductApi(AzureRMModuleBase):
+class AzureRMProductApi(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Product Api resource"""
 
     def __init__(self):
@@ -147,12 +178,10 @@ class AzureRMProductApi(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_productapi()
+        old_response = self.cached_get(self.get_productapi)
 
         if not old_response:
             self.log("Product Api instance doesn't exist")
@@ -165,7 +194,7 @@ class AzureRMProductApi(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -173,6 +202,7 @@ class AzureRMProductApi(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_productapi()
@@ -184,12 +214,11 @@ class AzureRMProductApi(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_productapi()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_productapi()
+            self.wait_for_delete(response, self.get_productapi, 'Product Api')
         else:
             self.log("Product Api instance unchanged")
             self.results['changed'] = False
@@ -207,7 +236,7 @@ class AzureRMProductApi(AzureRMModuleBase):
 
         :return: deserialized Product Api instance state dictionary
         '''
-        self.log("Creating / Updating the Product Api instance {0}".format(self.api_id))
+        self.log("Creating / Updating the Product Api instance {0}", self.api_id)
 
         try:
             response = self.mgmt_client.product_api.create_or_update(resource_group_name=self.resource_group,
@@ -226,9 +255,9 @@ class AzureRMProductApi(AzureRMModuleBase):
         '''
         Deletes specified Product Api instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Product Api instance {0}".format(self.api_id))
+        self.log("Deleting the Product Api instance {0}", self.api_id)
         try:
             response = self.mgmt_client.product_api.delete(resource_group_name=self.resource_group,
                                                            service_name=self.name,
@@ -238,7 +267,7 @@ class AzureRMProductApi(AzureRMModuleBase):
             self.log('Error attempting to delete the Product Api instance.')
             self.fail("Error deleting the Product Api instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_productapi(self):
         '''
@@ -246,13 +275,13 @@ class AzureRMProductApi(AzureRMModuleBase):
 
         :return: deserialized Product Api instance state dictionary
         '''
-        self.log("Checking if the Product Api instance {0} is present".format(self.api_id))
+        self.log("Checking if the Product Api instance {0} is present", self.api_id)
         found = False
         try:
             response = self.mgmt_client.product_api.get()
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Product Api instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Product Api instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Product Api instance.')
         if found is True:
@@ -261,49 +290,6 @@ class AzureRMProductApi(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMProductApi()
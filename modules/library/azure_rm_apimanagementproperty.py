@@ -48,6 +48,48 @@ options:
     if_match:
         description:
             - ETag of the Entity. Not required when creating an entity, but required when updating an entity.
+    items:
+        description:
+            - Manage several instances in one task, each element holds the options of one instance.
+            - Options missing in an element are taken from the module options, so options shared by all
+              instances (for example I(resource_group)) can be given once. Required options may be given
+              in either place.
+            - Instances are processed concurrently, see I(concurrency).
+        type: list
+        elements: dict
+    concurrency:
+        description:
+            - Maximum number of I(items) processed at the same time.
+        type: int
+        default: 10
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Property.
@@ -78,17 +120,25 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
+items:
+    description:
+        - One result per element of I(items), in the same order, with the element under C(item).
+    returned: when I(items) was used
+    type: list
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -99,7 +149,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMProperty(AzureRMModuleBase):
+class AzureRMProperty(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Property resource"""
 
     def __init__(self):
@@ -148,7 +198,8 @@ class AzureRMProperty(AzureRMModuleBase):
 
         super(AzureRMProperty, self).__init__(derived_arg_spec=self.module_arg_spec,
                                               supports_check_mode=True,
-                                              supports_tags=False)
+                                              supports_tags=False,
+                                              supports_items=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -162,12 +213,10 @@ class AzureRMProperty(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_property()
+        old_response = self.cached_get(self.get_property)
 
         if not old_response:
             self.log("Property instance doesn't exist")
@@ -180,7 +229,7 @@ class AzureRMProperty(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -188,6 +237,7 @@ class AzureRMProperty(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_property()
@@ -199,12 +249,11 @@ class AzureRMProperty(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_property()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_property()
+            self.wait_for_delete(response, self.get_property, 'Property')
         else:
             self.log("Property instance unchanged")
             self.results['changed'] = False
@@ -221,7 +270,7 @@ class AzureRMProperty(AzureRMModuleBase):
 
         :return: deserialized Property instance state dictionary
         '''
-        self.log("Creating / Updating the Property instance {0}".format(self.prop_id))
+        self.log("Creating / Updating the Property instance {0}", self.prop_id)
 
         try:
             response = self.mgmt_client.property.create_or_update(resource_group_name=self.resource_group,
@@ -240,9 +289,9 @@ class AzureRMProperty(AzureRMModuleBase):
         '''
         Deletes specified Property instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Property instance {0}".format(self.prop_id))
+        self.log("Deleting the Property instance {0}", self.prop_id)
         try:
             response = self.mgmt_client.property.delete(resource_group_name=self.resource_group,
                                                         service_name=self.name,
@@ -252,7 +301,7 @@ class AzureRMProperty(AzureRMModuleBase):
             self.log('Error attempting to delete the Property instance.')
             self.fail("Error deleting the Property instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_property(self):
         '''
@@ -260,15 +309,15 @@ class AzureRMProperty(AzureRMModuleBase):
 
         :return: deserialized Property instance state dictionary
         '''
-        self.log("Checking if the Property instance {0} is present".format(self.prop_id))
+        self.log("Checking if the Property instance {0} is present", self.prop_id)
         found = False
         try:
             response = self.mgmt_client.property.get(resource_group_name=self.resource_group,
                                                      service_name=self.name,
                                                      prop_id=self.prop_id)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Property instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Property instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Property instance.')
         if found is True:
@@ -277,49 +326,6 @@ class AzureRMProperty(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMProperty()
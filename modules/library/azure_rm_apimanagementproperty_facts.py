@@ -48,6 +48,29 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -109,20 +132,25 @@ property:
             returned: always
             type: str
             sample: propValue
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMPropertyFacts(AzureRMModuleBase):
+class AzureRMPropertyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -162,14 +190,18 @@ class AzureRMPropertyFacts(AzureRMModuleBase):
         self.skip = None
         self.prop_id = None
         self.tags = None
-        super(AzureRMPropertyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMPropertyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['property'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.prop_id is not None:
             self.results['property'] = self.get()
         else:
@@ -182,12 +214,12 @@ class AzureRMPropertyFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.property.list_by_service(resource_group_name=self.resource_group,
                                                                  service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Property.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 if self.has_tags(item.tags, self.tags):
                     results.append(self.format_response(item))
 
@@ -200,7 +232,7 @@ class AzureRMPropertyFacts(AzureRMModuleBase):
             response = self.mgmt_client.property.get(resource_group_name=self.resource_group,
                                                      service_name=self.name,
                                                      prop_id=self.prop_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Property.')
 
@@ -209,6 +241,14 @@ class AzureRMPropertyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.property, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -40,6 +40,16 @@ options:
         description:
             - Quota period key identifier.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -73,18 +83,17 @@ quota_by_period_keys:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMQuotaByPeriodKeyFacts(AzureRMModuleBase):
+class AzureRMQuotaByPeriodKeyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -114,14 +123,18 @@ class AzureRMQuotaByPeriodKeyFacts(AzureRMModuleBase):
         self.name = None
         self.quota_counter_key = None
         self.quota_period_key = None
-        super(AzureRMQuotaByPeriodKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMQuotaByPeriodKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['quota_by_period_keys'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['quota_by_period_keys'] = self.get()
         return self.results
 
@@ -133,7 +146,7 @@ class AzureRMQuotaByPeriodKeyFacts(AzureRMModuleBase):
                                                                  service_name=self.name,
                                                                  quota_counter_key=self.quota_counter_key,
                                                                  quota_period_key=self.quota_period_key)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Quota By Period Key.')
 
@@ -142,6 +155,14 @@ class AzureRMQuotaByPeriodKeyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.quota_by_period_keys, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
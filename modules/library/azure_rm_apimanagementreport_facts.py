@@ -44,6 +44,24 @@ options:
             - "By time interval. Interval must be multiple of 15 minutes and may not be zero. The value should be in ISO  8601 format
                (http://en.wikipedia.org/wiki/ISO_8601#Durations).This code can be used to convert TimeSpan to a valid interval string:
                XmlConvert.ToString(new TimeSpan(hours, minutes, secconds))"
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -126,20 +144,25 @@ reports:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMReportFacts(AzureRMModuleBase):
+class AzureRMReportFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -175,12 +198,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
         self.top = None
         self.skip = None
         self.interval = None
-        super(AzureRMReportFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMReportFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.interval is not None:
@@ -208,12 +231,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
             response = self.mgmt_client.reports.list_by_time(resource_group_name=self.resource_group,
                                                              service_name=self.name,
                                                              interval=self.interval)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -225,12 +248,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
             response = self.mgmt_client.reports.list_by_api(resource_group_name=self.resource_group,
                                                             service_name=self.name,
                                                             filter=self.filter)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -242,12 +265,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
             response = self.mgmt_client.reports.list_by_user(resource_group_name=self.resource_group,
                                                              service_name=self.name,
                                                              filter=self.filter)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -259,12 +282,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
             response = self.mgmt_client.reports.list_by_operation(resource_group_name=self.resource_group,
                                                                   service_name=self.name,
                                                                   filter=self.filter)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -276,12 +299,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
             response = self.mgmt_client.reports.list_by_product(resource_group_name=self.resource_group,
                                                                 service_name=self.name,
                                                                 filter=self.filter)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -292,12 +315,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.reports.list_by_geo(resource_group_name=self.resource_group,
                                                             service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -308,12 +331,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.reports.list_by_subscription(resource_group_name=self.resource_group,
                                                                      service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -325,12 +348,12 @@ class AzureRMReportFacts(AzureRMModuleBase):
             response = self.mgmt_client.reports.list_by_request(resource_group_name=self.resource_group,
                                                                 service_name=self.name,
                                                                 filter=self.filter)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Report.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -34,6 +34,16 @@ options:
         description:
             - Subscription entity Identifier. The entity represents the association between a user and a product in API Management.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -81,18 +91,17 @@ subscription:
             sample: submitted
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMSubscriptionFacts(AzureRMModuleBase):
+class AzureRMSubscriptionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -117,14 +126,18 @@ class AzureRMSubscriptionFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.sid = None
-        super(AzureRMSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['subscription'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['subscription'] = self.get()
         return self.results
 
@@ -135,7 +148,7 @@ class AzureRMSubscriptionFacts(AzureRMModuleBase):
             response = self.mgmt_client.subscription.get(resource_group_name=self.resource_group,
                                                          service_name=self.name,
                                                          sid=self.sid)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Subscription.')
 
@@ -144,6 +157,14 @@ class AzureRMSubscriptionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.subscription, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
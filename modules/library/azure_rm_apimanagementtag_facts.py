@@ -58,6 +58,29 @@ options:
     tag_id:
         description:
             - Tag identifier. Must be unique in the current API Management service instance.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -129,20 +152,25 @@ tag:
             returned: always
             type: str
             sample: 59306a29e4bbd510dc24e5f9
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMTagFacts(AzureRMModuleBase):
+class AzureRMTagFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -190,14 +218,18 @@ class AzureRMTagFacts(AzureRMModuleBase):
         self.skip = None
         self.product_id = None
         self.tag_id = None
-        super(AzureRMTagFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMTagFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['tag'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.api_id is not None and
                 self.operation_id is not None):
             self.results['tag'] = self.list_by_operation()
@@ -219,12 +251,12 @@ class AzureRMTagFacts(AzureRMModuleBase):
                                                               service_name=self.name,
                                                               api_id=self.api_id,
                                                               operation_id=self.operation_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Tag.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -236,12 +268,12 @@ class AzureRMTagFacts(AzureRMModuleBase):
             response = self.mgmt_client.tag.list_by_api(resource_group_name=self.resource_group,
                                                         service_name=self.name,
                                                         api_id=self.api_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Tag.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -253,12 +285,12 @@ class AzureRMTagFacts(AzureRMModuleBase):
             response = self.mgmt_client.tag.list_by_product(resource_group_name=self.resource_group,
                                                             service_name=self.name,
                                                             product_id=self.product_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Tag.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -269,12 +301,12 @@ class AzureRMTagFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.tag.list_by_service(resource_group_name=self.resource_group,
                                                             service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Tag.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -286,7 +318,7 @@ class AzureRMTagFacts(AzureRMModuleBase):
             response = self.mgmt_client.tag.get(resource_group_name=self.resource_group,
                                                 service_name=self.name,
                                                 tag_id=self.tag_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Tag.')
 
@@ -295,6 +327,14 @@ class AzureRMTagFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.tag, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
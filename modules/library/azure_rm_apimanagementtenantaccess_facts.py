@@ -34,6 +34,16 @@ options:
         description:
             - The identifier of the Access configuration.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -71,18 +81,17 @@ tenant_access:
             sample: True
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.apimanagement import ApiManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMTenantAccessFacts(AzureRMModuleBase):
+class AzureRMTenantAccessFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -107,14 +116,18 @@ class AzureRMTenantAccessFacts(AzureRMModuleBase):
         self.resource_group = None
         self.service_name = None
         self.name = None
-        super(AzureRMTenantAccessFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMTenantAccessFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApiManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.apimanagement.ApiManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['tenant_access'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['tenant_access'] = self.get()
         return self.results
 
@@ -125,7 +138,7 @@ class AzureRMTenantAccessFacts(AzureRMModuleBase):
             response = self.mgmt_client.tenant_access.get(resource_group_name=self.resource_group,
                                                           service_name=self.service_name,
                                                           access_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Tenant Access.')
 
@@ -134,6 +147,14 @@ class AzureRMTenantAccessFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.tenant_access, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -951,6 +951,34 @@ options:
     resource_guid:
         description:
             - Resource GUID property of the application gateway resource.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Application Gateway.
@@ -986,17 +1014,21 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -1007,7 +1039,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMApplicationGateway(AzureRMModuleBase):
+class AzureRMApplicationGateway(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Application Gateway resource"""
 
     def __init__(self):
@@ -1945,94 +1977,91 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_resource_id(self.parameters, ['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['sku', 'name'], True)
-        dict_map(self.parameters, ['sku', 'name'], {'standard_small': 'Standard_Small', 'standard_medium': 'Standard_Medium', 'standard_large': 'Standard_Large', 'waf_medium': 'WAF_Medium', 'waf_large': 'WAF_Large'})
-        dict_camelize(self.parameters, ['sku', 'tier'], True)
-        dict_map(self.parameters, ['sku', 'tier'], {'waf': 'WAF'})
-        dict_camelize(self.parameters, ['ssl_policy', 'policy_type'], True)
-        dict_camelize(self.parameters, ['ssl_policy', 'policy_name'], True)
-        dict_camelize(self.parameters, ['ssl_policy', 'min_protocol_version'], True)
-        dict_map(self.parameters, ['ssl_policy', 'min_protocol_version'], {'tl_sv1_0': 'TLSv1_0', 'tl_sv1_1': 'TLSv1_1', 'tl_sv1_2': 'TLSv1_2'})
-        dict_resource_id(self.parameters, ['gateway_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['gateway_ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['authentication_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['ssl_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['frontend_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['frontend_ip_configurations', 'private_ip_allocation_method'], True)
-        dict_resource_id(self.parameters, ['frontend_ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['frontend_ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['frontend_ports', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['probes', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['probes', 'protocol'], True)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'private_ip_allocation_method'], True)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], True)
-        dict_map(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], {'ipv4': 'IPv4', 'ipv6': 'IPv6'})
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'load_balancer_backend_address_pools', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'load_balancer_inbound_nat_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'load_balancer_inbound_nat_rules', 'frontend_ip_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'load_balancer_inbound_nat_rules', 'protocol'], True)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'private_ip_allocation_method'], True)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], True)
-        dict_map(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], {'ipv4': 'IPv4', 'ipv6': 'IPv6'})
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'subnet', 'network_security_group', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'subnet', 'route_table', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'subnet', 'resource_navigation_links', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'sku', 'name'], True)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'public_ip_allocation_method'], True)
-        dict_camelize(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'public_ip_address_version'], True)
-        dict_map(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'public_ip_address_version'], {'ipv4': 'IPv4', 'ipv6': 'IPv6'})
-        dict_resource_id(self.parameters, ['backend_address_pools', 'backend_ip_configurations', 'application_security_groups', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_http_settings_collection', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['backend_http_settings_collection', 'protocol'], True)
-        dict_map(self.parameters, ['backend_http_settings_collection', 'cookie_based_affinity'], {True: 'Enabled', False: 'Disabled'})
-        dict_resource_id(self.parameters, ['backend_http_settings_collection', 'probe', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['backend_http_settings_collection', 'authentication_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['http_listeners', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['http_listeners', 'frontend_ip_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['http_listeners', 'frontend_port', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['http_listeners', 'protocol'], True)
-        dict_resource_id(self.parameters, ['http_listeners', 'ssl_certificate', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'default_backend_address_pool', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'default_backend_http_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'default_redirect_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'path_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'path_rules', 'backend_address_pool', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'path_rules', 'backend_http_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['url_path_maps', 'path_rules', 'redirect_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['request_routing_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['request_routing_rules', 'rule_type'], True)
-        dict_resource_id(self.parameters, ['request_routing_rules', 'backend_address_pool', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['request_routing_rules', 'backend_http_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['request_routing_rules', 'http_listener', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['request_routing_rules', 'url_path_map', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['request_routing_rules', 'redirect_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['redirect_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['redirect_configurations', 'redirect_type'], True)
-        dict_resource_id(self.parameters, ['redirect_configurations', 'target_listener', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['redirect_configurations', 'request_routing_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['redirect_configurations', 'url_path_maps', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['redirect_configurations', 'path_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['web_application_firewall_configuration', 'firewall_mode'], True)
+        transform = DictTransform()
+        transform.resource_id(['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['sku', 'name'], True)
+        transform.map(['sku', 'name'], {'standard_small': 'Standard_Small', 'standard_medium': 'Standard_Medium', 'standard_large': 'Standard_Large', 'waf_medium': 'WAF_Medium', 'waf_large': 'WAF_Large'})
+        transform.camelize(['sku', 'tier'], True)
+        transform.map(['sku', 'tier'], {'waf': 'WAF'})
+        transform.camelize(['ssl_policy', 'policy_type'], True)
+        transform.camelize(['ssl_policy', 'policy_name'], True)
+        transform.camelize(['ssl_policy', 'min_protocol_version'], True)
+        transform.map(['ssl_policy', 'min_protocol_version'], {'tl_sv1_0': 'TLSv1_0', 'tl_sv1_1': 'TLSv1_1', 'tl_sv1_2': 'TLSv1_2'})
+        transform.resource_id(['gateway_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['gateway_ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['authentication_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['ssl_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['frontend_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['frontend_ip_configurations', 'private_ip_allocation_method'], True)
+        transform.resource_id(['frontend_ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['frontend_ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['frontend_ports', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['probes', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['probes', 'protocol'], True)
+        transform.resource_id(['backend_address_pools', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'private_ip_allocation_method'], True)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], True)
+        transform.map(['backend_address_pools', 'backend_ip_configurations', 'application_gateway_backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], {'ipv4': 'IPv4', 'ipv6': 'IPv6'})
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'load_balancer_backend_address_pools', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'load_balancer_inbound_nat_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'load_balancer_inbound_nat_rules', 'frontend_ip_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'load_balancer_inbound_nat_rules', 'protocol'], True)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'private_ip_allocation_method'], True)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], True)
+        transform.map(['backend_address_pools', 'backend_ip_configurations', 'private_ip_address_version'], {'ipv4': 'IPv4', 'ipv6': 'IPv6'})
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'subnet', 'network_security_group', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'subnet', 'route_table', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'subnet', 'resource_navigation_links', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'sku', 'name'], True)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'public_ip_allocation_method'], True)
+        transform.camelize(['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'public_ip_address_version'], True)
+        transform.map(['backend_address_pools', 'backend_ip_configurations', 'public_ip_address', 'public_ip_address_version'], {'ipv4': 'IPv4', 'ipv6': 'IPv6'})
+        transform.resource_id(['backend_address_pools', 'backend_ip_configurations', 'application_security_groups', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_http_settings_collection', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['backend_http_settings_collection', 'protocol'], True)
+        transform.map(['backend_http_settings_collection', 'cookie_based_affinity'], {True: 'Enabled', False: 'Disabled'})
+        transform.resource_id(['backend_http_settings_collection', 'probe', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['backend_http_settings_collection', 'authentication_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['http_listeners', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['http_listeners', 'frontend_ip_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['http_listeners', 'frontend_port', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['http_listeners', 'protocol'], True)
+        transform.resource_id(['http_listeners', 'ssl_certificate', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'default_backend_address_pool', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'default_backend_http_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'default_redirect_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'path_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'path_rules', 'backend_address_pool', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'path_rules', 'backend_http_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['url_path_maps', 'path_rules', 'redirect_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['request_routing_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['request_routing_rules', 'rule_type'], True)
+        transform.resource_id(['request_routing_rules', 'backend_address_pool', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['request_routing_rules', 'backend_http_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['request_routing_rules', 'http_listener', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['request_routing_rules', 'url_path_map', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['request_routing_rules', 'redirect_configuration', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['redirect_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['redirect_configurations', 'redirect_type'], True)
+        transform.resource_id(['redirect_configurations', 'target_listener', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['redirect_configurations', 'request_routing_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['redirect_configurations', 'url_path_maps', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['redirect_configurations', 'path_rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['web_application_firewall_configuration', 'firewall_mode'], True)
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_applicationgateway()
+        old_response = self.cached_get(self.get_applicationgateway)
 
         if not old_response:
             self.log("Application Gateway instance doesn't exist")
@@ -2045,14 +2074,16 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Application Gateway instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_applicationgateway()
@@ -2064,12 +2095,11 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_applicationgateway()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_applicationgateway()
+            self.wait_for_delete(response, self.get_applicationgateway, 'Application Gateway')
         else:
             self.log("Application Gateway instance unchanged")
             self.results['changed'] = False
@@ -2087,7 +2117,7 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
 
         :return: deserialized Application Gateway instance state dictionary
         '''
-        self.log("Creating / Updating the Application Gateway instance {0}".format(self.name))
+        self.log("Creating / Updating the Application Gateway instance {0}", self.name)
 
         try:
             response = self.mgmt_client.application_gateways.create_or_update(resource_group_name=self.resource_group,
@@ -2105,9 +2135,9 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
         '''
         Deletes specified Application Gateway instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Application Gateway instance {0}".format(self.name))
+        self.log("Deleting the Application Gateway instance {0}", self.name)
         try:
             response = self.mgmt_client.application_gateways.delete(resource_group_name=self.resource_group,
                                                                     application_gateway_name=self.name)
@@ -2115,7 +2145,7 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
             self.log('Error attempting to delete the Application Gateway instance.')
             self.fail("Error deleting the Application Gateway instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_applicationgateway(self):
         '''
@@ -2123,14 +2153,14 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
 
         :return: deserialized Application Gateway instance state dictionary
         '''
-        self.log("Checking if the Application Gateway instance {0} is present".format(self.name))
+        self.log("Checking if the Application Gateway instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.application_gateways.get(resource_group_name=self.resource_group,
                                                                  application_gateway_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Application Gateway instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Application Gateway instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Application Gateway instance.')
         if found is True:
@@ -2139,100 +2169,6 @@ class AzureRMApplicationGateway(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMApplicationGateway()
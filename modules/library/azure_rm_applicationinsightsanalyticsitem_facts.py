@@ -41,6 +41,16 @@ options:
     name:
         description:
             - The name of a specific item defined in the Application Insights component
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -80,18 +90,17 @@ analytics_items:
             sample: version
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.applicationinsights import ApplicationInsightsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAnalyticsItemFacts(AzureRMModuleBase):
+class AzureRMAnalyticsItemFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -124,14 +133,18 @@ class AzureRMAnalyticsItemFacts(AzureRMModuleBase):
         self.scope_path = None
         self.id = None
         self.name = None
-        super(AzureRMAnalyticsItemFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAnalyticsItemFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApplicationInsightsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.applicationinsights.ApplicationInsightsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['analytics_items'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['analytics_items'] = self.get()
         return self.results
 
@@ -142,7 +155,7 @@ class AzureRMAnalyticsItemFacts(AzureRMModuleBase):
             response = self.mgmt_client.analytics_items.get(resource_group_name=self.resource_group,
                                                             resource_name=self.resource_name,
                                                             scope_path=self.scope_path)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Analytics Item.')
 
@@ -151,6 +164,14 @@ class AzureRMAnalyticsItemFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.analytics_items, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -45,6 +45,34 @@ options:
     related_annotation:
         description:
             - Related parent annotation if any
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Annotation.
@@ -74,17 +102,21 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.applicationinsights import ApplicationInsightsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -95,7 +127,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMAnnotation(AzureRMModuleBase):
+class AzureRMAnnotation(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Annotation resource"""
 
     def __init__(self):
@@ -152,16 +184,16 @@ class AzureRMAnnotation(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.annotation_properties[key] = kwargs[key]
 
-        dict_resource_id(self.annotation_properties, ['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform = DictTransform()
+        transform.resource_id(['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.apply(self.annotation_properties)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ApplicationInsightsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.applicationinsights.ApplicationInsightsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_annotation()
+        old_response = self.cached_get(self.get_annotation)
 
         if not old_response:
             self.log("Annotation instance doesn't exist")
@@ -174,7 +206,7 @@ class AzureRMAnnotation(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.annotation_properties, old_response, '', self.results)):
+                if (not self.compare_state(self.annotation_properties, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -182,6 +214,7 @@ class AzureRMAnnotation(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.annotation_properties, old_response)
                 return self.results
 
             response = self.create_update_annotation()
@@ -193,12 +226,11 @@ class AzureRMAnnotation(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_annotation()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_annotation()
+            self.wait_for_delete(response, self.get_annotation, 'Annotation')
         else:
             self.log("Annotation instance unchanged")
             self.results['changed'] = False
@@ -215,7 +247,7 @@ class AzureRMAnnotation(AzureRMModuleBase):
 
         :return: deserialized Annotation instance state dictionary
         '''
-        self.log("Creating / Updating the Annotation instance {0}".format(self.annotation_id))
+        self.log("Creating / Updating the Annotation instance {0}", self.annotation_id)
 
         try:
             if self.to_do == Actions.Create:
@@ -236,9 +268,9 @@ class AzureRMAnnotation(AzureRMModuleBase):
         '''
         Deletes specified Annotation instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Annotation instance {0}".format(self.annotation_id))
+        self.log("Deleting the Annotation instance {0}", self.annotation_id)
         try:
             response = self.mgmt_client.annotations.delete(resource_group_name=self.resource_group,
                                                            resource_name=self.name,
@@ -247,7 +279,7 @@ class AzureRMAnnotation(AzureRMModuleBase):
             self.log('Error attempting to delete the Annotation instance.')
             self.fail("Error deleting the Annotation instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_annotation(self):
         '''
@@ -255,15 +287,15 @@ class AzureRMAnnotation(AzureRMModuleBase):
 
         :return: deserialized Annotation instance state dictionary
         '''
-        self.log("Checking if the Annotation instance {0} is present".format(self.annotation_id))
+        self.log("Checking if the Annotation instance {0} is present", self.annotation_id)
         found = False
         try:
             response = self.mgmt_client.annotations.get(resource_group_name=self.resource_group,
                                                         resource_name=self.name,
                                                         annotation_id=self.annotation_id)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Annotation instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Annotation instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Annotation instance.')
         if found is True:
@@ -272,70 +304,6 @@ class AzureRMAnnotation(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMAnnotation()
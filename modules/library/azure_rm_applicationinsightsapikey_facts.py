@@ -34,6 +34,16 @@ options:
         description:
             - The API Key ID. This is unique within a Application Insights component.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -72,18 +82,17 @@ api_keys:
             sample: test2
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.applicationinsights import ApplicationInsightsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAPIKeyFacts(AzureRMModuleBase):
+class AzureRMAPIKeyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -108,14 +117,18 @@ class AzureRMAPIKeyFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.key_id = None
-        super(AzureRMAPIKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAPIKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ApplicationInsightsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.applicationinsights.ApplicationInsightsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['api_keys'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['api_keys'] = self.get()
         return self.results
 
@@ -126,7 +139,7 @@ class AzureRMAPIKeyFacts(AzureRMModuleBase):
             response = self.mgmt_client.api_keys.get(resource_group_name=self.resource_group,
                                                      resource_name=self.name,
                                                      key_id=self.key_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for A P I Key.')
 
@@ -135,6 +148,14 @@ class AzureRMAPIKeyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.api_keys, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -42,6 +42,34 @@ options:
     work_item_properties:
         description:
             - Custom work item properties
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Work Item Configuration.
@@ -92,17 +120,20 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.applicationinsights import ApplicationInsightsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -113,7 +144,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMWorkItemConfiguration(AzureRMModuleBase):
+class AzureRMWorkItemConfiguration(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Work Item Configuration resource"""
 
     def __init__(self):
@@ -170,12 +201,10 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ApplicationInsightsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.applicationinsights.ApplicationInsightsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_workitemconfiguration()
+        old_response = self.cached_get(self.get_workitemconfiguration)
 
         if not old_response:
             self.log("Work Item Configuration instance doesn't exist")
@@ -188,7 +217,7 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.work_item_configuration_properties, old_response, '', self.results)):
+                if (not self.compare_state(self.work_item_configuration_properties, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -196,6 +225,7 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.work_item_configuration_properties, old_response)
                 return self.results
 
             response = self.create_update_workitemconfiguration()
@@ -207,12 +237,11 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_workitemconfiguration()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_workitemconfiguration()
+            self.wait_for_delete(response, self.get_workitemconfiguration, 'Work Item Configuration')
         else:
             self.log("Work Item Configuration instance unchanged")
             self.results['changed'] = False
@@ -230,7 +259,7 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
 
         :return: deserialized Work Item Configuration instance state dictionary
         '''
-        self.log("Creating / Updating the Work Item Configuration instance {0}".format(self.work_item_config_id))
+        self.log("Creating / Updating the Work Item Configuration instance {0}", self.work_item_config_id)
 
         try:
             if self.to_do == Actions.Create:
@@ -251,9 +280,9 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
         '''
         Deletes specified Work Item Configuration instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Work Item Configuration instance {0}".format(self.work_item_config_id))
+        self.log("Deleting the Work Item Configuration instance {0}", self.work_item_config_id)
         try:
             response = self.mgmt_client.work_item_configurations.delete(resource_group_name=self.resource_group,
                                                                         resource_name=self.name,
@@ -262,7 +291,7 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
             self.log('Error attempting to delete the Work Item Configuration instance.')
             self.fail("Error deleting the Work Item Configuration instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_workitemconfiguration(self):
         '''
@@ -270,13 +299,13 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
 
         :return: deserialized Work Item Configuration instance state dictionary
         '''
-        self.log("Checking if the Work Item Configuration instance {0} is present".format(self.work_item_config_id))
+        self.log("Checking if the Work Item Configuration instance {0} is present", self.work_item_config_id)
         found = False
         try:
             response = self.mgmt_client.work_item_configurations.get()
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Work Item Configuration instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Work Item Configuration instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Work Item Configuration instance.')
         if found is True:
@@ -285,49 +314,6 @@ class AzureRMWorkItemConfiguration(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMWorkItemConfiguration()
@@ -40,6 +40,16 @@ options:
     end_time:
         description:
             - UTC date and time specifying the end time of an interval. When not specified the service uses DateTime.UtcNow
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -86,18 +96,17 @@ client_groups:
             sample: clientGroup
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.armservicemap import ServiceMap
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMClientGroupFacts(AzureRMModuleBase):
+class AzureRMClientGroupFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -130,14 +139,18 @@ class AzureRMClientGroupFacts(AzureRMModuleBase):
         self.name = None
         self.start_time = None
         self.end_time = None
-        super(AzureRMClientGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMClientGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceMap,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.armservicemap.ServiceMap',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['client_groups'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['client_groups'] = self.get()
         return self.results
 
@@ -148,7 +161,7 @@ class AzureRMClientGroupFacts(AzureRMModuleBase):
             response = self.mgmt_client.client_groups.get(resource_group_name=self.resource_group,
                                                           workspace_name=self.workspace_name,
                                                           client_group_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Client Group.')
 
@@ -157,6 +170,14 @@ class AzureRMClientGroupFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.client_groups, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
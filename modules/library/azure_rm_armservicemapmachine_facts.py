@@ -52,6 +52,29 @@ options:
     name:
         description:
             - Machine resource name.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -111,20 +134,25 @@ machines:
             returned: always
             type: str
             sample: fully_qualified_domain_name
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.armservicemap import ServiceMap
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMMachineFacts(AzureRMModuleBase):
+class AzureRMMachineFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -168,14 +196,18 @@ class AzureRMMachineFacts(AzureRMModuleBase):
         self.timestamp = None
         self.top = None
         self.name = None
-        super(AzureRMMachineFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMMachineFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceMap,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.armservicemap.ServiceMap',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['machines'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['machines'] = self.get()
         else:
@@ -188,12 +220,12 @@ class AzureRMMachineFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.machines.list_by_workspace(resource_group_name=self.resource_group,
                                                                    workspace_name=self.workspace_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Machine.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -205,7 +237,7 @@ class AzureRMMachineFacts(AzureRMModuleBase):
             response = self.mgmt_client.machines.get(resource_group_name=self.resource_group,
                                                      workspace_name=self.workspace_name,
                                                      machine_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Machine.')
 
@@ -214,6 +246,14 @@ class AzureRMMachineFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.machines, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -64,6 +64,34 @@ options:
                 description:
                     - Constant filled by server.
                     - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Machine Group.
@@ -102,17 +130,21 @@ id:
     type: str
     sample: "/subscriptions/63BE4E24-FDF0-4E9C-9342-6A5D5A359722/resourceGroups/rg-sm/providers/Microsoft.OperationalInsights/workspaces/D6F79F14-E563-469B-8
             4B5-9286D2803B2F/machineGroups/ccfbf4bf-dc08-4371-9e9b-00a8d875d45a"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.armservicemap import ServiceMap
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -123,7 +155,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMMachineGroup(AzureRMModuleBase):
+class AzureRMMachineGroup(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Machine Group resource"""
 
     def __init__(self):
@@ -193,16 +225,16 @@ class AzureRMMachineGroup(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.machine_group[key] = kwargs[key]
 
-        dict_resource_id(self.machine_group, ['machines', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform = DictTransform()
+        transform.resource_id(['machines', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.apply(self.machine_group)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceMap,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.armservicemap.ServiceMap',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_machinegroup()
+        old_response = self.cached_get(self.get_machinegroup)
 
         if not old_response:
             self.log("Machine Group instance doesn't exist")
@@ -215,7 +247,7 @@ class AzureRMMachineGroup(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.machine_group, old_response, '', self.results)):
+                if (not self.compare_state(self.machine_group, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -223,6 +255,7 @@ class AzureRMMachineGroup(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.machine_group, old_response)
                 return self.results
 
             response = self.create_update_machinegroup()
@@ -234,12 +267,11 @@ class AzureRMMachineGroup(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_machinegroup()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_machinegroup()
+            self.wait_for_delete(response, self.get_machinegroup, 'Machine Group')
         else:
             self.log("Machine Group instance unchanged")
             self.results['changed'] = False
@@ -257,7 +289,7 @@ class AzureRMMachineGroup(AzureRMModuleBase):
 
         :return: deserialized Machine Group instance state dictionary
         '''
-        self.log("Creating / Updating the Machine Group instance {0}".format(self.machine_group_name))
+        self.log("Creating / Updating the Machine Group instance {0}", self.machine_group_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -281,9 +313,9 @@ class AzureRMMachineGroup(AzureRMModuleBase):
         '''
         Deletes specified Machine Group instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Machine Group instance {0}".format(self.machine_group_name))
+        self.log("Deleting the Machine Group instance {0}", self.machine_group_name)
         try:
             response = self.mgmt_client.machine_groups.delete(resource_group_name=self.resource_group,
                                                               workspace_name=self.name,
@@ -292,7 +324,7 @@ class AzureRMMachineGroup(AzureRMModuleBase):
             self.log('Error attempting to delete the Machine Group instance.')
             self.fail("Error deleting the Machine Group instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_machinegroup(self):
         '''
@@ -300,15 +332,15 @@ class AzureRMMachineGroup(AzureRMModuleBase):
 
         :return: deserialized Machine Group instance state dictionary
         '''
-        self.log("Checking if the Machine Group instance {0} is present".format(self.machine_group_name))
+        self.log("Checking if the Machine Group instance {0} is present", self.machine_group_name)
         found = False
         try:
             response = self.mgmt_client.machine_groups.get(resource_group_name=self.resource_group,
                                                            workspace_name=self.name,
                                                            machine_group_name=self.machine_group_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Machine Group instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Machine Group instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Machine Group instance.')
         if found is True:
@@ -317,70 +349,6 @@ class AzureRMMachineGroup(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMMachineGroup()
@@ -44,6 +44,16 @@ options:
     end_time:
         description:
             - UTC date and time specifying the end time of an interval. When not specified the service uses DateTime.UtcNow
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -78,18 +88,17 @@ ports:
             sample: id
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.armservicemap import ServiceMap
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMPortFacts(AzureRMModuleBase):
+class AzureRMPortFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -127,14 +136,18 @@ class AzureRMPortFacts(AzureRMModuleBase):
         self.name = None
         self.start_time = None
         self.end_time = None
-        super(AzureRMPortFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMPortFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceMap,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.armservicemap.ServiceMap',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['ports'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['ports'] = self.get()
         return self.results
 
@@ -146,7 +159,7 @@ class AzureRMPortFacts(AzureRMModuleBase):
                                                   workspace_name=self.workspace_name,
                                                   machine_name=self.machine_name,
                                                   port_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Port.')
 
@@ -155,6 +168,14 @@ class AzureRMPortFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.ports, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -41,6 +41,16 @@ options:
     timestamp:
         description:
             - UTC date and time specifying a time instance relative to which to evaluate a resource. When not specified, the service uses DateTime.UtcNow.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -172,18 +182,17 @@ processes:
                     sample: "provider:azure"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.armservicemap import ServiceMap
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMProcesseFacts(AzureRMModuleBase):
+class AzureRMProcesseFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -217,14 +226,18 @@ class AzureRMProcesseFacts(AzureRMModuleBase):
         self.machine_name = None
         self.name = None
         self.timestamp = None
-        super(AzureRMProcesseFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMProcesseFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceMap,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.armservicemap.ServiceMap',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['processes'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['processes'] = self.get()
         return self.results
 
@@ -236,7 +249,7 @@ class AzureRMProcesseFacts(AzureRMModuleBase):
                                                       workspace_name=self.workspace_name,
                                                       machine_name=self.machine_name,
                                                       process_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Processe.')
 
@@ -245,6 +258,14 @@ class AzureRMProcesseFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.processes, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
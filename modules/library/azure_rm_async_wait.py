@@ -0,0 +1,234 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2018 Zim Kalinowski, <zikalino@microsoft.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_async_wait
+version_added: "2.8"
+short_description: Wait for many long running Azure operations at once.
+description:
+    - Poll the status of long running operations started by resource modules with I(wait_for_completion=no), a bounded
+      number at a time, until they are all finished or I(wait_timeout) is reached, and return the status of each.
+    - Every operation is polled with its own exponential backoff, and never more often than Azure asks for with
+      Retry-After.
+    - Fails when an operation failed, was canceled or did not finish in time.
+
+options:
+    operations:
+        description:
+            - URLs of the operations, as returned in I(operation_url) by the resource modules.
+            - Empty entries, from tasks whose operation completed at once, are skipped.
+        type: list
+        required: True
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for all operations.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - First backoff window in seconds. Every operation is polled at once, then again after at most
+              I(poll_interval) seconds, with the window doubling after each request up to 30 seconds.
+        type: int
+        default: 5
+    concurrency:
+        description:
+            - Maximum number of status requests sent at the same time.
+        type: int
+        default: 10
+
+extends_documentation_fragment:
+    - azure
+
+author:
+    - "Zim Kalinowski (@zikalino)"
+
+'''
+
+EXAMPLES = '''
+  - name: Start creating the SQL databases
+    azure_rm_sqldatabase:
+      resource_group: myResourceGroup
+      server_name: sqlcrudtest-5961
+      name: "{{ item }}"
+      location: eastus
+      wait_for_completion: no
+    loop: "{{ databases }}"
+    register: created
+
+  - name: Wait for all of them
+    azure_rm_async_wait:
+      operations: "{{ created.results | map(attribute='operation_url') | map('default', '') | list }}"
+      wait_timeout: 3600
+'''
+
+RETURN = '''
+operations:
+    description:
+        - Status of each operation, in the order of I(operations).
+    returned: always
+    type: complex
+    contains:
+        url:
+            description:
+                - URL of the operation.
+            returned: always
+            type: str
+        status:
+            description:
+                - Final status of the operation, C(Succeeded), C(Failed) or C(Canceled), or C(TimedOut) when it was
+                  still running at I(wait_timeout).
+            returned: always
+            type: str
+            sample: Succeeded
+        error:
+            description:
+                - Error reported by Azure for the operation.
+            returned: when the operation failed
+            type: str
+        polls:
+            description:
+                - Number of status requests sent.
+            returned: always
+            type: int
+            sample: 4
+        seconds:
+            description:
+                - Seconds from the start of the task until the operation was seen finished.
+            returned: always
+            type: float
+            sample: 62.4
+'''
+
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMRunMixin
+from ansible.module_utils.azure_rm_broker import attach
+from ansible.module_utils.azure_rm_throttle import attach as attach_throttle, throttle
+from ansible.module_utils.azure_rm_token_cache import use_token_cache
+from ansible.module_utils.azure_rm_wait import DEFAULT_POLL_INTERVAL, DEFAULT_WAIT_TIMEOUT, TERMINAL_STATUSES, retry_after_header, \
+    wait_for_operations
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+    from msrest.exceptions import ClientRequestError
+    from azure.mgmt.resource import ResourceManagementClient
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+# status values of operations, by lower case value
+STATUSES = dict((status.lower(), status) for status in TERMINAL_STATUSES)
+
+
+class AzureRMAsyncWait(AzureRMRunMixin, AzureRMModuleBase):
+    def __init__(self):
+        # define user inputs into argument
+        self.module_arg_spec = dict(
+            operations=dict(
+                type='list',
+                required=True
+            ),
+            wait_timeout=dict(
+                type='int',
+                default=DEFAULT_WAIT_TIMEOUT
+            ),
+            poll_interval=dict(
+                type='int',
+                default=DEFAULT_POLL_INTERVAL
+            ),
+            concurrency=dict(
+                type='int',
+                default=10
+            )
+        )
+        # store the results of the module operation
+        self.results = dict(
+            changed=False
+        )
+        self.client = None
+        use_token_cache()
+        self._throttle = throttle()
+        super(AzureRMAsyncWait, self).__init__(self.module_arg_spec, supports_check_mode=True, supports_tags=False, skip_exec=True)
+        self.module.exit_json(**self.add_throttling(self.exec_module(**self.module.params)))
+
+    def exec_module(self, **kwargs):
+        urls = [url for url in kwargs['operations'] if url]
+        endpoint = urlparse(self._cloud_environment.endpoints.resource_manager)
+        for url in urls:
+            parsed = urlparse(url)
+            # the credentials of the module are sent to these URLs
+            if (parsed.scheme, parsed.netloc.lower()) != (endpoint.scheme, endpoint.netloc.lower()):
+                self.fail("Operation URL {0} is not on the resource manager endpoint {1}".format(url, endpoint.geturl()))
+
+        self.client = self.get_mgmt_svc_client(ResourceManagementClient,
+                                               base_url=self._cloud_environment.endpoints.resource_manager,
+                                               api_version='2017-05-10')
+        operations = wait_for_operations(urls, self.poll, timeout=kwargs['wait_timeout'], interval=kwargs['poll_interval'],
+                                         concurrency=kwargs['concurrency'])
+        self.results['operations'] = operations
+        failed = len([o for o in operations if o['status'] != 'Succeeded'])
+        if failed:
+            self.fail("{0} of {1} operations did not succeed".format(failed, len(operations)), **self.results)
+        return self.results
+
+    def get_mgmt_svc_client(self, client_type, *args, **kwargs):
+        '''
+        Return a management client sending its requests through the connection broker and the rate
+        limiter, like the clients of the other modules.
+        '''
+        client = attach(super(AzureRMAsyncWait, self).get_mgmt_svc_client(client_type, *args, **kwargs))
+        return attach_throttle(client, self._throttle)
+
+    def poll(self, url):
+        '''
+        Send one status request.
+
+        Azure-AsyncOperation URLs answer with the status of the operation in the body, Location URLs
+        with 202 until the operation is finished.
+
+        :return: (status, Retry-After seconds, error message)
+        '''
+        try:
+            response = self.client._client.send(self.client._client.get(url))
+        except ClientRequestError as exc:
+            # connection errors are retried like a running operation
+            self.log("Error polling {0}: {1}", url, exc)
+            return 'InProgress', 0, None
+        delay = retry_after_header(response.headers)
+        if response.status_code == 202:
+            return 'InProgress', delay, None
+        if response.status_code not in (200, 201, 204):
+            return 'Failed', delay, str(CloudError(response))
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            body = None
+        if not isinstance(body, dict) or 'status' not in body:
+            # final result of a Location URL
+            return 'Succeeded', delay, None
+        status = STATUSES.get(str(body['status']).lower(), 'InProgress')
+        error = None
+        if status != 'Succeeded' and status != 'InProgress':
+            error = (body.get('error') or {}).get('message') or status
+        return status, delay, error
+
+
+def main():
+    AzureRMAsyncWait()
+
+
+if __name__ == '__main__':
+    main()
@@ -29,6 +29,16 @@ options:
     expand:
         description:
             - Specifies whether to expand the values.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -72,18 +82,17 @@ provider_operations_metadata:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.authorization import AuthorizationManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMProviderOperationsMetadataFacts(AzureRMModuleBase):
+class AzureRMProviderOperationsMetadataFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -102,14 +111,18 @@ class AzureRMProviderOperationsMetadataFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_provider_namespace = None
         self.expand = None
-        super(AzureRMProviderOperationsMetadataFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMProviderOperationsMetadataFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AuthorizationManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.authorization.AuthorizationManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['provider_operations_metadata'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['provider_operations_metadata'] = self.get()
         return self.results
 
@@ -118,7 +131,7 @@ class AzureRMProviderOperationsMetadataFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.provider_operations_metadata.get(resource_provider_namespace=self.resource_provider_namespace)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Provider Operations Metadata.')
 
@@ -127,6 +140,14 @@ class AzureRMProviderOperationsMetadataFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.provider_operations_metadata, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -37,6 +37,29 @@ options:
     name:
         description:
             - The name of activity.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -94,20 +117,25 @@ activity:
             sample: "The Add-AzureRmAcccount cmdlet adds an authenticated Azure account to use for Azure Resource Manager cmdlet requests.\n\nYou can use
                      this authenticated account only with Azure Resource Manager cmdlets. To add an authenticated account for use with Service Management
                      cmdlets, use the Add-AzureAccount or the Import-AzurePublishSettingsFile cmdlet."
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.automation import AutomationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMActivityFacts(AzureRMModuleBase):
+class AzureRMActivityFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -136,14 +164,18 @@ class AzureRMActivityFacts(AzureRMModuleBase):
         self.automation_account_name = None
         self.module_name = None
         self.name = None
-        super(AzureRMActivityFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMActivityFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AutomationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.automation.AutomationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['activity'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['activity'] = self.get()
         else:
@@ -158,7 +190,7 @@ class AzureRMActivityFacts(AzureRMModuleBase):
                                                      automation_account_name=self.automation_account_name,
                                                      module_name=self.module_name,
                                                      activity_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Activity.')
 
@@ -167,6 +199,14 @@ class AzureRMActivityFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.activity, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_module(self):
         response = None
         results = []
@@ -174,12 +214,12 @@ class AzureRMActivityFacts(AzureRMModuleBase):
             response = self.mgmt_client.activity.list_by_module(resource_group_name=self.resource_group,
                                                                 automation_account_name=self.automation_account_name,
                                                                 module_name=self.module_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Activity.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -45,6 +45,29 @@ options:
     node_id:
         description:
             - The node id.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -101,20 +124,25 @@ dsc_node:
             returned: always
             type: str
             sample: Pending
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.automation import AutomationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMDscNodeFacts(AzureRMModuleBase):
+class AzureRMDscNodeFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -154,14 +182,18 @@ class AzureRMDscNodeFacts(AzureRMModuleBase):
         self.top = None
         self.inlinecount = None
         self.node_id = None
-        super(AzureRMDscNodeFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMDscNodeFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AutomationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.automation.AutomationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['dsc_node'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.node_id is not None:
             self.results['dsc_node'] = self.get()
         else:
@@ -174,12 +206,12 @@ class AzureRMDscNodeFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.dsc_node.list_by_automation_account(resource_group_name=self.resource_group,
                                                                             automation_account_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Dsc Node.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -191,7 +223,7 @@ class AzureRMDscNodeFacts(AzureRMModuleBase):
             response = self.mgmt_client.dsc_node.get(resource_group_name=self.resource_group,
                                                      automation_account_name=self.name,
                                                      node_id=self.node_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Dsc Node.')
 
@@ -200,6 +232,14 @@ class AzureRMDscNodeFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.dsc_node, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
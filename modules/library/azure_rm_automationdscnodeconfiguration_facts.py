@@ -45,6 +45,29 @@ options:
     name:
         description:
             - The Dsc node configuration name.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -109,20 +132,25 @@ dsc_node_configuration:
             returned: always
             type: str
             sample: source
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.automation import AutomationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMDscNodeConfigurationFacts(AzureRMModuleBase):
+class AzureRMDscNodeConfigurationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -162,14 +190,18 @@ class AzureRMDscNodeConfigurationFacts(AzureRMModuleBase):
         self.top = None
         self.inlinecount = None
         self.name = None
-        super(AzureRMDscNodeConfigurationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMDscNodeConfigurationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AutomationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.automation.AutomationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['dsc_node_configuration'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['dsc_node_configuration'] = self.get()
         else:
@@ -182,12 +214,12 @@ class AzureRMDscNodeConfigurationFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.dsc_node_configuration.list_by_automation_account(resource_group_name=self.resource_group,
                                                                                           automation_account_name=self.automation_account_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Dsc Node Configuration.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -199,7 +231,7 @@ class AzureRMDscNodeConfigurationFacts(AzureRMModuleBase):
             response = self.mgmt_client.dsc_node_configuration.get(resource_group_name=self.resource_group,
                                                                    automation_account_name=self.automation_account_name,
                                                                    node_configuration_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Dsc Node Configuration.')
 
@@ -208,6 +240,14 @@ class AzureRMDscNodeConfigurationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.dsc_node_configuration, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
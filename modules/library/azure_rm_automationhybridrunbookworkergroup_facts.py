@@ -36,6 +36,29 @@ options:
     filter:
         description:
             - The filter to apply on the operation.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -91,20 +114,25 @@ hybrid_runbook_worker_group:
                     returned: always
                     type: str
                     sample: myRunAsCredentialName
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.automation import AutomationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMHybridRunbookWorkerGroupFacts(AzureRMModuleBase):
+class AzureRMHybridRunbookWorkerGroupFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -132,14 +160,18 @@ class AzureRMHybridRunbookWorkerGroupFacts(AzureRMModuleBase):
         self.automation_account_name = None
         self.name = None
         self.filter = None
-        super(AzureRMHybridRunbookWorkerGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMHybridRunbookWorkerGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AutomationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.automation.AutomationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['hybrid_runbook_worker_group'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['hybrid_runbook_worker_group'] = self.get()
         else:
@@ -153,7 +185,7 @@ class AzureRMHybridRunbookWorkerGroupFacts(AzureRMModuleBase):
             response = self.mgmt_client.hybrid_runbook_worker_group.get(resource_group_name=self.resource_group,
                                                                         automation_account_name=self.automation_account_name,
                                                                         hybrid_runbook_worker_group_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Hybrid Runbook Worker Group.')
 
@@ -162,18 +194,26 @@ class AzureRMHybridRunbookWorkerGroupFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.hybrid_runbook_worker_group, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_automation_account(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.hybrid_runbook_worker_group.list_by_automation_account(resource_group_name=self.resource_group,
                                                                                                automation_account_name=self.automation_account_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Hybrid Runbook Worker Group.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -34,6 +34,16 @@ options:
         description:
             - The type of counts to retrieve
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -66,18 +76,17 @@ node_count_information:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.automation import AutomationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMNodeCountInformationFacts(AzureRMModuleBase):
+class AzureRMNodeCountInformationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -102,14 +111,18 @@ class AzureRMNodeCountInformationFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.self.config.count_type = None
-        super(AzureRMNodeCountInformationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMNodeCountInformationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AutomationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.automation.AutomationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['node_count_information'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['node_count_information'] = self.get()
         return self.results
 
@@ -120,7 +133,7 @@ class AzureRMNodeCountInformationFacts(AzureRMModuleBase):
             response = self.mgmt_client.node_count_information.get(resource_group_name=self.resource_group,
                                                                    automation_account_name=self.name,
                                                                    self.config.count_type=self.self.config.count_type)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Node Count Information.')
 
@@ -129,6 +142,14 @@ class AzureRMNodeCountInformationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.node_count_information, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
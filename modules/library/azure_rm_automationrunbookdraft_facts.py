@@ -34,6 +34,16 @@ options:
         description:
             - The runbook name.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -65,18 +75,17 @@ runbook_draft:
             sample: {}
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.automation import AutomationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMRunbookDraftFacts(AzureRMModuleBase):
+class AzureRMRunbookDraftFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -101,14 +110,18 @@ class AzureRMRunbookDraftFacts(AzureRMModuleBase):
         self.resource_group = None
         self.automation_account_name = None
         self.name = None
-        super(AzureRMRunbookDraftFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMRunbookDraftFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AutomationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.automation.AutomationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['runbook_draft'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['runbook_draft'] = self.get()
         return self.results
 
@@ -119,7 +132,7 @@ class AzureRMRunbookDraftFacts(AzureRMModuleBase):
             response = self.mgmt_client.runbook_draft.get(resource_group_name=self.resource_group,
                                                           automation_account_name=self.automation_account_name,
                                                           runbook_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Runbook Draft.')
 
@@ -128,6 +141,14 @@ class AzureRMRunbookDraftFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.runbook_draft, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
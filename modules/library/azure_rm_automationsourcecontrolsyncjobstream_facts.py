@@ -44,6 +44,29 @@ options:
     stream_id:
         description:
             - The id of the sync job stream.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -104,20 +127,25 @@ source_control_sync_job_streams:
             type: complex
             sample: "{\n  'Exception': {\n    'Message': 'System.Management.Automation.ParameterBindingValidationException: Cannot validate argument on
                      parameter 'Location'. The argument is null or empty . . .} }'\n  }\n}"
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.automation import AutomationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMSourceControlSyncJobStreamFacts(AzureRMModuleBase):
+class AzureRMSourceControlSyncJobStreamFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -155,14 +183,18 @@ class AzureRMSourceControlSyncJobStreamFacts(AzureRMModuleBase):
         self.source_control_sync_job_id = None
         self.filter = None
         self.stream_id = None
-        super(AzureRMSourceControlSyncJobStreamFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMSourceControlSyncJobStreamFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AutomationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.automation.AutomationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['source_control_sync_job_streams'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.stream_id is not None:
             self.results['source_control_sync_job_streams'] = self.get()
         else:
@@ -177,12 +209,12 @@ class AzureRMSourceControlSyncJobStreamFacts(AzureRMModuleBase):
                                                                                          automation_account_name=self.automation_account_name,
                                                                                          source_control_name=self.name,
                                                                                          source_control_sync_job_id=self.source_control_sync_job_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Source Control Sync Job Stream.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -196,7 +228,7 @@ class AzureRMSourceControlSyncJobStreamFacts(AzureRMModuleBase):
                                                                             source_control_name=self.name,
                                                                             source_control_sync_job_id=self.source_control_sync_job_id,
                                                                             stream_id=self.stream_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Source Control Sync Job Stream.')
 
@@ -205,6 +237,14 @@ class AzureRMSourceControlSyncJobStreamFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.source_control_sync_job_streams, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -37,6 +37,34 @@ options:
     tenant_id:
         description:
             - Tenant Id.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Customer Subscription.
@@ -70,17 +98,20 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.azurestack import AzureStackManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -91,7 +122,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMCustomerSubscription(AzureRMModuleBase):
+class AzureRMCustomerSubscription(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Customer Subscription resource"""
 
     def __init__(self):
@@ -144,10 +175,10 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(AzureStackManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.azurestack.AzureStackManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        old_response = self.get_customersubscription()
+        old_response = self.cached_get(self.get_customersubscription)
 
         if not old_response:
             self.log("Customer Subscription instance doesn't exist")
@@ -160,7 +191,7 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.customer_creation_parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.customer_creation_parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -168,6 +199,7 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.customer_creation_parameters, old_response)
                 return self.results
 
             response = self.create_update_customersubscription()
@@ -179,12 +211,11 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_customersubscription()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_customersubscription()
+            self.wait_for_delete(response, self.get_customersubscription, 'Customer Subscription')
         else:
             self.log("Customer Subscription instance unchanged")
             self.results['changed'] = False
@@ -202,7 +233,7 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
 
         :return: deserialized Customer Subscription instance state dictionary
         '''
-        self.log("Creating / Updating the Customer Subscription instance {0}".format(self.name))
+        self.log("Creating / Updating the Customer Subscription instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -224,9 +255,9 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
         '''
         Deletes specified Customer Subscription instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Customer Subscription instance {0}".format(self.name))
+        self.log("Deleting the Customer Subscription instance {0}", self.name)
         try:
             response = self.mgmt_client.customer_subscriptions.delete(resource_group=self.resource_group,
                                                                       registration_name=self.registration_name,
@@ -235,7 +266,7 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
             self.log('Error attempting to delete the Customer Subscription instance.')
             self.fail("Error deleting the Customer Subscription instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_customersubscription(self):
         '''
@@ -243,15 +274,15 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
 
         :return: deserialized Customer Subscription instance state dictionary
         '''
-        self.log("Checking if the Customer Subscription instance {0} is present".format(self.name))
+        self.log("Checking if the Customer Subscription instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.customer_subscriptions.get(resource_group=self.resource_group,
                                                                    registration_name=self.registration_name,
                                                                    customer_subscription_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Customer Subscription instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Customer Subscription instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Customer Subscription instance.')
         if found is True:
@@ -260,49 +291,6 @@ class AzureRMCustomerSubscription(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMCustomerSubscription()
@@ -34,6 +34,16 @@ options:
         description:
             - Name of the product.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -72,18 +82,17 @@ customer_subscriptions:
             sample: testregistration/E09A4E93-29A7-4EBA-A6D4-76202383F07F
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.azurestack import AzureStackManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMCustomerSubscriptionFacts(AzureRMModuleBase):
+class AzureRMCustomerSubscriptionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -108,14 +117,18 @@ class AzureRMCustomerSubscriptionFacts(AzureRMModuleBase):
         self.resource_group = None
         self.registration_name = None
         self.name = None
-        super(AzureRMCustomerSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMCustomerSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureStackManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.azurestack.AzureStackManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['customer_subscriptions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['customer_subscriptions'] = self.get()
         return self.results
 
@@ -126,7 +139,7 @@ class AzureRMCustomerSubscriptionFacts(AzureRMModuleBase):
             response = self.mgmt_client.customer_subscriptions.get(resource_group=self.resource_group,
                                                                    registration_name=self.registration_name,
                                                                    customer_subscription_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Customer Subscription.')
 
@@ -135,6 +148,14 @@ class AzureRMCustomerSubscriptionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.customer_subscriptions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -34,6 +34,16 @@ options:
         description:
             - Name of the product.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -84,18 +94,17 @@ products:
             sample: sku
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.azurestack import AzureStackManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMProductFacts(AzureRMModuleBase):
+class AzureRMProductFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -120,14 +129,18 @@ class AzureRMProductFacts(AzureRMModuleBase):
         self.resource_group = None
         self.registration_name = None
         self.name = None
-        super(AzureRMProductFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMProductFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureStackManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.azurestack.AzureStackManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['products'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['products'] = self.get()
         return self.results
 
@@ -138,7 +151,7 @@ class AzureRMProductFacts(AzureRMModuleBase):
             response = self.mgmt_client.products.get(resource_group=self.resource_group,
                                                      registration_name=self.registration_name,
                                                      product_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Product.')
 
@@ -147,6 +160,14 @@ class AzureRMProductFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.products, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -33,6 +33,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -87,18 +97,17 @@ registrations:
             sample: 0d00527e-0000-0000-0000-5a81ebdf0000
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.azurestack import AzureStackManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMRegistrationFacts(AzureRMModuleBase):
+class AzureRMRegistrationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -122,14 +131,18 @@ class AzureRMRegistrationFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.tags = None
-        super(AzureRMRegistrationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMRegistrationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureStackManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.azurestack.AzureStackManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['registrations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['registrations'] = self.get()
         return self.results
 
@@ -139,7 +152,7 @@ class AzureRMRegistrationFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.registrations.get(resource_group=self.resource_group,
                                                           registration_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Registration.')
 
@@ -148,6 +161,14 @@ class AzureRMRegistrationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.registrations, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -81,6 +81,34 @@ options:
                 description:
                     - The ID of the resource
                     - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the File Server.
@@ -123,17 +151,21 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.batchai import BatchAIManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -144,7 +176,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMFileServer(AzureRMModuleBase):
+class AzureRMFileServer(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM File Server resource"""
 
     def __init__(self):
@@ -239,21 +271,18 @@ class AzureRMFileServer(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['data_disks', 'storage_account_type'], True)
-        dict_map(self.parameters, ['data_disks', 'storage_account_type'], {'standard_lrs': 'Standard_LRS', 'premium_lrs': 'Premium_LRS'})
-        dict_resource_id(self.parameters, ['subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform = DictTransform()
+        transform.camelize(['data_disks', 'storage_account_type'], True)
+        transform.map(['data_disks', 'storage_account_type'], {'standard_lrs': 'Standard_LRS', 'premium_lrs': 'Premium_LRS'})
+        transform.resource_id(['subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(BatchAIManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.batchai.BatchAIManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_fileserver()
+        old_response = self.cached_get(self.get_fileserver)
 
         if not old_response:
             self.log("File Server instance doesn't exist")
@@ -266,14 +295,16 @@ class AzureRMFileServer(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the File Server instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_fileserver()
@@ -285,12 +316,11 @@ class AzureRMFileServer(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_fileserver()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_fileserver()
+            self.wait_for_delete(response, self.get_fileserver, 'File Server')
         else:
             self.log("File Server instance unchanged")
             self.results['changed'] = False
@@ -308,7 +338,7 @@ class AzureRMFileServer(AzureRMModuleBase):
 
         :return: deserialized File Server instance state dictionary
         '''
-        self.log("Creating / Updating the File Server instance {0}".format(self.name))
+        self.log("Creating / Updating the File Server instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -329,9 +359,9 @@ class AzureRMFileServer(AzureRMModuleBase):
         '''
         Deletes specified File Server instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the File Server instance {0}".format(self.name))
+        self.log("Deleting the File Server instance {0}", self.name)
         try:
             response = self.mgmt_client.file_servers.delete(resource_group_name=self.resource_group,
                                                             file_server_name=self.name)
@@ -339,7 +369,7 @@ class AzureRMFileServer(AzureRMModuleBase):
             self.log('Error attempting to delete the File Server instance.')
             self.fail("Error deleting the File Server instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_fileserver(self):
         '''
@@ -347,14 +377,14 @@ class AzureRMFileServer(AzureRMModuleBase):
 
         :return: deserialized File Server instance state dictionary
         '''
-        self.log("Checking if the File Server instance {0} is present".format(self.name))
+        self.log("Checking if the File Server instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.file_servers.get(resource_group_name=self.resource_group,
                                                          file_server_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("File Server instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("File Server instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the File Server instance.')
         if found is True:
@@ -363,100 +393,6 @@ class AzureRMFileServer(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMFileServer()
@@ -34,6 +34,16 @@ options:
         description:
             - The ID of the application.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -65,18 +75,17 @@ application:
             sample: id
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.batch import BatchManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMApplicationFacts(AzureRMModuleBase):
+class AzureRMApplicationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -101,14 +110,18 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.application_id = None
-        super(AzureRMApplicationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMApplicationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(BatchManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.batch.BatchManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['application'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['application'] = self.get()
         return self.results
 
@@ -119,7 +132,7 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
             response = self.mgmt_client.application.get(resource_group_name=self.resource_group,
                                                         account_name=self.name,
                                                         application_id=self.application_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Application.')
 
@@ -128,6 +141,14 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.application, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -481,6 +481,34 @@ options:
     if_none_match:
         description:
             - "Set to '*' to allow a new pool to be created, but to prevent updating an existing pool. Other values will be ignored."
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Pool.
@@ -523,17 +551,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/default-azurebatch-japaneast/providers/Microsoft.Batch/batchAccounts/sampleacct/pools/testpool
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.batch import BatchManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -544,7 +576,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMPool(AzureRMModuleBase):
+class AzureRMPool(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Pool resource"""
 
     def __init__(self):
@@ -937,31 +969,31 @@ class AzureRMPool(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_resource_id(self.parameters, ['deployment_configuration', 'virtual_machine_configuration', 'image_reference', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['deployment_configuration', 'virtual_machine_configuration', 'os_disk', 'caching'], True)
-        dict_camelize(self.parameters, ['deployment_configuration', 'virtual_machine_configuration', 'data_disks', 'caching'], True)
-        dict_camelize(self.parameters, ['deployment_configuration', 'virtual_machine_configuration', 'data_disks', 'storage_account_type'], True)
-        dict_map(self.parameters, ['deployment_configuration', 'virtual_machine_configuration', 'data_disks', 'storage_account_type'], {'standard_lrs': 'Standard_LRS', 'premium_lrs': 'Premium_LRS'})
-        dict_camelize(self.parameters, ['scale_settings', 'fixed_scale', 'node_deallocation_option'], True)
-        dict_map(self.parameters, ['inter_node_communication'], {True: 'Enabled', False: 'Disabled'})
-        dict_upper(self.parameters, ['network_configuration', 'endpoint_configuration', 'inbound_nat_pools', 'protocol'])
-        dict_camelize(self.parameters, ['network_configuration', 'endpoint_configuration', 'inbound_nat_pools', 'network_security_group_rules', 'access'], True)
-        dict_camelize(self.parameters, ['task_scheduling_policy', 'node_fill_type'], True)
-        dict_camelize(self.parameters, ['user_accounts', 'elevation_level'], True)
-        dict_camelize(self.parameters, ['start_task', 'user_identity', 'auto_user', 'scope'], True)
-        dict_camelize(self.parameters, ['start_task', 'user_identity', 'auto_user', 'elevation_level'], True)
-        dict_resource_id(self.parameters, ['certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['certificates', 'store_location'], True)
-        dict_resource_id(self.parameters, ['application_packages', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform = DictTransform()
+        transform.resource_id(['deployment_configuration', 'virtual_machine_configuration', 'image_reference', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['deployment_configuration', 'virtual_machine_configuration', 'os_disk', 'caching'], True)
+        transform.camelize(['deployment_configuration', 'virtual_machine_configuration', 'data_disks', 'caching'], True)
+        transform.camelize(['deployment_configuration', 'virtual_machine_configuration', 'data_disks', 'storage_account_type'], True)
+        transform.map(['deployment_configuration', 'virtual_machine_configuration', 'data_disks', 'storage_account_type'], {'standard_lrs': 'Standard_LRS', 'premium_lrs': 'Premium_LRS'})
+        transform.camelize(['scale_settings', 'fixed_scale', 'node_deallocation_option'], True)
+        transform.map(['inter_node_communication'], {True: 'Enabled', False: 'Disabled'})
+        transform.upper(['network_configuration', 'endpoint_configuration', 'inbound_nat_pools', 'protocol'])
+        transform.camelize(['network_configuration', 'endpoint_configuration', 'inbound_nat_pools', 'network_security_group_rules', 'access'], True)
+        transform.camelize(['task_scheduling_policy', 'node_fill_type'], True)
+        transform.camelize(['user_accounts', 'elevation_level'], True)
+        transform.camelize(['start_task', 'user_identity', 'auto_user', 'scope'], True)
+        transform.camelize(['start_task', 'user_identity', 'auto_user', 'elevation_level'], True)
+        transform.resource_id(['certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['certificates', 'store_location'], True)
+        transform.resource_id(['application_packages', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(BatchManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.batch.BatchManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_pool()
+        old_response = self.cached_get(self.get_pool)
 
         if not old_response:
             self.log("Pool instance doesn't exist")
@@ -974,7 +1006,7 @@ class AzureRMPool(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -982,6 +1014,7 @@ class AzureRMPool(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_pool()
@@ -993,12 +1026,11 @@ class AzureRMPool(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_pool()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_pool()
+            self.wait_for_delete(response, self.get_pool, 'Pool')
         else:
             self.log("Pool instance unchanged")
             self.results['changed'] = False
@@ -1016,7 +1048,7 @@ class AzureRMPool(AzureRMModuleBase):
 
         :return: deserialized Pool instance state dictionary
         '''
-        self.log("Creating / Updating the Pool instance {0}".format(self.name))
+        self.log("Creating / Updating the Pool instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -1041,9 +1073,9 @@ class AzureRMPool(AzureRMModuleBase):
         '''
         Deletes specified Pool instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Pool instance {0}".format(self.name))
+        self.log("Deleting the Pool instance {0}", self.name)
         try:
             response = self.mgmt_client.pool.delete(resource_group_name=self.resource_group,
                                                     account_name=self.account_name,
@@ -1052,7 +1084,7 @@ class AzureRMPool(AzureRMModuleBase):
             self.log('Error attempting to delete the Pool instance.')
             self.fail("Error deleting the Pool instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_pool(self):
         '''
@@ -1060,15 +1092,15 @@ class AzureRMPool(AzureRMModuleBase):
 
         :return: deserialized Pool instance state dictionary
         '''
-        self.log("Checking if the Pool instance {0} is present".format(self.name))
+        self.log("Checking if the Pool instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.pool.get(resource_group_name=self.resource_group,
                                                  account_name=self.account_name,
                                                  pool_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Pool instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Pool instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Pool instance.')
         if found is True:
@@ -1077,115 +1109,6 @@ class AzureRMPool(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_upper(d, path):
-   if isinstance(d, list):
-        for i in range(len(d)):
-            dict_upper(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = old_value.upper()
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_upper(sd, path[1:])
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMPool()
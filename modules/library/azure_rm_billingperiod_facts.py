@@ -26,6 +26,16 @@ options:
         description:
             - The name of a BillingPeriod resource.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -61,18 +71,17 @@ billing_periods:
             sample: 201702-1
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.billing import BillingManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBillingPeriodFacts(AzureRMModuleBase):
+class AzureRMBillingPeriodFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -87,14 +96,18 @@ class AzureRMBillingPeriodFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.name = None
-        super(AzureRMBillingPeriodFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBillingPeriodFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(BillingManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.billing.BillingManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['billing_periods'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['billing_periods'] = self.get()
         return self.results
 
@@ -103,7 +116,7 @@ class AzureRMBillingPeriodFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.billing_periods.get(billing_period_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Billing Period.')
 
@@ -112,6 +125,14 @@ class AzureRMBillingPeriodFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.billing_periods, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -30,6 +30,16 @@ options:
         description:
             - name of the blueprint.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -88,18 +98,17 @@ blueprints:
                      subscription along with blueprint assignment.'\n    }\n  }\n}"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.blueprint import BlueprintManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBlueprintFacts(AzureRMModuleBase):
+class AzureRMBlueprintFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -119,14 +128,18 @@ class AzureRMBlueprintFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.management_group_name = None
         self.name = None
-        super(AzureRMBlueprintFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBlueprintFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(BlueprintManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.blueprint.BlueprintManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['blueprints'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['blueprints'] = self.get()
         return self.results
 
@@ -136,7 +149,7 @@ class AzureRMBlueprintFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.blueprints.get(management_group_name=self.management_group_name,
                                                        blueprint_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Blueprint.')
 
@@ -145,6 +158,14 @@ class AzureRMBlueprintFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.blueprints, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -38,6 +38,16 @@ options:
         description:
             - name of the artifact.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -83,18 +93,17 @@ published_artifacts:
             sample: template
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.blueprint import BlueprintManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMPublishedArtifactFacts(AzureRMModuleBase):
+class AzureRMPublishedArtifactFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -124,14 +133,18 @@ class AzureRMPublishedArtifactFacts(AzureRMModuleBase):
         self.blueprint_name = None
         self.version_id = None
         self.name = None
-        super(AzureRMPublishedArtifactFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMPublishedArtifactFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(BlueprintManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.blueprint.BlueprintManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['published_artifacts'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['published_artifacts'] = self.get()
         return self.results
 
@@ -143,7 +156,7 @@ class AzureRMPublishedArtifactFacts(AzureRMModuleBase):
                                                                 blueprint_name=self.blueprint_name,
                                                                 version_id=self.version_id,
                                                                 artifact_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Published Artifact.')
 
@@ -152,6 +165,14 @@ class AzureRMPublishedArtifactFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.published_artifacts, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -20,6 +20,8 @@ version_added: "2.8"
 short_description: Get Azure Rate Card facts.
 description:
     - Get facts of Azure Rate Card.
+    - With I(output_file), the meters of the rate card are written to a file instead of being returned. The rate card
+      is a single response, it is read and its meters are written one at a time.
 
 options:
     filter:
@@ -27,6 +29,32 @@ options:
             - "The filter to apply on the operation. It ONLY supports the 'eq' and 'and' logical operators at this time. All the 4 query parameters
                'OfferDurableId',  'Currency', 'Locale', 'Region' are required to be a part of the $filter."
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    output_file:
+        description:
+            - Write the meters to this file as they are read instead of returning them; only I(output_file), I(count)
+              and I(bytes) are returned.
+            - The file is replaced when the module ends.
+        type: path
+    output_format:
+        description:
+            - Format of I(output_file), one JSON document per line, CSV or Parquet.
+            - CSV and Parquet have a column per attribute of the model of the first instance, or per attribute in
+              I(select). Nested values are written as JSON. Parquet needs the C(pyarrow) Python package.
+        default: ndjson
+        choices:
+            - ndjson
+            - csv
+            - parquet
 
 extends_documentation_fragment:
     - azure
@@ -40,28 +68,48 @@ EXAMPLES = '''
   - name: Get instance of Rate Card
     azure_rm_commerceratecard_facts:
       filter: filter
+
+  - name: Write the meters of a rate card to a file
+    azure_rm_commerceratecard_facts:
+      filter: "OfferDurableId eq 'MS-AZR-0003P' and Currency eq 'USD' and Locale eq 'en-US' and RegionInfo eq 'US'"
+      output_file: /tmp/ratecard.ndjson
 '''
 
 RETURN = '''
+output_file:
+    description:
+        - Path of the file the meters were written to.
+    returned: when I(output_file) was given
+    type: str
+count:
+    description:
+        - Number of meters written to I(output_file).
+    returned: when I(output_file) was given
+    type: int
+bytes:
+    description:
+        - Size of I(output_file).
+    returned: when I(output_file) was given
+    type: int
 rate_card:
     description: A list of dictionaries containing facts for Rate Card.
-    returned: always
+    returned: when I(output_file) was not given
     type: complex
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
+from ansible.module_utils.azure_rm_sink import CHUNK_SIZE, json_array_items
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.commerce import UsageManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMRateCardFacts(AzureRMModuleBase):
+class AzureRMRateCardFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -76,14 +124,23 @@ class AzureRMRateCardFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.filter = None
-        super(AzureRMRateCardFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMRateCardFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True,
+                                                   supports_output=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(UsageManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.commerce.UsageManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['rate_card'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
+        if self.output_enabled():
+            self.write_meters()
+            return self.results
+
         self.results['rate_card'] = self.get()
         return self.results
 
@@ -92,7 +149,7 @@ class AzureRMRateCardFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.rate_card.get(filter=self.filter)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Rate Card.')
 
@@ -101,6 +158,35 @@ class AzureRMRateCardFacts(AzureRMModuleBase):
 
         return results
 
+    def write_meters(self):
+        '''
+        Write the meters of the rate card to output_file as the response arrives. The request of
+        rate_card.get is sent with a streamed body, and the meters are decoded one at a time instead of
+        the whole rate card being deserialized.
+        '''
+        operations = self.mgmt_client.rate_card
+        url = self.mgmt_client._client.format_url(operations.get.metadata['url'],
+                                                  subscriptionId=self.mgmt_client.config.subscription_id)
+        request = self.mgmt_client._client.get(url, {'$filter': self.filter, 'api-version': operations.api_version})
+        response = self.mgmt_client._client.send(request, stream=True)
+        try:
+            if response.status_code != 200:
+                self.fail("Error getting facts for Rate Card: {0}".format(str(CloudError(response))))
+            for meter in json_array_items(response.iter_content(CHUNK_SIZE), 'Meters'):
+                self.write_output(operations._deserialize('MeterInfo', meter))
+        except ValueError as e:
+            self.fail("Error reading Rate Card: {0}".format(str(e)))
+        finally:
+            response.close()
+
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.rate_card, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
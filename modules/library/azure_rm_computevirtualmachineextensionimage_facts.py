@@ -38,6 +38,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -76,18 +86,17 @@ virtual_machine_extension_images:
             sample: tags
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.compute import ComputeManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMVirtualMachineExtensionImageFacts(AzureRMModuleBase):
+class AzureRMVirtualMachineExtensionImageFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -121,14 +130,18 @@ class AzureRMVirtualMachineExtensionImageFacts(AzureRMModuleBase):
         self.type = None
         self.version = None
         self.tags = None
-        super(AzureRMVirtualMachineExtensionImageFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMVirtualMachineExtensionImageFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ComputeManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.compute.ComputeManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['virtual_machine_extension_images'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['virtual_machine_extension_images'] = self.get()
         return self.results
 
@@ -140,7 +153,7 @@ class AzureRMVirtualMachineExtensionImageFacts(AzureRMModuleBase):
                                                                              publisher_name=self.name,
                                                                              type=self.type,
                                                                              version=self.version)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Virtual Machine Extension Image.')
 
@@ -149,6 +162,14 @@ class AzureRMVirtualMachineExtensionImageFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.virtual_machine_extension_images, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
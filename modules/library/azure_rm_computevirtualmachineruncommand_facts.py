@@ -30,6 +30,16 @@ options:
         description:
             - The command id.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -86,18 +96,17 @@ virtual_machine_run_commands:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.compute import ComputeManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMVirtualMachineRunCommandFacts(AzureRMModuleBase):
+class AzureRMVirtualMachineRunCommandFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -117,14 +126,18 @@ class AzureRMVirtualMachineRunCommandFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.location = None
         self.command_id = None
-        super(AzureRMVirtualMachineRunCommandFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMVirtualMachineRunCommandFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ComputeManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.compute.ComputeManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['virtual_machine_run_commands'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['virtual_machine_run_commands'] = self.get()
         return self.results
 
@@ -134,7 +147,7 @@ class AzureRMVirtualMachineRunCommandFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.virtual_machine_run_commands.get(location=self.location,
                                                                          command_id=self.command_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Virtual Machine Run Command.')
 
@@ -143,6 +156,14 @@ class AzureRMVirtualMachineRunCommandFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.virtual_machine_run_commands, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
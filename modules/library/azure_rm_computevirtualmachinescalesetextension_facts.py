@@ -37,6 +37,16 @@ options:
     expand:
         description:
             - The expand expression to apply on the operation.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -69,18 +79,17 @@ virtual_machine_scale_set_extensions:
             sample: id
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.compute import ComputeManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMVirtualMachineScaleSetExtensionFacts(AzureRMModuleBase):
+class AzureRMVirtualMachineScaleSetExtensionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -109,14 +118,18 @@ class AzureRMVirtualMachineScaleSetExtensionFacts(AzureRMModuleBase):
         self.vm_scale_set_name = None
         self.name = None
         self.expand = None
-        super(AzureRMVirtualMachineScaleSetExtensionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMVirtualMachineScaleSetExtensionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ComputeManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.compute.ComputeManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['virtual_machine_scale_set_extensions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['virtual_machine_scale_set_extensions'] = self.get()
         return self.results
 
@@ -127,7 +140,7 @@ class AzureRMVirtualMachineScaleSetExtensionFacts(AzureRMModuleBase):
             response = self.mgmt_client.virtual_machine_scale_set_extensions.get(resource_group_name=self.resource_group,
                                                                                  vm_scale_set_name=self.vm_scale_set_name,
                                                                                  vmss_extension_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Virtual Machine Scale Set Extension.')
 
@@ -136,6 +149,14 @@ class AzureRMVirtualMachineScaleSetExtensionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.virtual_machine_scale_set_extensions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
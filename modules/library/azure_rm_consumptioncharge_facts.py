@@ -37,6 +37,24 @@ options:
     department_id:
         description:
             - Department ID
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -66,20 +84,25 @@ charges:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.consumption import ConsumptionManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMChargeFacts(AzureRMModuleBase):
+class AzureRMChargeFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -106,12 +129,12 @@ class AzureRMChargeFacts(AzureRMModuleBase):
         self.enrollment_account_id = None
         self.filter = None
         self.department_id = None
-        super(AzureRMChargeFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMChargeFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ConsumptionManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.consumption.ConsumptionManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.enrollment_account_id is not None:
@@ -126,12 +149,12 @@ class AzureRMChargeFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.charges.list_by_enrollment_account(billing_account_id=self.billing_account_id,
                                                                            enrollment_account_id=self.enrollment_account_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Charge.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -142,12 +165,12 @@ class AzureRMChargeFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.charges.list_by_department(billing_account_id=self.billing_account_id,
                                                                    department_id=self.department_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Charge.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -46,6 +46,24 @@ options:
     enrollment_account_id:
         description:
             - EnrollmentAccount ID
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -91,20 +109,25 @@ marketplaces:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.consumption import ConsumptionManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMMarketplaceFacts(AzureRMModuleBase):
+class AzureRMMarketplaceFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -142,12 +165,12 @@ class AzureRMMarketplaceFacts(AzureRMModuleBase):
         self.billing_account_id = None
         self.department_id = None
         self.enrollment_account_id = None
-        super(AzureRMMarketplaceFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMMarketplaceFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ConsumptionManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.consumption.ConsumptionManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.name is not None:
@@ -165,12 +188,12 @@ class AzureRMMarketplaceFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.marketplaces.list_by_billing_period(billing_period_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Marketplace.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -180,12 +203,12 @@ class AzureRMMarketplaceFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.marketplaces.list_by_billing_account(billing_account_id=self.billing_account_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Marketplace.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -195,12 +218,12 @@ class AzureRMMarketplaceFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.marketplaces.list_by_department(department_id=self.department_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Marketplace.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -210,12 +233,12 @@ class AzureRMMarketplaceFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.marketplaces.list_by_enrollment_account(enrollment_account_id=self.enrollment_account_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Marketplace.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -20,6 +20,7 @@ version_added: "2.8"
 short_description: Get Azure Price Sheet facts.
 description:
     - Get facts of Azure Price Sheet.
+    - With I(output_file), the entries of the price sheet are written to a file one response page at a time.
 
 options:
     expand:
@@ -35,6 +36,32 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    output_file:
+        description:
+            - Write the price sheet entries to this file as they are read instead of returning them; only I(output_file), I(count)
+              and I(bytes) are returned.
+            - The file is replaced when the module ends.
+        type: path
+    output_format:
+        description:
+            - Format of I(output_file), one JSON document per line, CSV or Parquet.
+            - CSV and Parquet have a column per attribute of the model of the first instance, or per attribute in
+              I(select). Nested values are written as JSON. Parquet needs the C(pyarrow) Python package.
+        default: ndjson
+        choices:
+            - ndjson
+            - csv
+            - parquet
 
 extends_documentation_fragment:
     - azure
@@ -50,12 +77,33 @@ EXAMPLES = '''
       expand: expand
       skiptoken: skiptoken
       top: top
+
+  - name: Write the price sheet entries to a CSV file
+    azure_rm_consumptionpricesheet_facts:
+      expand: properties/meterDetails
+      output_file: /tmp/pricesheet.csv
+      output_format: csv
 '''
 
 RETURN = '''
+output_file:
+    description:
+        - Path of the file the price sheet entries were written to.
+    returned: when I(output_file) was given
+    type: str
+count:
+    description:
+        - Number of price sheet entries written to I(output_file).
+    returned: when I(output_file) was given
+    type: int
+bytes:
+    description:
+        - Size of I(output_file).
+    returned: when I(output_file) was given
+    type: int
 price_sheet:
     description: A list of dictionaries containing facts for Price Sheet.
-    returned: always
+    returned: when I(output_file) was not given
     type: complex
     contains:
         id:
@@ -86,18 +134,18 @@ price_sheet:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlparse
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.consumption import ConsumptionManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMPriceSheetFacts(AzureRMModuleBase):
+class AzureRMPriceSheetFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -123,14 +171,23 @@ class AzureRMPriceSheetFacts(AzureRMModuleBase):
         self.skiptoken = None
         self.top = None
         self.tags = None
-        super(AzureRMPriceSheetFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMPriceSheetFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True,
+                                                     supports_output=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ConsumptionManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.consumption.ConsumptionManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['price_sheet'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
+        if self.output_enabled():
+            self.write_pages()
+            return self.results
+
         self.results['price_sheet'] = self.get()
         return self.results
 
@@ -139,7 +196,7 @@ class AzureRMPriceSheetFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.price_sheet.get()
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Price Sheet.')
 
@@ -148,6 +205,37 @@ class AzureRMPriceSheetFacts(AzureRMModuleBase):
 
         return results
 
+    def write_pages(self):
+        '''
+        Write the entries of the price sheet to output_file, following the $skiptoken of next_link
+        until the end of the price sheet, or until top entries were written.
+        '''
+        skiptoken = self.skiptoken
+        written = 0
+        while True:
+            try:
+                response = self.mgmt_client.price_sheet.get(expand=self.expand, skiptoken=skiptoken, top=self.top)
+                self.log("Response : {0}", response)
+            except CloudError as e:
+                self.fail("Error getting facts for Price Sheet: {0}".format(str(e)))
+
+            if not self.has_tags(response.tags, self.tags):
+                return
+            for entry in (response.pricesheets or [])[:None if self.top is None else self.top - written]:
+                self.write_output(entry)
+                written += 1
+            skiptoken = parse_qs(urlparse(response.next_link or '').query).get('$skiptoken', [None])[0]
+            if not skiptoken or (self.top is not None and written >= self.top):
+                return
+
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.price_sheet, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -36,6 +36,24 @@ options:
     filter:
         description:
             - "Required only for daily I(grain). The properties/UsageDate for start date and end date. The filter supports 'le' and  'ge'"
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -66,20 +84,25 @@ reservations_summaries:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.consumption import ConsumptionManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMReservationsSummaryFacts(AzureRMModuleBase):
+class AzureRMReservationsSummaryFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -107,12 +130,12 @@ class AzureRMReservationsSummaryFacts(AzureRMModuleBase):
         self.reservation_id = None
         self.grain = None
         self.filter = None
-        super(AzureRMReservationsSummaryFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMReservationsSummaryFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ConsumptionManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.consumption.ConsumptionManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.reservation_id is not None:
@@ -128,12 +151,12 @@ class AzureRMReservationsSummaryFacts(AzureRMModuleBase):
             response = self.mgmt_client.reservations_summaries.list_by_reservation_order_and_reservation(reservation_order_id=self.reservation_order_id,
                                                                                                          reservation_id=self.reservation_id,
                                                                                                          grain=self.grain)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Reservations Summary.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -144,12 +167,12 @@ class AzureRMReservationsSummaryFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.reservations_summaries.list_by_reservation_order(reservation_order_id=self.reservation_order_id,
                                                                                          grain=self.grain)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Reservations Summary.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -56,6 +56,40 @@ options:
     management_group_id:
         description:
             - Azure Management Group ID.
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
+    output_file:
+        description:
+            - Write the usage details to this file as they are read instead of returning them; only I(output_file), I(count)
+              and I(bytes) are returned.
+            - The file is replaced when the module ends.
+        type: path
+    output_format:
+        description:
+            - Format of I(output_file), one JSON document per line, CSV or Parquet.
+            - CSV and Parquet have a column per attribute of the model of the first instance, or per attribute in
+              I(select). Nested values are written as JSON. Parquet needs the C(pyarrow) Python package.
+        default: ndjson
+        choices:
+            - ndjson
+            - csv
+            - parquet
 
 extends_documentation_fragment:
     - azure
@@ -110,28 +144,54 @@ EXAMPLES = '''
       skiptoken: skiptoken
       top: top
       query_options: query_options
+
+  - name: Write the usage details of a billing period to a Parquet file
+    azure_rm_consumptionusagedetail_facts:
+      name: billing_period_name
+      output_file: /tmp/usage.parquet
+      output_format: parquet
 '''
 
 RETURN = '''
 usage_details:
-    description: A list of dictionaries containing facts for Usage Detail.
+    description: A list of dictionaries containing facts for Usage Detail, empty with I(output_file).
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
+output_file:
+    description:
+        - Path of the file the usage details were written to.
+    returned: when I(output_file) was given
+    type: str
+count:
+    description:
+        - Number of usage details written to I(output_file).
+    returned: when I(output_file) was given
+    type: int
+bytes:
+    description:
+        - Size of I(output_file).
+    returned: when I(output_file) was given
+    type: int
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.consumption import ConsumptionManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMUsageDetailFacts(AzureRMModuleBase):
+class AzureRMUsageDetailFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -181,12 +241,13 @@ class AzureRMUsageDetailFacts(AzureRMModuleBase):
         self.department_id = None
         self.enrollment_account_id = None
         self.management_group_id = None
-        super(AzureRMUsageDetailFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMUsageDetailFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True,
+                                                      supports_output=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ConsumptionManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.consumption.ConsumptionManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.name is not None:
@@ -206,12 +267,12 @@ class AzureRMUsageDetailFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.usage_details.list_by_billing_period(billing_period_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Usage Detail.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -221,12 +282,12 @@ class AzureRMUsageDetailFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.usage_details.list_by_billing_account(billing_account_id=self.billing_account_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Usage Detail.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -236,12 +297,12 @@ class AzureRMUsageDetailFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.usage_details.list_by_department(department_id=self.department_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Usage Detail.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -251,12 +312,12 @@ class AzureRMUsageDetailFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.usage_details.list_by_enrollment_account(enrollment_account_id=self.enrollment_account_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Usage Detail.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -266,12 +327,12 @@ class AzureRMUsageDetailFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.usage_details.list_by_management_group(management_group_id=self.management_group_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Usage Detail.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
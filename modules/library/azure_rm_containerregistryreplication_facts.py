@@ -37,6 +37,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -106,18 +116,17 @@ replications:
                     sample: "2017-03-01T23:15:37.0707808Z"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.containerregistry import ContainerRegistryManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMReplicationFacts(AzureRMModuleBase):
+class AzureRMReplicationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -146,14 +155,18 @@ class AzureRMReplicationFacts(AzureRMModuleBase):
         self.registry_name = None
         self.name = None
         self.tags = None
-        super(AzureRMReplicationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMReplicationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ContainerRegistryManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.containerregistry.ContainerRegistryManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['replications'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['replications'] = self.get()
         return self.results
 
@@ -164,7 +177,7 @@ class AzureRMReplicationFacts(AzureRMModuleBase):
             response = self.mgmt_client.replications.get(resource_group_name=self.resource_group,
                                                          registry_name=self.registry_name,
                                                          replication_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Replication.')
 
@@ -173,6 +186,14 @@ class AzureRMReplicationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.replications, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
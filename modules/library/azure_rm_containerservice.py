@@ -564,6 +564,34 @@ options:
                         description:
                             - Whether the VM diagnostic agent is provisioned on the VM.
                             - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Container Service.
@@ -597,17 +625,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid1/resourceGroups/rg1/providers/Microsoft.ContainerService/containerServices/acs1
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.containerservice import ContainerServiceClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -618,7 +650,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMContainerService(AzureRMModuleBase):
+class AzureRMContainerService(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Container Service resource"""
 
     def __init__(self):
@@ -1170,27 +1202,24 @@ class AzureRMContainerService(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['orchestrator_profile', 'orchestrator_type'], True)
-        dict_map(self.parameters, ['orchestrator_profile', 'orchestrator_type'], {'dcos': 'DCOS', 'docker_ce': 'DockerCE'})
-        dict_camelize(self.parameters, ['master_profile', 'vm_size'], True)
-        dict_map(self.parameters, ['master_profile', 'vm_size'], {'standard_a1': 'Standard_A1', 'standard_a10': 'Standard_A10', 'standard_a11': 'Standard_A11', 'standard_a1_v2': 'Standard_A1_v2', 'standard_a2': 'Standard_A2', 'standard_a2_v2': 'Standard_A2_v2', 'standard_a2m_v2': 'Standard_A2m_v2', 'standard_a3': 'Standard_A3', 'standard_a4': 'Standard_A4', 'standard_a4_v2': 'Standard_A4_v2', 'standard_a4m_v2': 'Standard_A4m_v2', 'standard_a5': 'Standard_A5', 'standard_a6': 'Standard_A6', 'standard_a7': 'Standard_A7', 'standard_a8': 'Standard_A8', 'standard_a8_v2': 'Standard_A8_v2', 'standard_a8m_v2': 'Standard_A8m_v2', 'standard_a9': 'Standard_A9', 'standard_b2ms': 'Standard_B2ms', 'standard_b2s': 'Standard_B2s', 'standard_b4ms': 'Standard_B4ms', 'standard_b8ms': 'Standard_B8ms', 'standard_d1': 'Standard_D1', 'standard_d11': 'Standard_D11', 'standard_d11_v2': 'Standard_D11_v2', 'standard_d11_v2_promo': 'Standard_D11_v2_Promo', 'standard_d12': 'Standard_D12', 'standard_d12_v2': 'Standard_D12_v2', 'standard_d12_v2_promo': 'Standard_D12_v2_Promo', 'standard_d13': 'Standard_D13', 'standard_d13_v2': 'Standard_D13_v2', 'standard_d13_v2_promo': 'Standard_D13_v2_Promo', 'standard_d14': 'Standard_D14', 'standard_d14_v2': 'Standard_D14_v2', 'standard_d14_v2_promo': 'Standard_D14_v2_Promo', 'standard_d15_v2': 'Standard_D15_v2', 'standard_d16_v3': 'Standard_D16_v3', 'standard_d16s_v3': 'Standard_D16s_v3', 'standard_d1_v2': 'Standard_D1_v2', 'standard_d2': 'Standard_D2', 'standard_d2_v2': 'Standard_D2_v2', 'standard_d2_v2_promo': 'Standard_D2_v2_Promo', 'standard_d2_v3': 'Standard_D2_v3', 'standard_d2s_v3': 'Standard_D2s_v3', 'standard_d3': 'Standard_D3', 'standard_d32_v3': 'Standard_D32_v3', 'standard_d32s_v3': 'Standard_D32s_v3', 'standard_d3_v2': 'Standard_D3_v2', 'standard_d3_v2_promo': 'Standard_D3_v2_Promo', 'standard_d4': 'Standard_D4', 'standard_d4_v2': 'Standard_D4_v2', 'standard_d4_v2_promo': 'Standard_D4_v2_Promo', 'standard_d4_v3': 'Standard_D4_v3', 'standard_d4s_v3': 'Standard_D4s_v3', 'standard_d5_v2': 'Standard_D5_v2', 'standard_d5_v2_promo': 'Standard_D5_v2_Promo', 'standard_d64_v3': 'Standard_D64_v3', 'standard_d64s_v3': 'Standard_D64s_v3', 'standard_d8_v3': 'Standard_D8_v3', 'standard_d8s_v3': 'Standard_D8s_v3', 'standard_ds1': 'Standard_DS1', 'standard_ds11': 'Standard_DS11', 'standard_ds11_v2': 'Standard_DS11_v2', 'standard_ds11_v2_promo': 'Standard_DS11_v2_Promo', 'standard_ds12': 'Standard_DS12', 'standard_ds12_v2': 'Standard_DS12_v2', 'standard_ds12_v2_promo': 'Standard_DS12_v2_Promo', 'standard_ds13': 'Standard_DS13', 'standard_ds13-2_v2': 'Standard_DS13-2_v2', 'standard_ds13-4_v2': 'Standard_DS13-4_v2', 'standard_ds13_v2': 'Standard_DS13_v2', 'standard_ds13_v2_promo': 'Standard_DS13_v2_Promo', 'standard_ds14': 'Standard_DS14', 'standard_ds14-4_v2': 'Standard_DS14-4_v2', 'standard_ds14-8_v2': 'Standard_DS14-8_v2', 'standard_ds14_v2': 'Standard_DS14_v2', 'standard_ds14_v2_promo': 'Standard_DS14_v2_Promo', 'standard_ds15_v2': 'Standard_DS15_v2', 'standard_ds1_v2': 'Standard_DS1_v2', 'standard_ds2': 'Standard_DS2', 'standard_ds2_v2': 'Standard_DS2_v2', 'standard_ds2_v2_promo': 'Standard_DS2_v2_Promo', 'standard_ds3': 'Standard_DS3', 'standard_ds3_v2': 'Standard_DS3_v2', 'standard_ds3_v2_promo': 'Standard_DS3_v2_Promo', 'standard_ds4': 'Standard_DS4', 'standard_ds4_v2': 'Standard_DS4_v2', 'standard_ds4_v2_promo': 'Standard_DS4_v2_Promo', 'standard_ds5_v2': 'Standard_DS5_v2', 'standard_ds5_v2_promo': 'Standard_DS5_v2_Promo', 'standard_e16_v3': 'Standard_E16_v3', 'standard_e16s_v3': 'Standard_E16s_v3', 'standard_e2_v3': 'Standard_E2_v3', 'standard_e2s_v3': 'Standard_E2s_v3', 'standard_e32-16s_v3': 'Standard_E32-16s_v3', 'standard_e32-8s_v3': 'Standard_E32-8s_v3', 'standard_e32_v3': 'Standard_E32_v3', 'standard_e32s_v3': 'Standard_E32s_v3', 'standard_e4_v3': 'Standard_E4_v3', 'standard_e4s_v3': 'Standard_E4s_v3', 'standard_e64-16s_v3': 'Standard_E64-16s_v3', 'standard_e64-32s_v3': 'Standard_E64-32s_v3', 'standard_e64_v3': 'Standard_E64_v3', 'standard_e64s_v3': 'Standard_E64s_v3', 'standard_e8_v3': 'Standard_E8_v3', 'standard_e8s_v3': 'Standard_E8s_v3', 'standard_f1': 'Standard_F1', 'standard_f16': 'Standard_F16', 'standard_f16s': 'Standard_F16s', 'standard_f16s_v2': 'Standard_F16s_v2', 'standard_f1s': 'Standard_F1s', 'standard_f2': 'Standard_F2', 'standard_f2s': 'Standard_F2s', 'standard_f2s_v2': 'Standard_F2s_v2', 'standard_f32s_v2': 'Standard_F32s_v2', 'standard_f4': 'Standard_F4', 'standard_f4s': 'Standard_F4s', 'standard_f4s_v2': 'Standard_F4s_v2', 'standard_f64s_v2': 'Standard_F64s_v2', 'standard_f72s_v2': 'Standard_F72s_v2', 'standard_f8': 'Standard_F8', 'standard_f8s': 'Standard_F8s', 'standard_f8s_v2': 'Standard_F8s_v2', 'standard_g1': 'Standard_G1', 'standard_g2': 'Standard_G2', 'standard_g3': 'Standard_G3', 'standard_g4': 'Standard_G4', 'standard_g5': 'Standard_G5', 'standard_gs1': 'Standard_GS1', 'standard_gs2': 'Standard_GS2', 'standard_gs3': 'Standard_GS3', 'standard_gs4': 'Standard_GS4', 'standard_gs4-4': 'Standard_GS4-4', 'standard_gs4-8': 'Standard_GS4-8', 'standard_gs5': 'Standard_GS5', 'standard_gs5-16': 'Standard_GS5-16', 'standard_gs5-8': 'Standard_GS5-8', 'standard_h16': 'Standard_H16', 'standard_h16m': 'Standard_H16m', 'standard_h16mr': 'Standard_H16mr', 'standard_h16r': 'Standard_H16r', 'standard_h8': 'Standard_H8', 'standard_h8m': 'Standard_H8m', 'standard_l16s': 'Standard_L16s', 'standard_l32s': 'Standard_L32s', 'standard_l4s': 'Standard_L4s', 'standard_l8s': 'Standard_L8s', 'standard_m128-32ms': 'Standard_M128-32ms', 'standard_m128-64ms': 'Standard_M128-64ms', 'standard_m128ms': 'Standard_M128ms', 'standard_m128s': 'Standard_M128s', 'standard_m64-16ms': 'Standard_M64-16ms', 'standard_m64-32ms': 'Standard_M64-32ms', 'standard_m64ms': 'Standard_M64ms', 'standard_m64s': 'Standard_M64s', 'standard_nc12': 'Standard_NC12', 'standard_nc12s_v2': 'Standard_NC12s_v2', 'standard_nc12s_v3': 'Standard_NC12s_v3', 'standard_nc24': 'Standard_NC24', 'standard_nc24r': 'Standard_NC24r', 'standard_nc24rs_v2': 'Standard_NC24rs_v2', 'standard_nc24rs_v3': 'Standard_NC24rs_v3', 'standard_nc24s_v2': 'Standard_NC24s_v2', 'standard_nc24s_v3': 'Standard_NC24s_v3', 'standard_nc6': 'Standard_NC6', 'standard_nc6s_v2': 'Standard_NC6s_v2', 'standard_nc6s_v3': 'Standard_NC6s_v3', 'standard_nd12s': 'Standard_ND12s', 'standard_nd24rs': 'Standard_ND24rs', 'standard_nd24s': 'Standard_ND24s', 'standard_nd6s': 'Standard_ND6s', 'standard_nv12': 'Standard_NV12', 'standard_nv24': 'Standard_NV24', 'standard_nv6': 'Standard_NV6'})
-        dict_camelize(self.parameters, ['master_profile', 'storage_profile'], True)
-        dict_camelize(self.parameters, ['agent_pool_profiles', 'vm_size'], True)
-        dict_map(self.parameters, ['agent_pool_profiles', 'vm_size'], {'standard_a1': 'Standard_A1', 'standard_a10': 'Standard_A10', 'standard_a11': 'Standard_A11', 'standard_a1_v2': 'Standard_A1_v2', 'standard_a2': 'Standard_A2', 'standard_a2_v2': 'Standard_A2_v2', 'standard_a2m_v2': 'Standard_A2m_v2', 'standard_a3': 'Standard_A3', 'standard_a4': 'Standard_A4', 'standard_a4_v2': 'Standard_A4_v2', 'standard_a4m_v2': 'Standard_A4m_v2', 'standard_a5': 'Standard_A5', 'standard_a6': 'Standard_A6', 'standard_a7': 'Standard_A7', 'standard_a8': 'Standard_A8', 'standard_a8_v2': 'Standard_A8_v2', 'standard_a8m_v2': 'Standard_A8m_v2', 'standard_a9': 'Standard_A9', 'standard_b2ms': 'Standard_B2ms', 'standard_b2s': 'Standard_B2s', 'standard_b4ms': 'Standard_B4ms', 'standard_b8ms': 'Standard_B8ms', 'standard_d1': 'Standard_D1', 'standard_d11': 'Standard_D11', 'standard_d11_v2': 'Standard_D11_v2', 'standard_d11_v2_promo': 'Standard_D11_v2_Promo', 'standard_d12': 'Standard_D12', 'standard_d12_v2': 'Standard_D12_v2', 'standard_d12_v2_promo': 'Standard_D12_v2_Promo', 'standard_d13': 'Standard_D13', 'standard_d13_v2': 'Standard_D13_v2', 'standard_d13_v2_promo': 'Standard_D13_v2_Promo', 'standard_d14': 'Standard_D14', 'standard_d14_v2': 'Standard_D14_v2', 'standard_d14_v2_promo': 'Standard_D14_v2_Promo', 'standard_d15_v2': 'Standard_D15_v2', 'standard_d16_v3': 'Standard_D16_v3', 'standard_d16s_v3': 'Standard_D16s_v3', 'standard_d1_v2': 'Standard_D1_v2', 'standard_d2': 'Standard_D2', 'standard_d2_v2': 'Standard_D2_v2', 'standard_d2_v2_promo': 'Standard_D2_v2_Promo', 'standard_d2_v3': 'Standard_D2_v3', 'standard_d2s_v3': 'Standard_D2s_v3', 'standard_d3': 'Standard_D3', 'standard_d32_v3': 'Standard_D32_v3', 'standard_d32s_v3': 'Standard_D32s_v3', 'standard_d3_v2': 'Standard_D3_v2', 'standard_d3_v2_promo': 'Standard_D3_v2_Promo', 'standard_d4': 'Standard_D4', 'standard_d4_v2': 'Standard_D4_v2', 'standard_d4_v2_promo': 'Standard_D4_v2_Promo', 'standard_d4_v3': 'Standard_D4_v3', 'standard_d4s_v3': 'Standard_D4s_v3', 'standard_d5_v2': 'Standard_D5_v2', 'standard_d5_v2_promo': 'Standard_D5_v2_Promo', 'standard_d64_v3': 'Standard_D64_v3', 'standard_d64s_v3': 'Standard_D64s_v3', 'standard_d8_v3': 'Standard_D8_v3', 'standard_d8s_v3': 'Standard_D8s_v3', 'standard_ds1': 'Standard_DS1', 'standard_ds11': 'Standard_DS11', 'standard_ds11_v2': 'Standard_DS11_v2', 'standard_ds11_v2_promo': 'Standard_DS11_v2_Promo', 'standard_ds12': 'Standard_DS12', 'standard_ds12_v2': 'Standard_DS12_v2', 'standard_ds12_v2_promo': 'Standard_DS12_v2_Promo', 'standard_ds13': 'Standard_DS13', 'standard_ds13-2_v2': 'Standard_DS13-2_v2', 'standard_ds13-4_v2': 'Standard_DS13-4_v2', 'standard_ds13_v2': 'Standard_DS13_v2', 'standard_ds13_v2_promo': 'Standard_DS13_v2_Promo', 'standard_ds14': 'Standard_DS14', 'standard_ds14-4_v2': 'Standard_DS14-4_v2', 'standard_ds14-8_v2': 'Standard_DS14-8_v2', 'standard_ds14_v2': 'Standard_DS14_v2', 'standard_ds14_v2_promo': 'Standard_DS14_v2_Promo', 'standard_ds15_v2': 'Standard_DS15_v2', 'standard_ds1_v2': 'Standard_DS1_v2', 'standard_ds2': 'Standard_DS2', 'standard_ds2_v2': 'Standard_DS2_v2', 'standard_ds2_v2_promo': 'Standard_DS2_v2_Promo', 'standard_ds3': 'Standard_DS3', 'standard_ds3_v2': 'Standard_DS3_v2', 'standard_ds3_v2_promo': 'Standard_DS3_v2_Promo', 'standard_ds4': 'Standard_DS4', 'standard_ds4_v2': 'Standard_DS4_v2', 'standard_ds4_v2_promo': 'Standard_DS4_v2_Promo', 'standard_ds5_v2': 'Standard_DS5_v2', 'standard_ds5_v2_promo': 'Standard_DS5_v2_Promo', 'standard_e16_v3': 'Standard_E16_v3', 'standard_e16s_v3': 'Standard_E16s_v3', 'standard_e2_v3': 'Standard_E2_v3', 'standard_e2s_v3': 'Standard_E2s_v3', 'standard_e32-16s_v3': 'Standard_E32-16s_v3', 'standard_e32-8s_v3': 'Standard_E32-8s_v3', 'standard_e32_v3': 'Standard_E32_v3', 'standard_e32s_v3': 'Standard_E32s_v3', 'standard_e4_v3': 'Standard_E4_v3', 'standard_e4s_v3': 'Standard_E4s_v3', 'standard_e64-16s_v3': 'Standard_E64-16s_v3', 'standard_e64-32s_v3': 'Standard_E64-32s_v3', 'standard_e64_v3': 'Standard_E64_v3', 'standard_e64s_v3': 'Standard_E64s_v3', 'standard_e8_v3': 'Standard_E8_v3', 'standard_e8s_v3': 'Standard_E8s_v3', 'standard_f1': 'Standard_F1', 'standard_f16': 'Standard_F16', 'standard_f16s': 'Standard_F16s', 'standard_f16s_v2': 'Standard_F16s_v2', 'standard_f1s': 'Standard_F1s', 'standard_f2': 'Standard_F2', 'standard_f2s': 'Standard_F2s', 'standard_f2s_v2': 'Standard_F2s_v2', 'standard_f32s_v2': 'Standard_F32s_v2', 'standard_f4': 'Standard_F4', 'standard_f4s': 'Standard_F4s', 'standard_f4s_v2': 'Standard_F4s_v2', 'standard_f64s_v2': 'Standard_F64s_v2', 'standard_f72s_v2': 'Standard_F72s_v2', 'standard_f8': 'Standard_F8', 'standard_f8s': 'Standard_F8s', 'standard_f8s_v2': 'Standard_F8s_v2', 'standard_g1': 'Standard_G1', 'standard_g2': 'Standard_G2', 'standard_g3': 'Standard_G3', 'standard_g4': 'Standard_G4', 'standard_g5': 'Standard_G5', 'standard_gs1': 'Standard_GS1', 'standard_gs2': 'Standard_GS2', 'standard_gs3': 'Standard_GS3', 'standard_gs4': 'Standard_GS4', 'standard_gs4-4': 'Standard_GS4-4', 'standard_gs4-8': 'Standard_GS4-8', 'standard_gs5': 'Standard_GS5', 'standard_gs5-16': 'Standard_GS5-16', 'standard_gs5-8': 'Standard_GS5-8', 'standard_h16': 'Standard_H16', 'standard_h16m': 'Standard_H16m', 'standard_h16mr': 'Standard_H16mr', 'standard_h16r': 'Standard_H16r', 'standard_h8': 'Standard_H8', 'standard_h8m': 'Standard_H8m', 'standard_l16s': 'Standard_L16s', 'standard_l32s': 'Standard_L32s', 'standard_l4s': 'Standard_L4s', 'standard_l8s': 'Standard_L8s', 'standard_m128-32ms': 'Standard_M128-32ms', 'standard_m128-64ms': 'Standard_M128-64ms', 'standard_m128ms': 'Standard_M128ms', 'standard_m128s': 'Standard_M128s', 'standard_m64-16ms': 'Standard_M64-16ms', 'standard_m64-32ms': 'Standard_M64-32ms', 'standard_m64ms': 'Standard_M64ms', 'standard_m64s': 'Standard_M64s', 'standard_nc12': 'Standard_NC12', 'standard_nc12s_v2': 'Standard_NC12s_v2', 'standard_nc12s_v3': 'Standard_NC12s_v3', 'standard_nc24': 'Standard_NC24', 'standard_nc24r': 'Standard_NC24r', 'standard_nc24rs_v2': 'Standard_NC24rs_v2', 'standard_nc24rs_v3': 'Standard_NC24rs_v3', 'standard_nc24s_v2': 'Standard_NC24s_v2', 'standard_nc24s_v3': 'Standard_NC24s_v3', 'standard_nc6': 'Standard_NC6', 'standard_nc6s_v2': 'Standard_NC6s_v2', 'standard_nc6s_v3': 'Standard_NC6s_v3', 'standard_nd12s': 'Standard_ND12s', 'standard_nd24rs': 'Standard_ND24rs', 'standard_nd24s': 'Standard_ND24s', 'standard_nd6s': 'Standard_ND6s', 'standard_nv12': 'Standard_NV12', 'standard_nv24': 'Standard_NV24', 'standard_nv6': 'Standard_NV6'})
-        dict_camelize(self.parameters, ['agent_pool_profiles', 'storage_profile'], True)
-        dict_camelize(self.parameters, ['agent_pool_profiles', 'os_type'], True)
+        transform = DictTransform()
+        transform.camelize(['orchestrator_profile', 'orchestrator_type'], True)
+        transform.map(['orchestrator_profile', 'orchestrator_type'], {'dcos': 'DCOS', 'docker_ce': 'DockerCE'})
+        transform.camelize(['master_profile', 'vm_size'], True)
+        transform.map(['master_profile', 'vm_size'], {'standard_a1': 'Standard_A1', 'standard_a10': 'Standard_A10', 'standard_a11': 'Standard_A11', 'standard_a1_v2': 'Standard_A1_v2', 'standard_a2': 'Standard_A2', 'standard_a2_v2': 'Standard_A2_v2', 'standard_a2m_v2': 'Standard_A2m_v2', 'standard_a3': 'Standard_A3', 'standard_a4': 'Standard_A4', 'standard_a4_v2': 'Standard_A4_v2', 'standard_a4m_v2': 'Standard_A4m_v2', 'standard_a5': 'Standard_A5', 'standard_a6': 'Standard_A6', 'standard_a7': 'Standard_A7', 'standard_a8': 'Standard_A8', 'standard_a8_v2': 'Standard_A8_v2', 'standard_a8m_v2': 'Standard_A8m_v2', 'standard_a9': 'Standard_A9', 'standard_b2ms': 'Standard_B2ms', 'standard_b2s': 'Standard_B2s', 'standard_b4ms': 'Standard_B4ms', 'standard_b8ms': 'Standard_B8ms', 'standard_d1': 'Standard_D1', 'standard_d11': 'Standard_D11', 'standard_d11_v2': 'Standard_D11_v2', 'standard_d11_v2_promo': 'Standard_D11_v2_Promo', 'standard_d12': 'Standard_D12', 'standard_d12_v2': 'Standard_D12_v2', 'standard_d12_v2_promo': 'Standard_D12_v2_Promo', 'standard_d13': 'Standard_D13', 'standard_d13_v2': 'Standard_D13_v2', 'standard_d13_v2_promo': 'Standard_D13_v2_Promo', 'standard_d14': 'Standard_D14', 'standard_d14_v2': 'Standard_D14_v2', 'standard_d14_v2_promo': 'Standard_D14_v2_Promo', 'standard_d15_v2': 'Standard_D15_v2', 'standard_d16_v3': 'Standard_D16_v3', 'standard_d16s_v3': 'Standard_D16s_v3', 'standard_d1_v2': 'Standard_D1_v2', 'standard_d2': 'Standard_D2', 'standard_d2_v2': 'Standard_D2_v2', 'standard_d2_v2_promo': 'Standard_D2_v2_Promo', 'standard_d2_v3': 'Standard_D2_v3', 'standard_d2s_v3': 'Standard_D2s_v3', 'standard_d3': 'Standard_D3', 'standard_d32_v3': 'Standard_D32_v3', 'standard_d32s_v3': 'Standard_D32s_v3', 'standard_d3_v2': 'Standard_D3_v2', 'standard_d3_v2_promo': 'Standard_D3_v2_Promo', 'standard_d4': 'Standard_D4', 'standard_d4_v2': 'Standard_D4_v2', 'standard_d4_v2_promo': 'Standard_D4_v2_Promo', 'standard_d4_v3': 'Standard_D4_v3', 'standard_d4s_v3': 'Standard_D4s_v3', 'standard_d5_v2': 'Standard_D5_v2', 'standard_d5_v2_promo': 'Standard_D5_v2_Promo', 'standard_d64_v3': 'Standard_D64_v3', 'standard_d64s_v3': 'Standard_D64s_v3', 'standard_d8_v3': 'Standard_D8_v3', 'standard_d8s_v3': 'Standard_D8s_v3', 'standard_ds1': 'Standard_DS1', 'standard_ds11': 'Standard_DS11', 'standard_ds11_v2': 'Standard_DS11_v2', 'standard_ds11_v2_promo': 'Standard_DS11_v2_Promo', 'standard_ds12': 'Standard_DS12', 'standard_ds12_v2': 'Standard_DS12_v2', 'standard_ds12_v2_promo': 'Standard_DS12_v2_Promo', 'standard_ds13': 'Standard_DS13', 'standard_ds13-2_v2': 'Standard_DS13-2_v2', 'standard_ds13-4_v2': 'Standard_DS13-4_v2', 'standard_ds13_v2': 'Standard_DS13_v2', 'standard_ds13_v2_promo': 'Standard_DS13_v2_Promo', 'standard_ds14': 'Standard_DS14', 'standard_ds14-4_v2': 'Standard_DS14-4_v2', 'standard_ds14-8_v2': 'Standard_DS14-8_v2', 'standard_ds14_v2': 'Standard_DS14_v2', 'standard_ds14_v2_promo': 'Standard_DS14_v2_Promo', 'standard_ds15_v2': 'Standard_DS15_v2', 'standard_ds1_v2': 'Standard_DS1_v2', 'standard_ds2': 'Standard_DS2', 'standard_ds2_v2': 'Standard_DS2_v2', 'standard_ds2_v2_promo': 'Standard_DS2_v2_Promo', 'standard_ds3': 'Standard_DS3', 'standard_ds3_v2': 'Standard_DS3_v2', 'standard_ds3_v2_promo': 'Standard_DS3_v2_Promo', 'standard_ds4': 'Standard_DS4', 'standard_ds4_v2': 'Standard_DS4_v2', 'standard_ds4_v2_promo': 'Standard_DS4_v2_Promo', 'standard_ds5_v2': 'Standard_DS5_v2', 'standard_ds5_v2_promo': 'Standard_DS5_v2_Promo', 'standard_e16_v3': 'Standard_E16_v3', 'standard_e16s_v3': 'Standard_E16s_v3', 'standard_e2_v3': 'Standard_E2_v3', 'standard_e2s_v3': 'Standard_E2s_v3', 'standard_e32-16s_v3': 'Standard_E32-16s_v3', 'standard_e32-8s_v3': 'Standard_E32-8s_v3', 'standard_e32_v3': 'Standard_E32_v3', 'standard_e32s_v3': 'Standard_E32s_v3', 'standard_e4_v3': 'Standard_E4_v3', 'standard_e4s_v3': 'Standard_E4s_v3', 'standard_e64-16s_v3': 'Standard_E64-16s_v3', 'standard_e64-32s_v3': 'Standard_E64-32s_v3', 'standard_e64_v3': 'Standard_E64_v3', 'standard_e64s_v3': 'Standard_E64s_v3', 'standard_e8_v3': 'Standard_E8_v3', 'standard_e8s_v3': 'Standard_E8s_v3', 'standard_f1': 'Standard_F1', 'standard_f16': 'Standard_F16', 'standard_f16s': 'Standard_F16s', 'standard_f16s_v2': 'Standard_F16s_v2', 'standard_f1s': 'Standard_F1s', 'standard_f2': 'Standard_F2', 'standard_f2s': 'Standard_F2s', 'standard_f2s_v2': 'Standard_F2s_v2', 'standard_f32s_v2': 'Standard_F32s_v2', 'standard_f4': 'Standard_F4', 'standard_f4s': 'Standard_F4s', 'standard_f4s_v2': 'Standard_F4s_v2', 'standard_f64s_v2': 'Standard_F64s_v2', 'standard_f72s_v2': 'Standard_F72s_v2', 'standard_f8': 'Standard_F8', 'standard_f8s': 'Standard_F8s', 'standard_f8s_v2': 'Standard_F8s_v2', 'standard_g1': 'Standard_G1', 'standard_g2': 'Standard_G2', 'standard_g3': 'Standard_G3', 'standard_g4': 'Standard_G4', 'standard_g5': 'Standard_G5', 'standard_gs1': 'Standard_GS1', 'standard_gs2': 'Standard_GS2', 'standard_gs3': 'Standard_GS3', 'standard_gs4': 'Standard_GS4', 'standard_gs4-4': 'Standard_GS4-4', 'standard_gs4-8': 'Standard_GS4-8', 'standard_gs5': 'Standard_GS5', 'standard_gs5-16': 'Standard_GS5-16', 'standard_gs5-8': 'Standard_GS5-8', 'standard_h16': 'Standard_H16', 'standard_h16m': 'Standard_H16m', 'standard_h16mr': 'Standard_H16mr', 'standard_h16r': 'Standard_H16r', 'standard_h8': 'Standard_H8', 'standard_h8m': 'Standard_H8m', 'standard_l16s': 'Standard_L16s', 'standard_l32s': 'Standard_L32s', 'standard_l4s': 'Standard_L4s', 'standard_l8s': 'Standard_L8s', 'standard_m128-32ms': 'Standard_M128-32ms', 'standard_m128-64ms': 'Standard_M128-64ms', 'standard_m128ms': 'Standard_M128ms', 'standard_m128s': 'Standard_M128s', 'standard_m64-16ms': 'Standard_M64-16ms', 'standard_m64-32ms': 'Standard_M64-32ms', 'standard_m64ms': 'Standard_M64ms', 'standard_m64s': 'Standard_M64s', 'standard_nc12': 'Standard_NC12', 'standard_nc12s_v2': 'Standard_NC12s_v2', 'standard_nc12s_v3': 'Standard_NC12s_v3', 'standard_nc24': 'Standard_NC24', 'standard_nc24r': 'Standard_NC24r', 'standard_nc24rs_v2': 'Standard_NC24rs_v2', 'standard_nc24rs_v3': 'Standard_NC24rs_v3', 'standard_nc24s_v2': 'Standard_NC24s_v2', 'standard_nc24s_v3': 'Standard_NC24s_v3', 'standard_nc6': 'Standard_NC6', 'standard_nc6s_v2': 'Standard_NC6s_v2', 'standard_nc6s_v3': 'Standard_NC6s_v3', 'standard_nd12s': 'Standard_ND12s', 'standard_nd24rs': 'Standard_ND24rs', 'standard_nd24s': 'Standard_ND24s', 'standard_nd6s': 'Standard_ND6s', 'standard_nv12': 'Standard_NV12', 'standard_nv24': 'Standard_NV24', 'standard_nv6': 'Standard_NV6'})
+        transform.camelize(['master_profile', 'storage_profile'], True)
+        transform.camelize(['agent_pool_profiles', 'vm_size'], True)
+        transform.map(['agent_pool_profiles', 'vm_size'], {'standard_a1': 'Standard_A1', 'standard_a10': 'Standard_A10', 'standard_a11': 'Standard_A11', 'standard_a1_v2': 'Standard_A1_v2', 'standard_a2': 'Standard_A2', 'standard_a2_v2': 'Standard_A2_v2', 'standard_a2m_v2': 'Standard_A2m_v2', 'standard_a3': 'Standard_A3', 'standard_a4': 'Standard_A4', 'standard_a4_v2': 'Standard_A4_v2', 'standard_a4m_v2': 'Standard_A4m_v2', 'standard_a5': 'Standard_A5', 'standard_a6': 'Standard_A6', 'standard_a7': 'Standard_A7', 'standard_a8': 'Standard_A8', 'standard_a8_v2': 'Standard_A8_v2', 'standard_a8m_v2': 'Standard_A8m_v2', 'standard_a9': 'Standard_A9', 'standard_b2ms': 'Standard_B2ms', 'standard_b2s': 'Standard_B2s', 'standard_b4ms': 'Standard_B4ms', 'standard_b8ms': 'Standard_B8ms', 'standard_d1': 'Standard_D1', 'standard_d11': 'Standard_D11', 'standard_d11_v2': 'Standard_D11_v2', 'standard_d11_v2_promo': 'Standard_D11_v2_Promo', 'standard_d12': 'Standard_D12', 'standard_d12_v2': 'Standard_D12_v2', 'standard_d12_v2_promo': 'Standard_D12_v2_Promo', 'standard_d13': 'Standard_D13', 'standard_d13_v2': 'Standard_D13_v2', 'standard_d13_v2_promo': 'Standard_D13_v2_Promo', 'standard_d14': 'Standard_D14', 'standard_d14_v2': 'Standard_D14_v2', 'standard_d14_v2_promo': 'Standard_D14_v2_Promo', 'standard_d15_v2': 'Standard_D15_v2', 'standard_d16_v3': 'Standard_D16_v3', 'standard_d16s_v3': 'Standard_D16s_v3', 'standard_d1_v2': 'Standard_D1_v2', 'standard_d2': 'Standard_D2', 'standard_d2_v2': 'Standard_D2_v2', 'standard_d2_v2_promo': 'Standard_D2_v2_Promo', 'standard_d2_v3': 'Standard_D2_v3', 'standard_d2s_v3': 'Standard_D2s_v3', 'standard_d3': 'Standard_D3', 'standard_d32_v3': 'Standard_D32_v3', 'standard_d32s_v3': 'Standard_D32s_v3', 'standard_d3_v2': 'Standard_D3_v2', 'standard_d3_v2_promo': 'Standard_D3_v2_Promo', 'standard_d4': 'Standard_D4', 'standard_d4_v2': 'Standard_D4_v2', 'standard_d4_v2_promo': 'Standard_D4_v2_Promo', 'standard_d4_v3': 'Standard_D4_v3', 'standard_d4s_v3': 'Standard_D4s_v3', 'standard_d5_v2': 'Standard_D5_v2', 'standard_d5_v2_promo': 'Standard_D5_v2_Promo', 'standard_d64_v3': 'Standard_D64_v3', 'standard_d64s_v3': 'Standard_D64s_v3', 'standard_d8_v3': 'Standard_D8_v3', 'standard_d8s_v3': 'Standard_D8s_v3', 'standard_ds1': 'Standard_DS1', 'standard_ds11': 'Standard_DS11', 'standard_ds11_v2': 'Standard_DS11_v2', 'standard_ds11_v2_promo': 'Standard_DS11_v2_Promo', 'standard_ds12': 'Standard_DS12', 'standard_ds12_v2': 'Standard_DS12_v2', 'standard_ds12_v2_promo': 'Standard_DS12_v2_Promo', 'standard_ds13': 'Standard_DS13', 'standard_ds13-2_v2': 'Standard_DS13-2_v2', 'standard_ds13-4_v2': 'Standard_DS13-4_v2', 'standard_ds13_v2': 'Standard_DS13_v2', 'standard_ds13_v2_promo': 'Standard_DS13_v2_Promo', 'standard_ds14': 'Standard_DS14', 'standard_ds14-4_v2': 'Standard_DS14-4_v2', 'standard_ds14-8_v2': 'Standard_DS14-8_v2', 'standard_ds14_v2': 'Standard_DS14_v2', 'standard_ds14_v2_promo': 'Standard_DS14_v2_Promo', 'standard_ds15_v2': 'Standard_DS15_v2', 'standard_ds1_v2': 'Standard_DS1_v2', 'standard_ds2': 'Standard_DS2', 'standard_ds2_v2': 'Standard_DS2_v2', 'standard_ds2_v2_promo': 'Standard_DS2_v2_Promo', 'standard_ds3': 'Standard_DS3', 'standard_ds3_v2': 'Standard_DS3_v2', 'standard_ds3_v2_promo': 'Standard_DS3_v2_Promo', 'standard_ds4': 'Standard_DS4', 'standard_ds4_v2': 'Standard_DS4_v2', 'standard_ds4_v2_promo': 'Standard_DS4_v2_Promo', 'standard_ds5_v2': 'Standard_DS5_v2', 'standard_ds5_v2_promo': 'Standard_DS5_v2_Promo', 'standard_e16_v3': 'Standard_E16_v3', 'standard_e16s_v3': 'Standard_E16s_v3', 'standard_e2_v3': 'Standard_E2_v3', 'standard_e2s_v3': 'Standard_E2s_v3', 'standard_e32-16s_v3': 'Standard_E32-16s_v3', 'standard_e32-8s_v3': 'Standard_E32-8s_v3', 'standard_e32_v3': 'Standard_E32_v3', 'standard_e32s_v3': 'Standard_E32s_v3', 'standard_e4_v3': 'Standard_E4_v3', 'standard_e4s_v3': 'Standard_E4s_v3', 'standard_e64-16s_v3': 'Standard_E64-16s_v3', 'standard_e64-32s_v3': 'Standard_E64-32s_v3', 'standard_e64_v3': 'Standard_E64_v3', 'standard_e64s_v3': 'Standard_E64s_v3', 'standard_e8_v3': 'Standard_E8_v3', 'standard_e8s_v3': 'Standard_E8s_v3', 'standard_f1': 'Standard_F1', 'standard_f16': 'Standard_F16', 'standard_f16s': 'Standard_F16s', 'standard_f16s_v2': 'Standard_F16s_v2', 'standard_f1s': 'Standard_F1s', 'standard_f2': 'Standard_F2', 'standard_f2s': 'Standard_F2s', 'standard_f2s_v2': 'Standard_F2s_v2', 'standard_f32s_v2': 'Standard_F32s_v2', 'standard_f4': 'Standard_F4', 'standard_f4s': 'Standard_F4s', 'standard_f4s_v2': 'Standard_F4s_v2', 'standard_f64s_v2': 'Standard_F64s_v2', 'standard_f72s_v2': 'Standard_F72s_v2', 'standard_f8': 'Standard_F8', 'standard_f8s': 'Standard_F8s', 'standard_f8s_v2': 'Standard_F8s_v2', 'standard_g1': 'Standard_G1', 'standard_g2': 'Standard_G2', 'standard_g3': 'Standard_G3', 'standard_g4': 'Standard_G4', 'standard_g5': 'Standard_G5', 'standard_gs1': 'Standard_GS1', 'standard_gs2': 'Standard_GS2', 'standard_gs3': 'Standard_GS3', 'standard_gs4': 'Standard_GS4', 'standard_gs4-4': 'Standard_GS4-4', 'standard_gs4-8': 'Standard_GS4-8', 'standard_gs5': 'Standard_GS5', 'standard_gs5-16': 'Standard_GS5-16', 'standard_gs5-8': 'Standard_GS5-8', 'standard_h16': 'Standard_H16', 'standard_h16m': 'Standard_H16m', 'standard_h16mr': 'Standard_H16mr', 'standard_h16r': 'Standard_H16r', 'standard_h8': 'Standard_H8', 'standard_h8m': 'Standard_H8m', 'standard_l16s': 'Standard_L16s', 'standard_l32s': 'Standard_L32s', 'standard_l4s': 'Standard_L4s', 'standard_l8s': 'Standard_L8s', 'standard_m128-32ms': 'Standard_M128-32ms', 'standard_m128-64ms': 'Standard_M128-64ms', 'standard_m128ms': 'Standard_M128ms', 'standard_m128s': 'Standard_M128s', 'standard_m64-16ms': 'Standard_M64-16ms', 'standard_m64-32ms': 'Standard_M64-32ms', 'standard_m64ms': 'Standard_M64ms', 'standard_m64s': 'Standard_M64s', 'standard_nc12': 'Standard_NC12', 'standard_nc12s_v2': 'Standard_NC12s_v2', 'standard_nc12s_v3': 'Standard_NC12s_v3', 'standard_nc24': 'Standard_NC24', 'standard_nc24r': 'Standard_NC24r', 'standard_nc24rs_v2': 'Standard_NC24rs_v2', 'standard_nc24rs_v3': 'Standard_NC24rs_v3', 'standard_nc24s_v2': 'Standard_NC24s_v2', 'standard_nc24s_v3': 'Standard_NC24s_v3', 'standard_nc6': 'Standard_NC6', 'standard_nc6s_v2': 'Standard_NC6s_v2', 'standard_nc6s_v3': 'Standard_NC6s_v3', 'standard_nd12s': 'Standard_ND12s', 'standard_nd24rs': 'Standard_ND24rs', 'standard_nd24s': 'Standard_ND24s', 'standard_nd6s': 'Standard_ND6s', 'standard_nv12': 'Standard_NV12', 'standard_nv24': 'Standard_NV24', 'standard_nv6': 'Standard_NV6'})
+        transform.camelize(['agent_pool_profiles', 'storage_profile'], True)
+        transform.camelize(['agent_pool_profiles', 'os_type'], True)
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ContainerServiceClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.containerservice.ContainerServiceClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_containerservice()
+        old_response = self.cached_get(self.get_containerservice)
 
         if not old_response:
             self.log("Container Service instance doesn't exist")
@@ -1203,14 +1232,16 @@ class AzureRMContainerService(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Container Service instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_containerservice()
@@ -1222,12 +1253,11 @@ class AzureRMContainerService(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_containerservice()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_containerservice()
+            self.wait_for_delete(response, self.get_containerservice, 'Container Service')
         else:
             self.log("Container Service instance unchanged")
             self.results['changed'] = False
@@ -1245,7 +1275,7 @@ class AzureRMContainerService(AzureRMModuleBase):
 
         :return: deserialized Container Service instance state dictionary
         '''
-        self.log("Creating / Updating the Container Service instance {0}".format(self.name))
+        self.log("Creating / Updating the Container Service instance {0}", self.name)
 
         try:
             response = self.mgmt_client.container_services.create_or_update(resource_group_name=self.resource_group,
@@ -1263,9 +1293,9 @@ class AzureRMContainerService(AzureRMModuleBase):
         '''
         Deletes specified Container Service instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Container Service instance {0}".format(self.name))
+        self.log("Deleting the Container Service instance {0}", self.name)
         try:
             response = self.mgmt_client.container_services.delete(resource_group_name=self.resource_group,
                                                                   container_service_name=self.name)
@@ -1273,7 +1303,7 @@ class AzureRMContainerService(AzureRMModuleBase):
             self.log('Error attempting to delete the Container Service instance.')
             self.fail("Error deleting the Container Service instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_containerservice(self):
         '''
@@ -1281,14 +1311,14 @@ class AzureRMContainerService(AzureRMModuleBase):
 
         :return: deserialized Container Service instance state dictionary
         '''
-        self.log("Checking if the Container Service instance {0} is present".format(self.name))
+        self.log("Checking if the Container Service instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.container_services.get(resource_group_name=self.resource_group,
                                                                container_service_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Container Service instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Container Service instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Container Service instance.')
         if found is True:
@@ -1297,79 +1327,6 @@ class AzureRMContainerService(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
 def main():
     """Main execution"""
     AzureRMContainerService()
@@ -38,6 +38,16 @@ options:
         description:
             - The integration runtime node name.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -84,18 +94,17 @@ integration_runtime_nodes:
             sample: 3.8.6743.6
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.datafactory import DataFactoryManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMIntegrationRuntimeNodeFacts(AzureRMModuleBase):
+class AzureRMIntegrationRuntimeNodeFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -125,14 +134,18 @@ class AzureRMIntegrationRuntimeNodeFacts(AzureRMModuleBase):
         self.factory_name = None
         self.integration_runtime_name = None
         self.name = None
-        super(AzureRMIntegrationRuntimeNodeFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMIntegrationRuntimeNodeFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DataFactoryManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.datafactory.DataFactoryManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['integration_runtime_nodes'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['integration_runtime_nodes'] = self.get()
         return self.results
 
@@ -144,7 +157,7 @@ class AzureRMIntegrationRuntimeNodeFacts(AzureRMModuleBase):
                                                                       factory_name=self.factory_name,
                                                                       integration_runtime_name=self.integration_runtime_name,
                                                                       node_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Integration Runtime Node.')
 
@@ -153,6 +166,14 @@ class AzureRMIntegrationRuntimeNodeFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.integration_runtime_nodes, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -37,6 +37,29 @@ options:
         description:
             - "ETag of the linked service entity. Should only be specified for get. If the ETag matches the existing entity tag, or if * was provided, then
                no content will be returned."
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -104,20 +127,25 @@ linked_services:
                     returned: always
                     type: str
                     sample: AzureStorage
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.datafactory import DataFactoryManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMLinkedServiceFacts(AzureRMModuleBase):
+class AzureRMLinkedServiceFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -145,14 +173,18 @@ class AzureRMLinkedServiceFacts(AzureRMModuleBase):
         self.factory_name = None
         self.name = None
         self.if_none_match = None
-        super(AzureRMLinkedServiceFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMLinkedServiceFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DataFactoryManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.datafactory.DataFactoryManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['linked_services'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['linked_services'] = self.get()
         else:
@@ -166,7 +198,7 @@ class AzureRMLinkedServiceFacts(AzureRMModuleBase):
             response = self.mgmt_client.linked_services.get(resource_group_name=self.resource_group,
                                                             factory_name=self.factory_name,
                                                             linked_service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Linked Service.')
 
@@ -175,18 +207,26 @@ class AzureRMLinkedServiceFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.linked_services, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_factory(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.linked_services.list_by_factory(resource_group_name=self.resource_group,
                                                                         factory_name=self.factory_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Linked Service.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -34,6 +34,16 @@ options:
         description:
             - The pipeline run identifier.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -77,18 +87,17 @@ pipeline_runs:
             sample: message
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.datafactory import DataFactoryManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMPipelineRunFacts(AzureRMModuleBase):
+class AzureRMPipelineRunFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -113,14 +122,18 @@ class AzureRMPipelineRunFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.run_id = None
-        super(AzureRMPipelineRunFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMPipelineRunFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DataFactoryManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.datafactory.DataFactoryManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['pipeline_runs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['pipeline_runs'] = self.get()
         return self.results
 
@@ -131,7 +144,7 @@ class AzureRMPipelineRunFacts(AzureRMModuleBase):
             response = self.mgmt_client.pipeline_runs.get(resource_group_name=self.resource_group,
                                                           factory_name=self.name,
                                                           run_id=self.run_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Pipeline Run.')
 
@@ -140,6 +153,14 @@ class AzureRMPipelineRunFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.pipeline_runs, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -50,6 +50,34 @@ options:
     media_type:
         description:
             - File content type. This propery can be modified to reflect the file content type.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the File.
@@ -85,16 +113,19 @@ id:
     type: str
     sample: "/subscriptions/fc04246f-04c5-437e-ac5e-206a19e7193f/resourceGroups/DmsSdkRg/providers/Microsoft.DataMigration/services/DmsSdkService/projects/Dm
             sSdkProject/files/x114d023d8"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
-import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.datamigration import DataMigrationServiceClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -105,7 +136,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMFiles(AzureRMModuleBase):
+class AzureRMFiles(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM File resource"""
 
     def __init__(self):
@@ -178,10 +209,10 @@ class AzureRMFiles(AzureRMModuleBase):
         old_response = None
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(DataMigrationServiceClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.datamigration.DataMigrationServiceClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        old_response = self.get_file()
+        old_response = self.cached_get(self.get_file)
 
         if not old_response:
             self.log("File instance doesn't exist")
@@ -216,13 +247,11 @@ class AzureRMFiles(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_file()
-            # make sure instance is actually deleted, for some Azure resources, instance is hanging around
-            # for some time after deletion -- this should be really fixed in Azure.
-            while self.get_file():
-                time.sleep(20)
+            response = self.delete_file()
+            self.wait_for_delete(response, self.get_file, 'File')
         else:
             self.log("File instance unchanged")
             self.results['changed'] = False
@@ -238,7 +267,7 @@ class AzureRMFiles(AzureRMModuleBase):
 
         :return: deserialized File instance state dictionary
         '''
-        self.log("Creating / Updating the File instance {0}".format(self.file_name))
+        self.log("Creating / Updating the File instance {0}", self.file_name)
 
         try:
             response = self.mgmt_client.files.create_or_update(group_name=self.group_name,
@@ -257,9 +286,9 @@ class AzureRMFiles(AzureRMModuleBase):
         '''
         Deletes specified File instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the File instance {0}".format(self.file_name))
+        self.log("Deleting the File instance {0}", self.file_name)
         try:
             response = self.mgmt_client.files.delete(group_name=self.group_name,
                                                      service_name=self.service_name,
@@ -269,7 +298,7 @@ class AzureRMFiles(AzureRMModuleBase):
             self.log('Error attempting to delete the File instance.')
             self.fail("Error deleting the File instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_file(self):
         '''
@@ -277,7 +306,7 @@ class AzureRMFiles(AzureRMModuleBase):
 
         :return: deserialized File instance state dictionary
         '''
-        self.log("Checking if the File instance {0} is present".format(self.file_name))
+        self.log("Checking if the File instance {0} is present", self.file_name)
         found = False
         try:
             response = self.mgmt_client.files.get(group_name=self.group_name,
@@ -285,8 +314,8 @@ class AzureRMFiles(AzureRMModuleBase):
                                                   project_name=self.project_name,
                                                   file_name=self.file_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("File instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("File instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the File instance.')
         if found is True:
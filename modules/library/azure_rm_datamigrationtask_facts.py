@@ -41,6 +41,16 @@ options:
         description:
             - Name of the Task
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -101,18 +111,17 @@ tasks:
                     sample: Queued
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.datamigration import DataMigrationServiceClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMTaskFacts(AzureRMModuleBase):
+class AzureRMTaskFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -146,14 +155,18 @@ class AzureRMTaskFacts(AzureRMModuleBase):
         self.service_name = None
         self.project_name = None
         self.name = None
-        super(AzureRMTaskFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMTaskFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DataMigrationServiceClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.datamigration.DataMigrationServiceClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['tasks'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['tasks'] = self.get()
         return self.results
 
@@ -165,7 +178,7 @@ class AzureRMTaskFacts(AzureRMModuleBase):
                                                   service_name=self.service_name,
                                                   project_name=self.project_name,
                                                   task_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Task.')
 
@@ -174,6 +187,14 @@ class AzureRMTaskFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.tasks, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -34,6 +34,16 @@ options:
         description:
             - The name of the default security rule.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -103,18 +113,17 @@ default_security_rules:
             sample: AllowVnetInBound
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMDefaultSecurityRuleFacts(AzureRMModuleBase):
+class AzureRMDefaultSecurityRuleFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -139,14 +148,18 @@ class AzureRMDefaultSecurityRuleFacts(AzureRMModuleBase):
         self.resource_group = None
         self.network_security_group_name = None
         self.name = None
-        super(AzureRMDefaultSecurityRuleFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMDefaultSecurityRuleFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['default_security_rules'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['default_security_rules'] = self.get()
         return self.results
 
@@ -157,7 +170,7 @@ class AzureRMDefaultSecurityRuleFacts(AzureRMModuleBase):
             response = self.mgmt_client.default_security_rules.get(resource_group_name=self.resource_group,
                                                                    network_security_group_name=self.network_security_group_name,
                                                                    default_security_rule_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Default Security Rule.')
 
@@ -166,6 +179,14 @@ class AzureRMDefaultSecurityRuleFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.default_security_rules, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -44,6 +44,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -83,18 +93,17 @@ arm_templates:
             sample: tags
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.devtestlabs import DevTestLabsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMArmTemplateFacts(AzureRMModuleBase):
+class AzureRMArmTemplateFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -132,14 +141,18 @@ class AzureRMArmTemplateFacts(AzureRMModuleBase):
         self.name = None
         self.expand = None
         self.tags = None
-        super(AzureRMArmTemplateFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMArmTemplateFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DevTestLabsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.devtestlabs.DevTestLabsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['arm_templates'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['arm_templates'] = self.get()
         return self.results
 
@@ -151,7 +164,7 @@ class AzureRMArmTemplateFacts(AzureRMModuleBase):
                                                           lab_name=self.lab_name,
                                                           artifact_source_name=self.artifact_source_name,
                                                           name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Arm Template.')
 
@@ -160,6 +173,14 @@ class AzureRMArmTemplateFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.arm_templates, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
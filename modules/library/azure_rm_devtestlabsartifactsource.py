@@ -65,6 +65,34 @@ options:
         description:
             - "Indicates if the artifact source is enabled (values: Enabled, Disabled). Possible values include: 'Enabled', 'Disabled'"
         type: bool
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Artifact Source.
@@ -105,17 +133,21 @@ status:
     returned: always
     type: str
     sample: status
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.devtestlabs import DevTestLabsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -126,7 +158,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMArtifactSource(AzureRMModuleBase):
+class AzureRMArtifactSource(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Artifact Source resource"""
 
     def __init__(self):
@@ -202,17 +234,17 @@ class AzureRMArtifactSource(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.artifact_source[key] = kwargs[key]
 
-        dict_camelize(self.artifact_source, ['source_type'], True)
-        dict_map(self.artifact_source, ['status'], {True: 'Enabled', False: 'Disabled'})
+        transform = DictTransform()
+        transform.camelize(['source_type'], True)
+        transform.map(['status'], {True: 'Enabled', False: 'Disabled'})
+        transform.apply(self.artifact_source)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(DevTestLabsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.devtestlabs.DevTestLabsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_artifactsource()
+        old_response = self.cached_get(self.get_artifactsource)
 
         if not old_response:
             self.log("Artifact Source instance doesn't exist")
@@ -225,7 +257,7 @@ class AzureRMArtifactSource(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.artifact_source, old_response, '', self.results)):
+                if (not self.compare_state(self.artifact_source, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -233,6 +265,7 @@ class AzureRMArtifactSource(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.artifact_source, old_response)
                 return self.results
 
             response = self.create_update_artifactsource()
@@ -244,12 +277,11 @@ class AzureRMArtifactSource(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_artifactsource()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_artifactsource()
+            self.wait_for_delete(response, self.get_artifactsource, 'Artifact Source')
         else:
             self.log("Artifact Source instance unchanged")
             self.results['changed'] = False
@@ -268,7 +300,7 @@ class AzureRMArtifactSource(AzureRMModuleBase):
 
         :return: deserialized Artifact Source instance state dictionary
         '''
-        self.log("Creating / Updating the Artifact Source instance {0}".format(self.name))
+        self.log("Creating / Updating the Artifact Source instance {0}", self.name)
 
         try:
             response = self.mgmt_client.artifact_sources.create_or_update(resource_group_name=self.resource_group,
@@ -287,9 +319,9 @@ class AzureRMArtifactSource(AzureRMModuleBase):
         '''
         Deletes specified Artifact Source instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Artifact Source instance {0}".format(self.name))
+        self.log("Deleting the Artifact Source instance {0}", self.name)
         try:
             response = self.mgmt_client.artifact_sources.delete(resource_group_name=self.resource_group,
                                                                 lab_name=self.lab_name,
@@ -298,7 +330,7 @@ class AzureRMArtifactSource(AzureRMModuleBase):
             self.log('Error attempting to delete the Artifact Source instance.')
             self.fail("Error deleting the Artifact Source instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_artifactsource(self):
         '''
@@ -306,15 +338,15 @@ class AzureRMArtifactSource(AzureRMModuleBase):
 
         :return: deserialized Artifact Source instance state dictionary
         '''
-        self.log("Checking if the Artifact Source instance {0} is present".format(self.name))
+        self.log("Checking if the Artifact Source instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.artifact_sources.get(resource_group_name=self.resource_group,
                                                              lab_name=self.lab_name,
                                                              name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Artifact Source instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Artifact Source instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Artifact Source instance.')
         if found is True:
@@ -323,79 +355,6 @@ class AzureRMArtifactSource(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
 def main():
     """Main execution"""
     AzureRMArtifactSource()
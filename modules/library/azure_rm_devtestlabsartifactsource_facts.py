@@ -40,6 +40,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -84,18 +94,17 @@ artifact_sources:
             sample: status
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.devtestlabs import DevTestLabsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMArtifactSourceFacts(AzureRMModuleBase):
+class AzureRMArtifactSourceFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -128,14 +137,18 @@ class AzureRMArtifactSourceFacts(AzureRMModuleBase):
         self.name = None
         self.expand = None
         self.tags = None
-        super(AzureRMArtifactSourceFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMArtifactSourceFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DevTestLabsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.devtestlabs.DevTestLabsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['artifact_sources'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['artifact_sources'] = self.get()
         return self.results
 
@@ -146,7 +159,7 @@ class AzureRMArtifactSourceFacts(AzureRMModuleBase):
             response = self.mgmt_client.artifact_sources.get(resource_group_name=self.resource_group,
                                                              lab_name=self.lab_name,
                                                              name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Artifact Source.')
 
@@ -155,6 +168,14 @@ class AzureRMArtifactSourceFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.artifact_sources, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
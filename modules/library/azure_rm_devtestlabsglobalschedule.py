@@ -85,6 +85,34 @@ options:
     target_resource_id:
         description:
             - The resource ID to which the schedule belongs
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Global Schedule.
@@ -126,17 +154,21 @@ status:
     returned: always
     type: str
     sample: status
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.devtestlabs import DevTestLabsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -147,7 +179,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMGlobalSchedule(AzureRMModuleBase):
+class AzureRMGlobalSchedule(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Global Schedule resource"""
 
     def __init__(self):
@@ -245,17 +277,17 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.schedule[key] = kwargs[key]
 
-        dict_map(self.schedule, ['status'], {True: 'Enabled', False: 'Disabled'})
-        dict_map(self.schedule, ['notification_settings', 'status'], {True: 'Enabled', False: 'Disabled'})
+        transform = DictTransform()
+        transform.map(['status'], {True: 'Enabled', False: 'Disabled'})
+        transform.map(['notification_settings', 'status'], {True: 'Enabled', False: 'Disabled'})
+        transform.apply(self.schedule)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(DevTestLabsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.devtestlabs.DevTestLabsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_globalschedule()
+        old_response = self.cached_get(self.get_globalschedule)
 
         if not old_response:
             self.log("Global Schedule instance doesn't exist")
@@ -268,7 +300,7 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.schedule, old_response, '', self.results)):
+                if (not self.compare_state(self.schedule, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -276,6 +308,7 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.schedule, old_response)
                 return self.results
 
             response = self.create_update_globalschedule()
@@ -287,12 +320,11 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_globalschedule()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_globalschedule()
+            self.wait_for_delete(response, self.get_globalschedule, 'Global Schedule')
         else:
             self.log("Global Schedule instance unchanged")
             self.results['changed'] = False
@@ -311,7 +343,7 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
 
         :return: deserialized Global Schedule instance state dictionary
         '''
-        self.log("Creating / Updating the Global Schedule instance {0}".format(self.name))
+        self.log("Creating / Updating the Global Schedule instance {0}", self.name)
 
         try:
             response = self.mgmt_client.global_schedules.create_or_update(resource_group_name=self.resource_group,
@@ -329,9 +361,9 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
         '''
         Deletes specified Global Schedule instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Global Schedule instance {0}".format(self.name))
+        self.log("Deleting the Global Schedule instance {0}", self.name)
         try:
             response = self.mgmt_client.global_schedules.delete(resource_group_name=self.resource_group,
                                                                 name=self.name)
@@ -339,7 +371,7 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
             self.log('Error attempting to delete the Global Schedule instance.')
             self.fail("Error deleting the Global Schedule instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_globalschedule(self):
         '''
@@ -347,14 +379,14 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
 
         :return: deserialized Global Schedule instance state dictionary
         '''
-        self.log("Checking if the Global Schedule instance {0} is present".format(self.name))
+        self.log("Checking if the Global Schedule instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.global_schedules.get(resource_group_name=self.resource_group,
                                                              name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Global Schedule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Global Schedule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Global Schedule instance.')
         if found is True:
@@ -363,64 +395,6 @@ class AzureRMGlobalSchedule(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
 def main():
     """Main execution"""
     AzureRMGlobalSchedule()
@@ -30,6 +30,16 @@ options:
         description:
             - The name of the operation.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -60,18 +70,17 @@ operations:
             sample: status
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.devtestlabs import DevTestLabsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMOperationFacts(AzureRMModuleBase):
+class AzureRMOperationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -91,14 +100,18 @@ class AzureRMOperationFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.location_name = None
         self.name = None
-        super(AzureRMOperationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMOperationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DevTestLabsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.devtestlabs.DevTestLabsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['operations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['operations'] = self.get()
         return self.results
 
@@ -108,7 +121,7 @@ class AzureRMOperationFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.operations.get(location_name=self.location_name,
                                                        name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Operation.')
 
@@ -117,6 +130,14 @@ class AzureRMOperationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.operations, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
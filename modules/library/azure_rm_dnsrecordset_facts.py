@@ -43,6 +43,29 @@ options:
     name:
         description:
             - The name of the record set, relative to the name of the zone.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -112,20 +135,25 @@ record_sets:
             returned: always
             type: str
             sample: record1.zone1
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.dns import DnsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMRecordSetFacts(AzureRMModuleBase):
+class AzureRMRecordSetFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -161,14 +189,18 @@ class AzureRMRecordSetFacts(AzureRMModuleBase):
         self.top = None
         self.recordsetnamesuffix = None
         self.name = None
-        super(AzureRMRecordSetFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMRecordSetFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(DnsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.dns.DnsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['record_sets'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.name is not None and
                 self.record_type is not None):
             self.results['record_sets'] = self.get()
@@ -185,12 +217,12 @@ class AzureRMRecordSetFacts(AzureRMModuleBase):
             response = self.mgmt_client.record_sets.list_by_type(resource_group_name=self.resource_group,
                                                                  zone_name=self.zone_name,
                                                                  record_type=self.record_type)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Record Set.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -203,7 +235,7 @@ class AzureRMRecordSetFacts(AzureRMModuleBase):
                                                         zone_name=self.zone_name,
                                                         relative_record_set_name=self.name,
                                                         record_type=self.record_type)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Record Set.')
 
@@ -212,18 +244,26 @@ class AzureRMRecordSetFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.record_sets, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_dns_zone(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.record_sets.list_by_dns_zone(resource_group_name=self.resource_group,
                                                                      zone_name=self.zone_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Record Set.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
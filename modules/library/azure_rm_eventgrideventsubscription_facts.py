@@ -52,6 +52,29 @@ options:
     name:
         description:
             - Name of the event subscription
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -125,20 +148,25 @@ event_subscriptions:
             returned: always
             type: str
             sample: "[\n  'label1',\n  'label2'\n]"
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.eventgrid import EventGridManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMEventSubscriptionFacts(AzureRMModuleBase):
+class AzureRMEventSubscriptionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -180,14 +208,18 @@ class AzureRMEventSubscriptionFacts(AzureRMModuleBase):
         self.topic_name = None
         self.scope = None
         self.name = None
-        super(AzureRMEventSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMEventSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(EventGridManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.eventgrid.EventGridManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['event_subscriptions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.resource_group is not None and
                 self.provider_namespace is not None and
                 self.resource_type_name is not None and
@@ -210,12 +242,12 @@ class AzureRMEventSubscriptionFacts(AzureRMModuleBase):
                                                                              provider_namespace=self.provider_namespace,
                                                                              resource_type_name=self.resource_type_name,
                                                                              resource_name=self.resource_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Event Subscription.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -227,12 +259,12 @@ class AzureRMEventSubscriptionFacts(AzureRMModuleBase):
             response = self.mgmt_client.event_subscriptions.list_by_domain_topic(resource_group_name=self.resource_group,
                                                                                  domain_name=self.domain_name,
                                                                                  topic_name=self.topic_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Event Subscription.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -243,7 +275,7 @@ class AzureRMEventSubscriptionFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.event_subscriptions.get(scope=self.scope,
                                                                 event_subscription_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Event Subscription.')
 
@@ -252,6 +284,14 @@ class AzureRMEventSubscriptionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.event_subscriptions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
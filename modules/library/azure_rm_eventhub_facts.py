@@ -40,6 +40,29 @@ options:
     name:
         description:
             - The Event Hub name
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -90,20 +113,25 @@ event_hubs:
             returned: always
             type: str
             sample: Active
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.eventhub import EventHubManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMEventHubFacts(AzureRMModuleBase):
+class AzureRMEventHubFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -135,14 +163,18 @@ class AzureRMEventHubFacts(AzureRMModuleBase):
         self.skip = None
         self.top = None
         self.name = None
-        super(AzureRMEventHubFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMEventHubFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(EventHubManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.eventhub.EventHubManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['event_hubs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['event_hubs'] = self.get()
         else:
@@ -155,12 +187,12 @@ class AzureRMEventHubFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.event_hubs.list_by_namespace(resource_group_name=self.resource_group,
                                                                      namespace_name=self.namespace_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Event Hub.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -172,7 +204,7 @@ class AzureRMEventHubFacts(AzureRMModuleBase):
             response = self.mgmt_client.event_hubs.get(resource_group_name=self.resource_group,
                                                        namespace_name=self.namespace_name,
                                                        event_hub_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Event Hub.')
 
@@ -181,6 +213,14 @@ class AzureRMEventHubFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.event_hubs, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -44,6 +44,29 @@ options:
     name:
         description:
             - The consumer group name
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -89,20 +112,25 @@ consumer_groups:
             returned: always
             type: str
             sample: sdk-ConsumerGroup-5563
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.eventhub import EventHubManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMConsumerGroupFacts(AzureRMModuleBase):
+class AzureRMConsumerGroupFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -139,14 +167,18 @@ class AzureRMConsumerGroupFacts(AzureRMModuleBase):
         self.skip = None
         self.top = None
         self.name = None
-        super(AzureRMConsumerGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMConsumerGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(EventHubManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.eventhub.EventHubManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['consumer_groups'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['consumer_groups'] = self.get()
         else:
@@ -160,12 +192,12 @@ class AzureRMConsumerGroupFacts(AzureRMModuleBase):
             response = self.mgmt_client.consumer_groups.list_by_event_hub(resource_group_name=self.resource_group,
                                                                           namespace_name=self.namespace_name,
                                                                           event_hub_name=self.event_hub_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Consumer Group.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -178,7 +210,7 @@ class AzureRMConsumerGroupFacts(AzureRMModuleBase):
                                                             namespace_name=self.namespace_name,
                                                             event_hub_name=self.event_hub_name,
                                                             consumer_group_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Consumer Group.')
 
@@ -187,6 +219,14 @@ class AzureRMConsumerGroupFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.consumer_groups, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
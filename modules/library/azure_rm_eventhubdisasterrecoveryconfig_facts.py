@@ -34,6 +34,16 @@ options:
         description:
             - The Disaster Recovery configuration name
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -79,18 +89,17 @@ disaster_recovery_configs:
             sample: Secondary
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.eventhub import EventHubManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMDisasterRecoveryConfigFacts(AzureRMModuleBase):
+class AzureRMDisasterRecoveryConfigFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -115,14 +124,18 @@ class AzureRMDisasterRecoveryConfigFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.alias = None
-        super(AzureRMDisasterRecoveryConfigFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMDisasterRecoveryConfigFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(EventHubManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.eventhub.EventHubManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['disaster_recovery_configs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['disaster_recovery_configs'] = self.get()
         return self.results
 
@@ -133,7 +146,7 @@ class AzureRMDisasterRecoveryConfigFacts(AzureRMModuleBase):
             response = self.mgmt_client.disaster_recovery_configs.get(resource_group_name=self.resource_group,
                                                                       namespace_name=self.name,
                                                                       alias=self.alias)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Disaster Recovery Config.')
 
@@ -142,6 +155,14 @@ class AzureRMDisasterRecoveryConfigFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.disaster_recovery_configs, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -34,6 +34,16 @@ options:
         description:
             - The name of the authorization.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -65,18 +75,17 @@ express_route_circuit_authorizations:
             sample: id
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMExpressRouteCircuitAuthorizationFacts(AzureRMModuleBase):
+class AzureRMExpressRouteCircuitAuthorizationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -101,14 +110,18 @@ class AzureRMExpressRouteCircuitAuthorizationFacts(AzureRMModuleBase):
         self.resource_group = None
         self.circuit_name = None
         self.name = None
-        super(AzureRMExpressRouteCircuitAuthorizationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMExpressRouteCircuitAuthorizationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['express_route_circuit_authorizations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['express_route_circuit_authorizations'] = self.get()
         return self.results
 
@@ -119,7 +132,7 @@ class AzureRMExpressRouteCircuitAuthorizationFacts(AzureRMModuleBase):
             response = self.mgmt_client.express_route_circuit_authorizations.get(resource_group_name=self.resource_group,
                                                                                  circuit_name=self.circuit_name,
                                                                                  authorization_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Express Route Circuit Authorization.')
 
@@ -128,6 +141,14 @@ class AzureRMExpressRouteCircuitAuthorizationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.express_route_circuit_authorizations, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -44,6 +44,34 @@ options:
             - 'azure_public_peering'
             - 'azure_private_peering'
             - 'microsoft_peering'
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
         description:
             - "The state of peering. Possible values are: 'Disabled' and 'Enabled'. Possible values include: 'Disabled', 'Enabled'"
@@ -709,17 +737,21 @@ state:
     returned: always
     type: str
     sample: state
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -730,7 +762,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
+class AzureRMExpressRouteCircuitPeering(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Express Route Circuit Peering resource"""
 
     def __init__(self):
@@ -1360,46 +1392,46 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.peering_parameters[key] = kwargs[key]
 
-        dict_resource_id(self.peering_parameters, ['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.peering_parameters, ['peering_type'], True)
-        dict_map(self.peering_parameters, ['state'], {True: 'Enabled', False: 'Disabled'})
-        dict_camelize(self.peering_parameters, ['microsoft_peering_config', 'advertised_public_prefixes_state'], True)
-        dict_resource_id(self.peering_parameters, ['route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.peering_parameters, ['route_filter', 'rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.peering_parameters, ['route_filter', 'rules', 'access'], True)
-        dict_resource_id(self.peering_parameters, ['route_filter', 'peerings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.peering_parameters, ['route_filter', 'peerings', 'peering_type'], True)
-        dict_map(self.peering_parameters, ['route_filter', 'peerings', 'state'], {True: 'Enabled', False: 'Disabled'})
-        dict_camelize(self.peering_parameters, ['route_filter', 'peerings', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
-        dict_resource_id(self.peering_parameters, ['route_filter', 'peerings', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.peering_parameters, ['route_filter', 'peerings', 'route_filter', 'rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.peering_parameters, ['route_filter', 'peerings', 'route_filter', 'rules', 'access'], True)
-        dict_resource_id(self.peering_parameters, ['route_filter', 'peerings', 'route_filter', 'peerings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.peering_parameters, ['route_filter', 'peerings', 'route_filter', 'peerings', 'peering_type'], True)
-        dict_map(self.peering_parameters, ['route_filter', 'peerings', 'route_filter', 'peerings', 'state'], {True: 'Enabled', False: 'Disabled'})
-        dict_camelize(self.peering_parameters, ['route_filter', 'peerings', 'ipv6_peering_config', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
-        dict_resource_id(self.peering_parameters, ['route_filter', 'peerings', 'ipv6_peering_config', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_map(self.peering_parameters, ['route_filter', 'peerings', 'ipv6_peering_config', 'state'], {True: 'Enabled', False: 'Disabled'})
-        dict_camelize(self.peering_parameters, ['ipv6_peering_config', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
-        dict_resource_id(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'rules', 'access'], True)
-        dict_resource_id(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'peerings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'peerings', 'peering_type'], True)
-        dict_map(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'peerings', 'state'], {True: 'Enabled', False: 'Disabled'})
-        dict_camelize(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'peerings', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
-        dict_resource_id(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'peerings', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_map(self.peering_parameters, ['ipv6_peering_config', 'route_filter', 'peerings', 'ipv6_peering_config', 'state'], {True: 'Enabled', False: 'Disabled'})
-        dict_map(self.peering_parameters, ['ipv6_peering_config', 'state'], {True: 'Enabled', False: 'Disabled'})
+        transform = DictTransform()
+        transform.resource_id(['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['peering_type'], True)
+        transform.map(['state'], {True: 'Enabled', False: 'Disabled'})
+        transform.camelize(['microsoft_peering_config', 'advertised_public_prefixes_state'], True)
+        transform.resource_id(['route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['route_filter', 'rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['route_filter', 'rules', 'access'], True)
+        transform.resource_id(['route_filter', 'peerings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['route_filter', 'peerings', 'peering_type'], True)
+        transform.map(['route_filter', 'peerings', 'state'], {True: 'Enabled', False: 'Disabled'})
+        transform.camelize(['route_filter', 'peerings', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
+        transform.resource_id(['route_filter', 'peerings', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['route_filter', 'peerings', 'route_filter', 'rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['route_filter', 'peerings', 'route_filter', 'rules', 'access'], True)
+        transform.resource_id(['route_filter', 'peerings', 'route_filter', 'peerings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['route_filter', 'peerings', 'route_filter', 'peerings', 'peering_type'], True)
+        transform.map(['route_filter', 'peerings', 'route_filter', 'peerings', 'state'], {True: 'Enabled', False: 'Disabled'})
+        transform.camelize(['route_filter', 'peerings', 'ipv6_peering_config', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
+        transform.resource_id(['route_filter', 'peerings', 'ipv6_peering_config', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.map(['route_filter', 'peerings', 'ipv6_peering_config', 'state'], {True: 'Enabled', False: 'Disabled'})
+        transform.camelize(['ipv6_peering_config', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
+        transform.resource_id(['ipv6_peering_config', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['ipv6_peering_config', 'route_filter', 'rules', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['ipv6_peering_config', 'route_filter', 'rules', 'access'], True)
+        transform.resource_id(['ipv6_peering_config', 'route_filter', 'peerings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['ipv6_peering_config', 'route_filter', 'peerings', 'peering_type'], True)
+        transform.map(['ipv6_peering_config', 'route_filter', 'peerings', 'state'], {True: 'Enabled', False: 'Disabled'})
+        transform.camelize(['ipv6_peering_config', 'route_filter', 'peerings', 'microsoft_peering_config', 'advertised_public_prefixes_state'], True)
+        transform.resource_id(['ipv6_peering_config', 'route_filter', 'peerings', 'route_filter', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.map(['ipv6_peering_config', 'route_filter', 'peerings', 'ipv6_peering_config', 'state'], {True: 'Enabled', False: 'Disabled'})
+        transform.map(['ipv6_peering_config', 'state'], {True: 'Enabled', False: 'Disabled'})
+        transform.apply(self.peering_parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_expressroutecircuitpeering()
+        old_response = self.cached_get(self.get_expressroutecircuitpeering)
 
         if not old_response:
             self.log("Express Route Circuit Peering instance doesn't exist")
@@ -1412,7 +1444,7 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.peering_parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.peering_parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -1420,6 +1452,7 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.peering_parameters, old_response)
                 return self.results
 
             response = self.create_update_expressroutecircuitpeering()
@@ -1431,12 +1464,11 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_expressroutecircuitpeering()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_expressroutecircuitpeering()
+            self.wait_for_delete(response, self.get_expressroutecircuitpeering, 'Express Route Circuit Peering')
         else:
             self.log("Express Route Circuit Peering instance unchanged")
             self.results['changed'] = False
@@ -1455,7 +1487,7 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit Peering instance state dictionary
         '''
-        self.log("Creating / Updating the Express Route Circuit Peering instance {0}".format(self.name))
+        self.log("Creating / Updating the Express Route Circuit Peering instance {0}", self.name)
 
         try:
             response = self.mgmt_client.express_route_circuit_peerings.create_or_update(resource_group_name=self.resource_group,
@@ -1474,9 +1506,9 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
         '''
         Deletes specified Express Route Circuit Peering instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Express Route Circuit Peering instance {0}".format(self.name))
+        self.log("Deleting the Express Route Circuit Peering instance {0}", self.name)
         try:
             response = self.mgmt_client.express_route_circuit_peerings.delete(resource_group_name=self.resource_group,
                                                                               circuit_name=self.circuit_name,
@@ -1485,7 +1517,7 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
             self.log('Error attempting to delete the Express Route Circuit Peering instance.')
             self.fail("Error deleting the Express Route Circuit Peering instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_expressroutecircuitpeering(self):
         '''
@@ -1493,15 +1525,15 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit Peering instance state dictionary
         '''
-        self.log("Checking if the Express Route Circuit Peering instance {0} is present".format(self.name))
+        self.log("Checking if the Express Route Circuit Peering instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.express_route_circuit_peerings.get(resource_group_name=self.resource_group,
                                                                            circuit_name=self.circuit_name,
                                                                            peering_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Express Route Circuit Peering instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Express Route Circuit Peering instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Express Route Circuit Peering instance.')
         if found is True:
@@ -1510,100 +1542,6 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMExpressRouteCircuitPeering()
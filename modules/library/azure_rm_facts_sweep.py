@@ -0,0 +1,373 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2018 Zim Kalinowski, <zikalino@microsoft.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_facts_sweep
+version_added: "2.8"
+short_description: List the instances of a facts module over many subscriptions and resource groups into a file.
+description:
+    - Run the list operation of a facts module over every matching resource group of one or more subscriptions, with
+      a bounded number of operations at a time, and write the instances to a file as they are read, one JSON
+      document per line (NDJSON), CSV or Parquet. Only a summary is returned.
+    - Child resources (for example the databases of SQL servers) are listed under every parent of the scope, unless
+      the parent is given in I(args). Parents are found with the generic resources API, so only child resources of
+      top level resources are supported this way.
+    - Facts modules and their list operations are taken from C(azure_rm_sweep_registry), built from the modules by
+      C(tools/build_sweep_registry.py).
+
+options:
+    module:
+        description:
+            - Name of the facts module whose instances are listed, e.g. C(azure_rm_sqldatabase_facts).
+        required: True
+    subscriptions:
+        description:
+            - Subscription IDs to list.
+            - Defaults to the subscription of the credentials.
+        type: list
+    resource_groups:
+        description:
+            - Shell style patterns of the resource group names to list, matched case insensitively.
+        type: list
+        default: ['*']
+    args:
+        description:
+            - Other options of I(module) passed to its list operation, e.g. C(server_name).
+        type: dict
+    tags:
+        description:
+            - Only write instances with these tags, each C(key) or C(key:value).
+        type: list
+    select:
+        description:
+            - List of attributes to write for each instance instead of the whole instance.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    concurrency:
+        description:
+            - Maximum number of list operations running at the same time.
+        type: int
+        default: 16
+    output_file:
+        description:
+            - Path of the file the instances are written to. It is replaced when the sweep ends.
+        type: path
+        required: True
+    output_format:
+        description:
+            - Format of I(output_file), one JSON document per line, CSV or Parquet.
+            - CSV and Parquet have a column per attribute of the model of the first instance, or per attribute in
+              I(select). Nested values are written as JSON. Parquet needs the C(pyarrow) Python package.
+        default: ndjson
+        choices:
+            - ndjson
+            - csv
+            - parquet
+
+extends_documentation_fragment:
+    - azure
+
+author:
+    - "Zim Kalinowski (@zikalino)"
+
+'''
+
+EXAMPLES = '''
+  - name: Write all SQL databases of two subscriptions to a file
+    azure_rm_facts_sweep:
+      module: azure_rm_sqldatabase_facts
+      subscriptions:
+        - 00000000-1111-2222-3333-444444444444
+        - 55555555-6666-7777-8888-999999999999
+      resource_groups:
+        - prod-*
+      output_file: /tmp/databases.ndjson
+
+  - name: Write selected attributes of the storage accounts
+    azure_rm_facts_sweep:
+      module: azure_rm_storageaccount_facts
+      select:
+        - id
+        - sku.name
+      output_file: /tmp/storage.ndjson
+'''
+
+RETURN = '''
+output_file:
+    description:
+        - Path of the file.
+    returned: always
+    type: str
+count:
+    description:
+        - Number of instances written.
+    returned: always
+    type: int
+    sample: 25012
+bytes:
+    description:
+        - Size of the file.
+    returned: always
+    type: int
+calls:
+    description:
+        - Number of list operations run, one per resource group, parent or subscription.
+    returned: always
+    type: int
+errors:
+    description:
+        - List operations that failed with a service or connection error, each with C(scope) (subscription,
+          resource group or parent ID) and C(msg). Instances of the other operations are still written.
+    returned: always
+    type: list
+'''
+
+import fnmatch
+import traceback
+from multiprocessing.pool import ThreadPool
+
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
+from ansible.module_utils.azure_rm_resources import list_resources, odata_string
+from ansible.module_utils.azure_rm_sweep_registry import SWEEP_TARGETS
+
+try:
+    from msrest.exceptions import ClientRequestError
+    from msrestazure.azure_exceptions import CloudError
+    from msrestazure.tools import parse_resource_id
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+
+class SweepFailed(Exception):
+    pass
+
+
+def normalized(name):
+    return name.replace('_', '').lower()
+
+
+def parent_type(url, argument):
+    '''
+    Resource type of the parent a list operation URL template names with argument, e.g.
+    Microsoft.Sql/servers for server_name in .../providers/Microsoft.Sql/servers/{serverName}/databases.
+
+    :return: the type, None unless argument names a top level resource
+    '''
+    segments = (url or '').strip('/').split('/')
+    lowered = [s.lower() for s in segments]
+    if 'providers' not in lowered:
+        return None
+    index = lowered.index('providers')
+    rest = segments[index + 1:]
+    if len(rest) < 3 or normalized(rest[2].strip('{}')) != normalized(argument):
+        return None
+    return '{0}/{1}'.format(rest[0], rest[1])
+
+
+class AzureRMFactsSweep(AzureRMFactsModuleBase):
+    def __init__(self):
+        # define user inputs into argument
+        self.module_arg_spec = dict(
+            module=dict(
+                type='str',
+                required=True
+            ),
+            subscriptions=dict(
+                type='list'
+            ),
+            resource_groups=dict(
+                type='list',
+                default=['*']
+            ),
+            args=dict(
+                type='dict'
+            ),
+            tags=dict(
+                type='list'
+            ),
+            concurrency=dict(
+                type='int',
+                default=16
+            ),
+            output_file=dict(
+                type='path',
+                required=True
+            )
+        )
+        # store the results of the module operation
+        self.results = dict(
+            changed=False
+        )
+        self.subscriptions = None
+        self.resource_groups = None
+        self.args = None
+        self.tags = None
+        self.concurrency = None
+        self.output_file = None
+        self.group_clients = None
+        super(AzureRMFactsSweep, self).__init__(self.module_arg_spec, supports_tags=False, supports_output=True)
+
+    def exec_module(self, **kwargs):
+        target = SWEEP_TARGETS.get(kwargs['module'])
+        if target is None:
+            self.fail("{0} is not a facts module with list operations".format(kwargs['module']))
+        for key in self.module_arg_spec:
+            if key != 'module':
+                setattr(self, key, kwargs[key])
+        self.args = self.args or {}
+        if 'resource_group' in self.args:
+            self.fail("Give the resource groups to list in resource_groups, not in args")
+        client_type, operations = target
+        operation, arguments, missing = self.choose_operation(kwargs['module'], operations)
+
+        subscriptions = self.subscriptions or [self.subscription_id]
+        clients = dict((s, self.client(client_type, s)) for s in subscriptions)
+        if missing is None and 'resource_group' in arguments.values():
+            self.group_clients = dict((s, self.client('azure.mgmt.resource.ResourceManagementClient', s, api_version='2017-05-10'))
+                                      for s in subscriptions)
+        pool = ThreadPool(max(1, self.concurrency))
+        # fail_json must not run on the pool, failures end the sweep from here
+        self.fail = self._fail_sweep
+        failure = None
+        try:
+            scopes = []
+            for found in pool.map(lambda s: self.scopes(clients[s], s, operation, arguments, missing), subscriptions):
+                scopes.extend(found)
+            errors = [error for error in pool.map(lambda scope: self.sweep(operation, scope), scopes) if error]
+        except SweepFailed as exc:
+            failure = dict(msg=str(exc))
+        except Exception as exc:
+            # e.g. arguments the SDK rejects, the same for every scope
+            failure = dict(msg="Error sweeping {0}: {1}".format(kwargs['module'], str(exc)), exception=traceback.format_exc())
+        finally:
+            pool.close()
+            pool.join()
+            del self.fail
+        if failure is not None:
+            # also removes the partial output file
+            self.fail(**failure)
+        self.results.update(calls=len(scopes), errors=errors)
+        return self.results
+
+    def choose_operation(self, module, operations):
+        '''
+        The list operation that takes every option of args, preferring one needing no parent, and
+        then one matching the resource group scope: by resource group when resource_groups filters,
+        by subscription otherwise.
+
+        :return: (operations group, method), its arguments, the argument naming the parent to list
+                 or None
+        '''
+        by_group = self.resource_groups != ['*']
+        candidates = []
+        for group, method, arguments in operations:
+            options = set(arguments.values())
+            if set(self.args) - options:
+                continue
+            missing = [a for a, o in arguments.items() if o not in self.args and o != 'resource_group']
+            if len(missing) > 1:
+                continue
+            candidates.append((len(missing), ('resource_group' in options) != by_group, group, method, arguments, missing))
+        if not candidates:
+            self.fail("No list operation of {0} takes args {1}; the options of its list operations are {2}".format(
+                module, sorted(self.args), [sorted(o[2].values()) for o in operations]))
+        dummy, dummy, group, method, arguments, missing = sorted(candidates, key=lambda c: c[:4])[0]
+        return (group, method), arguments, missing[0] if missing else None
+
+    def client(self, client_type, subscription_id, **kwargs):
+        client = self.get_mgmt_svc_client(client_type, base_url=self._cloud_environment.endpoints.resource_manager, **kwargs)
+        client.config.subscription_id = subscription_id
+        return client
+
+    def scopes(self, client, subscription_id, operation, arguments, missing):
+        '''
+        Arguments of the list operations of a subscription: one set per matching resource group, per
+        parent in a matching resource group when missing names a parent, or a single one.
+        '''
+        base = dict((a, self.args[o]) for a, o in arguments.items() if o in self.args)
+        needs_group = 'resource_group' in arguments.values()
+        group_argument = [a for a, o in arguments.items() if o == 'resource_group']
+        result = []
+        if missing is not None:
+            method = getattr(getattr(client, operation[0]), operation[1])
+            rtype = parent_type((getattr(method, 'metadata', None) or {}).get('url'), missing)
+            if rtype is None:
+                raise SweepFailed("Cannot find the parents of {0}, give option {1} in args".format(operation[1], arguments[missing]))
+            try:
+                parents = list_resources(client, subscription_id, odata_filter='resourceType eq {0}'.format(odata_string(rtype)))
+            except CloudError as exc:
+                raise SweepFailed("Error listing {0} of subscription {1}: {2}".format(rtype, subscription_id, str(exc)))
+            for parent in parents:
+                group = parse_resource_id(parent['id']).get('resource_group')
+                if self.matches(group):
+                    scope = dict(base, **{missing: parent['name']})
+                    if needs_group:
+                        scope[group_argument[0]] = group
+                    result.append((client, parent['id'], scope))
+        elif needs_group:
+            for group in self.list_groups(subscription_id):
+                if self.matches(group):
+                    result.append((client, '/subscriptions/{0}/resourceGroups/{1}'.format(subscription_id, group),
+                                   dict(base, **{group_argument[0]: group})))
+        else:
+            result.append((client, '/subscriptions/{0}'.format(subscription_id), base))
+        return result
+
+    def list_groups(self, subscription_id):
+        try:
+            return [group.name for group in self.group_clients[subscription_id].resource_groups.list()]
+        except CloudError as exc:
+            raise SweepFailed("Error listing the resource groups of subscription {0}: {1}".format(subscription_id, str(exc)))
+
+    def matches(self, group):
+        if self.resource_groups == ['*']:
+            return True
+        return group is not None and any(fnmatch.fnmatch(group.lower(), p.lower()) for p in self.resource_groups)
+
+    def _fail_sweep(self, msg, **kwargs):
+        raise SweepFailed(msg)
+
+    def sweep(self, operation, scope):
+        '''
+        Run one list operation and write its instances as the pages arrive.
+
+        :return: the error, None when the operation succeeded
+        '''
+        client, path, arguments = scope
+        # subscription wide operations are filtered here
+        filter_groups = 'resourcegroups' not in path.lower() and self.resource_groups != ['*']
+        try:
+            response = getattr(getattr(client, operation[0]), operation[1])(**arguments)
+            for item in response:
+                if filter_groups and not self.matches(parse_resource_id(getattr(item, 'id', None) or '').get('resource_group')):
+                    continue
+                if self.tags and not self.has_tags(getattr(item, 'tags', None), self.tags):
+                    continue
+                self.write_output(item)
+        except (CloudError, ClientRequestError) as exc:
+            # service and connection errors only affect this scope
+            self.log("Error listing {0}: {1}", path, exc)
+            return dict(scope=path, msg=str(exc))
+        return None
+
+
+def main():
+    AzureRMFactsSweep()
+
+
+if __name__ == '__main__':
+    main()
@@ -30,6 +30,16 @@ options:
         description:
             - The name of the feature to get.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -79,18 +89,17 @@ features:
             sample: feature_id1
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.features import FeatureClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMFeatureFacts(AzureRMModuleBase):
+class AzureRMFeatureFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -110,14 +119,18 @@ class AzureRMFeatureFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_provider_namespace = None
         self.name = None
-        super(AzureRMFeatureFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMFeatureFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(FeatureClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.features.FeatureClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['features'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['features'] = self.get()
         return self.results
 
@@ -127,7 +140,7 @@ class AzureRMFeatureFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.features.get(resource_provider_namespace=self.resource_provider_namespace,
                                                      feature_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Feature.')
 
@@ -136,6 +149,14 @@ class AzureRMFeatureFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.features, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
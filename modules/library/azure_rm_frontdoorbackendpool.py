@@ -91,6 +91,34 @@ options:
     name:
         description:
             - Resource name.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Backend Pool.
@@ -135,17 +163,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/frontDoors/frontDoor1/backendPools/backendPool1
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.frontdoor import FrontDoorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -156,7 +188,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMBackendPool(AzureRMModuleBase):
+class AzureRMBackendPool(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Backend Pool resource"""
 
     def __init__(self):
@@ -260,20 +292,20 @@ class AzureRMBackendPool(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.backend_pool_parameters[key] = kwargs[key]
 
-        dict_resource_id(self.backend_pool_parameters, ['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_map(self.backend_pool_parameters, ['backends', 'enabled_state'], {True: 'Enabled', False: 'Disabled'})
-        dict_resource_id(self.backend_pool_parameters, ['load_balancing_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.backend_pool_parameters, ['health_probe_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.backend_pool_parameters, ['resource_state'], True)
+        transform = DictTransform()
+        transform.resource_id(['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.map(['backends', 'enabled_state'], {True: 'Enabled', False: 'Disabled'})
+        transform.resource_id(['load_balancing_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['health_probe_settings', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['resource_state'], True)
+        transform.apply(self.backend_pool_parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(FrontDoorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.frontdoor.FrontDoorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_backendpool()
+        old_response = self.cached_get(self.get_backendpool)
 
         if not old_response:
             self.log("Backend Pool instance doesn't exist")
@@ -286,7 +318,7 @@ class AzureRMBackendPool(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.backend_pool_parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.backend_pool_parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -294,6 +326,7 @@ class AzureRMBackendPool(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.backend_pool_parameters, old_response)
                 return self.results
 
             response = self.create_update_backendpool()
@@ -305,12 +338,11 @@ class AzureRMBackendPool(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_backendpool()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_backendpool()
+            self.wait_for_delete(response, self.get_backendpool, 'Backend Pool')
         else:
             self.log("Backend Pool instance unchanged")
             self.results['changed'] = False
@@ -328,7 +360,7 @@ class AzureRMBackendPool(AzureRMModuleBase):
 
         :return: deserialized Backend Pool instance state dictionary
         '''
-        self.log("Creating / Updating the Backend Pool instance {0}".format(self.name))
+        self.log("Creating / Updating the Backend Pool instance {0}", self.name)
 
         try:
             response = self.mgmt_client.backend_pools.create_or_update(resource_group_name=self.resource_group,
@@ -347,9 +379,9 @@ class AzureRMBackendPool(AzureRMModuleBase):
         '''
         Deletes specified Backend Pool instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Backend Pool instance {0}".format(self.name))
+        self.log("Deleting the Backend Pool instance {0}", self.name)
         try:
             response = self.mgmt_client.backend_pools.delete(resource_group_name=self.resource_group,
                                                              front_door_name=self.front_door_name,
@@ -358,7 +390,7 @@ class AzureRMBackendPool(AzureRMModuleBase):
             self.log('Error attempting to delete the Backend Pool instance.')
             self.fail("Error deleting the Backend Pool instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_backendpool(self):
         '''
@@ -366,15 +398,15 @@ class AzureRMBackendPool(AzureRMModuleBase):
 
         :return: deserialized Backend Pool instance state dictionary
         '''
-        self.log("Checking if the Backend Pool instance {0} is present".format(self.name))
+        self.log("Checking if the Backend Pool instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.backend_pools.get(resource_group_name=self.resource_group,
                                                           front_door_name=self.front_door_name,
                                                           backend_pool_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Backend Pool instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Backend Pool instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Backend Pool instance.')
         if found is True:
@@ -383,100 +415,6 @@ class AzureRMBackendPool(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMBackendPool()
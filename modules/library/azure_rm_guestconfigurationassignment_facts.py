@@ -34,6 +34,16 @@ options:
         description:
             - The name of the virtual machine.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -91,18 +101,17 @@ guest_configuration_assignments:
                     sample: context
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.guestconfiguration import GuestConfigurationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMGuestConfigurationAssignmentFacts(AzureRMModuleBase):
+class AzureRMGuestConfigurationAssignmentFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -127,14 +136,18 @@ class AzureRMGuestConfigurationAssignmentFacts(AzureRMModuleBase):
         self.resource_group = None
         self.guest_configuration_assignment_name = None
         self.name = None
-        super(AzureRMGuestConfigurationAssignmentFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMGuestConfigurationAssignmentFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(GuestConfigurationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.guestconfiguration.GuestConfigurationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['guest_configuration_assignments'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['guest_configuration_assignments'] = self.get()
         return self.results
 
@@ -145,7 +158,7 @@ class AzureRMGuestConfigurationAssignmentFacts(AzureRMModuleBase):
             response = self.mgmt_client.guest_configuration_assignments.get(resource_group_name=self.resource_group,
                                                                             guest_configuration_assignment_name=self.guest_configuration_assignment_name,
                                                                             vm_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Guest Configuration Assignment.')
 
@@ -154,6 +167,14 @@ class AzureRMGuestConfigurationAssignmentFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.guest_configuration_assignments, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
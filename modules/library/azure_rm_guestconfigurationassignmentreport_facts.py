@@ -38,6 +38,16 @@ options:
         description:
             - The name of the virtual machine.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -143,18 +153,17 @@ guest_configuration_assignment_reports:
                             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.guestconfiguration import GuestConfigurationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMGuestConfigurationAssignmentReportFacts(AzureRMModuleBase):
+class AzureRMGuestConfigurationAssignmentReportFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -184,14 +193,18 @@ class AzureRMGuestConfigurationAssignmentReportFacts(AzureRMModuleBase):
         self.guest_configuration_assignment_name = None
         self.report_id = None
         self.name = None
-        super(AzureRMGuestConfigurationAssignmentReportFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMGuestConfigurationAssignmentReportFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(GuestConfigurationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.guestconfiguration.GuestConfigurationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['guest_configuration_assignment_reports'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['guest_configuration_assignment_reports'] = self.get()
         return self.results
 
@@ -203,7 +216,7 @@ class AzureRMGuestConfigurationAssignmentReportFacts(AzureRMModuleBase):
                                                                                    guest_configuration_assignment_name=self.guest_configuration_assignment_name,
                                                                                    report_id=self.report_id,
                                                                                    vm_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Guest Configuration Assignment Report.')
 
@@ -212,6 +225,14 @@ class AzureRMGuestConfigurationAssignmentReportFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.guest_configuration_assignment_reports, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
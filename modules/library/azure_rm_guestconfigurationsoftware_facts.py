@@ -34,6 +34,16 @@ options:
         description:
             - The software Id.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -59,18 +69,17 @@ software:
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.guestconfiguration import GuestConfigurationClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMSoftwareFacts(AzureRMModuleBase):
+class AzureRMSoftwareFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -95,14 +104,18 @@ class AzureRMSoftwareFacts(AzureRMModuleBase):
         self.resource_group = None
         self.vm_name = None
         self.software_id = None
-        super(AzureRMSoftwareFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMSoftwareFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(GuestConfigurationClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.guestconfiguration.GuestConfigurationClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['software'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['software'] = self.get()
         return self.results
 
@@ -113,7 +126,7 @@ class AzureRMSoftwareFacts(AzureRMModuleBase):
             response = self.mgmt_client.software.get(resource_group_name=self.resource_group,
                                                      vm_name=self.vm_name,
                                                      software_id=self.software_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Software.')
 
@@ -122,6 +135,14 @@ class AzureRMSoftwareFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.software, ids):
+            if response is not None:
+                results.append(self.format_item(response))
+
+        return results
+
     def format_item(self, item):
         d = item.as_dict()
         d = {
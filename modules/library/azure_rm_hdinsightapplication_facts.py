@@ -37,6 +37,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -93,18 +103,17 @@ applications:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.hdinsight import HDInsightManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMApplicationFacts(AzureRMModuleBase):
+class AzureRMApplicationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -133,14 +142,18 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
         self.cluster_name = None
         self.name = None
         self.tags = None
-        super(AzureRMApplicationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMApplicationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(HDInsightManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.hdinsight.HDInsightManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['applications'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['applications'] = self.get()
         return self.results
 
@@ -151,7 +164,7 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
             response = self.mgmt_client.applications.get(resource_group_name=self.resource_group,
                                                          cluster_name=self.cluster_name,
                                                          application_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Application.')
 
@@ -160,6 +173,14 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.applications, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -193,6 +193,34 @@ options:
                        form:
                        '/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.ManagedIdentity/userAssignedIdentities/{ident
                       ityName}'."
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Cluster.
@@ -252,17 +280,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.HDInsight/clusters/cluster1
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.hdinsight import HDInsightManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -273,7 +305,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMCluster(AzureRMModuleBase):
+class AzureRMCluster(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Cluster resource"""
 
     def __init__(self):
@@ -480,38 +512,33 @@ class AzureRMCluster(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_expand(self.parameters, ['cluster_version'])
-        dict_expand(self.parameters, ['os_type'])
-        dict_camelize(self.parameters, ['os_type'], True)
-        dict_expand(self.parameters, ['tier'])
-        dict_camelize(self.parameters, ['tier'], True)
-        dict_expand(self.parameters, ['cluster_definition'])
-        dict_camelize(self.parameters, ['security_profile', 'directory_type'], True)
-        dict_expand(self.parameters, ['security_profile'])
-        dict_expand(self.parameters, ['compute_profile_roles', 'vm_size'])
-        dict_rename(self.parameters, ['compute_profile_roles', 'linux_profile'], 'os_profile')
-        dict_expand(self.parameters, ['compute_profile_roles', 'linux_profile'])
-        dict_resource_id(self.parameters, ['compute_profile_roles', 'virtual_network_profile', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_rename(self.parameters, ['compute_profile_roles'], 'compute_profile')
-        dict_expand(self.parameters, ['compute_profile_roles'])
-        dict_expand(self.parameters, ['compute_profile'])
-        dict_rename(self.parameters, ['storage_accounts'], 'storage_profile')
-        dict_expand(self.parameters, ['storage_accounts'])
-        dict_expand(self.parameters, ['storage_profile'])
-        dict_camelize(self.parameters, ['identity', 'type'], True)
-        dict_map(self.parameters, ['identity', 'type'], {'system_assigned, _user_assigned': 'SystemAssigned, UserAssigned'})
+        transform = DictTransform()
+        transform.expand(['cluster_version'], 'properties')
+        transform.expand(['os_type'], 'properties')
+        transform.camelize(['properties', 'os_type'], True)
+        transform.expand(['tier'], 'properties')
+        transform.camelize(['properties', 'tier'], True)
+        transform.expand(['cluster_definition'], 'properties')
+        transform.camelize(['security_profile', 'directory_type'], True)
+        transform.expand(['security_profile'], 'properties')
+        transform.rename(['compute_profile_roles', 'os_profile', 'linux_profile'], 'linux_operating_system_profile')
+        transform.resource_id(['compute_profile_roles', 'virtual_network_profile', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.rename(['compute_profile_roles'], 'roles')
+        transform.expand(['roles'], 'compute_profile')
+        transform.expand(['compute_profile'], 'properties')
+        transform.rename(['storage_accounts'], 'storageaccounts')
+        transform.expand(['storageaccounts'], 'storage_profile')
+        transform.expand(['storage_profile'], 'properties')
+        transform.camelize(['identity', 'type'], True)
+        transform.map(['identity', 'type'], {'system_assigned, _user_assigned': 'SystemAssigned, UserAssigned'})
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(HDInsightManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.hdinsight.HDInsightManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_cluster()
+        old_response = self.cached_get(self.get_cluster)
 
         if not old_response:
             self.log("Cluster instance doesn't exist")
@@ -524,14 +551,16 @@ class AzureRMCluster(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Cluster instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_cluster()
@@ -543,12 +572,11 @@ class AzureRMCluster(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_cluster()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_cluster()
+            self.wait_for_delete(response, self.get_cluster, 'Cluster')
         else:
             self.log("Cluster instance unchanged")
             self.results['changed'] = False
@@ -566,7 +594,7 @@ class AzureRMCluster(AzureRMModuleBase):
 
         :return: deserialized Cluster instance state dictionary
         '''
-        self.log("Creating / Updating the Cluster instance {0}".format(self.name))
+        self.log("Creating / Updating the Cluster instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -588,9 +616,9 @@ class AzureRMCluster(AzureRMModuleBase):
         '''
         Deletes specified Cluster instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Cluster instance {0}".format(self.name))
+        self.log("Deleting the Cluster instance {0}", self.name)
         try:
             response = self.mgmt_client.clusters.delete(resource_group_name=self.resource_group,
                                                         cluster_name=self.name)
@@ -598,7 +626,7 @@ class AzureRMCluster(AzureRMModuleBase):
             self.log('Error attempting to delete the Cluster instance.')
             self.fail("Error deleting the Cluster instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_cluster(self):
         '''
@@ -606,14 +634,14 @@ class AzureRMCluster(AzureRMModuleBase):
 
         :return: deserialized Cluster instance state dictionary
         '''
-        self.log("Checking if the Cluster instance {0} is present".format(self.name))
+        self.log("Checking if the Cluster instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.clusters.get(resource_group_name=self.resource_group,
                                                      cluster_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Cluster instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Cluster instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Cluster instance.')
         if found is True:
@@ -622,131 +650,6 @@ class AzureRMCluster(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_rename(d, path, new_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_rename(d[i], path, new_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[new_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_rename(sd, path[1:], new_name)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMCluster()
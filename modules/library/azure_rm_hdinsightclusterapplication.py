@@ -205,6 +205,34 @@ options:
     additional_properties:
         description:
             - The additional properties for application.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Application.
@@ -239,15 +267,18 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
-import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
-    from azure.mgmt.cluster import HDInsightManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -258,7 +289,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMApplications(AzureRMModuleBase):
+class AzureRMApplications(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Application resource"""
 
     def __init__(self):
@@ -347,12 +378,10 @@ class AzureRMApplications(AzureRMModuleBase):
         old_response = None
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(HDInsightManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.cluster.HDInsightManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_application()
+        old_response = self.cached_get(self.get_application)
 
         if not old_response:
             self.log("Application instance doesn't exist")
@@ -373,6 +402,7 @@ class AzureRMApplications(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_application()
@@ -387,13 +417,11 @@ class AzureRMApplications(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_application()
-            # make sure instance is actually deleted, for some Azure resources, instance is hanging around
-            # for some time after deletion -- this should be really fixed in Azure.
-            while self.get_application():
-                time.sleep(20)
+            response = self.delete_application()
+            self.wait_for_delete(response, self.get_application, 'Application')
         else:
             self.log("Application instance unchanged")
             self.results['changed'] = False
@@ -408,7 +436,7 @@ class AzureRMApplications(AzureRMModuleBase):
 
         :return: deserialized Application instance state dictionary
         '''
-        self.log("Creating / Updating the Application instance {0}".format(self.name))
+        self.log("Creating / Updating the Application instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -430,9 +458,9 @@ class AzureRMApplications(AzureRMModuleBase):
         '''
         Deletes specified Application instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Application instance {0}".format(self.name))
+        self.log("Deleting the Application instance {0}", self.name)
         try:
             response = self.mgmt_client.applications.delete(resource_group_name=self.resource_group,
                                                             cluster_name=self.cluster_name,
@@ -441,7 +469,7 @@ class AzureRMApplications(AzureRMModuleBase):
             self.log('Error attempting to delete the Application instance.')
             self.fail("Error deleting the Application instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_application(self):
         '''
@@ -449,15 +477,15 @@ class AzureRMApplications(AzureRMModuleBase):
 
         :return: deserialized Application instance state dictionary
         '''
-        self.log("Checking if the Application instance {0} is present".format(self.name))
+        self.log("Checking if the Application instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.applications.get(resource_group_name=self.resource_group,
                                                          cluster_name=self.cluster_name,
                                                          application_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Application instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Application instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Application instance.')
         if found is True:
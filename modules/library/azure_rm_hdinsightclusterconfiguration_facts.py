@@ -34,6 +34,16 @@ options:
         description:
             - The constant for configuration type of gateway.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -59,19 +69,18 @@ configurations:
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.cluster import HDInsightManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMConfigurationsFacts(AzureRMModuleBase):
+class AzureRMConfigurationsFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -96,14 +105,18 @@ class AzureRMConfigurationsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.cluster_name = None
         self.configuration_name = None
-        super(AzureRMConfigurationsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMConfigurationsFacts, self).__init__(self.module_arg_spec, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(HDInsightManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.cluster.HDInsightManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['configurations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.resource_group is not None and
                 self.cluster_name is not None and
                 self.configuration_name is not None):
@@ -117,7 +130,7 @@ class AzureRMConfigurationsFacts(AzureRMModuleBase):
             response = self.mgmt_client.configurations.get(resource_group_name=self.resource_group,
                                                            cluster_name=self.cluster_name,
                                                            configuration_name=self.configuration_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Configurations.')
 
@@ -126,6 +139,14 @@ class AzureRMConfigurationsFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.configurations, ids):
+            if response is not None:
+                results.append(self.format_item(response))
+
+        return results
+
     def format_item(self, item):
         d = item.as_dict()
         d = {
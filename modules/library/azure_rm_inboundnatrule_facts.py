@@ -37,6 +37,16 @@ options:
     expand:
         description:
             - Expands referenced resources.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -81,18 +91,17 @@ inbound_nat_rules:
             sample: natRule1.1
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMInboundNatRuleFacts(AzureRMModuleBase):
+class AzureRMInboundNatRuleFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -121,14 +130,18 @@ class AzureRMInboundNatRuleFacts(AzureRMModuleBase):
         self.load_balancer_name = None
         self.name = None
         self.expand = None
-        super(AzureRMInboundNatRuleFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMInboundNatRuleFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['inbound_nat_rules'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['inbound_nat_rules'] = self.get()
         return self.results
 
@@ -139,7 +152,7 @@ class AzureRMInboundNatRuleFacts(AzureRMModuleBase):
             response = self.mgmt_client.inbound_nat_rules.get(resource_group_name=self.resource_group,
                                                               load_balancer_name=self.load_balancer_name,
                                                               inbound_nat_rule_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Inbound Nat Rule.')
 
@@ -148,6 +161,14 @@ class AzureRMInboundNatRuleFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.inbound_nat_rules, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -37,6 +37,16 @@ options:
     if_match:
         description:
             - ETag of the certificate.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -119,18 +129,17 @@ dps_certificate:
             sample: AAAAAAExpNs=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.iothubprovisioningservices import IotDpsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMDpsCertificateFacts(AzureRMModuleBase):
+class AzureRMDpsCertificateFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -159,14 +168,18 @@ class AzureRMDpsCertificateFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.if_match = None
-        super(AzureRMDpsCertificateFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMDpsCertificateFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(IotDpsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.iothubprovisioningservices.IotDpsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['dps_certificate'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['dps_certificate'] = self.get()
         return self.results
 
@@ -177,7 +190,7 @@ class AzureRMDpsCertificateFacts(AzureRMModuleBase):
             response = self.mgmt_client.dps_certificate.get(certificate_name=self.certificate_name,
                                                             resource_group_name=self.resource_group,
                                                             provisioning_service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Dps Certificate.')
 
@@ -186,6 +199,14 @@ class AzureRMDpsCertificateFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.dps_certificate, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -34,22 +34,34 @@ options:
         description:
             - The resource location.
             - Required when C(state) is I(present).
-    state:
+    wait_for_completion:
         description:
-            - Current state of the provisioning service.
-        choices:
-            - 'activating'
-            - 'active'
-            - 'deleting'
-            - 'deleted'
-            - 'activation_failed'
-            - 'deletion_failed'
-            - 'transitioning'
-            - 'suspending'
-            - 'suspended'
-            - 'resuming'
-            - 'failing_over'
-            - 'failover_failed'
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     iot_hubs:
         description:
             - List of IoT hubs assosciated with this provisioning service.
@@ -152,17 +164,21 @@ id:
     type: str
     sample: "/subscriptions/91d12660-3dec-467a-be2a-213b5544ddc0/resourceGroups/myResourceGroup/providers/Microsoft.Devices/ProvisioningServices/myFirstProvi
             sioningService"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.iothubprovisioningservices import IotDpsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -173,7 +189,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMIotDpsResource(AzureRMModuleBase):
+class AzureRMIotDpsResource(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Iot Dps Resource resource"""
 
     def __init__(self):
@@ -189,21 +205,6 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
             location=dict(
                 type='str'
             ),
-            state=dict(
-                type='str',
-                choices=['activating',
-                         'active',
-                         'deleting',
-                         'deleted',
-                         'activation_failed',
-                         'deletion_failed',
-                         'transitioning',
-                         'suspending',
-                         'suspended',
-                         'resuming',
-                         'failing_over',
-                         'failover_failed']
-            ),
             iot_hubs=dict(
                 type='list',
                 options=dict(
@@ -291,23 +292,21 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.iot_dps_description[key] = kwargs[key]
 
-        dict_expand(self.iot_dps_description, ['state'])
-        dict_camelize(self.iot_dps_description, ['state'], True)
-        dict_expand(self.iot_dps_description, ['iot_hubs'])
-        dict_expand(self.iot_dps_description, ['allocation_policy'])
-        dict_camelize(self.iot_dps_description, ['allocation_policy'], True)
-        dict_camelize(self.iot_dps_description, ['authorization_policies', 'rights'], True)
-        dict_expand(self.iot_dps_description, ['authorization_policies'])
-        dict_camelize(self.iot_dps_description, ['sku', 'name'], True)
+        transform = DictTransform()
+        transform.expand(['iot_hubs'], 'properties')
+        transform.expand(['allocation_policy'], 'properties')
+        transform.camelize(['properties', 'allocation_policy'], True)
+        transform.camelize(['authorization_policies', 'rights'], True)
+        transform.expand(['authorization_policies'], 'properties')
+        transform.camelize(['sku', 'name'], True)
+        transform.apply(self.iot_dps_description)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(IotDpsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.iothubprovisioningservices.IotDpsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_iotdpsresource()
+        old_response = self.cached_get(self.get_iotdpsresource)
 
         if not old_response:
             self.log("Iot Dps Resource instance doesn't exist")
@@ -320,7 +319,7 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.iot_dps_description, old_response, '', self.results)):
+                if (not self.compare_state(self.iot_dps_description, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -328,6 +327,7 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.iot_dps_description, old_response)
                 return self.results
 
             response = self.create_update_iotdpsresource()
@@ -339,12 +339,11 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_iotdpsresource()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_iotdpsresource()
+            self.wait_for_delete(response, self.get_iotdpsresource, 'Iot Dps Resource')
         else:
             self.log("Iot Dps Resource instance unchanged")
             self.results['changed'] = False
@@ -362,7 +361,7 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
 
         :return: deserialized Iot Dps Resource instance state dictionary
         '''
-        self.log("Creating / Updating the Iot Dps Resource instance {0}".format(self.resource_group))
+        self.log("Creating / Updating the Iot Dps Resource instance {0}", self.resource_group)
 
         try:
             response = self.mgmt_client.iot_dps_resource.create_or_update(resource_group_name=self.resource_group,
@@ -380,9 +379,9 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
         '''
         Deletes specified Iot Dps Resource instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Iot Dps Resource instance {0}".format(self.resource_group))
+        self.log("Deleting the Iot Dps Resource instance {0}", self.resource_group)
         try:
             response = self.mgmt_client.iot_dps_resource.delete(provisioning_service_name=self.name,
                                                                 resource_group_name=self.resource_group)
@@ -390,7 +389,7 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
             self.log('Error attempting to delete the Iot Dps Resource instance.')
             self.fail("Error deleting the Iot Dps Resource instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_iotdpsresource(self):
         '''
@@ -398,14 +397,14 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
 
         :return: deserialized Iot Dps Resource instance state dictionary
         '''
-        self.log("Checking if the Iot Dps Resource instance {0} is present".format(self.resource_group))
+        self.log("Checking if the Iot Dps Resource instance {0} is present", self.resource_group)
         found = False
         try:
             response = self.mgmt_client.iot_dps_resource.get(provisioning_service_name=self.name,
                                                              resource_group_name=self.resource_group)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Iot Dps Resource instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Iot Dps Resource instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Iot Dps Resource instance.')
         if found is True:
@@ -414,80 +413,6 @@ class AzureRMIotDpsResource(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMIotDpsResource()
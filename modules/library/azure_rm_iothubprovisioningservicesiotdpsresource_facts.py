@@ -31,6 +31,29 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -130,20 +153,25 @@ iot_dps_resource:
                     returned: always
                     type: int
                     sample: 1
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.iothubprovisioningservices import IotDpsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMIotDpsResourceFacts(AzureRMModuleBase):
+class AzureRMIotDpsResourceFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -165,14 +193,18 @@ class AzureRMIotDpsResourceFacts(AzureRMModuleBase):
         self.provisioning_service_name = None
         self.resource_group = None
         self.tags = None
-        super(AzureRMIotDpsResourceFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMIotDpsResourceFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(IotDpsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.iothubprovisioningservices.IotDpsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['iot_dps_resource'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.provisioning_service_name is not None and
                 self.resource_group is not None):
             self.results['iot_dps_resource'] = self.get()
@@ -188,7 +220,7 @@ class AzureRMIotDpsResourceFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.iot_dps_resource.get(provisioning_service_name=self.provisioning_service_name,
                                                              resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Iot Dps Resource.')
 
@@ -197,17 +229,25 @@ class AzureRMIotDpsResourceFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.iot_dps_resource, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_resource_group(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.iot_dps_resource.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Iot Dps Resource.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 if self.has_tags(item.tags, self.tags):
                     results.append(self.format_response(item))
 
@@ -218,12 +258,12 @@ class AzureRMIotDpsResourceFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.iot_dps_resource.list_by_subscription()
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Iot Dps Resource.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 if self.has_tags(item.tags, self.tags):
                     results.append(self.format_response(item))
 
@@ -341,6 +341,34 @@ options:
     if_match:
         description:
             - ETag of the IoT Hub. Do not specify for creating a brand new IoT Hub. Required to update an existing IoT Hub.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Iot Hub Resource.
@@ -443,17 +471,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/ae24ff83-d2ca-4fc8-9717-05dae4bba489/resourceGroups/myResourceGroup/providers/Microsoft.Devices/IotHubs/testHub
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.iothub import IotHubClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -464,7 +496,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMIotHubResource(AzureRMModuleBase):
+class AzureRMIotHubResource(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Iot Hub Resource resource"""
 
     def __init__(self):
@@ -770,32 +802,32 @@ class AzureRMIotHubResource(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.iot_hub_description[key] = kwargs[key]
 
-        dict_camelize(self.iot_hub_description, ['authorization_policies', 'rights'], True)
-        dict_map(self.iot_hub_description, ['authorization_policies', 'rights'], {'registry_read, _registry_write': 'RegistryRead, RegistryWrite', 'registry_read, _service_connect': 'RegistryRead, ServiceConnect', 'registry_read, _device_connect': 'RegistryRead, DeviceConnect', 'registry_write, _service_connect': 'RegistryWrite, ServiceConnect', 'registry_write, _device_connect': 'RegistryWrite, DeviceConnect', 'service_connect, _device_connect': 'ServiceConnect, DeviceConnect', 'registry_read, _registry_write, _service_connect': 'RegistryRead, RegistryWrite, ServiceConnect', 'registry_read, _registry_write, _device_connect': 'RegistryRead, RegistryWrite, DeviceConnect', 'registry_read, _service_connect, _device_connect': 'RegistryRead, ServiceConnect, DeviceConnect', 'registry_write, _service_connect, _device_connect': 'RegistryWrite, ServiceConnect, DeviceConnect', 'registry_read, _registry_write, _service_connect, _device_connect': 'RegistryRead, RegistryWrite, ServiceConnect, DeviceConnect'})
-        dict_expand(self.iot_hub_description, ['authorization_policies'])
-        dict_camelize(self.iot_hub_description, ['ip_filter_rules', 'action'], True)
-        dict_expand(self.iot_hub_description, ['ip_filter_rules'])
-        dict_expand(self.iot_hub_description, ['event_hub_endpoints'])
-        dict_camelize(self.iot_hub_description, ['routing', 'routes', 'source'], True)
-        dict_expand(self.iot_hub_description, ['routing'])
-        dict_expand(self.iot_hub_description, ['storage_endpoints'])
-        dict_expand(self.iot_hub_description, ['messaging_endpoints'])
-        dict_expand(self.iot_hub_description, ['enable_file_upload_notifications'])
-        dict_expand(self.iot_hub_description, ['cloud_to_device'])
-        dict_expand(self.iot_hub_description, ['comments'])
-        dict_expand(self.iot_hub_description, ['operations_monitoring_properties'])
-        dict_expand(self.iot_hub_description, ['features'])
-        dict_camelize(self.iot_hub_description, ['features'], True)
-        dict_camelize(self.iot_hub_description, ['sku', 'name'], True)
+        transform = DictTransform()
+        transform.camelize(['authorization_policies', 'rights'], True)
+        transform.map(['authorization_policies', 'rights'], {'registry_read, _registry_write': 'RegistryRead, RegistryWrite', 'registry_read, _service_connect': 'RegistryRead, ServiceConnect', 'registry_read, _device_connect': 'RegistryRead, DeviceConnect', 'registry_write, _service_connect': 'RegistryWrite, ServiceConnect', 'registry_write, _device_connect': 'RegistryWrite, DeviceConnect', 'service_connect, _device_connect': 'ServiceConnect, DeviceConnect', 'registry_read, _registry_write, _service_connect': 'RegistryRead, RegistryWrite, ServiceConnect', 'registry_read, _registry_write, _device_connect': 'RegistryRead, RegistryWrite, DeviceConnect', 'registry_read, _service_connect, _device_connect': 'RegistryRead, ServiceConnect, DeviceConnect', 'registry_write, _service_connect, _device_connect': 'RegistryWrite, ServiceConnect, DeviceConnect', 'registry_read, _registry_write, _service_connect, _device_connect': 'RegistryRead, RegistryWrite, ServiceConnect, DeviceConnect'})
+        transform.expand(['authorization_policies'], 'properties')
+        transform.camelize(['ip_filter_rules', 'action'], True)
+        transform.expand(['ip_filter_rules'], 'properties')
+        transform.expand(['event_hub_endpoints'], 'properties')
+        transform.camelize(['routing', 'routes', 'source'], True)
+        transform.expand(['routing'], 'properties')
+        transform.expand(['storage_endpoints'], 'properties')
+        transform.expand(['messaging_endpoints'], 'properties')
+        transform.expand(['enable_file_upload_notifications'], 'properties')
+        transform.expand(['cloud_to_device'], 'properties')
+        transform.expand(['comments'], 'properties')
+        transform.expand(['operations_monitoring_properties'], 'properties')
+        transform.expand(['features'], 'properties')
+        transform.camelize(['properties', 'features'], True)
+        transform.camelize(['sku', 'name'], True)
+        transform.apply(self.iot_hub_description)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(IotHubClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.iothub.IotHubClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_iothubresource()
+        old_response = self.cached_get(self.get_iothubresource)
 
         if not old_response:
             self.log("Iot Hub Resource instance doesn't exist")
@@ -808,7 +840,7 @@ class AzureRMIotHubResource(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.iot_hub_description, old_response, '', self.results)):
+                if (not self.compare_state(self.iot_hub_description, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -816,6 +848,7 @@ class AzureRMIotHubResource(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.iot_hub_description, old_response)
                 return self.results
 
             response = self.create_update_iothubresource()
@@ -827,12 +860,11 @@ class AzureRMIotHubResource(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_iothubresource()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_iothubresource()
+            self.wait_for_delete(response, self.get_iothubresource, 'Iot Hub Resource')
         else:
             self.log("Iot Hub Resource instance unchanged")
             self.results['changed'] = False
@@ -850,7 +882,7 @@ class AzureRMIotHubResource(AzureRMModuleBase):
 
         :return: deserialized Iot Hub Resource instance state dictionary
         '''
-        self.log("Creating / Updating the Iot Hub Resource instance {0}".format(self.name))
+        self.log("Creating / Updating the Iot Hub Resource instance {0}", self.name)
 
         try:
             response = self.mgmt_client.iot_hub_resource.create_or_update(resource_group_name=self.resource_group,
@@ -868,9 +900,9 @@ class AzureRMIotHubResource(AzureRMModuleBase):
         '''
         Deletes specified Iot Hub Resource instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Iot Hub Resource instance {0}".format(self.name))
+        self.log("Deleting the Iot Hub Resource instance {0}", self.name)
         try:
             response = self.mgmt_client.iot_hub_resource.delete(resource_group_name=self.resource_group,
                                                                 resource_name=self.name)
@@ -878,7 +910,7 @@ class AzureRMIotHubResource(AzureRMModuleBase):
             self.log('Error attempting to delete the Iot Hub Resource instance.')
             self.fail("Error deleting the Iot Hub Resource instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_iothubresource(self):
         '''
@@ -886,14 +918,14 @@ class AzureRMIotHubResource(AzureRMModuleBase):
 
         :return: deserialized Iot Hub Resource instance state dictionary
         '''
-        self.log("Checking if the Iot Hub Resource instance {0} is present".format(self.name))
+        self.log("Checking if the Iot Hub Resource instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.iot_hub_resource.get(resource_group_name=self.resource_group,
                                                              resource_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Iot Hub Resource instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Iot Hub Resource instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Iot Hub Resource instance.')
         if found is True:
@@ -902,95 +934,6 @@ class AzureRMIotHubResource(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMIotHubResource()
@@ -34,6 +34,16 @@ options:
         description:
             - The name of the frontend IP configuration.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -90,18 +100,17 @@ load_balancer_frontend_ip_configurations:
             sample: "W/\'00000000-0000-0000-0000-000000000000\'"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMLoadBalancerFrontendIPConfigurationFacts(AzureRMModuleBase):
+class AzureRMLoadBalancerFrontendIPConfigurationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -126,14 +135,18 @@ class AzureRMLoadBalancerFrontendIPConfigurationFacts(AzureRMModuleBase):
         self.resource_group = None
         self.load_balancer_name = None
         self.name = None
-        super(AzureRMLoadBalancerFrontendIPConfigurationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMLoadBalancerFrontendIPConfigurationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['load_balancer_frontend_ip_configurations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['load_balancer_frontend_ip_configurations'] = self.get()
         return self.results
 
@@ -144,7 +157,7 @@ class AzureRMLoadBalancerFrontendIPConfigurationFacts(AzureRMModuleBase):
             response = self.mgmt_client.load_balancer_frontend_ip_configurations.get(resource_group_name=self.resource_group,
                                                                                      load_balancer_name=self.load_balancer_name,
                                                                                      frontend_ip_configuration_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Load Balancer Frontend I P Configuration.')
 
@@ -153,6 +166,14 @@ class AzureRMLoadBalancerFrontendIPConfigurationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.load_balancer_frontend_ip_configurations, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -38,6 +38,34 @@ options:
         description:
             - The resource id of the resource that will be linked to the workspace.
         required: True
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Linked Service.
@@ -73,17 +101,20 @@ id:
     type: str
     sample: "/subscriptions/00000000-0000-0000-0000-00000000000/resourcegroups/mms-eus/providers/microsoft.operationalinsights/workspaces/testlinkws/linkedse
             rvices/automation"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.loganalytics import OperationalInsightsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -94,7 +125,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMLinkedService(AzureRMModuleBase):
+class AzureRMLinkedService(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Linked Service resource"""
 
     def __init__(self):
@@ -148,12 +179,10 @@ class AzureRMLinkedService(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(OperationalInsightsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.loganalytics.OperationalInsightsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_linkedservice()
+        old_response = self.cached_get(self.get_linkedservice)
 
         if not old_response:
             self.log("Linked Service instance doesn't exist")
@@ -166,7 +195,7 @@ class AzureRMLinkedService(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -174,6 +203,7 @@ class AzureRMLinkedService(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_linkedservice()
@@ -185,12 +215,11 @@ class AzureRMLinkedService(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_linkedservice()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_linkedservice()
+            self.wait_for_delete(response, self.get_linkedservice, 'Linked Service')
         else:
             self.log("Linked Service instance unchanged")
             self.results['changed'] = False
@@ -208,7 +237,7 @@ class AzureRMLinkedService(AzureRMModuleBase):
 
         :return: deserialized Linked Service instance state dictionary
         '''
-        self.log("Creating / Updating the Linked Service instance {0}".format(self.name))
+        self.log("Creating / Updating the Linked Service instance {0}", self.name)
 
         try:
             response = self.mgmt_client.linked_services.create_or_update(resource_group_name=self.resource_group,
@@ -227,9 +256,9 @@ class AzureRMLinkedService(AzureRMModuleBase):
         '''
         Deletes specified Linked Service instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Linked Service instance {0}".format(self.name))
+        self.log("Deleting the Linked Service instance {0}", self.name)
         try:
             response = self.mgmt_client.linked_services.delete(resource_group_name=self.resource_group,
                                                                workspace_name=self.workspace_name,
@@ -238,7 +267,7 @@ class AzureRMLinkedService(AzureRMModuleBase):
             self.log('Error attempting to delete the Linked Service instance.')
             self.fail("Error deleting the Linked Service instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_linkedservice(self):
         '''
@@ -246,15 +275,15 @@ class AzureRMLinkedService(AzureRMModuleBase):
 
         :return: deserialized Linked Service instance state dictionary
         '''
-        self.log("Checking if the Linked Service instance {0} is present".format(self.name))
+        self.log("Checking if the Linked Service instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.linked_services.get(resource_group_name=self.resource_group,
                                                             workspace_name=self.workspace_name,
                                                             linked_service_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Linked Service instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Linked Service instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Linked Service instance.')
         if found is True:
@@ -263,49 +292,6 @@ class AzureRMLinkedService(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMLinkedService()
@@ -37,6 +37,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -94,18 +104,17 @@ integration_account_agreements:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.logic import LogicManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMIntegrationAccountAgreementFacts(AzureRMModuleBase):
+class AzureRMIntegrationAccountAgreementFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -134,14 +143,18 @@ class AzureRMIntegrationAccountAgreementFacts(AzureRMModuleBase):
         self.integration_account_name = None
         self.name = None
         self.tags = None
-        super(AzureRMIntegrationAccountAgreementFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMIntegrationAccountAgreementFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(LogicManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.logic.LogicManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['integration_account_agreements'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['integration_account_agreements'] = self.get()
         return self.results
 
@@ -152,7 +165,7 @@ class AzureRMIntegrationAccountAgreementFacts(AzureRMModuleBase):
             response = self.mgmt_client.integration_account_agreements.get(resource_group_name=self.resource_group,
                                                                            integration_account_name=self.integration_account_name,
                                                                            agreement_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Integration Account Agreement.')
 
@@ -161,6 +174,14 @@ class AzureRMIntegrationAccountAgreementFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.integration_account_agreements, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -89,6 +89,34 @@ options:
     assembly_public_key_token:
         description:
             - The assembly public key token.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Integration Account Assembly.
@@ -127,17 +155,21 @@ id:
     type: str
     sample: "/subscriptions/34adfa4f-cedf-4dc0-ba29-b6d1a69ab345/resourceGroups/testResourceGroup/providers/Microsoft.Logic/integrationAccounts/testIntegrati
             onAccount/assemblies/testAssembly"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.logic import LogicManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -148,7 +180,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
+class AzureRMIntegrationAccountAssembly(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Integration Account Assembly resource"""
 
     def __init__(self):
@@ -253,25 +285,25 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.assembly_artifact[key] = kwargs[key]
 
-        dict_expand(self.assembly_artifact, ['created_time'])
-        dict_expand(self.assembly_artifact, ['changed_time'])
-        dict_expand(self.assembly_artifact, ['metadata'])
-        dict_expand(self.assembly_artifact, ['content'])
-        dict_expand(self.assembly_artifact, ['content_type'])
-        dict_expand(self.assembly_artifact, ['content_link'])
-        dict_expand(self.assembly_artifact, ['assembly_name'])
-        dict_expand(self.assembly_artifact, ['assembly_version'])
-        dict_expand(self.assembly_artifact, ['assembly_culture'])
-        dict_expand(self.assembly_artifact, ['assembly_public_key_token'])
+        transform = DictTransform()
+        transform.expand(['created_time'], 'properties')
+        transform.expand(['changed_time'], 'properties')
+        transform.expand(['metadata'], 'properties')
+        transform.expand(['content'], 'properties')
+        transform.expand(['content_type'], 'properties')
+        transform.expand(['content_link'], 'properties')
+        transform.expand(['assembly_name'], 'properties')
+        transform.expand(['assembly_version'], 'properties')
+        transform.expand(['assembly_culture'], 'properties')
+        transform.expand(['assembly_public_key_token'], 'properties')
+        transform.apply(self.assembly_artifact)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(LogicManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.logic.LogicManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_integrationaccountassembly()
+        old_response = self.cached_get(self.get_integrationaccountassembly)
 
         if not old_response:
             self.log("Integration Account Assembly instance doesn't exist")
@@ -284,7 +316,7 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.assembly_artifact, old_response, '', self.results)):
+                if (not self.compare_state(self.assembly_artifact, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -292,6 +324,7 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.assembly_artifact, old_response)
                 return self.results
 
             response = self.create_update_integrationaccountassembly()
@@ -303,12 +336,11 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_integrationaccountassembly()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_integrationaccountassembly()
+            self.wait_for_delete(response, self.get_integrationaccountassembly, 'Integration Account Assembly')
         else:
             self.log("Integration Account Assembly instance unchanged")
             self.results['changed'] = False
@@ -326,7 +358,7 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
 
         :return: deserialized Integration Account Assembly instance state dictionary
         '''
-        self.log("Creating / Updating the Integration Account Assembly instance {0}".format(self.name))
+        self.log("Creating / Updating the Integration Account Assembly instance {0}", self.name)
 
         try:
             response = self.mgmt_client.integration_account_assemblies.create_or_update(resource_group_name=self.resource_group,
@@ -345,9 +377,9 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
         '''
         Deletes specified Integration Account Assembly instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Integration Account Assembly instance {0}".format(self.name))
+        self.log("Deleting the Integration Account Assembly instance {0}", self.name)
         try:
             response = self.mgmt_client.integration_account_assemblies.delete(resource_group_name=self.resource_group,
                                                                               integration_account_name=self.integration_account_name,
@@ -356,7 +388,7 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
             self.log('Error attempting to delete the Integration Account Assembly instance.')
             self.fail("Error deleting the Integration Account Assembly instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_integrationaccountassembly(self):
         '''
@@ -364,15 +396,15 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
 
         :return: deserialized Integration Account Assembly instance state dictionary
         '''
-        self.log("Checking if the Integration Account Assembly instance {0} is present".format(self.name))
+        self.log("Checking if the Integration Account Assembly instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.integration_account_assemblies.get(resource_group_name=self.resource_group,
                                                                            integration_account_name=self.integration_account_name,
                                                                            assembly_artifact_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Integration Account Assembly instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Integration Account Assembly instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Integration Account Assembly instance.')
         if found is True:
@@ -381,65 +413,6 @@ class AzureRMIntegrationAccountAssembly(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMIntegrationAccountAssembly()
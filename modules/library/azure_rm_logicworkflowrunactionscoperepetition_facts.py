@@ -45,6 +45,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -111,18 +121,17 @@ workflow_run_action_scope_repetitions:
             sample: NotSpecified
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.logic import LogicManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMWorkflowRunActionScopeRepetitionFacts(AzureRMModuleBase):
+class AzureRMWorkflowRunActionScopeRepetitionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -161,14 +170,18 @@ class AzureRMWorkflowRunActionScopeRepetitionFacts(AzureRMModuleBase):
         self.action_name = None
         self.name = None
         self.tags = None
-        super(AzureRMWorkflowRunActionScopeRepetitionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMWorkflowRunActionScopeRepetitionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(LogicManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.logic.LogicManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['workflow_run_action_scope_repetitions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['workflow_run_action_scope_repetitions'] = self.get()
         return self.results
 
@@ -181,7 +194,7 @@ class AzureRMWorkflowRunActionScopeRepetitionFacts(AzureRMModuleBase):
                                                                                   run_name=self.run_name,
                                                                                   action_name=self.action_name,
                                                                                   repetition_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Workflow Run Action Scope Repetition.')
 
@@ -190,6 +203,14 @@ class AzureRMWorkflowRunActionScopeRepetitionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.workflow_run_action_scope_repetitions, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
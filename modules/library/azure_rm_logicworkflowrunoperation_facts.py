@@ -38,6 +38,16 @@ options:
         description:
             - The workflow operation id.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -156,18 +166,17 @@ workflow_run_operations:
             sample: 08586774142730039209110422528
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.logic import LogicManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMWorkflowRunOperationFacts(AzureRMModuleBase):
+class AzureRMWorkflowRunOperationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -197,14 +206,18 @@ class AzureRMWorkflowRunOperationFacts(AzureRMModuleBase):
         self.workflow_name = None
         self.name = None
         self.operation_id = None
-        super(AzureRMWorkflowRunOperationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMWorkflowRunOperationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(LogicManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.logic.LogicManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['workflow_run_operations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['workflow_run_operations'] = self.get()
         return self.results
 
@@ -216,7 +229,7 @@ class AzureRMWorkflowRunOperationFacts(AzureRMModuleBase):
                                                                     workflow_name=self.workflow_name,
                                                                     run_name=self.name,
                                                                     operation_id=self.operation_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Workflow Run Operation.')
 
@@ -225,6 +238,14 @@ class AzureRMWorkflowRunOperationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.workflow_run_operations, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -34,6 +34,16 @@ options:
         description:
             - The workflow trigger name.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -78,18 +88,17 @@ workflow_triggers:
             sample: status
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.logic import LogicManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMWorkflowTriggerFacts(AzureRMModuleBase):
+class AzureRMWorkflowTriggerFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -114,14 +123,18 @@ class AzureRMWorkflowTriggerFacts(AzureRMModuleBase):
         self.resource_group = None
         self.workflow_name = None
         self.name = None
-        super(AzureRMWorkflowTriggerFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMWorkflowTriggerFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(LogicManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.logic.LogicManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['workflow_triggers'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['workflow_triggers'] = self.get()
         return self.results
 
@@ -132,7 +145,7 @@ class AzureRMWorkflowTriggerFacts(AzureRMModuleBase):
             response = self.mgmt_client.workflow_triggers.get(resource_group_name=self.resource_group,
                                                               workflow_name=self.workflow_name,
                                                               trigger_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Workflow Trigger.')
 
@@ -141,6 +154,14 @@ class AzureRMWorkflowTriggerFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.workflow_triggers, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -38,6 +38,16 @@ options:
         description:
             - The workflow trigger history name. Corresponds to the run name for triggers that resulted in a run.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -77,18 +87,17 @@ workflow_trigger_histories:
             sample: status
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.logic import LogicManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMWorkflowTriggerHistoryFacts(AzureRMModuleBase):
+class AzureRMWorkflowTriggerHistoryFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -118,14 +127,18 @@ class AzureRMWorkflowTriggerHistoryFacts(AzureRMModuleBase):
         self.workflow_name = None
         self.trigger_name = None
         self.name = None
-        super(AzureRMWorkflowTriggerHistoryFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMWorkflowTriggerHistoryFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(LogicManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.logic.LogicManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['workflow_trigger_histories'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['workflow_trigger_histories'] = self.get()
         return self.results
 
@@ -137,7 +150,7 @@ class AzureRMWorkflowTriggerHistoryFacts(AzureRMModuleBase):
                                                                        workflow_name=self.workflow_name,
                                                                        trigger_name=self.trigger_name,
                                                                        history_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Workflow Trigger History.')
 
@@ -146,6 +159,14 @@ class AzureRMWorkflowTriggerHistoryFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.workflow_trigger_histories, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
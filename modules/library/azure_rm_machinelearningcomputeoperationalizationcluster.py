@@ -222,6 +222,34 @@ options:
                     refresh_period_in_seconds:
                         description:
                             - Refresh period in seconds.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Operationalization Cluster.
@@ -272,17 +300,21 @@ id:
     type: str
     sample: "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.MachineLearningCompute/operationalization
             Clusters/myCluster"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.machinelearningcompute import MachineLearningComputeManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -293,7 +325,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMOperationalizationCluster(AzureRMModuleBase):
+class AzureRMOperationalizationCluster(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Operationalization Cluster resource"""
 
     def __init__(self):
@@ -519,26 +551,23 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['cluster_type'], True)
-        dict_map(self.parameters, ['cluster_type'], {'acs': 'ACS'})
-        dict_camelize(self.parameters, ['container_service', 'orchestrator_type'], True)
-        dict_camelize(self.parameters, ['container_service', 'system_services', 'system_service_type'], True)
-        dict_camelize(self.parameters, ['container_service', 'agent_vm_size'], True)
-        dict_map(self.parameters, ['container_service', 'agent_vm_size'], {'standard_a0': 'Standard_A0', 'standard_a1': 'Standard_A1', 'standard_a2': 'Standard_A2', 'standard_a3': 'Standard_A3', 'standard_a4': 'Standard_A4', 'standard_a5': 'Standard_A5', 'standard_a6': 'Standard_A6', 'standard_a7': 'Standard_A7', 'standard_a8': 'Standard_A8', 'standard_a9': 'Standard_A9', 'standard_a10': 'Standard_A10', 'standard_a11': 'Standard_A11', 'standard_d1': 'Standard_D1', 'standard_d2': 'Standard_D2', 'standard_d3': 'Standard_D3', 'standard_d4': 'Standard_D4', 'standard_d11': 'Standard_D11', 'standard_d12': 'Standard_D12', 'standard_d13': 'Standard_D13', 'standard_d14': 'Standard_D14', 'standard_d1_v2': 'Standard_D1_v2', 'standard_d2_v2': 'Standard_D2_v2', 'standard_d3_v2': 'Standard_D3_v2', 'standard_d4_v2': 'Standard_D4_v2', 'standard_d5_v2': 'Standard_D5_v2', 'standard_d11_v2': 'Standard_D11_v2', 'standard_d12_v2': 'Standard_D12_v2', 'standard_d13_v2': 'Standard_D13_v2', 'standard_d14_v2': 'Standard_D14_v2', 'standard_g1': 'Standard_G1', 'standard_g2': 'Standard_G2', 'standard_g3': 'Standard_G3', 'standard_g4': 'Standard_G4', 'standard_g5': 'Standard_G5', 'standard_ds1': 'Standard_DS1', 'standard_ds2': 'Standard_DS2', 'standard_ds3': 'Standard_DS3', 'standard_ds4': 'Standard_DS4', 'standard_ds11': 'Standard_DS11', 'standard_ds12': 'Standard_DS12', 'standard_ds13': 'Standard_DS13', 'standard_ds14': 'Standard_DS14', 'standard_gs1': 'Standard_GS1', 'standard_gs2': 'Standard_GS2', 'standard_gs3': 'Standard_GS3', 'standard_gs4': 'Standard_GS4', 'standard_gs5': 'Standard_GS5'})
-        dict_map(self.parameters, ['global_service_configuration', 'ssl', 'status'], {True: 'Enabled', False: 'Disabled'})
-        dict_map(self.parameters, ['global_service_configuration', 'auto_scale', 'status'], {True: 'Enabled', False: 'Disabled'})
+        transform = DictTransform()
+        transform.camelize(['cluster_type'], True)
+        transform.map(['cluster_type'], {'acs': 'ACS'})
+        transform.camelize(['container_service', 'orchestrator_type'], True)
+        transform.camelize(['container_service', 'system_services', 'system_service_type'], True)
+        transform.camelize(['container_service', 'agent_vm_size'], True)
+        transform.map(['container_service', 'agent_vm_size'], {'standard_a0': 'Standard_A0', 'standard_a1': 'Standard_A1', 'standard_a2': 'Standard_A2', 'standard_a3': 'Standard_A3', 'standard_a4': 'Standard_A4', 'standard_a5': 'Standard_A5', 'standard_a6': 'Standard_A6', 'standard_a7': 'Standard_A7', 'standard_a8': 'Standard_A8', 'standard_a9': 'Standard_A9', 'standard_a10': 'Standard_A10', 'standard_a11': 'Standard_A11', 'standard_d1': 'Standard_D1', 'standard_d2': 'Standard_D2', 'standard_d3': 'Standard_D3', 'standard_d4': 'Standard_D4', 'standard_d11': 'Standard_D11', 'standard_d12': 'Standard_D12', 'standard_d13': 'Standard_D13', 'standard_d14': 'Standard_D14', 'standard_d1_v2': 'Standard_D1_v2', 'standard_d2_v2': 'Standard_D2_v2', 'standard_d3_v2': 'Standard_D3_v2', 'standard_d4_v2': 'Standard_D4_v2', 'standard_d5_v2': 'Standard_D5_v2', 'standard_d11_v2': 'Standard_D11_v2', 'standard_d12_v2': 'Standard_D12_v2', 'standard_d13_v2': 'Standard_D13_v2', 'standard_d14_v2': 'Standard_D14_v2', 'standard_g1': 'Standard_G1', 'standard_g2': 'Standard_G2', 'standard_g3': 'Standard_G3', 'standard_g4': 'Standard_G4', 'standard_g5': 'Standard_G5', 'standard_ds1': 'Standard_DS1', 'standard_ds2': 'Standard_DS2', 'standard_ds3': 'Standard_DS3', 'standard_ds4': 'Standard_DS4', 'standard_ds11': 'Standard_DS11', 'standard_ds12': 'Standard_DS12', 'standard_ds13': 'Standard_DS13', 'standard_ds14': 'Standard_DS14', 'standard_gs1': 'Standard_GS1', 'standard_gs2': 'Standard_GS2', 'standard_gs3': 'Standard_GS3', 'standard_gs4': 'Standard_GS4', 'standard_gs5': 'Standard_GS5'})
+        transform.map(['global_service_configuration', 'ssl', 'status'], {True: 'Enabled', False: 'Disabled'})
+        transform.map(['global_service_configuration', 'auto_scale', 'status'], {True: 'Enabled', False: 'Disabled'})
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MachineLearningComputeManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.machinelearningcompute.MachineLearningComputeManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_operationalizationcluster()
+        old_response = self.cached_get(self.get_operationalizationcluster)
 
         if not old_response:
             self.log("Operationalization Cluster instance doesn't exist")
@@ -551,14 +580,16 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Operationalization Cluster instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_operationalizationcluster()
@@ -570,12 +601,11 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_operationalizationcluster()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_operationalizationcluster()
+            self.wait_for_delete(response, self.get_operationalizationcluster, 'Operationalization Cluster')
         else:
             self.log("Operationalization Cluster instance unchanged")
             self.results['changed'] = False
@@ -593,7 +623,7 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
 
         :return: deserialized Operationalization Cluster instance state dictionary
         '''
-        self.log("Creating / Updating the Operationalization Cluster instance {0}".format(self.name))
+        self.log("Creating / Updating the Operationalization Cluster instance {0}", self.name)
 
         try:
             response = self.mgmt_client.operationalization_clusters.create_or_update(resource_group_name=self.resource_group,
@@ -611,9 +641,9 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
         '''
         Deletes specified Operationalization Cluster instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Operationalization Cluster instance {0}".format(self.name))
+        self.log("Deleting the Operationalization Cluster instance {0}", self.name)
         try:
             response = self.mgmt_client.operationalization_clusters.delete(resource_group_name=self.resource_group,
                                                                            cluster_name=self.name)
@@ -621,7 +651,7 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
             self.log('Error attempting to delete the Operationalization Cluster instance.')
             self.fail("Error deleting the Operationalization Cluster instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_operationalizationcluster(self):
         '''
@@ -629,14 +659,14 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
 
         :return: deserialized Operationalization Cluster instance state dictionary
         '''
-        self.log("Checking if the Operationalization Cluster instance {0} is present".format(self.name))
+        self.log("Checking if the Operationalization Cluster instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.operationalization_clusters.get(resource_group_name=self.resource_group,
                                                                         cluster_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Operationalization Cluster instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Operationalization Cluster instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Operationalization Cluster instance.')
         if found is True:
@@ -645,79 +675,6 @@ class AzureRMOperationalizationCluster(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
 def main():
     """Main execution"""
     AzureRMOperationalizationCluster()
@@ -44,6 +44,34 @@ options:
         description:
             - The friendly name for this workspace. This will be the workspace name in the arm id when the workspace object gets created
             - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Workspace.
@@ -80,17 +108,20 @@ id:
     type: str
     sample: "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.MachineLearningExperimentation/accounts/t
             estaccount/workspaces/testworkspace"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.machinelearningexperimentation import MLTeamAccountManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -101,7 +132,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMWorkspace(AzureRMModuleBase):
+class AzureRMWorkspace(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Workspace resource"""
 
     def __init__(self):
@@ -160,15 +191,10 @@ class AzureRMWorkspace(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MLTeamAccountManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.machinelearningexperimentation.MLTeamAccountManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_workspace()
+        old_response = self.cached_get(self.get_workspace)
 
         if not old_response:
             self.log("Workspace instance doesn't exist")
@@ -181,14 +207,16 @@ class AzureRMWorkspace(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Workspace instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_workspace()
@@ -200,12 +228,11 @@ class AzureRMWorkspace(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_workspace()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_workspace()
+            self.wait_for_delete(response, self.get_workspace, 'Workspace')
         else:
             self.log("Workspace instance unchanged")
             self.results['changed'] = False
@@ -223,7 +250,7 @@ class AzureRMWorkspace(AzureRMModuleBase):
 
         :return: deserialized Workspace instance state dictionary
         '''
-        self.log("Creating / Updating the Workspace instance {0}".format(self.name))
+        self.log("Creating / Updating the Workspace instance {0}", self.name)
 
         try:
             response = self.mgmt_client.workspaces.create_or_update(resource_group_name=self.resource_group,
@@ -242,9 +269,9 @@ class AzureRMWorkspace(AzureRMModuleBase):
         '''
         Deletes specified Workspace instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Workspace instance {0}".format(self.name))
+        self.log("Deleting the Workspace instance {0}", self.name)
         try:
             response = self.mgmt_client.workspaces.delete(resource_group_name=self.resource_group,
                                                           account_name=self.account_name,
@@ -253,7 +280,7 @@ class AzureRMWorkspace(AzureRMModuleBase):
             self.log('Error attempting to delete the Workspace instance.')
             self.fail("Error deleting the Workspace instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_workspace(self):
         '''
@@ -261,15 +288,15 @@ class AzureRMWorkspace(AzureRMModuleBase):
 
         :return: deserialized Workspace instance state dictionary
         '''
-        self.log("Checking if the Workspace instance {0} is present".format(self.name))
+        self.log("Checking if the Workspace instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.workspaces.get(resource_group_name=self.resource_group,
                                                        account_name=self.account_name,
                                                        workspace_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Workspace instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Workspace instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Workspace instance.')
         if found is True:
@@ -278,49 +305,6 @@ class AzureRMWorkspace(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMWorkspace()
@@ -39,6 +39,16 @@ options:
     cache_control:
         description:
             - "Indicates that the request shouldn't utilize any caches."
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -112,18 +122,17 @@ management_groups:
                             sample: RootGroup
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.managementgroups import ManagementGroupsAPI
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMManagementGroupFacts(AzureRMModuleBase):
+class AzureRMManagementGroupFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -154,14 +163,18 @@ class AzureRMManagementGroupFacts(AzureRMModuleBase):
         self.recurse = None
         self.filter = None
         self.cache_control = None
-        super(AzureRMManagementGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMManagementGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ManagementGroupsAPI,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.managementgroups.ManagementGroupsAPI',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['management_groups'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['management_groups'] = self.get()
         return self.results
 
@@ -170,7 +183,7 @@ class AzureRMManagementGroupFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.management_groups.get(group_id=self.group_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Management Group.')
 
@@ -179,6 +192,14 @@ class AzureRMManagementGroupFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.management_groups, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
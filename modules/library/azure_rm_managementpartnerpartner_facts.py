@@ -26,6 +26,16 @@ options:
         description:
             - Id of the Partner
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -79,18 +89,17 @@ partner:
             sample: Active
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.managementpartner import ACEProvisioningManagementPartnerAPI
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMPartnerFacts(AzureRMModuleBase):
+class AzureRMPartnerFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -105,14 +114,18 @@ class AzureRMPartnerFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.partner_id = None
-        super(AzureRMPartnerFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMPartnerFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ACEProvisioningManagementPartnerAPI,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.managementpartner.ACEProvisioningManagementPartnerAPI',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['partner'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['partner'] = self.get()
         return self.results
 
@@ -121,7 +134,7 @@ class AzureRMPartnerFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.partner.get(partner_id=self.partner_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Partner.')
 
@@ -130,6 +143,14 @@ class AzureRMPartnerFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.partner, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
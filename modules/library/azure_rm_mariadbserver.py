@@ -86,6 +86,34 @@ options:
     location:
         description:
             - Resource location. If not set, location from the resource group will be used as default.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the MariaDB Server.
@@ -149,17 +177,21 @@ fully_qualified_domain_name:
     returned: always
     type: str
     sample: fully_qualified_domain_name
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform, dict_flatten
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.mariadb import MariaDBManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -170,7 +202,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMMariaDBServer(AzureRMModuleBase):
+class AzureRMMariaDBServer(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM MariaDB Server resource"""
 
     def __init__(self):
@@ -271,30 +303,27 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['sku', 'tier'], True)
-        dict_expand(self.parameters, ['version'])
-        dict_rename(self.parameters, ['enforce_ssl'], 'properties')
-        dict_expand(self.parameters, ['enforce_ssl'])
-        dict_map(self.parameters, ['enforce_ssl'], {True: 'Enabled', False: 'Disabled'})
-        dict_map(self.parameters, ['storage_profile', 'geo_redundant_backup'], {True: 'Enabled', False: 'Disabled'})
-        dict_expand(self.parameters, ['storage_profile'])
-        dict_expand(self.parameters, ['create_mode'])
-        dict_rename(self.parameters, ['admin_username'], 'properties')
-        dict_expand(self.parameters, ['admin_username'])
-        dict_rename(self.parameters, ['admin_password'], 'properties')
-        dict_expand(self.parameters, ['admin_password'])
+        transform = DictTransform()
+        transform.camelize(['sku', 'tier'], True)
+        transform.expand(['version'], 'properties')
+        transform.rename(['enforce_ssl'], 'ssl_enforcement')
+        transform.map(['ssl_enforcement'], {True: 'Enabled', False: 'Disabled'})
+        transform.expand(['ssl_enforcement'], 'properties')
+        transform.map(['storage_profile', 'geo_redundant_backup'], {True: 'Enabled', False: 'Disabled'})
+        transform.expand(['storage_profile'], 'properties')
+        transform.expand(['create_mode'], 'properties')
+        transform.rename(['admin_username'], 'administrator_login')
+        transform.expand(['administrator_login'], 'properties')
+        transform.rename(['admin_password'], 'administrator_login_password')
+        transform.expand(['administrator_login_password'], 'properties')
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MariaDBManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.mariadb.MariaDBManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_mariadbserver()
+        old_response = self.cached_get(self.get_mariadbserver)
 
         if not old_response:
             self.log("MariaDB Server instance doesn't exist")
@@ -307,14 +336,16 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the MariaDB Server instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_mariadbserver()
@@ -326,12 +357,11 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_mariadbserver()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_mariadbserver()
+            self.wait_for_delete(response, self.get_mariadbserver, 'MariaDB Server')
         else:
             self.log("MariaDB Server instance unchanged")
             self.results['changed'] = False
@@ -352,13 +382,13 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
 
         :return: deserialized MariaDB Server instance state dictionary
         '''
-        self.log("Creating / Updating the MariaDB Server instance {0}".format(self.name))
+        self.log("Creating / Updating the MariaDB Server instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
                 response = self.mgmt_client.servers.create(resource_group_name=self.resource_group,
                                                            server_name=self.name,
-                                                           parameters=self.parameters)
+                                                           parameters=dict_flatten(self.parameters))
             else:
                 response = self.mgmt_client.servers.update(resource_group_name=self.resource_group,
                                                            server_name=self.name,
@@ -375,9 +405,9 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
         '''
         Deletes specified MariaDB Server instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the MariaDB Server instance {0}".format(self.name))
+        self.log("Deleting the MariaDB Server instance {0}", self.name)
         try:
             response = self.mgmt_client.servers.delete(resource_group_name=self.resource_group,
                                                        server_name=self.name)
@@ -385,7 +415,7 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
             self.log('Error attempting to delete the MariaDB Server instance.')
             self.fail("Error deleting the MariaDB Server instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_mariadbserver(self):
         '''
@@ -393,14 +423,14 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
 
         :return: deserialized MariaDB Server instance state dictionary
         '''
-        self.log("Checking if the MariaDB Server instance {0} is present".format(self.name))
+        self.log("Checking if the MariaDB Server instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.servers.get(resource_group_name=self.resource_group,
                                                     server_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("MariaDB Server instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("MariaDB Server instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the MariaDB Server instance.')
         if found is True:
@@ -409,110 +439,6 @@ class AzureRMMariaDBServer(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_rename(d, path, new_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_rename(d[i], path, new_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[new_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_rename(sd, path[1:], new_name)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMMariaDBServer()
@@ -34,6 +34,16 @@ options:
         description:
             - The name of the security alert policy.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -78,18 +88,17 @@ server_security_alert_policies:
             sample: Disabled
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.mariadb import MariaDBManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMServerSecurityAlertPolicyFacts(AzureRMModuleBase):
+class AzureRMServerSecurityAlertPolicyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -114,14 +123,18 @@ class AzureRMServerSecurityAlertPolicyFacts(AzureRMModuleBase):
         self.resource_group = None
         self.server_name = None
         self.name = None
-        super(AzureRMServerSecurityAlertPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMServerSecurityAlertPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(MariaDBManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.mariadb.MariaDBManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['server_security_alert_policies'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['server_security_alert_policies'] = self.get()
         return self.results
 
@@ -132,7 +145,7 @@ class AzureRMServerSecurityAlertPolicyFacts(AzureRMModuleBase):
             response = self.mgmt_client.server_security_alert_policies.get(resource_group_name=self.resource_group,
                                                                            server_name=self.server_name,
                                                                            security_alert_policy_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Server Security Alert Policy.')
 
@@ -141,6 +154,14 @@ class AzureRMServerSecurityAlertPolicyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.server_security_alert_policies, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
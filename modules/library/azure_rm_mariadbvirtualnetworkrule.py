@@ -41,6 +41,34 @@ options:
     ignore_missing_vnet_service_endpoint:
         description:
             - Create firewall rule before the virtual network has vnet service endpoint enabled.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Virtual Network Rule.
@@ -82,16 +110,19 @@ state:
     returned: always
     type: str
     sample: state
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
-import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.mariadb import MariaDBManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -102,7 +133,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMVirtualNetworkRules(AzureRMModuleBase):
+class AzureRMVirtualNetworkRules(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Virtual Network Rule resource"""
 
     def __init__(self):
@@ -158,12 +189,10 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
         old_response = None
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MariaDBManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.mariadb.MariaDBManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_virtualnetworkrule()
+        old_response = self.cached_get(self.get_virtualnetworkrule)
 
         if not old_response:
             self.log("Virtual Network Rule instance doesn't exist")
@@ -198,13 +227,11 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_virtualnetworkrule()
-            # make sure instance is actually deleted, for some Azure resources, instance is hanging around
-            # for some time after deletion -- this should be really fixed in Azure.
-            while self.get_virtualnetworkrule():
-                time.sleep(20)
+            response = self.delete_virtualnetworkrule()
+            self.wait_for_delete(response, self.get_virtualnetworkrule, 'Virtual Network Rule')
         else:
             self.log("Virtual Network Rule instance unchanged")
             self.results['changed'] = False
@@ -220,7 +247,7 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Rule instance state dictionary
         '''
-        self.log("Creating / Updating the Virtual Network Rule instance {0}".format(self.virtual_network_rule_name))
+        self.log("Creating / Updating the Virtual Network Rule instance {0}", self.virtual_network_rule_name)
 
         try:
             response = self.mgmt_client.virtual_network_rules.create_or_update(resource_group_name=self.resource_group,
@@ -239,9 +266,9 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
         '''
         Deletes specified Virtual Network Rule instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Virtual Network Rule instance {0}".format(self.virtual_network_rule_name))
+        self.log("Deleting the Virtual Network Rule instance {0}", self.virtual_network_rule_name)
         try:
             response = self.mgmt_client.virtual_network_rules.delete(resource_group_name=self.resource_group,
                                                                      server_name=self.server_name,
@@ -250,7 +277,7 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
             self.log('Error attempting to delete the Virtual Network Rule instance.')
             self.fail("Error deleting the Virtual Network Rule instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_virtualnetworkrule(self):
         '''
@@ -258,15 +285,15 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Rule instance state dictionary
         '''
-        self.log("Checking if the Virtual Network Rule instance {0} is present".format(self.virtual_network_rule_name))
+        self.log("Checking if the Virtual Network Rule instance {0} is present", self.virtual_network_rule_name)
         found = False
         try:
             response = self.mgmt_client.virtual_network_rules.get(resource_group_name=self.resource_group,
                                                                   server_name=self.server_name,
                                                                   virtual_network_rule_name=self.virtual_network_rule_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Virtual Network Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Virtual Network Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Virtual Network Rule instance.')
         if found is True:
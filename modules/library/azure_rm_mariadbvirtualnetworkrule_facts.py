@@ -33,6 +33,29 @@ options:
     virtual_network_rule_name:
         description:
             - The name of the virtual network rule.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -80,20 +103,25 @@ virtual_network_rules:
             returned: always
             type: str
             sample: Ready
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.mariadb import MariaDBManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMVirtualNetworkRulesFacts(AzureRMModuleBase):
+class AzureRMVirtualNetworkRulesFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -117,14 +145,18 @@ class AzureRMVirtualNetworkRulesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.server_name = None
         self.virtual_network_rule_name = None
-        super(AzureRMVirtualNetworkRulesFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMVirtualNetworkRulesFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(MariaDBManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.mariadb.MariaDBManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['virtual_network_rules'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.virtual_network_rule_name is not None:
             self.results['virtual_network_rules'] = self.get()
         else:
@@ -138,7 +170,7 @@ class AzureRMVirtualNetworkRulesFacts(AzureRMModuleBase):
             response = self.mgmt_client.virtual_network_rules.get(resource_group_name=self.resource_group,
                                                                   server_name=self.server_name,
                                                                   virtual_network_rule_name=self.virtual_network_rule_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for VirtualNetworkRules.')
 
@@ -147,18 +179,26 @@ class AzureRMVirtualNetworkRulesFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.virtual_network_rules, ids):
+            if response is not None:
+                results.append(self.format_item(response))
+
+        return results
+
     def list_by_server(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.virtual_network_rules.list_by_server(resource_group_name=self.resource_group,
                                                                              server_name=self.server_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for VirtualNetworkRules.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_item(item))
 
         return results
@@ -34,6 +34,16 @@ options:
         description:
             - The Asset name.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -90,18 +100,17 @@ assets:
             sample: asset-1b648c1a-2268-461d-a1da-742bde23db40
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.media import AzureMediaServices
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAssetFacts(AzureRMModuleBase):
+class AzureRMAssetFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -126,14 +135,18 @@ class AzureRMAssetFacts(AzureRMModuleBase):
         self.resource_group = None
         self.account_name = None
         self.name = None
-        super(AzureRMAssetFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAssetFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMediaServices,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.media.AzureMediaServices',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['assets'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['assets'] = self.get()
         return self.results
 
@@ -144,7 +157,7 @@ class AzureRMAssetFacts(AzureRMModuleBase):
             response = self.mgmt_client.assets.get(resource_group_name=self.resource_group,
                                                    account_name=self.account_name,
                                                    asset_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Asset.')
 
@@ -153,6 +166,14 @@ class AzureRMAssetFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.assets, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -38,6 +38,16 @@ options:
         description:
             - The Asset Filter name
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -84,18 +94,17 @@ asset_filters:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.media import AzureMediaServices
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAssetFilterFacts(AzureRMModuleBase):
+class AzureRMAssetFilterFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -125,14 +134,18 @@ class AzureRMAssetFilterFacts(AzureRMModuleBase):
         self.account_name = None
         self.asset_name = None
         self.name = None
-        super(AzureRMAssetFilterFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAssetFilterFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMediaServices,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.media.AzureMediaServices',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['asset_filters'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['asset_filters'] = self.get()
         return self.results
 
@@ -144,7 +157,7 @@ class AzureRMAssetFilterFacts(AzureRMModuleBase):
                                                           account_name=self.account_name,
                                                           asset_name=self.asset_name,
                                                           filter_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Asset Filter.')
 
@@ -153,6 +166,14 @@ class AzureRMAssetFilterFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.asset_filters, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -175,6 +175,34 @@ options:
         description:
             - The options to use for the LiveEvent.  This value is specified at creation time and cannot be updated.
         type: list
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Live Event.
@@ -221,17 +249,21 @@ id:
     type: str
     sample: "/subscriptions/0a6ec948-5a62-437d-b9df-934dc7c1b722/resourceGroups/mediaresources/providers/Microsoft.Media/mediaservices/slitestmedia10/liveeve
             nts/myLiveEvent1"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.media import AzureMediaServices
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -242,7 +274,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMLiveEvent(AzureRMModuleBase):
+class AzureRMLiveEvent(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Live Event resource"""
 
     def __init__(self):
@@ -429,21 +461,18 @@ class AzureRMLiveEvent(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_upper(self.parameters, ['input', 'streaming_protocol'])
-        dict_map(self.parameters, ['input', 'streaming_protocol'], {'fragmented_mp4': 'FragmentedMP4'})
-        dict_camelize(self.parameters, ['encoding', 'encoding_type'], True)
+        transform = DictTransform()
+        transform.upper(['input', 'streaming_protocol'])
+        transform.map(['input', 'streaming_protocol'], {'fragmented_mp4': 'FragmentedMP4'})
+        transform.camelize(['encoding', 'encoding_type'], True)
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMediaServices,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.media.AzureMediaServices',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_liveevent()
+        old_response = self.cached_get(self.get_liveevent)
 
         if not old_response:
             self.log("Live Event instance doesn't exist")
@@ -456,14 +485,16 @@ class AzureRMLiveEvent(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Live Event instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_liveevent()
@@ -475,12 +506,11 @@ class AzureRMLiveEvent(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_liveevent()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_liveevent()
+            self.wait_for_delete(response, self.get_liveevent, 'Live Event')
         else:
             self.log("Live Event instance unchanged")
             self.results['changed'] = False
@@ -498,7 +528,7 @@ class AzureRMLiveEvent(AzureRMModuleBase):
 
         :return: deserialized Live Event instance state dictionary
         '''
-        self.log("Creating / Updating the Live Event instance {0}".format(self.name))
+        self.log("Creating / Updating the Live Event instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -523,9 +553,9 @@ class AzureRMLiveEvent(AzureRMModuleBase):
         '''
         Deletes specified Live Event instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Live Event instance {0}".format(self.name))
+        self.log("Deleting the Live Event instance {0}", self.name)
         try:
             response = self.mgmt_client.live_events.delete(resource_group_name=self.resource_group,
                                                            account_name=self.account_name,
@@ -534,7 +564,7 @@ class AzureRMLiveEvent(AzureRMModuleBase):
             self.log('Error attempting to delete the Live Event instance.')
             self.fail("Error deleting the Live Event instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_liveevent(self):
         '''
@@ -542,15 +572,15 @@ class AzureRMLiveEvent(AzureRMModuleBase):
 
         :return: deserialized Live Event instance state dictionary
         '''
-        self.log("Checking if the Live Event instance {0} is present".format(self.name))
+        self.log("Checking if the Live Event instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.live_events.get(resource_group_name=self.resource_group,
                                                         account_name=self.account_name,
                                                         live_event_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Live Event instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Live Event instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Live Event instance.')
         if found is True:
@@ -559,94 +589,6 @@ class AzureRMLiveEvent(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_upper(d, path):
-   if isinstance(d, list):
-        for i in range(len(d)):
-            dict_upper(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = old_value.upper()
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_upper(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMLiveEvent()
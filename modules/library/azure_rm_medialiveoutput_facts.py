@@ -38,6 +38,16 @@ options:
         description:
             - The name of the Live Output.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -96,18 +106,17 @@ live_outputs:
             sample: "0001-01-01T08:00:00+00:00"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.media import AzureMediaServices
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMLiveOutputFacts(AzureRMModuleBase):
+class AzureRMLiveOutputFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -137,14 +146,18 @@ class AzureRMLiveOutputFacts(AzureRMModuleBase):
         self.account_name = None
         self.live_event_name = None
         self.name = None
-        super(AzureRMLiveOutputFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMLiveOutputFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMediaServices,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.media.AzureMediaServices',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['live_outputs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['live_outputs'] = self.get()
         return self.results
 
@@ -156,7 +169,7 @@ class AzureRMLiveOutputFacts(AzureRMModuleBase):
                                                          account_name=self.account_name,
                                                          live_event_name=self.live_event_name,
                                                          live_output_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Live Output.')
 
@@ -165,6 +178,14 @@ class AzureRMLiveOutputFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.live_outputs, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -37,6 +37,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -99,18 +109,17 @@ streaming_endpoints:
             sample: "2018-03-03T02:25:09.3500423Z"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.media import AzureMediaServices
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMStreamingEndpointFacts(AzureRMModuleBase):
+class AzureRMStreamingEndpointFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -139,14 +148,18 @@ class AzureRMStreamingEndpointFacts(AzureRMModuleBase):
         self.account_name = None
         self.name = None
         self.tags = None
-        super(AzureRMStreamingEndpointFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMStreamingEndpointFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMediaServices,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.media.AzureMediaServices',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['streaming_endpoints'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['streaming_endpoints'] = self.get()
         return self.results
 
@@ -157,7 +170,7 @@ class AzureRMStreamingEndpointFacts(AzureRMModuleBase):
             response = self.mgmt_client.streaming_endpoints.get(resource_group_name=self.resource_group,
                                                                 account_name=self.account_name,
                                                                 streaming_endpoint_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Streaming Endpoint.')
 
@@ -166,6 +179,14 @@ class AzureRMStreamingEndpointFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.streaming_endpoints, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
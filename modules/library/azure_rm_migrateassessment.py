@@ -220,6 +220,34 @@ options:
         choices:
             - 'performance_based'
             - 'as_on_premises'
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Assessment.
@@ -276,17 +304,21 @@ status:
     returned: always
     type: str
     sample: Invalid
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.migrate import AzureMigrate
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -297,7 +329,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMAssessment(AzureRMModuleBase):
+class AzureRMAssessment(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Assessment resource"""
 
     def __init__(self):
@@ -509,27 +541,27 @@ class AzureRMAssessment(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.assessment[key] = kwargs[key]
 
-        dict_camelize(self.assessment, ['azure_location'], True)
-        dict_camelize(self.assessment, ['azure_offer_code'], True)
-        dict_map(self.assessment, ['azure_offer_code'], {'msazr0003_p': 'MSAZR0003P', 'msazr0044_p': 'MSAZR0044P', 'msazr0059_p': 'MSAZR0059P', 'msazr0060_p': 'MSAZR0060P', 'msazr0062_p': 'MSAZR0062P', 'msazr0063_p': 'MSAZR0063P', 'msazr0064_p': 'MSAZR0064P', 'msazr0029_p': 'MSAZR0029P', 'msazr0022_p': 'MSAZR0022P', 'msazr0023_p': 'MSAZR0023P', 'msazr0148_p': 'MSAZR0148P', 'msazr0025_p': 'MSAZR0025P', 'msazr0036_p': 'MSAZR0036P', 'msazr0120_p': 'MSAZR0120P', 'msazr0121_p': 'MSAZR0121P', 'msazr0122_p': 'MSAZR0122P', 'msazr0123_p': 'MSAZR0123P', 'msazr0124_p': 'MSAZR0124P', 'msazr0125_p': 'MSAZR0125P', 'msazr0126_p': 'MSAZR0126P', 'msazr0127_p': 'MSAZR0127P', 'msazr0128_p': 'MSAZR0128P', 'msazr0129_p': 'MSAZR0129P', 'msazr0130_p': 'MSAZR0130P', 'msazr0111_p': 'MSAZR0111P', 'msazr0144_p': 'MSAZR0144P', 'msazr0149_p': 'MSAZR0149P', 'msmcazr0044_p': 'MSMCAZR0044P', 'msmcazr0059_p': 'MSMCAZR0059P', 'msmcazr0060_p': 'MSMCAZR0060P', 'msmcazr0063_p': 'MSMCAZR0063P', 'msmcazr0120_p': 'MSMCAZR0120P', 'msmcazr0121_p': 'MSMCAZR0121P', 'msmcazr0125_p': 'MSMCAZR0125P', 'msmcazr0128_p': 'MSMCAZR0128P', 'msazrde0003_p': 'MSAZRDE0003P', 'msazrde0044_p': 'MSAZRDE0044P'})
-        dict_camelize(self.assessment, ['azure_pricing_tier'], True)
-        dict_camelize(self.assessment, ['azure_storage_redundancy'], True)
-        dict_camelize(self.assessment, ['percentile'], True)
-        dict_camelize(self.assessment, ['time_range'], True)
-        dict_camelize(self.assessment, ['stage'], True)
-        dict_upper(self.assessment, ['currency'])
-        dict_map(self.assessment, ['currency'], {'unknown': 'Unknown'})
-        dict_camelize(self.assessment, ['azure_hybrid_use_benefit'], True)
-        dict_camelize(self.assessment, ['sizing_criterion'], True)
+        transform = DictTransform()
+        transform.camelize(['azure_location'], True)
+        transform.camelize(['azure_offer_code'], True)
+        transform.map(['azure_offer_code'], {'msazr0003_p': 'MSAZR0003P', 'msazr0044_p': 'MSAZR0044P', 'msazr0059_p': 'MSAZR0059P', 'msazr0060_p': 'MSAZR0060P', 'msazr0062_p': 'MSAZR0062P', 'msazr0063_p': 'MSAZR0063P', 'msazr0064_p': 'MSAZR0064P', 'msazr0029_p': 'MSAZR0029P', 'msazr0022_p': 'MSAZR0022P', 'msazr0023_p': 'MSAZR0023P', 'msazr0148_p': 'MSAZR0148P', 'msazr0025_p': 'MSAZR0025P', 'msazr0036_p': 'MSAZR0036P', 'msazr0120_p': 'MSAZR0120P', 'msazr0121_p': 'MSAZR0121P', 'msazr0122_p': 'MSAZR0122P', 'msazr0123_p': 'MSAZR0123P', 'msazr0124_p': 'MSAZR0124P', 'msazr0125_p': 'MSAZR0125P', 'msazr0126_p': 'MSAZR0126P', 'msazr0127_p': 'MSAZR0127P', 'msazr0128_p': 'MSAZR0128P', 'msazr0129_p': 'MSAZR0129P', 'msazr0130_p': 'MSAZR0130P', 'msazr0111_p': 'MSAZR0111P', 'msazr0144_p': 'MSAZR0144P', 'msazr0149_p': 'MSAZR0149P', 'msmcazr0044_p': 'MSMCAZR0044P', 'msmcazr0059_p': 'MSMCAZR0059P', 'msmcazr0060_p': 'MSMCAZR0060P', 'msmcazr0063_p': 'MSMCAZR0063P', 'msmcazr0120_p': 'MSMCAZR0120P', 'msmcazr0121_p': 'MSMCAZR0121P', 'msmcazr0125_p': 'MSMCAZR0125P', 'msmcazr0128_p': 'MSMCAZR0128P', 'msazrde0003_p': 'MSAZRDE0003P', 'msazrde0044_p': 'MSAZRDE0044P'})
+        transform.camelize(['azure_pricing_tier'], True)
+        transform.camelize(['azure_storage_redundancy'], True)
+        transform.camelize(['percentile'], True)
+        transform.camelize(['time_range'], True)
+        transform.camelize(['stage'], True)
+        transform.upper(['currency'])
+        transform.map(['currency'], {'unknown': 'Unknown'})
+        transform.camelize(['azure_hybrid_use_benefit'], True)
+        transform.camelize(['sizing_criterion'], True)
+        transform.apply(self.assessment)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMigrate,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.migrate.AzureMigrate',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_assessment()
+        old_response = self.cached_get(self.get_assessment)
 
         if not old_response:
             self.log("Assessment instance doesn't exist")
@@ -542,7 +574,7 @@ class AzureRMAssessment(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.assessment, old_response, '', self.results)):
+                if (not self.compare_state(self.assessment, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -550,6 +582,7 @@ class AzureRMAssessment(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.assessment, old_response)
                 return self.results
 
             response = self.create_update_assessment()
@@ -561,12 +594,11 @@ class AzureRMAssessment(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_assessment()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_assessment()
+            self.wait_for_delete(response, self.get_assessment, 'Assessment')
         else:
             self.log("Assessment instance unchanged")
             self.results['changed'] = False
@@ -585,7 +617,7 @@ class AzureRMAssessment(AzureRMModuleBase):
 
         :return: deserialized Assessment instance state dictionary
         '''
-        self.log("Creating / Updating the Assessment instance {0}".format(self.self.config.accept_language))
+        self.log("Creating / Updating the Assessment instance {0}", self.self.config.accept_language)
 
         try:
             if self.to_do == Actions.Create:
@@ -607,9 +639,9 @@ class AzureRMAssessment(AzureRMModuleBase):
         '''
         Deletes specified Assessment instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Assessment instance {0}".format(self.self.config.accept_language))
+        self.log("Deleting the Assessment instance {0}", self.self.config.accept_language)
         try:
             response = self.mgmt_client.assessments.delete(resource_group_name=self.resource_group,
                                                            project_name=self.project_name,
@@ -619,7 +651,7 @@ class AzureRMAssessment(AzureRMModuleBase):
             self.log('Error attempting to delete the Assessment instance.')
             self.fail("Error deleting the Assessment instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_assessment(self):
         '''
@@ -627,7 +659,7 @@ class AzureRMAssessment(AzureRMModuleBase):
 
         :return: deserialized Assessment instance state dictionary
         '''
-        self.log("Checking if the Assessment instance {0} is present".format(self.self.config.accept_language))
+        self.log("Checking if the Assessment instance {0} is present", self.self.config.accept_language)
         found = False
         try:
             response = self.mgmt_client.assessments.get(resource_group_name=self.resource_group,
@@ -635,8 +667,8 @@ class AzureRMAssessment(AzureRMModuleBase):
                                                         group_name=self.group_name,
                                                         assessment_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Assessment instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Assessment instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Assessment instance.')
         if found is True:
@@ -645,94 +677,6 @@ class AzureRMAssessment(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_upper(d, path):
-   if isinstance(d, list):
-        for i in range(len(d)):
-            dict_upper(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = old_value.upper()
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_upper(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMAssessment()
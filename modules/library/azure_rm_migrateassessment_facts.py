@@ -39,6 +39,29 @@ options:
     self.config.accept_language:
         description:
             - Standard request header. Used by service to respond to client in appropriate language.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -118,20 +141,25 @@ assessments:
             returned: always
             type: str
             sample: Invalid
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.migrate import AzureMigrate
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAssessmentFacts(AzureRMModuleBase):
+class AzureRMAssessmentFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -163,14 +191,18 @@ class AzureRMAssessmentFacts(AzureRMModuleBase):
         self.group_name = None
         self.name = None
         self.self.config.accept_language = None
-        super(AzureRMAssessmentFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAssessmentFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMigrate,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.migrate.AzureMigrate',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['assessments'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.group_name is not None and
                 self.name is not None):
             self.results['assessments'] = self.get()
@@ -188,7 +220,7 @@ class AzureRMAssessmentFacts(AzureRMModuleBase):
                                                         project_name=self.project_name,
                                                         group_name=self.group_name,
                                                         assessment_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Assessment.')
 
@@ -197,6 +229,14 @@ class AzureRMAssessmentFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.assessments, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_group(self):
         response = None
         results = []
@@ -204,12 +244,12 @@ class AzureRMAssessmentFacts(AzureRMModuleBase):
             response = self.mgmt_client.assessments.list_by_group(resource_group_name=self.resource_group,
                                                                   project_name=self.project_name,
                                                                   group_name=self.group_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Assessment.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -220,12 +260,12 @@ class AzureRMAssessmentFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.assessments.list_by_project(resource_group_name=self.resource_group,
                                                                     project_name=self.project_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Assessment.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
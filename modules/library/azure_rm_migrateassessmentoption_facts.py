@@ -29,6 +29,16 @@ options:
     self.config.accept_language:
         description:
             - Standard request header. Used by service to respond to client in appropriate language.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -53,18 +63,17 @@ assessment_options:
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.migrate import AzureMigrate
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAssessmentOptionFacts(AzureRMModuleBase):
+class AzureRMAssessmentOptionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -83,14 +92,18 @@ class AzureRMAssessmentOptionFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.name = None
         self.self.config.accept_language = None
-        super(AzureRMAssessmentOptionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAssessmentOptionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMigrate,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.migrate.AzureMigrate',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['assessment_options'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['assessment_options'] = self.get()
         return self.results
 
@@ -99,7 +112,7 @@ class AzureRMAssessmentOptionFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.assessment_options.get(location_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Assessment Option.')
 
@@ -108,6 +121,14 @@ class AzureRMAssessmentOptionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.assessment_options, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
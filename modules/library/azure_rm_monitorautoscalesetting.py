@@ -300,6 +300,34 @@ options:
     target_resource_uri:
         description:
             - the resource identifier of the resource that the autoscale setting should be added to.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Autoscale Setting.
@@ -372,17 +400,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/b67f7fec-69fc-4974-9099-a26bd6ffeda3/resourceGroups/TestingMetricsScaleSet/providers/microsoft.insights/autoscalesettings/MySetting
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.monitor import MonitorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -393,7 +425,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMAutoscaleSetting(AzureRMModuleBase):
+class AzureRMAutoscaleSetting(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Autoscale Setting resource"""
 
     def __init__(self):
@@ -622,24 +654,21 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['profiles', 'rules', 'metric_trigger', 'statistic'], True)
-        dict_camelize(self.parameters, ['profiles', 'rules', 'metric_trigger', 'time_aggregation'], True)
-        dict_camelize(self.parameters, ['profiles', 'rules', 'metric_trigger', 'operator'], True)
-        dict_camelize(self.parameters, ['profiles', 'rules', 'scale_action', 'direction'], True)
-        dict_camelize(self.parameters, ['profiles', 'rules', 'scale_action', 'type'], True)
-        dict_camelize(self.parameters, ['profiles', 'recurrence', 'frequency'], True)
+        transform = DictTransform()
+        transform.camelize(['profiles', 'rules', 'metric_trigger', 'statistic'], True)
+        transform.camelize(['profiles', 'rules', 'metric_trigger', 'time_aggregation'], True)
+        transform.camelize(['profiles', 'rules', 'metric_trigger', 'operator'], True)
+        transform.camelize(['profiles', 'rules', 'scale_action', 'direction'], True)
+        transform.camelize(['profiles', 'rules', 'scale_action', 'type'], True)
+        transform.camelize(['profiles', 'recurrence', 'frequency'], True)
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MonitorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.monitor.MonitorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_autoscalesetting()
+        old_response = self.cached_get(self.get_autoscalesetting)
 
         if not old_response:
             self.log("Autoscale Setting instance doesn't exist")
@@ -652,14 +681,16 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Autoscale Setting instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_autoscalesetting()
@@ -671,12 +702,11 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_autoscalesetting()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_autoscalesetting()
+            self.wait_for_delete(response, self.get_autoscalesetting, 'Autoscale Setting')
         else:
             self.log("Autoscale Setting instance unchanged")
             self.results['changed'] = False
@@ -694,7 +724,7 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
 
         :return: deserialized Autoscale Setting instance state dictionary
         '''
-        self.log("Creating / Updating the Autoscale Setting instance {0}".format(self.name))
+        self.log("Creating / Updating the Autoscale Setting instance {0}", self.name)
 
         try:
             response = self.mgmt_client.autoscale_settings.create_or_update(resource_group_name=self.resource_group,
@@ -712,9 +742,9 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
         '''
         Deletes specified Autoscale Setting instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Autoscale Setting instance {0}".format(self.name))
+        self.log("Deleting the Autoscale Setting instance {0}", self.name)
         try:
             response = self.mgmt_client.autoscale_settings.delete(resource_group_name=self.resource_group,
                                                                   autoscale_setting_name=self.name)
@@ -722,7 +752,7 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
             self.log('Error attempting to delete the Autoscale Setting instance.')
             self.fail("Error deleting the Autoscale Setting instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_autoscalesetting(self):
         '''
@@ -730,14 +760,14 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
 
         :return: deserialized Autoscale Setting instance state dictionary
         '''
-        self.log("Checking if the Autoscale Setting instance {0} is present".format(self.name))
+        self.log("Checking if the Autoscale Setting instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.autoscale_settings.get(resource_group_name=self.resource_group,
                                                                autoscale_setting_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Autoscale Setting instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Autoscale Setting instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Autoscale Setting instance.')
         if found is True:
@@ -746,64 +776,6 @@ class AzureRMAutoscaleSetting(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
 def main():
     """Main execution"""
     AzureRMAutoscaleSetting()
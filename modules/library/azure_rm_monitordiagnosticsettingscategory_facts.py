@@ -30,6 +30,16 @@ options:
         description:
             - The name of the diagnostic setting.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -67,18 +77,17 @@ diagnostic_settings_category:
             sample: WorkflowRuntime
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.monitor import MonitorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMDiagnosticSettingsCategoryFacts(AzureRMModuleBase):
+class AzureRMDiagnosticSettingsCategoryFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -98,14 +107,18 @@ class AzureRMDiagnosticSettingsCategoryFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_uri = None
         self.name = None
-        super(AzureRMDiagnosticSettingsCategoryFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMDiagnosticSettingsCategoryFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(MonitorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.monitor.MonitorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['diagnostic_settings_category'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['diagnostic_settings_category'] = self.get()
         return self.results
 
@@ -115,7 +128,7 @@ class AzureRMDiagnosticSettingsCategoryFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.diagnostic_settings_category.get(resource_uri=self.resource_uri,
                                                                          name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Diagnostic Settings Category.')
 
@@ -124,6 +137,14 @@ class AzureRMDiagnosticSettingsCategoryFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.diagnostic_settings_category, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -60,6 +60,34 @@ options:
                 description:
                     - the number of days for the retention in days. A value of 0 will retain the events indefinitely.
                     - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Log Profile.
@@ -106,17 +134,20 @@ id:
     returned: always
     type: str
     sample: /subscriptions/df602c9c-7aa0-407d-a6fb-eb20c8bd1192/providers/microsoft.insights/logprofiles/default
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.monitor import MonitorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -127,7 +158,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMLogProfile(AzureRMModuleBase):
+class AzureRMLogProfile(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Log Profile resource"""
 
     def __init__(self):
@@ -193,13 +224,10 @@ class AzureRMLogProfile(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MonitorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.monitor.MonitorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_logprofile()
+        old_response = self.cached_get(self.get_logprofile)
 
         if not old_response:
             self.log("Log Profile instance doesn't exist")
@@ -212,14 +240,16 @@ class AzureRMLogProfile(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Log Profile instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_logprofile()
@@ -231,12 +261,11 @@ class AzureRMLogProfile(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_logprofile()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_logprofile()
+            self.wait_for_delete(response, self.get_logprofile, 'Log Profile')
         else:
             self.log("Log Profile instance unchanged")
             self.results['changed'] = False
@@ -254,7 +283,7 @@ class AzureRMLogProfile(AzureRMModuleBase):
 
         :return: deserialized Log Profile instance state dictionary
         '''
-        self.log("Creating / Updating the Log Profile instance {0}".format(self.name))
+        self.log("Creating / Updating the Log Profile instance {0}", self.name)
 
         try:
             response = self.mgmt_client.log_profiles.create_or_update(log_profile_name=self.name,
@@ -271,16 +300,16 @@ class AzureRMLogProfile(AzureRMModuleBase):
         '''
         Deletes specified Log Profile instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Log Profile instance {0}".format(self.name))
+        self.log("Deleting the Log Profile instance {0}", self.name)
         try:
             response = self.mgmt_client.log_profiles.delete(log_profile_name=self.name)
         except CloudError as e:
             self.log('Error attempting to delete the Log Profile instance.')
             self.fail("Error deleting the Log Profile instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_logprofile(self):
         '''
@@ -288,13 +317,13 @@ class AzureRMLogProfile(AzureRMModuleBase):
 
         :return: deserialized Log Profile instance state dictionary
         '''
-        self.log("Checking if the Log Profile instance {0} is present".format(self.name))
+        self.log("Checking if the Log Profile instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.log_profiles.get(log_profile_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Log Profile instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Log Profile instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Log Profile instance.')
         if found is True:
@@ -303,49 +332,6 @@ class AzureRMLogProfile(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMLogProfile()
@@ -89,6 +89,34 @@ options:
             webhook_properties:
                 description:
                     - The properties of a webhook object.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Metric Alert.
@@ -138,17 +166,20 @@ id:
     returned: always
     type: str
     sample: /subscriptions/14ddf0c5-77c5-4b53-84f6-e1fa43ad68f7/resourceGroups/gigtest/providers/providers/microsoft.insights/metricalerts/chiricutin
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.monitor import MonitorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -159,7 +190,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMMetricAlert(AzureRMModuleBase):
+class AzureRMMetricAlert(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Metric Alert resource"""
 
     def __init__(self):
@@ -256,15 +287,10 @@ class AzureRMMetricAlert(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MonitorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.monitor.MonitorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_metricalert()
+        old_response = self.cached_get(self.get_metricalert)
 
         if not old_response:
             self.log("Metric Alert instance doesn't exist")
@@ -277,14 +303,16 @@ class AzureRMMetricAlert(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Metric Alert instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_metricalert()
@@ -296,12 +324,11 @@ class AzureRMMetricAlert(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_metricalert()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_metricalert()
+            self.wait_for_delete(response, self.get_metricalert, 'Metric Alert')
         else:
             self.log("Metric Alert instance unchanged")
             self.results['changed'] = False
@@ -319,7 +346,7 @@ class AzureRMMetricAlert(AzureRMModuleBase):
 
         :return: deserialized Metric Alert instance state dictionary
         '''
-        self.log("Creating / Updating the Metric Alert instance {0}".format(self.name))
+        self.log("Creating / Updating the Metric Alert instance {0}", self.name)
 
         try:
             response = self.mgmt_client.metric_alerts.create_or_update(resource_group_name=self.resource_group,
@@ -337,9 +364,9 @@ class AzureRMMetricAlert(AzureRMModuleBase):
         '''
         Deletes specified Metric Alert instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Metric Alert instance {0}".format(self.name))
+        self.log("Deleting the Metric Alert instance {0}", self.name)
         try:
             response = self.mgmt_client.metric_alerts.delete(resource_group_name=self.resource_group,
                                                              rule_name=self.name)
@@ -347,7 +374,7 @@ class AzureRMMetricAlert(AzureRMModuleBase):
             self.log('Error attempting to delete the Metric Alert instance.')
             self.fail("Error deleting the Metric Alert instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_metricalert(self):
         '''
@@ -355,14 +382,14 @@ class AzureRMMetricAlert(AzureRMModuleBase):
 
         :return: deserialized Metric Alert instance state dictionary
         '''
-        self.log("Checking if the Metric Alert instance {0} is present".format(self.name))
+        self.log("Checking if the Metric Alert instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.metric_alerts.get(resource_group_name=self.resource_group,
                                                           rule_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Metric Alert instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Metric Alert instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Metric Alert instance.')
         if found is True:
@@ -371,49 +398,6 @@ class AzureRMMetricAlert(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMMetricAlert()
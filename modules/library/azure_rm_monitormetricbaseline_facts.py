@@ -47,6 +47,16 @@ options:
     result_type:
         description:
             - Allows retrieving only metadata of the baseline. On data request all information is retrieved.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -129,18 +139,17 @@ metric_baseline:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.monitor import MonitorManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMMetricBaselineFacts(AzureRMModuleBase):
+class AzureRMMetricBaselineFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -180,14 +189,18 @@ class AzureRMMetricBaselineFacts(AzureRMModuleBase):
         self.aggregation = None
         self.sensitivities = None
         self.result_type = None
-        super(AzureRMMetricBaselineFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMMetricBaselineFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(MonitorManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.monitor.MonitorManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['metric_baseline'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['metric_baseline'] = self.get()
         return self.results
 
@@ -197,7 +210,7 @@ class AzureRMMetricBaselineFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.metric_baseline.get(resource_uri=self.resource_uri,
                                                             metric_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Metric Baseline.')
 
@@ -206,6 +219,14 @@ class AzureRMMetricBaselineFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.metric_baseline, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
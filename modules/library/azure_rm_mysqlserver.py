@@ -71,6 +71,34 @@ options:
     location:
         description:
             - Resource location. If not set, location from the resource group will be used as default.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the MySQL Server.
@@ -130,17 +158,21 @@ fully_qualified_domain_name:
     returned: always
     type: str
     sample: mysqlsrv1b6dd89593.mysql.database.azure.com
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.rdbms.mysql import MySQLManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -151,7 +183,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMMySQLServer(AzureRMModuleBase):
+class AzureRMMySQLServer(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM MySQL Server resource"""
 
     def __init__(self):
@@ -237,29 +269,27 @@ class AzureRMMySQLServer(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['sku', 'tier'], True)
-        dict_expand(self.parameters, ['storage_mb'])
-        dict_expand(self.parameters, ['version'])
-        dict_rename(self.parameters, ['enforce_ssl'], 'properties')
-        dict_expand(self.parameters, ['enforce_ssl'])
-        dict_map(self.parameters, ['enforce_ssl'], {True: 'Enabled', False: 'Disabled'})
-        dict_expand(self.parameters, ['create_mode'])
-        dict_rename(self.parameters, ['admin_username'], 'properties')
-        dict_expand(self.parameters, ['admin_username'])
-        dict_rename(self.parameters, ['admin_password'], 'properties')
-        dict_expand(self.parameters, ['admin_password'])
+        transform = DictTransform()
+        transform.camelize(['sku', 'tier'], True)
+        transform.expand(['storage_mb'], 'storage_profile')
+        transform.expand(['storage_profile'], 'properties')
+        transform.expand(['version'], 'properties')
+        transform.rename(['enforce_ssl'], 'ssl_enforcement')
+        transform.map(['ssl_enforcement'], {True: 'Enabled', False: 'Disabled'})
+        transform.expand(['ssl_enforcement'], 'properties')
+        transform.expand(['create_mode'], 'properties')
+        transform.rename(['admin_username'], 'administrator_login')
+        transform.expand(['administrator_login'], 'properties')
+        transform.rename(['admin_password'], 'administrator_login_password')
+        transform.expand(['administrator_login_password'], 'properties')
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(MySQLManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.rdbms.mysql.MySQLManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_mysqlserver()
+        old_response = self.cached_get(self.get_mysqlserver)
 
         if not old_response:
             self.log("MySQL Server instance doesn't exist")
@@ -272,14 +302,16 @@ class AzureRMMySQLServer(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the MySQL Server instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_mysqlserver()
@@ -291,12 +323,11 @@ class AzureRMMySQLServer(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_mysqlserver()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_mysqlserver()
+            self.wait_for_delete(response, self.get_mysqlserver, 'MySQL Server')
         else:
             self.log("MySQL Server instance unchanged")
             self.results['changed'] = False
@@ -317,7 +348,7 @@ class AzureRMMySQLServer(AzureRMModuleBase):
 
         :return: deserialized MySQL Server instance state dictionary
         '''
-        self.log("Creating / Updating the MySQL Server instance {0}".format(self.name))
+        self.log("Creating / Updating the MySQL Server instance {0}", self.name)
 
         try:
             response = self.mgmt_client.servers.create_or_update(resource_group_name=self.resource_group,
@@ -335,9 +366,9 @@ class AzureRMMySQLServer(AzureRMModuleBase):
         '''
         Deletes specified MySQL Server instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the MySQL Server instance {0}".format(self.name))
+        self.log("Deleting the MySQL Server instance {0}", self.name)
         try:
             response = self.mgmt_client.servers.delete(resource_group_name=self.resource_group,
                                                        server_name=self.name)
@@ -345,7 +376,7 @@ class AzureRMMySQLServer(AzureRMModuleBase):
             self.log('Error attempting to delete the MySQL Server instance.')
             self.fail("Error deleting the MySQL Server instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_mysqlserver(self):
         '''
@@ -353,14 +384,14 @@ class AzureRMMySQLServer(AzureRMModuleBase):
 
         :return: deserialized MySQL Server instance state dictionary
         '''
-        self.log("Checking if the MySQL Server instance {0} is present".format(self.name))
+        self.log("Checking if the MySQL Server instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.servers.get(resource_group_name=self.resource_group,
                                                     server_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("MySQL Server instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("MySQL Server instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the MySQL Server instance.')
         if found is True:
@@ -369,110 +400,6 @@ class AzureRMMySQLServer(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_rename(d, path, new_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_rename(d[i], path, new_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[new_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_rename(sd, path[1:], new_name)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMMySQLServer()
@@ -37,6 +37,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -74,18 +84,17 @@ connection_monitors:
             sample: tags
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMConnectionMonitorFacts(AzureRMModuleBase):
+class AzureRMConnectionMonitorFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -114,14 +123,18 @@ class AzureRMConnectionMonitorFacts(AzureRMModuleBase):
         self.network_watcher_name = None
         self.name = None
         self.tags = None
-        super(AzureRMConnectionMonitorFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMConnectionMonitorFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['connection_monitors'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['connection_monitors'] = self.get()
         return self.results
 
@@ -132,7 +145,7 @@ class AzureRMConnectionMonitorFacts(AzureRMModuleBase):
             response = self.mgmt_client.connection_monitors.get(resource_group_name=self.resource_group,
                                                                 network_watcher_name=self.network_watcher_name,
                                                                 connection_monitor_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Connection Monitor.')
 
@@ -141,6 +154,14 @@ class AzureRMConnectionMonitorFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.connection_monitors, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -37,6 +37,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -87,18 +97,17 @@ notification_hubs:
             sample: tags
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.notificationhubs import NotificationHubsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMNotificationHubFacts(AzureRMModuleBase):
+class AzureRMNotificationHubFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -127,14 +136,18 @@ class AzureRMNotificationHubFacts(AzureRMModuleBase):
         self.namespace_name = None
         self.name = None
         self.tags = None
-        super(AzureRMNotificationHubFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMNotificationHubFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(NotificationHubsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.notificationhubs.NotificationHubsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['notification_hubs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['notification_hubs'] = self.get()
         return self.results
 
@@ -145,7 +158,7 @@ class AzureRMNotificationHubFacts(AzureRMModuleBase):
             response = self.mgmt_client.notification_hubs.get(resource_group_name=self.resource_group,
                                                               namespace_name=self.namespace_name,
                                                               notification_hub_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Notification Hub.')
 
@@ -154,6 +167,14 @@ class AzureRMNotificationHubFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.notification_hubs, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -349,6 +349,34 @@ options:
             tenant_id:
                 description:
                     - The AAD tenant ID to use for authentication. If not specified, will use the tenant of the deployment subscription.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Managed Cluster.
@@ -382,16 +410,19 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid1/resourcegroups/rg1/providers/Microsoft.ContainerService/managedClusters/clustername1
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
-import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.openshiftmanagedclusters import ContainerServiceClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -402,7 +433,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMManagedClusters(AzureRMModuleBase):
+class AzureRMManagedClusters(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Managed Cluster resource"""
 
     def __init__(self):
@@ -856,15 +887,10 @@ class AzureRMManagedClusters(AzureRMModuleBase):
         old_response = None
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ContainerServiceClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.openshiftmanagedclusters.ContainerServiceClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_managedcluster()
+        old_response = self.cached_get(self.get_managedcluster)
 
         if not old_response:
             self.log("Managed Cluster instance doesn't exist")
@@ -882,9 +908,11 @@ class AzureRMManagedClusters(AzureRMModuleBase):
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Managed Cluster instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_managedcluster()
@@ -899,13 +927,11 @@ class AzureRMManagedClusters(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_managedcluster()
-            # make sure instance is actually deleted, for some Azure resources, instance is hanging around
-            # for some time after deletion -- this should be really fixed in Azure.
-            while self.get_managedcluster():
-                time.sleep(20)
+            response = self.delete_managedcluster()
+            self.wait_for_delete(response, self.get_managedcluster, 'Managed Cluster')
         else:
             self.log("Managed Cluster instance unchanged")
             self.results['changed'] = False
@@ -921,7 +947,7 @@ class AzureRMManagedClusters(AzureRMModuleBase):
 
         :return: deserialized Managed Cluster instance state dictionary
         '''
-        self.log("Creating / Updating the Managed Cluster instance {0}".format(self.resource_name))
+        self.log("Creating / Updating the Managed Cluster instance {0}", self.resource_name)
 
         try:
             response = self.mgmt_client.managed_clusters.create_or_update(resource_group_name=self.resource_group,
@@ -939,9 +965,9 @@ class AzureRMManagedClusters(AzureRMModuleBase):
         '''
         Deletes specified Managed Cluster instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Managed Cluster instance {0}".format(self.resource_name))
+        self.log("Deleting the Managed Cluster instance {0}", self.resource_name)
         try:
             response = self.mgmt_client.managed_clusters.delete(resource_group_name=self.resource_group,
                                                                 resource_name=self.resource_name)
@@ -949,7 +975,7 @@ class AzureRMManagedClusters(AzureRMModuleBase):
             self.log('Error attempting to delete the Managed Cluster instance.')
             self.fail("Error deleting the Managed Cluster instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_managedcluster(self):
         '''
@@ -957,14 +983,14 @@ class AzureRMManagedClusters(AzureRMModuleBase):
 
         :return: deserialized Managed Cluster instance state dictionary
         '''
-        self.log("Checking if the Managed Cluster instance {0} is present".format(self.resource_name))
+        self.log("Checking if the Managed Cluster instance {0} is present", self.resource_name)
         found = False
         try:
             response = self.mgmt_client.managed_clusters.get(resource_group_name=self.resource_group,
                                                              resource_name=self.resource_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Managed Cluster instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Managed Cluster instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Managed Cluster instance.')
         if found is True:
@@ -26,15 +26,15 @@ options:
         description:
             - The name of the resource group to get. The name is case insensitive.
         required: True
-    self.config.provider_name:
+    provider_name:
         description:
             - Provider name for the parent resource.
         required: True
-    self.config.resource_type:
+    resource_type:
         description:
             - Resource type for the parent resource
         required: True
-    self.config.resource_name:
+    resource_name:
         description:
             - Parent resource name.
         required: True
@@ -49,6 +49,34 @@ options:
         description:
             - The applicationId of the appliance for this association.
             - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Management Association.
@@ -70,9 +98,9 @@ EXAMPLES = '''
   - name: Create (or update) Management Association
     azure_rm_operationsmanagementmanagementassociation:
       resource_group: rg1
-      self.config.provider_name: NOT FOUND
-      self.config.resource_type: NOT FOUND
-      self.config.resource_name: NOT FOUND
+      provider_name: Microsoft.OperationalInsights
+      resource_type: workspaces
+      resource_name: myworkspace
       name: managementAssociation1
       location: eastus
       application_id: /subscriptions/sub1/resourcegroups/rg1/providers/Microsoft.Appliance/Appliances/appliance1
@@ -86,17 +114,21 @@ id:
     type: str
     sample: "/subscriptions/subid/resourcegroups/rg1/providers/Microsoft.OperationalInsights/workspaces/ws1/Microsoft.OperationsManagement/ManagementAssociat
             ions/managementAssociation1"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.operationsmanagement import OperationsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -107,7 +139,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMManagementAssociation(AzureRMModuleBase):
+class AzureRMManagementAssociation(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Management Association resource"""
 
     def __init__(self):
@@ -116,15 +148,15 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
                 type='str',
                 required=True
             ),
-            self.config.provider_name=dict(
+            provider_name=dict(
                 type='str',
                 required=True
             ),
-            self.config.resource_type=dict(
+            resource_type=dict(
                 type='str',
                 required=True
             ),
-            self.config.resource_name=dict(
+            resource_name=dict(
                 type='str',
                 required=True
             ),
@@ -146,9 +178,9 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
         )
 
         self.resource_group = None
-        self.self.config.provider_name = None
-        self.self.config.resource_type = None
-        self.self.config.resource_name = None
+        self.provider_name = None
+        self.resource_type = None
+        self.resource_name = None
         self.name = None
         self.parameters = dict()
 
@@ -170,19 +202,20 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_expand(self.parameters, ['application_id'])
+        transform = DictTransform()
+        transform.expand(['application_id'], 'properties')
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(OperationsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.operationsmanagement.OperationsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
+        # the parent resource is part of the client configuration
+        self.mgmt_client.config.provider_name = self.provider_name
+        self.mgmt_client.config.resource_type = self.resource_type
+        self.mgmt_client.config.resource_name = self.resource_name
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_managementassociation()
+        old_response = self.cached_get(self.get_managementassociation)
 
         if not old_response:
             self.log("Management Association instance doesn't exist")
@@ -195,14 +228,16 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Management Association instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_managementassociation()
@@ -214,12 +249,11 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_managementassociation()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_managementassociation()
+            self.wait_for_delete(response, self.get_managementassociation, 'Management Association')
         else:
             self.log("Management Association instance unchanged")
             self.results['changed'] = False
@@ -237,13 +271,10 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
 
         :return: deserialized Management Association instance state dictionary
         '''
-        self.log("Creating / Updating the Management Association instance {0}".format(self.name))
+        self.log("Creating / Updating the Management Association instance {0}", self.name)
 
         try:
             response = self.mgmt_client.management_associations.create_or_update(resource_group_name=self.resource_group,
-                                                                                 self.config.provider_name=self.self.config.provider_name,
-                                                                                 self.config.resource_type=self.self.config.resource_type,
-                                                                                 self.config.resource_name=self.self.config.resource_name,
                                                                                  management_association_name=self.name,
                                                                                  parameters=self.parameters)
             if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
@@ -258,20 +289,17 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
         '''
         Deletes specified Management Association instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Management Association instance {0}".format(self.name))
+        self.log("Deleting the Management Association instance {0}", self.name)
         try:
             response = self.mgmt_client.management_associations.delete(resource_group_name=self.resource_group,
-                                                                       self.config.provider_name=self.self.config.provider_name,
-                                                                       self.config.resource_type=self.self.config.resource_type,
-                                                                       self.config.resource_name=self.self.config.resource_name,
                                                                        management_association_name=self.name)
         except CloudError as e:
             self.log('Error attempting to delete the Management Association instance.')
             self.fail("Error deleting the Management Association instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_managementassociation(self):
         '''
@@ -279,17 +307,14 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
 
         :return: deserialized Management Association instance state dictionary
         '''
-        self.log("Checking if the Management Association instance {0} is present".format(self.name))
+        self.log("Checking if the Management Association instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.management_associations.get(resource_group_name=self.resource_group,
-                                                                    self.config.provider_name=self.self.config.provider_name,
-                                                                    self.config.resource_type=self.self.config.resource_type,
-                                                                    self.config.resource_name=self.self.config.resource_name,
                                                                     management_association_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Management Association instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Management Association instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Management Association instance.')
         if found is True:
@@ -298,65 +323,6 @@ class AzureRMManagementAssociation(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMManagementAssociation()
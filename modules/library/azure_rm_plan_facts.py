@@ -0,0 +1,226 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2018 Zim Kalinowski, <zikalino@microsoft.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_plan_facts
+version_added: "2.8"
+short_description: Plan the changes of many resources against one Resource Graph snapshot.
+description:
+    - Compare the desired state of many resources with their current state and report what applying them would
+      change, without changing anything.
+    - The current state of all resources is read with a single Azure Resource Graph query, instead of one GET per
+      resource.
+    - Resource Graph only indexes top level resources; child resources are planned with action C(unknown).
+
+options:
+    resources:
+        description:
+            - Desired state documents, one per resource.
+        type: list
+        elements: dict
+        required: True
+        suboptions:
+            id:
+                description:
+                    - Resource ID.
+                required: True
+            state:
+                description:
+                    - Whether the resource should exist.
+                default: present
+                choices:
+                    - absent
+                    - present
+            properties:
+                description:
+                    - Desired ARM document of the resource, with the top level properties of the REST API, e.g.
+                      C(location), C(tags), C(sku) and C(properties). Nested names are camel case, as Azure returns them.
+                    - Only the values given are compared.
+                type: dict
+
+extends_documentation_fragment:
+    - azure
+
+author:
+    - "Zim Kalinowski (@zikalino)"
+
+'''
+
+EXAMPLES = '''
+  - name: Plan storage accounts and key vaults
+    azure_rm_plan_facts:
+      resources:
+        - id: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Storage/storageAccounts/sa1
+          properties:
+            location: westeurope
+            tags:
+              env: prod
+            sku:
+              name: Standard_LRS
+        - id: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.KeyVault/vaults/kv1
+          state: absent
+'''
+
+RETURN = '''
+plan:
+    description: One entry per element of I(resources), in the same order.
+    returned: always
+    type: complex
+    contains:
+        id:
+            description:
+                - Resource ID.
+            returned: always
+            type: str
+            sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Storage/storageAccounts/sa1
+        action:
+            description:
+                - C(create), C(update), C(delete), C(none), or C(unknown) for resources Resource Graph does not index.
+            returned: always
+            type: str
+            sample: update
+        changes:
+            description:
+                - Differences between the desired and the current state, each with C(path) (JSON pointer), C(op), C(before)
+                  and C(after).
+            returned: always
+            type: list
+        diff:
+            description:
+                - The changes in the before / after form of the Ansible diff callback.
+            returned: always
+            type: complex
+summary:
+    description:
+        - Number of resources per action.
+    returned: always
+    type: complex
+    sample: "{'create': 1, 'update': 2, 'delete': 0, 'none': 4997, 'unknown': 0}"
+'''
+
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
+from ansible.module_utils.azure_rm_diff import diff_summary, structural_diff
+from ansible.module_utils.azure_rm_graph import build_types_query, query_resources, resource_type
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+    from msrestazure.tools import parse_resource_id
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+
+ACTIONS = ['create', 'update', 'delete', 'none', 'unknown']
+
+
+class AzureRMPlanFacts(AzureRMFactsModuleBase):
+    def __init__(self):
+        # define user inputs into argument
+        self.module_arg_spec = dict(
+            resources=dict(
+                type='list',
+                elements='dict',
+                required=True,
+                options=dict(
+                    id=dict(
+                        type='str',
+                        required=True
+                    ),
+                    state=dict(
+                        type='str',
+                        default='present',
+                        choices=['present', 'absent']
+                    ),
+                    properties=dict(
+                        type='dict'
+                    )
+                )
+            )
+        )
+        # store the results of the module operation
+        self.results = dict(
+            changed=False
+        )
+        self.resources = None
+        super(AzureRMPlanFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+
+    def exec_module(self, **kwargs):
+        for key in self.module_arg_spec:
+            setattr(self, key, kwargs[key])
+
+        current = self.snapshot()
+        plan = [self.plan_resource(resource, current) for resource in self.resources]
+        self.results['plan'] = plan
+        self.results['summary'] = dict((action, sum(1 for p in plan if p['action'] == action)) for action in ACTIONS)
+        return self.results
+
+    def snapshot(self):
+        '''
+        Current state of the planned resources Resource Graph indexes, by lower case id, read with one
+        query over the subscriptions, resource types and resource groups of the plan. Rows of other
+        resources are dropped as the pages arrive.
+        '''
+        wanted = set()
+        subscriptions = set()
+        types = set()
+        groups = set()
+        for resource in self.resources:
+            rtype = resource_type(resource['id'])
+            if rtype is None:
+                continue
+            parts = parse_resource_id(resource['id'])
+            wanted.add(resource['id'].lower())
+            subscriptions.add(parts['subscription'])
+            types.add(rtype)
+            groups.add(parts.get('resource_group'))
+        current = {}
+        if not wanted:
+            return current
+        # subscription level resources rule out the resource group filter
+        query = build_types_query(sorted(types), resource_groups=None if None in groups else sorted(groups))
+        self.log("Resource Graph query: {0}", query)
+        try:
+            for row in query_resources(self.rm_client, sorted(subscriptions), query):
+                key = (row.get('id') or '').lower()
+                if key in wanted:
+                    current[key] = row
+        except CloudError as exc:
+            self.fail("Error querying Resource Graph: {0}".format(str(exc)))
+        return current
+
+    def plan_resource(self, resource, current):
+        if resource_type(resource['id']) is None:
+            return dict(id=resource['id'], action='unknown', changes=[], diff=dict(before={}, after={}))
+        old = current.get(resource['id'].lower())
+        desired = resource['properties'] or {}
+        if resource['state'] == 'absent':
+            if not old:
+                return dict(id=resource['id'], action='none', changes=[], diff=dict(before={}, after={}))
+            return dict(id=resource['id'], action='delete', changes=[dict(path='', op='remove', before=old, after=None)],
+                        diff=dict(before=old, after={}))
+        if not old:
+            return dict(id=resource['id'], action='create', changes=[dict(path='', op='add', before=None, after=desired)],
+                        diff=dict(before={}, after=desired))
+        changes = structural_diff(desired, old)
+        return dict(id=resource['id'], action='update' if changes else 'none', changes=changes, diff=diff_summary(changes))
+
+
+def main():
+    AzureRMPlanFacts()
+
+
+if __name__ == '__main__':
+    main()
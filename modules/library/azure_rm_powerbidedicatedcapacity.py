@@ -57,6 +57,34 @@ options:
                 description:
                     - An array of administrator user identities.
                 type: list
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Capacity.
@@ -107,17 +135,21 @@ state:
     returned: always
     type: str
     sample: Provisioning
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.powerbidedicated import PowerBIDedicatedManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -128,7 +160,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMCapacity(AzureRMModuleBase):
+class AzureRMCapacity(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Capacity resource"""
 
     def __init__(self):
@@ -193,20 +225,17 @@ class AzureRMCapacity(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.capacity_parameters[key] = kwargs[key]
 
-        dict_camelize(self.capacity_parameters, ['sku', 'tier'], True)
-        dict_map(self.capacity_parameters, ['sku', 'tier'], {'pbie_azure': 'PBIE_Azure'})
+        transform = DictTransform()
+        transform.camelize(['sku', 'tier'], True)
+        transform.map(['sku', 'tier'], {'pbie_azure': 'PBIE_Azure'})
+        transform.apply(self.capacity_parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(PowerBIDedicatedManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.powerbidedicated.PowerBIDedicatedManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_capacity()
+        old_response = self.cached_get(self.get_capacity)
 
         if not old_response:
             self.log("Capacity instance doesn't exist")
@@ -219,14 +248,16 @@ class AzureRMCapacity(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.capacity_parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.capacity_parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Capacity instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.capacity_parameters, old_response)
                 return self.results
 
             response = self.create_update_capacity()
@@ -238,12 +269,11 @@ class AzureRMCapacity(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_capacity()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_capacity()
+            self.wait_for_delete(response, self.get_capacity, 'Capacity')
         else:
             self.log("Capacity instance unchanged")
             self.results['changed'] = False
@@ -262,7 +292,7 @@ class AzureRMCapacity(AzureRMModuleBase):
 
         :return: deserialized Capacity instance state dictionary
         '''
-        self.log("Creating / Updating the Capacity instance {0}".format(self.name))
+        self.log("Creating / Updating the Capacity instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -285,9 +315,9 @@ class AzureRMCapacity(AzureRMModuleBase):
         '''
         Deletes specified Capacity instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Capacity instance {0}".format(self.name))
+        self.log("Deleting the Capacity instance {0}", self.name)
         try:
             response = self.mgmt_client.capacities.delete(resource_group_name=self.resource_group,
                                                           dedicated_capacity_name=self.name)
@@ -295,7 +325,7 @@ class AzureRMCapacity(AzureRMModuleBase):
             self.log('Error attempting to delete the Capacity instance.')
             self.fail("Error deleting the Capacity instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_capacity(self):
         '''
@@ -303,13 +333,13 @@ class AzureRMCapacity(AzureRMModuleBase):
 
         :return: deserialized Capacity instance state dictionary
         '''
-        self.log("Checking if the Capacity instance {0} is present".format(self.name))
+        self.log("Checking if the Capacity instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.capacities.get()
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Capacity instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Capacity instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Capacity instance.')
         if found is True:
@@ -318,79 +348,6 @@ class AzureRMCapacity(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
 def main():
     """Main execution"""
     AzureRMCapacity()
@@ -43,6 +43,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -96,18 +106,17 @@ backup_engines:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.recoveryservicesbackup import RecoveryServicesBackupClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBackupEngineFacts(AzureRMModuleBase):
+class AzureRMBackupEngineFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -144,14 +153,18 @@ class AzureRMBackupEngineFacts(AzureRMModuleBase):
         self.filter = None
         self.skip_token = None
         self.tags = None
-        super(AzureRMBackupEngineFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBackupEngineFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(RecoveryServicesBackupClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.recoveryservicesbackup.RecoveryServicesBackupClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['backup_engines'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['backup_engines'] = self.get()
         return self.results
 
@@ -162,7 +175,7 @@ class AzureRMBackupEngineFacts(AzureRMModuleBase):
             response = self.mgmt_client.backup_engines.get(vault_name=self.vault_name,
                                                            resource_group_name=self.resource_group,
                                                            backup_engine_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Backup Engine.')
 
@@ -171,6 +184,14 @@ class AzureRMBackupEngineFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.backup_engines, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
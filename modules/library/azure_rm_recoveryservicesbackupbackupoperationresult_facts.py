@@ -34,6 +34,16 @@ options:
         description:
             - OperationID which represents the operation.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -59,18 +69,17 @@ backup_operation_results:
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.recoveryservicesbackup import RecoveryServicesBackupClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBackupOperationResultFacts(AzureRMModuleBase):
+class AzureRMBackupOperationResultFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -95,14 +104,18 @@ class AzureRMBackupOperationResultFacts(AzureRMModuleBase):
         self.vault_name = None
         self.resource_group = None
         self.operation_id = None
-        super(AzureRMBackupOperationResultFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBackupOperationResultFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(RecoveryServicesBackupClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.recoveryservicesbackup.RecoveryServicesBackupClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['backup_operation_results'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['backup_operation_results'] = self.get()
         return self.results
 
@@ -113,7 +126,7 @@ class AzureRMBackupOperationResultFacts(AzureRMModuleBase):
             response = self.mgmt_client.backup_operation_results.get(vault_name=self.vault_name,
                                                                      resource_group_name=self.resource_group,
                                                                      operation_id=self.operation_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Backup Operation Result.')
 
@@ -122,6 +135,14 @@ class AzureRMBackupOperationResultFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.backup_operation_results, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
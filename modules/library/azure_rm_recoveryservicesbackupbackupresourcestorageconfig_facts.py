@@ -33,6 +33,16 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -83,18 +93,17 @@ backup_resource_storage_configs:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.recoveryservicesbackup import RecoveryServicesBackupClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBackupResourceStorageConfigFacts(AzureRMModuleBase):
+class AzureRMBackupResourceStorageConfigFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -118,14 +127,18 @@ class AzureRMBackupResourceStorageConfigFacts(AzureRMModuleBase):
         self.vault_name = None
         self.resource_group = None
         self.tags = None
-        super(AzureRMBackupResourceStorageConfigFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBackupResourceStorageConfigFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(RecoveryServicesBackupClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.recoveryservicesbackup.RecoveryServicesBackupClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['backup_resource_storage_configs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['backup_resource_storage_configs'] = self.get()
         return self.results
 
@@ -135,7 +148,7 @@ class AzureRMBackupResourceStorageConfigFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.backup_resource_storage_configs.get(vault_name=self.vault_name,
                                                                             resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Backup Resource Storage Config.')
 
@@ -144,6 +157,14 @@ class AzureRMBackupResourceStorageConfigFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.backup_resource_storage_configs, ids):
+            if response and self.has_tags(response.tags, self.tags):
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -30,6 +30,16 @@ options:
         description:
             - Container Backup Status Request
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -54,18 +64,17 @@ backup_status:
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.recoveryservicesbackup import RecoveryServicesBackupClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBackupStatusFacts(AzureRMModuleBase):
+class AzureRMBackupStatusFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -85,14 +94,18 @@ class AzureRMBackupStatusFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.azure_region = None
         self.parameters = None
-        super(AzureRMBackupStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBackupStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(RecoveryServicesBackupClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.recoveryservicesbackup.RecoveryServicesBackupClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['backup_status'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['backup_status'] = self.get()
         return self.results
 
@@ -102,7 +115,7 @@ class AzureRMBackupStatusFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.backup_status.get(azure_region=self.azure_region,
                                                           parameters=self.parameters)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Backup Status.')
 
@@ -111,6 +124,14 @@ class AzureRMBackupStatusFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.backup_status, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -79,9 +79,6 @@ options:
             - 'sql_data_base'
             - 'azure_file_share'
             - 'sap_hana_database'
-    container_name:
-        description:
-            - Unique name of container
     source_resource_id:
         description:
             - ARM ID of the resource to be backed up.
@@ -105,6 +102,34 @@ options:
         description:
             - Constant filled by server.
             - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Protected Item.
@@ -143,17 +168,21 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.recoveryservicesbackup import RecoveryServicesBackupClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -164,7 +193,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMProtectedItem(AzureRMModuleBase):
+class AzureRMProtectedItem(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Protected Item resource"""
 
     def __init__(self):
@@ -224,9 +253,6 @@ class AzureRMProtectedItem(AzureRMModuleBase):
                          'azure_file_share',
                          'sap_hana_database']
             ),
-            container_name=dict(
-                type='str'
-            ),
             source_resource_id=dict(
                 type='str'
             ),
@@ -280,32 +306,28 @@ class AzureRMProtectedItem(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_expand(self.parameters, ['backup_management_type'])
-        dict_camelize(self.parameters, ['backup_management_type'], True)
-        dict_map(self.parameters, ['backup_management_type'], {'azure_iaas_vm': 'AzureIaasVM', 'mab': 'MAB', 'dpm': 'DPM'})
-        dict_expand(self.parameters, ['workload_type'])
-        dict_camelize(self.parameters, ['workload_type'], True)
-        dict_map(self.parameters, ['workload_type'], {'vm': 'VM', 'sqldb': 'SQLDB', 'vmware_vm': 'VMwareVM', 'sql_data_base': 'SQLDataBase', 'sap_hana_database': 'SAPHanaDatabase'})
-        dict_expand(self.parameters, ['container_name'])
-        dict_expand(self.parameters, ['source_resource_id'])
-        dict_expand(self.parameters, ['policy_id'])
-        dict_expand(self.parameters, ['last_recovery_point'])
-        dict_expand(self.parameters, ['backup_set_name'])
-        dict_expand(self.parameters, ['create_mode'])
-        dict_camelize(self.parameters, ['create_mode'], True)
-        dict_expand(self.parameters, ['protected_item_type'])
+        transform = DictTransform()
+        transform.expand(['backup_management_type'], 'properties')
+        transform.camelize(['properties', 'backup_management_type'], True)
+        transform.map(['properties', 'backup_management_type'], {'azure_iaas_vm': 'AzureIaasVM', 'mab': 'MAB', 'dpm': 'DPM'})
+        transform.expand(['workload_type'], 'properties')
+        transform.camelize(['properties', 'workload_type'], True)
+        transform.map(['properties', 'workload_type'], {'vm': 'VM', 'sqldb': 'SQLDB', 'vmware_vm': 'VMwareVM', 'sql_data_base': 'SQLDataBase', 'sap_hana_database': 'SAPHanaDatabase'})
+        transform.expand(['source_resource_id'], 'properties')
+        transform.expand(['policy_id'], 'properties')
+        transform.expand(['last_recovery_point'], 'properties')
+        transform.expand(['backup_set_name'], 'properties')
+        transform.expand(['create_mode'], 'properties')
+        transform.camelize(['properties', 'create_mode'], True)
+        transform.expand(['protected_item_type'], 'properties')
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(RecoveryServicesBackupClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.recoveryservicesbackup.RecoveryServicesBackupClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_protecteditem()
+        old_response = self.cached_get(self.get_protecteditem)
 
         if not old_response:
             self.log("Protected Item instance doesn't exist")
@@ -318,14 +340,16 @@ class AzureRMProtectedItem(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Protected Item instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_protecteditem()
@@ -337,12 +361,11 @@ class AzureRMProtectedItem(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_protecteditem()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_protecteditem()
+            self.wait_for_delete(response, self.get_protecteditem, 'Protected Item')
         else:
             self.log("Protected Item instance unchanged")
             self.results['changed'] = False
@@ -360,7 +383,7 @@ class AzureRMProtectedItem(AzureRMModuleBase):
 
         :return: deserialized Protected Item instance state dictionary
         '''
-        self.log("Creating / Updating the Protected Item instance {0}".format(self.name))
+        self.log("Creating / Updating the Protected Item instance {0}", self.name)
 
         try:
             response = self.mgmt_client.protected_items.create_or_update(vault_name=self.vault_name,
@@ -381,9 +404,9 @@ class AzureRMProtectedItem(AzureRMModuleBase):
         '''
         Deletes specified Protected Item instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Protected Item instance {0}".format(self.name))
+        self.log("Deleting the Protected Item instance {0}", self.name)
         try:
             response = self.mgmt_client.protected_items.delete(vault_name=self.vault_name,
                                                                resource_group_name=self.resource_group,
@@ -394,7 +417,7 @@ class AzureRMProtectedItem(AzureRMModuleBase):
             self.log('Error attempting to delete the Protected Item instance.')
             self.fail("Error deleting the Protected Item instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_protecteditem(self):
         '''
@@ -402,7 +425,7 @@ class AzureRMProtectedItem(AzureRMModuleBase):
 
         :return: deserialized Protected Item instance state dictionary
         '''
-        self.log("Checking if the Protected Item instance {0} is present".format(self.name))
+        self.log("Checking if the Protected Item instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.protected_items.get(vault_name=self.vault_name,
@@ -411,8 +434,8 @@ class AzureRMProtectedItem(AzureRMModuleBase):
                                                             container_name=self.container_name,
                                                             protected_item_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Protected Item instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Protected Item instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Protected Item instance.')
         if found is True:
@@ -421,95 +444,6 @@ class AzureRMProtectedItem(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMProtectedItem()
@@ -46,6 +46,16 @@ options:
         description:
             - OperationID represents the operation whose status needs to be fetched.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -99,18 +109,17 @@ protected_item_operation_statuses:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.recoveryservicesbackup import RecoveryServicesBackupClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMProtectedItemOperationStatusFacts(AzureRMModuleBase):
+class AzureRMProtectedItemOperationStatusFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -150,14 +159,18 @@ class AzureRMProtectedItemOperationStatusFacts(AzureRMModuleBase):
         self.container_name = None
         self.name = None
         self.operation_id = None
-        super(AzureRMProtectedItemOperationStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMProtectedItemOperationStatusFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(RecoveryServicesBackupClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.recoveryservicesbackup.RecoveryServicesBackupClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['protected_item_operation_statuses'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['protected_item_operation_statuses'] = self.get()
         return self.results
 
@@ -171,7 +184,7 @@ class AzureRMProtectedItemOperationStatusFacts(AzureRMModuleBase):
                                                                               container_name=self.container_name,
                                                                               protected_item_name=self.name,
                                                                               operation_id=self.operation_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Protected Item Operation Status.')
 
@@ -180,6 +193,14 @@ class AzureRMProtectedItemOperationStatusFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.protected_item_operation_statuses, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
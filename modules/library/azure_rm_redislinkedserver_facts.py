@@ -34,6 +34,16 @@ options:
         description:
             - The name of the linked server.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -71,18 +81,17 @@ linked_server:
             sample: cache2
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.redis import RedisManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMLinkedServerFacts(AzureRMModuleBase):
+class AzureRMLinkedServerFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -107,14 +116,18 @@ class AzureRMLinkedServerFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.linked_server_name = None
-        super(AzureRMLinkedServerFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMLinkedServerFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(RedisManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.redis.RedisManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['linked_server'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['linked_server'] = self.get()
         return self.results
 
@@ -125,7 +138,7 @@ class AzureRMLinkedServerFacts(AzureRMModuleBase):
             response = self.mgmt_client.linked_server.get(resource_group_name=self.resource_group,
                                                           name=self.name,
                                                           linked_server_name=self.linked_server_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Linked Server.')
 
@@ -134,6 +147,14 @@ class AzureRMLinkedServerFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.linked_server, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
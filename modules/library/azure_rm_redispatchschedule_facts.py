@@ -35,6 +35,29 @@ options:
     cache_name:
         description:
             - The name of the Redis cache.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -75,20 +98,25 @@ patch_schedules:
             returned: always
             type: str
             sample: default
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.redis import RedisManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMPatchScheduleFacts(AzureRMModuleBase):
+class AzureRMPatchScheduleFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -115,14 +143,18 @@ class AzureRMPatchScheduleFacts(AzureRMModuleBase):
         self.name = None
         self.default = None
         self.cache_name = None
-        super(AzureRMPatchScheduleFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMPatchScheduleFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(RedisManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.redis.RedisManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['patch_schedules'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.name is not None and
                 self.default is not None):
             self.results['patch_schedules'] = self.get()
@@ -137,7 +169,7 @@ class AzureRMPatchScheduleFacts(AzureRMModuleBase):
             response = self.mgmt_client.patch_schedules.get(resource_group_name=self.resource_group,
                                                             name=self.name,
                                                             default=self.default)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Patch Schedule.')
 
@@ -146,18 +178,26 @@ class AzureRMPatchScheduleFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.patch_schedules, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_redis_resource(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.patch_schedules.list_by_redis_resource(resource_group_name=self.resource_group,
                                                                                cache_name=self.cache_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Patch Schedule.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -30,6 +30,16 @@ options:
         description:
             - Order Id of the reservation
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -104,18 +114,17 @@ reservation:
                     sample: 3
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.reservations import AzureReservationAPI
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMReservationFacts(AzureRMModuleBase):
+class AzureRMReservationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -135,14 +144,18 @@ class AzureRMReservationFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.reservation_id = None
         self.reservation_order_id = None
-        super(AzureRMReservationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMReservationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureReservationAPI,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.reservations.AzureReservationAPI',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['reservation'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['reservation'] = self.get()
         return self.results
 
@@ -152,7 +165,7 @@ class AzureRMReservationFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.reservation.get(reservation_id=self.reservation_id,
                                                         reservation_order_id=self.reservation_order_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Reservation.')
 
@@ -161,6 +174,14 @@ class AzureRMReservationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.reservation, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
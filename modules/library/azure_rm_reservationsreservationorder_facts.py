@@ -26,6 +26,16 @@ options:
         description:
             - Order Id of the reservation
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -73,18 +83,17 @@ reservation_order:
             sample: P1Y
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.reservations import AzureReservationAPI
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMReservationOrderFacts(AzureRMModuleBase):
+class AzureRMReservationOrderFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -99,14 +108,18 @@ class AzureRMReservationOrderFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.reservation_order_id = None
-        super(AzureRMReservationOrderFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMReservationOrderFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(AzureReservationAPI,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.reservations.AzureReservationAPI',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['reservation_order'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['reservation_order'] = self.get()
         return self.results
 
@@ -115,7 +128,7 @@ class AzureRMReservationOrderFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.reservation_order.get(reservation_order_id=self.reservation_order_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Reservation Order.')
 
@@ -124,6 +137,14 @@ class AzureRMReservationOrderFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.reservation_order, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
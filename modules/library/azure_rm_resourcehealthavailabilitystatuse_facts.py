@@ -32,6 +32,24 @@ options:
     expand:
         description:
             - Setting $expand=recommendedactions in url query expands the recommendedactions in the response.
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -60,20 +78,25 @@ availability_statuses:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.resourcehealth import MicrosoftResourceHealth
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMAvailabilityStatuseFacts(AzureRMModuleBase):
+class AzureRMAvailabilityStatuseFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -95,12 +118,12 @@ class AzureRMAvailabilityStatuseFacts(AzureRMModuleBase):
         self.resource_group = None
         self.filter = None
         self.expand = None
-        super(AzureRMAvailabilityStatuseFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMAvailabilityStatuseFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(MicrosoftResourceHealth,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.resourcehealth.MicrosoftResourceHealth',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.resource_group is not None:
@@ -114,12 +137,12 @@ class AzureRMAvailabilityStatuseFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.availability_statuses.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Availability Statuse.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -129,12 +152,12 @@ class AzureRMAvailabilityStatuseFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.availability_statuses.list_by_subscription_id()
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Availability Statuse.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
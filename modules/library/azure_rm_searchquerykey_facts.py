@@ -33,6 +33,24 @@ options:
     search_management_request_options:
         description:
             - Additional parameters for the operation
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -56,20 +74,25 @@ query_keys:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.search import SearchManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMQueryKeyFacts(AzureRMModuleBase):
+class AzureRMQueryKeyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -93,12 +116,12 @@ class AzureRMQueryKeyFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.search_management_request_options = None
-        super(AzureRMQueryKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMQueryKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SearchManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.search.SearchManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         self.results['query_keys'] = self.list_by_search_service()
@@ -110,12 +133,12 @@ class AzureRMQueryKeyFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.query_keys.list_by_search_service(resource_group_name=self.resource_group,
                                                                           search_service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Query Key.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -34,6 +34,16 @@ options:
         description:
             - "The configuration name. Should always be '$default'."
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -72,18 +82,17 @@ migration_configs:
             sample: sdk-Namespace-41
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.servicebus import ServiceBusManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMMigrationConfigFacts(AzureRMModuleBase):
+class AzureRMMigrationConfigFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -108,14 +117,18 @@ class AzureRMMigrationConfigFacts(AzureRMModuleBase):
         self.resource_group = None
         self.namespace_name = None
         self.name = None
-        super(AzureRMMigrationConfigFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMMigrationConfigFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceBusManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.servicebus.ServiceBusManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['migration_configs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['migration_configs'] = self.get()
         return self.results
 
@@ -126,7 +139,7 @@ class AzureRMMigrationConfigFacts(AzureRMModuleBase):
             response = self.mgmt_client.migration_configs.get(resource_group_name=self.resource_group,
                                                               namespace_name=self.namespace_name,
                                                               config_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Migration Config.')
 
@@ -135,6 +148,14 @@ class AzureRMMigrationConfigFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.migration_configs, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
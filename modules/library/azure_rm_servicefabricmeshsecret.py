@@ -45,6 +45,34 @@ options:
         description:
             - "The type of the content stored in the secret value. The value of this property is opaque to Service Fabric. Once set, the value of this
                property cannot be changed."
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Secret.
@@ -82,17 +110,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/00000000-0000-0000-0000-000000000000/resourcegroups/sbz_demo/providers/Microsoft.ServiceFabricMesh/secrets/dbConnectionString
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.servicefabricmesh import ServiceFabricMeshManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -103,7 +135,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMSecret(AzureRMModuleBase):
+class AzureRMSecret(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Secret resource"""
 
     def __init__(self):
@@ -157,18 +189,18 @@ class AzureRMSecret(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.secret_resource_description[key] = kwargs[key]
 
-        dict_expand(self.secret_resource_description, ['kind'])
-        dict_expand(self.secret_resource_description, ['description'])
-        dict_expand(self.secret_resource_description, ['content_type'])
+        transform = DictTransform()
+        transform.expand(['kind'], 'properties')
+        transform.expand(['description'], 'properties')
+        transform.expand(['content_type'], 'properties')
+        transform.apply(self.secret_resource_description)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceFabricMeshManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.servicefabricmesh.ServiceFabricMeshManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_secret()
+        old_response = self.cached_get(self.get_secret)
 
         if not old_response:
             self.log("Secret instance doesn't exist")
@@ -181,7 +213,7 @@ class AzureRMSecret(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.secret_resource_description, old_response, '', self.results)):
+                if (not self.compare_state(self.secret_resource_description, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -189,6 +221,7 @@ class AzureRMSecret(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.secret_resource_description, old_response)
                 return self.results
 
             response = self.create_update_secret()
@@ -200,12 +233,11 @@ class AzureRMSecret(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_secret()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_secret()
+            self.wait_for_delete(response, self.get_secret, 'Secret')
         else:
             self.log("Secret instance unchanged")
             self.results['changed'] = False
@@ -223,7 +255,7 @@ class AzureRMSecret(AzureRMModuleBase):
 
         :return: deserialized Secret instance state dictionary
         '''
-        self.log("Creating / Updating the Secret instance {0}".format(self.name))
+        self.log("Creating / Updating the Secret instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -244,9 +276,9 @@ class AzureRMSecret(AzureRMModuleBase):
         '''
         Deletes specified Secret instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Secret instance {0}".format(self.name))
+        self.log("Deleting the Secret instance {0}", self.name)
         try:
             response = self.mgmt_client.secret.delete(resource_group_name=self.resource_group,
                                                       secret_resource_name=self.name)
@@ -254,7 +286,7 @@ class AzureRMSecret(AzureRMModuleBase):
             self.log('Error attempting to delete the Secret instance.')
             self.fail("Error deleting the Secret instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_secret(self):
         '''
@@ -262,14 +294,14 @@ class AzureRMSecret(AzureRMModuleBase):
 
         :return: deserialized Secret instance state dictionary
         '''
-        self.log("Checking if the Secret instance {0} is present".format(self.name))
+        self.log("Checking if the Secret instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.secret.get(resource_group_name=self.resource_group,
                                                    secret_resource_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Secret instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Secret instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Secret instance.')
         if found is True:
@@ -278,65 +310,6 @@ class AzureRMSecret(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMSecret()
@@ -38,6 +38,16 @@ options:
         description:
             - Service Fabric replica name.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -64,18 +74,17 @@ service_replica:
     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.servicefabricmesh import ServiceFabricMeshManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMServiceReplicaFacts(AzureRMModuleBase):
+class AzureRMServiceReplicaFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -105,14 +114,18 @@ class AzureRMServiceReplicaFacts(AzureRMModuleBase):
         self.application_resource_name = None
         self.service_resource_name = None
         self.name = None
-        super(AzureRMServiceReplicaFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMServiceReplicaFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(ServiceFabricMeshManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.servicefabricmesh.ServiceFabricMeshManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['service_replica'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['service_replica'] = self.get()
         return self.results
 
@@ -124,7 +137,7 @@ class AzureRMServiceReplicaFacts(AzureRMModuleBase):
                                                             application_resource_name=self.application_resource_name,
                                                             service_resource_name=self.service_resource_name,
                                                             replica_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Service Replica.')
 
@@ -133,6 +146,14 @@ class AzureRMServiceReplicaFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.service_replica, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
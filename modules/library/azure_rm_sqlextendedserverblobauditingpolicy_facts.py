@@ -34,6 +34,16 @@ options:
         description:
             - The name of the blob auditing policy.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -79,18 +89,17 @@ extended_server_blob_auditing_policies:
             sample: Disabled
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMExtendedServerBlobAuditingPolicyFacts(AzureRMModuleBase):
+class AzureRMExtendedServerBlobAuditingPolicyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -115,14 +124,18 @@ class AzureRMExtendedServerBlobAuditingPolicyFacts(AzureRMModuleBase):
         self.resource_group = None
         self.server_name = None
         self.name = None
-        super(AzureRMExtendedServerBlobAuditingPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMExtendedServerBlobAuditingPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['extended_server_blob_auditing_policies'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['extended_server_blob_auditing_policies'] = self.get()
         return self.results
 
@@ -133,7 +146,7 @@ class AzureRMExtendedServerBlobAuditingPolicyFacts(AzureRMModuleBase):
             response = self.mgmt_client.extended_server_blob_auditing_policies.get(resource_group_name=self.resource_group,
                                                                                    server_name=self.server_name,
                                                                                    blob_auditing_policy_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Extended Server Blob Auditing Policy.')
 
@@ -142,6 +155,14 @@ class AzureRMExtendedServerBlobAuditingPolicyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.extended_server_blob_auditing_policies, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -41,6 +41,48 @@ options:
         description:
             - "The end IP address of the firewall rule. Must be IPv4 format. Must be greater than or equal to I(start_ip_address). Use value '0.0.0.0' to
                represent all Azure-internal IP addresses."
+    items:
+        description:
+            - Manage several instances in one task, each element holds the options of one instance.
+            - Options missing in an element are taken from the module options, so options shared by all
+              instances (for example I(resource_group)) can be given once. Required options may be given
+              in either place.
+            - Instances are processed concurrently, see I(concurrency).
+        type: list
+        elements: dict
+    concurrency:
+        description:
+            - Maximum number of I(items) processed at the same time.
+        type: int
+        default: 10
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the SQL Firewall Rule.
@@ -76,17 +118,25 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/firewallrulecrudtest-12/providers/Microsoft.Sql/servers/firewallrulecrudtest-
             6285/firewallRules/firewallrulecrudtest-5370"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
+items:
+    description:
+        - One result per element of I(items), in the same order, with the element under C(item).
+    returned: when I(items) was used
+    type: list
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -97,7 +147,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMSQLFirewallRule(AzureRMModuleBase):
+class AzureRMSQLFirewallRule(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM SQL Firewall Rule resource"""
 
     def __init__(self):
@@ -140,7 +190,8 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
 
         super(AzureRMSQLFirewallRule, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                        supports_check_mode=True,
-                                                       supports_tags=False)
+                                                       supports_tags=False,
+                                                       supports_items=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -151,15 +202,12 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_sqlfirewallrule()
+        old_response = self.cached_get(self.get_sqlfirewallrule)
 
         if not old_response:
             self.log("SQL Firewall Rule instance doesn't exist")
@@ -172,7 +220,8 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(dict(start_ip_address=self.start_ip_address,
+                                                end_ip_address=self.end_ip_address), old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -180,6 +229,7 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(dict(start_ip_address=self.start_ip_address, end_ip_address=self.end_ip_address), old_response)
                 return self.results
 
             response = self.create_update_sqlfirewallrule()
@@ -191,12 +241,11 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_sqlfirewallrule()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_sqlfirewallrule()
+            self.wait_for_delete(response, self.get_sqlfirewallrule, 'SQL Firewall Rule')
         else:
             self.log("SQL Firewall Rule instance unchanged")
             self.results['changed'] = False
@@ -214,7 +263,7 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
 
         :return: deserialized SQL Firewall Rule instance state dictionary
         '''
-        self.log("Creating / Updating the SQL Firewall Rule instance {0}".format(self.name))
+        self.log("Creating / Updating the SQL Firewall Rule instance {0}", self.name)
 
         try:
             response = self.mgmt_client.firewall_rules.create_or_update(resource_group_name=self.resource_group,
@@ -234,9 +283,9 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
         '''
         Deletes specified SQL Firewall Rule instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the SQL Firewall Rule instance {0}".format(self.name))
+        self.log("Deleting the SQL Firewall Rule instance {0}", self.name)
         try:
             response = self.mgmt_client.firewall_rules.delete(resource_group_name=self.resource_group,
                                                               server_name=self.server_name,
@@ -245,7 +294,7 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
             self.log('Error attempting to delete the SQL Firewall Rule instance.')
             self.fail("Error deleting the SQL Firewall Rule instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_sqlfirewallrule(self):
         '''
@@ -253,15 +302,15 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
 
         :return: deserialized SQL Firewall Rule instance state dictionary
         '''
-        self.log("Checking if the SQL Firewall Rule instance {0} is present".format(self.name))
+        self.log("Checking if the SQL Firewall Rule instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.firewall_rules.get(resource_group_name=self.resource_group,
                                                            server_name=self.server_name,
                                                            firewall_rule_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("SQL Firewall Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("SQL Firewall Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the SQL Firewall Rule instance.')
         if found is True:
@@ -270,49 +319,6 @@ class AzureRMSQLFirewallRule(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMSQLFirewallRule()
@@ -80,6 +80,34 @@ options:
             partner_managed_instance_id:
                 description:
                     - Id of Partner Managed Instance in pair.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Instance Failover Group.
@@ -123,17 +151,21 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/Default/providers/Microsoft.Sql/locations/JapanEast/instanceFailoverGroups/fa
             ilover-group-test-3"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -144,7 +176,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
+class AzureRMInstanceFailoverGroup(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Instance Failover Group resource"""
 
     def __init__(self):
@@ -231,17 +263,17 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_camelize(self.parameters, ['read_write_endpoint', 'failover_policy'], True)
-        dict_map(self.parameters, ['read_only_endpoint', 'failover_policy'], {True: 'Enabled', False: 'Disabled'})
+        transform = DictTransform()
+        transform.camelize(['read_write_endpoint', 'failover_policy'], True)
+        transform.map(['read_only_endpoint', 'failover_policy'], {True: 'Enabled', False: 'Disabled'})
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_instancefailovergroup()
+        old_response = self.cached_get(self.get_instancefailovergroup)
 
         if not old_response:
             self.log("Instance Failover Group instance doesn't exist")
@@ -254,7 +286,7 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -262,6 +294,7 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_instancefailovergroup()
@@ -273,12 +306,11 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_instancefailovergroup()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_instancefailovergroup()
+            self.wait_for_delete(response, self.get_instancefailovergroup, 'Instance Failover Group')
         else:
             self.log("Instance Failover Group instance unchanged")
             self.results['changed'] = False
@@ -296,7 +328,7 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
 
         :return: deserialized Instance Failover Group instance state dictionary
         '''
-        self.log("Creating / Updating the Instance Failover Group instance {0}".format(self.name))
+        self.log("Creating / Updating the Instance Failover Group instance {0}", self.name)
 
         try:
             response = self.mgmt_client.instance_failover_groups.create_or_update(resource_group_name=self.resource_group,
@@ -315,9 +347,9 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
         '''
         Deletes specified Instance Failover Group instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Instance Failover Group instance {0}".format(self.name))
+        self.log("Deleting the Instance Failover Group instance {0}", self.name)
         try:
             response = self.mgmt_client.instance_failover_groups.delete(resource_group_name=self.resource_group,
                                                                         location_name=self.location_name,
@@ -326,7 +358,7 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
             self.log('Error attempting to delete the Instance Failover Group instance.')
             self.fail("Error deleting the Instance Failover Group instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_instancefailovergroup(self):
         '''
@@ -334,15 +366,15 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
 
         :return: deserialized Instance Failover Group instance state dictionary
         '''
-        self.log("Checking if the Instance Failover Group instance {0} is present".format(self.name))
+        self.log("Checking if the Instance Failover Group instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.instance_failover_groups.get(resource_group_name=self.resource_group,
                                                                      location_name=self.location_name,
                                                                      failover_group_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Instance Failover Group instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Instance Failover Group instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Instance Failover Group instance.')
         if found is True:
@@ -351,79 +383,6 @@ class AzureRMInstanceFailoverGroup(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
 def main():
     """Main execution"""
     AzureRMInstanceFailoverGroup()
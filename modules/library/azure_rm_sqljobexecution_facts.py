@@ -61,6 +61,29 @@ options:
     job_execution_id:
         description:
             - The id of the job execution
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -133,20 +156,25 @@ job_executions:
             returned: always
             type: str
             sample: Created
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMJobExecutionFacts(AzureRMModuleBase):
+class AzureRMJobExecutionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -207,14 +235,18 @@ class AzureRMJobExecutionFacts(AzureRMModuleBase):
         self.skip = None
         self.top = None
         self.job_execution_id = None
-        super(AzureRMJobExecutionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMJobExecutionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['job_executions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.name is not None and
                 self.job_execution_id is not None):
             self.results['job_executions'] = self.get()
@@ -232,12 +264,12 @@ class AzureRMJobExecutionFacts(AzureRMModuleBase):
                                                                    server_name=self.server_name,
                                                                    job_agent_name=self.job_agent_name,
                                                                    job_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Execution.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -249,12 +281,12 @@ class AzureRMJobExecutionFacts(AzureRMModuleBase):
             response = self.mgmt_client.job_executions.list_by_agent(resource_group_name=self.resource_group,
                                                                      server_name=self.server_name,
                                                                      job_agent_name=self.job_agent_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Execution.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -268,7 +300,7 @@ class AzureRMJobExecutionFacts(AzureRMModuleBase):
                                                            job_agent_name=self.job_agent_name,
                                                            job_name=self.name,
                                                            job_execution_id=self.job_execution_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Execution.')
 
@@ -277,6 +309,14 @@ class AzureRMJobExecutionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.job_executions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
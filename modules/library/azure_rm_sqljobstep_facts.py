@@ -44,6 +44,29 @@ options:
     name:
         description:
             - The name of the job step.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -149,20 +172,25 @@ job_steps:
                     type: str
                     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/group1/providers/Microsoft.Sql/servers/server1/jobAgents/agen
                             t1/credentials/cred0"
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMJobStepFacts(AzureRMModuleBase):
+class AzureRMJobStepFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -200,14 +228,18 @@ class AzureRMJobStepFacts(AzureRMModuleBase):
         self.job_name = None
         self.job_version = None
         self.name = None
-        super(AzureRMJobStepFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMJobStepFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['job_steps'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.job_version is not None:
             self.results['job_steps'] = self.list_by_version()
         elif self.name is not None:
@@ -225,12 +257,12 @@ class AzureRMJobStepFacts(AzureRMModuleBase):
                                                                   job_agent_name=self.job_agent_name,
                                                                   job_name=self.job_name,
                                                                   job_version=self.job_version)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Step.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -244,7 +276,7 @@ class AzureRMJobStepFacts(AzureRMModuleBase):
                                                       job_agent_name=self.job_agent_name,
                                                       job_name=self.job_name,
                                                       step_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Step.')
 
@@ -253,6 +285,14 @@ class AzureRMJobStepFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.job_steps, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_job(self):
         response = None
         results = []
@@ -261,12 +301,12 @@ class AzureRMJobStepFacts(AzureRMModuleBase):
                                                               server_name=self.server_name,
                                                               job_agent_name=self.job_agent_name,
                                                               job_name=self.job_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Step.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -69,6 +69,29 @@ options:
     target_id:
         description:
             - The target id.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -160,20 +183,25 @@ job_target_executions:
                     returned: always
                     type: str
                     sample: SqlDatabase
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMJobTargetExecutionFacts(AzureRMModuleBase):
+class AzureRMJobTargetExecutionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -244,14 +272,18 @@ class AzureRMJobTargetExecutionFacts(AzureRMModuleBase):
         self.skip = None
         self.top = None
         self.target_id = None
-        super(AzureRMJobTargetExecutionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMJobTargetExecutionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['job_target_executions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.name is not None and
                 self.target_id is not None):
             self.results['job_target_executions'] = self.get()
@@ -271,12 +303,12 @@ class AzureRMJobTargetExecutionFacts(AzureRMModuleBase):
                                                                            job_name=self.job_name,
                                                                            job_execution_id=self.job_execution_id,
                                                                            step_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Target Execution.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -290,12 +322,12 @@ class AzureRMJobTargetExecutionFacts(AzureRMModuleBase):
                                                                                     job_agent_name=self.job_agent_name,
                                                                                     job_name=self.job_name,
                                                                                     job_execution_id=self.job_execution_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Target Execution.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -311,7 +343,7 @@ class AzureRMJobTargetExecutionFacts(AzureRMModuleBase):
                                                                   job_execution_id=self.job_execution_id,
                                                                   step_name=self.name,
                                                                   target_id=self.target_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Target Execution.')
 
@@ -320,6 +352,14 @@ class AzureRMJobTargetExecutionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.job_target_executions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
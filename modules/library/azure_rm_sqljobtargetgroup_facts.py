@@ -37,6 +37,29 @@ options:
     name:
         description:
             - The name of the target group.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -87,20 +110,25 @@ job_target_groups:
             type: complex
             sample: members
             contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMJobTargetGroupFacts(AzureRMModuleBase):
+class AzureRMJobTargetGroupFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -129,14 +157,18 @@ class AzureRMJobTargetGroupFacts(AzureRMModuleBase):
         self.server_name = None
         self.job_agent_name = None
         self.name = None
-        super(AzureRMJobTargetGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMJobTargetGroupFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['job_target_groups'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['job_target_groups'] = self.get()
         else:
@@ -151,7 +183,7 @@ class AzureRMJobTargetGroupFacts(AzureRMModuleBase):
                                                               server_name=self.server_name,
                                                               job_agent_name=self.job_agent_name,
                                                               target_group_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Target Group.')
 
@@ -160,6 +192,14 @@ class AzureRMJobTargetGroupFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.job_target_groups, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_agent(self):
         response = None
         results = []
@@ -167,12 +207,12 @@ class AzureRMJobTargetGroupFacts(AzureRMModuleBase):
             response = self.mgmt_client.job_target_groups.list_by_agent(resource_group_name=self.resource_group,
                                                                         server_name=self.server_name,
                                                                         job_agent_name=self.job_agent_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Target Group.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -41,6 +41,29 @@ options:
     job_version:
         description:
             - The version of the job to get.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -86,20 +109,25 @@ job_versions:
             returned: always
             type: str
             sample: 1
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMJobVersionFacts(AzureRMModuleBase):
+class AzureRMJobVersionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -133,14 +161,18 @@ class AzureRMJobVersionFacts(AzureRMModuleBase):
         self.job_agent_name = None
         self.name = None
         self.job_version = None
-        super(AzureRMJobVersionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMJobVersionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['job_versions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.job_version is not None:
             self.results['job_versions'] = self.get()
         else:
@@ -156,7 +188,7 @@ class AzureRMJobVersionFacts(AzureRMModuleBase):
                                                          job_agent_name=self.job_agent_name,
                                                          job_name=self.name,
                                                          job_version=self.job_version)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Version.')
 
@@ -165,6 +197,14 @@ class AzureRMJobVersionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.job_versions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_job(self):
         response = None
         results = []
@@ -173,12 +213,12 @@ class AzureRMJobVersionFacts(AzureRMModuleBase):
                                                                  server_name=self.server_name,
                                                                  job_agent_name=self.job_agent_name,
                                                                  job_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Job Version.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
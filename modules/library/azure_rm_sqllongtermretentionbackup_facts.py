@@ -39,6 +39,29 @@ options:
     name:
         description:
             - The backup name.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -98,20 +121,25 @@ long_term_retention_backups:
             returned: always
             type: str
             sample: "2017-03-10T08:00:00.000Z;55555555-6666-7777-8888-999999999999;131637960820000000"
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMLongTermRetentionBackupFacts(AzureRMModuleBase):
+class AzureRMLongTermRetentionBackupFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -146,14 +174,18 @@ class AzureRMLongTermRetentionBackupFacts(AzureRMModuleBase):
         self.only_latest_per_database = None
         self.database_state = None
         self.name = None
-        super(AzureRMLongTermRetentionBackupFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMLongTermRetentionBackupFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['long_term_retention_backups'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.long_term_retention_server_name is not None and
                 self.long_term_retention_database_name is not None and
                 self.name is not None):
@@ -174,12 +206,12 @@ class AzureRMLongTermRetentionBackupFacts(AzureRMModuleBase):
             response = self.mgmt_client.long_term_retention_backups.list_by_database(location_name=self.location_name,
                                                                                      long_term_retention_server_name=self.long_term_retention_server_name,
                                                                                      long_term_retention_database_name=self.long_term_retention_database_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Long Term Retention Backup.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -192,7 +224,7 @@ class AzureRMLongTermRetentionBackupFacts(AzureRMModuleBase):
                                                                         long_term_retention_server_name=self.long_term_retention_server_name,
                                                                         long_term_retention_database_name=self.long_term_retention_database_name,
                                                                         backup_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Long Term Retention Backup.')
 
@@ -201,18 +233,26 @@ class AzureRMLongTermRetentionBackupFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.long_term_retention_backups, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_server(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.long_term_retention_backups.list_by_server(location_name=self.location_name,
                                                                                    long_term_retention_server_name=self.long_term_retention_server_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Long Term Retention Backup.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -222,12 +262,12 @@ class AzureRMLongTermRetentionBackupFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.long_term_retention_backups.list_by_location(location_name=self.location_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Long Term Retention Backup.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
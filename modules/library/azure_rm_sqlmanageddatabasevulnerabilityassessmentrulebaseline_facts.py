@@ -46,6 +46,16 @@ options:
         description:
             - The name of the vulnerability assessment rule baseline (default implies a baseline on a database level rule and master for server level rule).
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -87,18 +97,17 @@ managed_database_vulnerability_assessment_rule_baselines:
             sample: default
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMManagedDatabaseVulnerabilityAssessmentRuleBaselineFacts(AzureRMModuleBase):
+class AzureRMManagedDatabaseVulnerabilityAssessmentRuleBaselineFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -138,14 +147,18 @@ class AzureRMManagedDatabaseVulnerabilityAssessmentRuleBaselineFacts(AzureRMModu
         self.vulnerability_assessment_name = None
         self.rule_id = None
         self.name = None
-        super(AzureRMManagedDatabaseVulnerabilityAssessmentRuleBaselineFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMManagedDatabaseVulnerabilityAssessmentRuleBaselineFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['managed_database_vulnerability_assessment_rule_baselines'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['managed_database_vulnerability_assessment_rule_baselines'] = self.get()
         return self.results
 
@@ -159,7 +172,7 @@ class AzureRMManagedDatabaseVulnerabilityAssessmentRuleBaselineFacts(AzureRMModu
                                                                                                      vulnerability_assessment_name=self.vulnerability_assessment_name,
                                                                                                      rule_id=self.rule_id,
                                                                                                      baseline_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Managed Database Vulnerability Assessment Rule Baseline.')
 
@@ -168,6 +181,14 @@ class AzureRMManagedDatabaseVulnerabilityAssessmentRuleBaselineFacts(AzureRMModu
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.managed_database_vulnerability_assessment_rule_baselines, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
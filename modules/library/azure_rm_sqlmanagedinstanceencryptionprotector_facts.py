@@ -33,6 +33,29 @@ options:
     name:
         description:
             - The name of the encryption protector to be retrieved.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -86,20 +109,25 @@ managed_instance_encryption_protectors:
             returned: always
             type: str
             sample: "https://someVault.vault.azure.net/keys/someKey/01234567890123456789012345678901"
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMManagedInstanceEncryptionProtectorFacts(AzureRMModuleBase):
+class AzureRMManagedInstanceEncryptionProtectorFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -123,14 +151,18 @@ class AzureRMManagedInstanceEncryptionProtectorFacts(AzureRMModuleBase):
         self.resource_group = None
         self.managed_instance_name = None
         self.name = None
-        super(AzureRMManagedInstanceEncryptionProtectorFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMManagedInstanceEncryptionProtectorFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['managed_instance_encryption_protectors'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['managed_instance_encryption_protectors'] = self.get()
         else:
@@ -144,7 +176,7 @@ class AzureRMManagedInstanceEncryptionProtectorFacts(AzureRMModuleBase):
             response = self.mgmt_client.managed_instance_encryption_protectors.get(resource_group_name=self.resource_group,
                                                                                    managed_instance_name=self.managed_instance_name,
                                                                                    encryption_protector_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Managed Instance Encryption Protector.')
 
@@ -153,18 +185,26 @@ class AzureRMManagedInstanceEncryptionProtectorFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.managed_instance_encryption_protectors, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_instance(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.managed_instance_encryption_protectors.list_by_instance(resource_group_name=self.resource_group,
                                                                                                 managed_instance_name=self.managed_instance_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Managed Instance Encryption Protector.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
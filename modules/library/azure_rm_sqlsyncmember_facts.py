@@ -41,6 +41,29 @@ options:
     name:
         description:
             - The name of the sync member.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -86,20 +109,25 @@ sync_members:
             returned: always
             type: str
             sample: syncgroupcrud-4879
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.sql import SqlManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMSyncMemberFacts(AzureRMModuleBase):
+class AzureRMSyncMemberFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -133,14 +161,18 @@ class AzureRMSyncMemberFacts(AzureRMModuleBase):
         self.database_name = None
         self.sync_group_name = None
         self.name = None
-        super(AzureRMSyncMemberFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMSyncMemberFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.sql.SqlManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['sync_members'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['sync_members'] = self.get()
         else:
@@ -156,7 +188,7 @@ class AzureRMSyncMemberFacts(AzureRMModuleBase):
                                                          database_name=self.database_name,
                                                          sync_group_name=self.sync_group_name,
                                                          sync_member_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Sync Member.')
 
@@ -165,6 +197,14 @@ class AzureRMSyncMemberFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.sync_members, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_sync_group(self):
         response = None
         results = []
@@ -173,12 +213,12 @@ class AzureRMSyncMemberFacts(AzureRMModuleBase):
                                                                         server_name=self.server_name,
                                                                         database_name=self.database_name,
                                                                         sync_group_name=self.sync_group_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Sync Member.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -36,6 +36,16 @@ options:
             - "The name of the blob container within the specified storage account. Blob container names must be between 3 and 63 characters in length and
                use numbers, lower-case letters and dash (-) only. Every dash (-) character must be immediately preceded and followed by a letter or number."
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -81,18 +91,17 @@ blob_containers:
             sample: "'0x8D592D74CC20EBA'"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storage import StorageManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBlobContainerFacts(AzureRMModuleBase):
+class AzureRMBlobContainerFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -117,14 +126,18 @@ class AzureRMBlobContainerFacts(AzureRMModuleBase):
         self.resource_group = None
         self.account_name = None
         self.name = None
-        super(AzureRMBlobContainerFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBlobContainerFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorageManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storage.StorageManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['blob_containers'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['blob_containers'] = self.get()
         return self.results
 
@@ -135,7 +148,7 @@ class AzureRMBlobContainerFacts(AzureRMModuleBase):
             response = self.mgmt_client.blob_containers.get(resource_group_name=self.resource_group,
                                                             account_name=self.account_name,
                                                             container_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Blob Container.')
 
@@ -144,6 +157,14 @@ class AzureRMBlobContainerFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.blob_containers, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
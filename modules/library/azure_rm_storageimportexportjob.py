@@ -30,9 +30,6 @@ options:
         description:
             - The resource group name uniquely identifies the resource group within the user subscription.
         required: True
-    self.config.accept_language:
-        description:
-            - Specifies the preferred language for the response.
     client_tenant_id:
         description:
             - The tenant ID of the client making the request.
@@ -179,9 +176,34 @@ options:
     backup_drive_manifest:
         description:
             - Default value is false. Indicates whether the manifest files on the drives should be copied to block blobs.
-    state:
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
         description:
-            - Current state of the job.
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     cancel_requested:
         description:
             - Indicates whether a request has been submitted to cancel the job.
@@ -281,7 +303,6 @@ EXAMPLES = '''
     azure_rm_storageimportexportjob:
       job_name: test-by1-import
       resource_group: Default-Storage-WestUS
-      self.config.accept_language: NOT FOUND
       client_tenant_id: NOT FOUND
       location: West US
       storage_account_id: /subscriptions/aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee/resourceGroups/Default-Storage-WestUS/providers/Microsoft.ClassicStorage/storageAccounts/test
@@ -313,17 +334,21 @@ id:
     returned: always
     type: str
     sample: /subscriptions/aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee/resourceGroups/Default-Storage-WestUS/providers/Microsoft.ImportExport/jobs/test-by1-import
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform, dict_flatten
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.storageimportexport import StorageImportExport
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -334,7 +359,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMJob(AzureRMModuleBase):
+class AzureRMJob(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Job resource"""
 
     def __init__(self):
@@ -347,9 +372,6 @@ class AzureRMJob(AzureRMModuleBase):
                 type='str',
                 required=True
             ),
-            self.config.accept_language=dict(
-                type='str'
-            ),
             client_tenant_id=dict(
                 type='str'
             ),
@@ -477,9 +499,6 @@ class AzureRMJob(AzureRMModuleBase):
             backup_drive_manifest=dict(
                 type='str'
             ),
-            state=dict(
-                type='str'
-            ),
             cancel_requested=dict(
                 type='str'
             ),
@@ -560,7 +579,6 @@ class AzureRMJob(AzureRMModuleBase):
 
         self.job_name = None
         self.resource_group = None
-        self.self.config.accept_language = None
         self.client_tenant_id = None
         self.body = dict()
 
@@ -582,32 +600,31 @@ class AzureRMJob(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.body[key] = kwargs[key]
 
-        dict_expand(self.body, ['storage_account_id'])
-        dict_expand(self.body, ['job_type'])
-        dict_expand(self.body, ['return_address'])
-        dict_expand(self.body, ['return_shipping'])
-        dict_expand(self.body, ['shipping_information'])
-        dict_expand(self.body, ['delivery_package'])
-        dict_expand(self.body, ['return_package'])
-        dict_expand(self.body, ['diagnostics_path'])
-        dict_expand(self.body, ['log_level'])
-        dict_expand(self.body, ['backup_drive_manifest'])
-        dict_expand(self.body, ['state'])
-        dict_expand(self.body, ['cancel_requested'])
-        dict_expand(self.body, ['percent_complete'])
-        dict_expand(self.body, ['incomplete_blob_list_uri'])
-        dict_camelize(self.body, ['drive_list', 'state'], True)
-        dict_expand(self.body, ['drive_list'])
-        dict_expand(self.body, ['export'])
+        transform = DictTransform()
+        transform.expand(['storage_account_id'], 'properties')
+        transform.expand(['job_type'], 'properties')
+        transform.expand(['return_address'], 'properties')
+        transform.expand(['return_shipping'], 'properties')
+        transform.expand(['shipping_information'], 'properties')
+        transform.expand(['delivery_package'], 'properties')
+        transform.expand(['return_package'], 'properties')
+        transform.expand(['diagnostics_path'], 'properties')
+        transform.expand(['log_level'], 'properties')
+        transform.expand(['backup_drive_manifest'], 'properties')
+        transform.expand(['cancel_requested'], 'properties')
+        transform.expand(['percent_complete'], 'properties')
+        transform.expand(['incomplete_blob_list_uri'], 'properties')
+        transform.camelize(['drive_list', 'state'], True)
+        transform.expand(['drive_list'], 'properties')
+        transform.expand(['export'], 'properties')
+        transform.apply(self.body)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(StorageImportExport,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storageimportexport.StorageImportExport',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_job()
+        old_response = self.cached_get(self.get_job)
 
         if not old_response:
             self.log("Job instance doesn't exist")
@@ -620,7 +637,7 @@ class AzureRMJob(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.body, old_response, '', self.results)):
+                if (not self.compare_state(self.body, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -628,6 +645,7 @@ class AzureRMJob(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.body, old_response)
                 return self.results
 
             response = self.create_update_job()
@@ -639,12 +657,11 @@ class AzureRMJob(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_job()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_job()
+            self.wait_for_delete(response, self.get_job, 'Job')
         else:
             self.log("Job instance unchanged")
             self.results['changed'] = False
@@ -662,13 +679,13 @@ class AzureRMJob(AzureRMModuleBase):
 
         :return: deserialized Job instance state dictionary
         '''
-        self.log("Creating / Updating the Job instance {0}".format(self.self.config.accept_language))
+        self.log("Creating / Updating the Job instance {0}", self.job_name)
 
         try:
             if self.to_do == Actions.Create:
                 response = self.mgmt_client.jobs.create(job_name=self.job_name,
                                                         resource_group_name=self.resource_group,
-                                                        body=self.body)
+                                                        body=dict_flatten(self.body))
             else:
                 response = self.mgmt_client.jobs.update(job_name=self.job_name,
                                                         resource_group_name=self.resource_group,
@@ -685,9 +702,9 @@ class AzureRMJob(AzureRMModuleBase):
         '''
         Deletes specified Job instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Job instance {0}".format(self.self.config.accept_language))
+        self.log("Deleting the Job instance {0}", self.job_name)
         try:
             response = self.mgmt_client.jobs.delete(job_name=self.job_name,
                                                     resource_group_name=self.resource_group)
@@ -695,7 +712,7 @@ class AzureRMJob(AzureRMModuleBase):
             self.log('Error attempting to delete the Job instance.')
             self.fail("Error deleting the Job instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_job(self):
         '''
@@ -703,14 +720,14 @@ class AzureRMJob(AzureRMModuleBase):
 
         :return: deserialized Job instance state dictionary
         '''
-        self.log("Checking if the Job instance {0} is present".format(self.self.config.accept_language))
+        self.log("Checking if the Job instance {0} is present", self.job_name)
         found = False
         try:
             response = self.mgmt_client.jobs.get(job_name=self.job_name,
                                                  resource_group_name=self.resource_group)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Job instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Job instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Job instance.')
         if found is True:
@@ -719,80 +736,6 @@ class AzureRMJob(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
 def main():
     """Main execution"""
     AzureRMJob()
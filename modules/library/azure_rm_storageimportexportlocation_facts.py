@@ -29,6 +29,16 @@ options:
     self.config.accept_language:
         description:
             - Specifies the preferred language for the response.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -77,18 +87,17 @@ locations:
             sample: 408 352 7600
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storageimportexport import StorageImportExport
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMLocationFacts(AzureRMModuleBase):
+class AzureRMLocationFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -107,14 +116,18 @@ class AzureRMLocationFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.name = None
         self.self.config.accept_language = None
-        super(AzureRMLocationFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMLocationFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorageImportExport,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storageimportexport.StorageImportExport',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['locations'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['locations'] = self.get()
         return self.results
 
@@ -123,7 +136,7 @@ class AzureRMLocationFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.locations.get(location_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Location.')
 
@@ -132,6 +145,14 @@ class AzureRMLocationFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.locations, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -35,6 +35,16 @@ options:
         description:
             - "The name of the Storage Account Management Policy. It should always be 'default'"
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -86,18 +96,17 @@ management_policies:
                      '30'\n            }\n          }\n        }\n      }\n    }\n  ]\n}"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storage import StorageManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMManagementPolicyFacts(AzureRMModuleBase):
+class AzureRMManagementPolicyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -122,14 +131,18 @@ class AzureRMManagementPolicyFacts(AzureRMModuleBase):
         self.resource_group = None
         self.account_name = None
         self.name = None
-        super(AzureRMManagementPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMManagementPolicyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorageManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storage.StorageManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['management_policies'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['management_policies'] = self.get()
         return self.results
 
@@ -140,7 +153,7 @@ class AzureRMManagementPolicyFacts(AzureRMModuleBase):
             response = self.mgmt_client.management_policies.get(resource_group_name=self.resource_group,
                                                                 account_name=self.account_name,
                                                                 management_policy_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Management Policy.')
 
@@ -149,6 +162,14 @@ class AzureRMManagementPolicyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.management_policies, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
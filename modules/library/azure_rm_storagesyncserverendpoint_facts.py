@@ -37,6 +37,29 @@ options:
     name:
         description:
             - Name of Server Endpoint object.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -81,20 +104,25 @@ server_endpoints:
             returned: always
             type: str
             sample: SampleServerEndpoint_1
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storagesync import StorageSyncManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMServerEndpointFacts(AzureRMModuleBase):
+class AzureRMServerEndpointFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -123,14 +151,18 @@ class AzureRMServerEndpointFacts(AzureRMModuleBase):
         self.storage_sync_service_name = None
         self.sync_group_name = None
         self.name = None
-        super(AzureRMServerEndpointFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMServerEndpointFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorageSyncManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storagesync.StorageSyncManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['server_endpoints'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['server_endpoints'] = self.get()
         else:
@@ -145,7 +177,7 @@ class AzureRMServerEndpointFacts(AzureRMModuleBase):
                                                              storage_sync_service_name=self.storage_sync_service_name,
                                                              sync_group_name=self.sync_group_name,
                                                              server_endpoint_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Server Endpoint.')
 
@@ -154,6 +186,14 @@ class AzureRMServerEndpointFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.server_endpoints, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_sync_group(self):
         response = None
         results = []
@@ -161,12 +201,12 @@ class AzureRMServerEndpointFacts(AzureRMModuleBase):
             response = self.mgmt_client.server_endpoints.list_by_sync_group(resource_group_name=self.resource_group,
                                                                             storage_sync_service_name=self.storage_sync_service_name,
                                                                             sync_group_name=self.sync_group_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Server Endpoint.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
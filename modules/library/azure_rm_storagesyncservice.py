@@ -33,6 +33,34 @@ options:
     location:
         description:
             - Resource location. If not set, location from the resource group will be used as default.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Storage Sync Service.
@@ -68,17 +96,20 @@ id:
     type: str
     sample: "/subscriptions/3a048283-338f-4002-a9dd-a50fdadcb392/resourceGroups/SampleResourceGroup_1/providers/Microsoft.StorageSync/storageSyncServices/Sam
             pleStorageSyncService_1"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.storagesync import StorageSyncManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -89,7 +120,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMStorageSyncService(AzureRMModuleBase):
+class AzureRMStorageSyncService(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Storage Sync Service resource"""
 
     def __init__(self):
@@ -137,15 +168,10 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(StorageSyncManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storagesync.StorageSyncManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_storagesyncservice()
+        old_response = self.cached_get(self.get_storagesyncservice)
 
         if not old_response:
             self.log("Storage Sync Service instance doesn't exist")
@@ -158,14 +184,16 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Storage Sync Service instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_storagesyncservice()
@@ -177,12 +205,11 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_storagesyncservice()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_storagesyncservice()
+            self.wait_for_delete(response, self.get_storagesyncservice, 'Storage Sync Service')
         else:
             self.log("Storage Sync Service instance unchanged")
             self.results['changed'] = False
@@ -200,7 +227,7 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
 
         :return: deserialized Storage Sync Service instance state dictionary
         '''
-        self.log("Creating / Updating the Storage Sync Service instance {0}".format(self.name))
+        self.log("Creating / Updating the Storage Sync Service instance {0}", self.name)
 
         try:
             if self.to_do == Actions.Create:
@@ -222,9 +249,9 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
         '''
         Deletes specified Storage Sync Service instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Storage Sync Service instance {0}".format(self.name))
+        self.log("Deleting the Storage Sync Service instance {0}", self.name)
         try:
             response = self.mgmt_client.storage_sync_services.delete(resource_group_name=self.resource_group,
                                                                      storage_sync_service_name=self.name)
@@ -232,7 +259,7 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
             self.log('Error attempting to delete the Storage Sync Service instance.')
             self.fail("Error deleting the Storage Sync Service instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_storagesyncservice(self):
         '''
@@ -240,14 +267,14 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
 
         :return: deserialized Storage Sync Service instance state dictionary
         '''
-        self.log("Checking if the Storage Sync Service instance {0} is present".format(self.name))
+        self.log("Checking if the Storage Sync Service instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.storage_sync_services.get(resource_group_name=self.resource_group,
                                                                   storage_sync_service_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Storage Sync Service instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Storage Sync Service instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Storage Sync Service instance.')
         if found is True:
@@ -256,49 +283,6 @@ class AzureRMStorageSyncService(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMStorageSyncService()
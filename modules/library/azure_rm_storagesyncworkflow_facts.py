@@ -33,6 +33,29 @@ options:
     workflow_id:
         description:
             - workflow Id
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -95,20 +118,25 @@ workflows:
             sample: "[{'name':'validateInput','friendlyName':'validateInput','status':'Succeeded','error':null},{'name':'newServerEndpoint','friendlyName':'n
                     ewServerEndpoint','status':'Succeeded','error':null},{'name':'updateReplicaGroupCertificates','friendlyName':'updateReplicaGroupCertific
                     ates','status':'Succeeded','error':null},{'name':'runServerJob','friendlyName':'runServerJob','status':'Succeeded','error':null}]"
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storagesync import StorageSyncManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMWorkflowFacts(AzureRMModuleBase):
+class AzureRMWorkflowFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -132,14 +160,18 @@ class AzureRMWorkflowFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.workflow_id = None
-        super(AzureRMWorkflowFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMWorkflowFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorageSyncManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storagesync.StorageSyncManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['workflows'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.workflow_id is not None:
             self.results['workflows'] = self.get()
         else:
@@ -153,7 +185,7 @@ class AzureRMWorkflowFacts(AzureRMModuleBase):
             response = self.mgmt_client.workflows.get(resource_group_name=self.resource_group,
                                                       storage_sync_service_name=self.name,
                                                       workflow_id=self.workflow_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Workflow.')
 
@@ -162,18 +194,26 @@ class AzureRMWorkflowFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.workflows, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_storage_sync_service(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.workflows.list_by_storage_sync_service(resource_group_name=self.resource_group,
                                                                                storage_sync_service_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Workflow.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -39,6 +39,24 @@ options:
     filter:
         description:
             - OData Filter options
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -70,20 +88,25 @@ backups:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storsimple import StorSimpleManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMBackupFacts(AzureRMModuleBase):
+class AzureRMBackupFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -115,12 +138,12 @@ class AzureRMBackupFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.filter = None
-        super(AzureRMBackupFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMBackupFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorSimpleManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storsimple.StorSimpleManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if self.device_name is not None:
@@ -136,12 +159,12 @@ class AzureRMBackupFacts(AzureRMModuleBase):
             response = self.mgmt_client.backups.list_by_device(device_name=self.device_name,
                                                                resource_group_name=self.resource_group,
                                                                manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Backup.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -152,12 +175,12 @@ class AzureRMBackupFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.backups.list_by_manager(resource_group_name=self.resource_group,
                                                                 manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Backup.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
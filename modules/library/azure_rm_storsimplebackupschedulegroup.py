@@ -51,6 +51,34 @@ options:
         description:
             - The manager name
         required: True
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Backup Schedule Group.
@@ -88,17 +116,20 @@ id:
     type: str
     sample: "/subscriptions/9eb689cd-7243-43b4-b6f6-5c65cb296641/resourceGroups/ResourceGroupForSDKTest/providers/Microsoft.StorSimple/managers/hAzureSDKOper
             ations/devices/hsdk-4xy4fi2ivg/backupScheduleGroups/BackupSchGroupForSDKTest"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.storsimple import StorSimpleManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -109,7 +140,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMBackupScheduleGroup(AzureRMModuleBase):
+class AzureRMBackupScheduleGroup(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Backup Schedule Group resource"""
 
     def __init__(self):
@@ -175,12 +206,10 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(StorSimpleManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storsimple.StorSimpleManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_backupschedulegroup()
+        old_response = self.cached_get(self.get_backupschedulegroup)
 
         if not old_response:
             self.log("Backup Schedule Group instance doesn't exist")
@@ -193,7 +222,7 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.schedule_group, old_response, '', self.results)):
+                if (not self.compare_state(self.schedule_group, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -201,6 +230,7 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.schedule_group, old_response)
                 return self.results
 
             response = self.create_update_backupschedulegroup()
@@ -212,12 +242,11 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_backupschedulegroup()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_backupschedulegroup()
+            self.wait_for_delete(response, self.get_backupschedulegroup, 'Backup Schedule Group')
         else:
             self.log("Backup Schedule Group instance unchanged")
             self.results['changed'] = False
@@ -235,7 +264,7 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
 
         :return: deserialized Backup Schedule Group instance state dictionary
         '''
-        self.log("Creating / Updating the Backup Schedule Group instance {0}".format(self.name))
+        self.log("Creating / Updating the Backup Schedule Group instance {0}", self.name)
 
         try:
             response = self.mgmt_client.backup_schedule_groups.create_or_update(device_name=self.device_name,
@@ -255,9 +284,9 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
         '''
         Deletes specified Backup Schedule Group instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Backup Schedule Group instance {0}".format(self.name))
+        self.log("Deleting the Backup Schedule Group instance {0}", self.name)
         try:
             response = self.mgmt_client.backup_schedule_groups.delete(device_name=self.device_name,
                                                                       schedule_group_name=self.schedule_group_name,
@@ -267,7 +296,7 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
             self.log('Error attempting to delete the Backup Schedule Group instance.')
             self.fail("Error deleting the Backup Schedule Group instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_backupschedulegroup(self):
         '''
@@ -275,7 +304,7 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
 
         :return: deserialized Backup Schedule Group instance state dictionary
         '''
-        self.log("Checking if the Backup Schedule Group instance {0} is present".format(self.name))
+        self.log("Checking if the Backup Schedule Group instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.backup_schedule_groups.get(device_name=self.device_name,
@@ -283,8 +312,8 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
                                                                    resource_group_name=self.resource_group,
                                                                    manager_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Backup Schedule Group instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Backup Schedule Group instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Backup Schedule Group instance.')
         if found is True:
@@ -293,49 +322,6 @@ class AzureRMBackupScheduleGroup(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMBackupScheduleGroup()
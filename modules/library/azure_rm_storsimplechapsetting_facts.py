@@ -37,6 +37,29 @@ options:
         description:
             - The manager name
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -96,20 +119,25 @@ chap_settings:
                     sample: "QAabTlWY4Qz7ygqWeYVoUpgg+wtITX9O6uAj1j+ejQkNR45r5/1knhgSroeeavtxGGJtaWFwMGGde1EA31eoueZwhhWODWBlaTAhGhY3SITMIKj+9k+xUJwkq6aqc2qD
                             comW+juLTd72oVwpMCmGALALCPAjNBiKzi7WUV+6U9j/F0dAsz8kmTFBh2rrY3yYTVQ7LjxZ7EPeqiie1ikvLoL/Q8S0jKu+O70m3ES1+WIG61ig4Nl9S/1NlV30wpJd
                             gnnxA4Vg83PEIgoz0nQpfodGguwkDYhaeNYiYZGVXo75UgFMILouVUCHkuKWQOxL48kIleEW3hIL7sZkQQcLwA=="
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storsimple import StorSimpleManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMChapSettingFacts(AzureRMModuleBase):
+class AzureRMChapSettingFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -138,14 +166,18 @@ class AzureRMChapSettingFacts(AzureRMModuleBase):
         self.chap_user_name = None
         self.resource_group = None
         self.name = None
-        super(AzureRMChapSettingFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMChapSettingFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorSimpleManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storsimple.StorSimpleManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['chap_settings'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.chap_user_name is not None:
             self.results['chap_settings'] = self.get()
         else:
@@ -160,7 +192,7 @@ class AzureRMChapSettingFacts(AzureRMModuleBase):
                                                           chap_user_name=self.chap_user_name,
                                                           resource_group_name=self.resource_group,
                                                           manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Chap Setting.')
 
@@ -169,6 +201,14 @@ class AzureRMChapSettingFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.chap_settings, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_device(self):
         response = None
         results = []
@@ -176,12 +216,12 @@ class AzureRMChapSettingFacts(AzureRMModuleBase):
             response = self.mgmt_client.chap_settings.list_by_device(device_name=self.device_name,
                                                                      resource_group_name=self.resource_group,
                                                                      manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Chap Setting.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -40,6 +40,29 @@ options:
         description:
             - The manager name
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -97,20 +120,25 @@ file_shares:
             returned: always
             type: str
             sample: Demo FileShare for SDK Test Tiered
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storsimple import StorSimpleManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMFileShareFacts(AzureRMModuleBase):
+class AzureRMFileShareFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -143,14 +171,18 @@ class AzureRMFileShareFacts(AzureRMModuleBase):
         self.share_name = None
         self.resource_group = None
         self.name = None
-        super(AzureRMFileShareFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMFileShareFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorSimpleManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storsimple.StorSimpleManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['file_shares'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.file_server_name is not None and
                 self.share_name is not None):
             self.results['file_shares'] = self.get()
@@ -169,7 +201,7 @@ class AzureRMFileShareFacts(AzureRMModuleBase):
                                                         share_name=self.share_name,
                                                         resource_group_name=self.resource_group,
                                                         manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for File Share.')
 
@@ -178,6 +210,14 @@ class AzureRMFileShareFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.file_shares, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_file_server(self):
         response = None
         results = []
@@ -186,12 +226,12 @@ class AzureRMFileShareFacts(AzureRMModuleBase):
                                                                         file_server_name=self.file_server_name,
                                                                         resource_group_name=self.resource_group,
                                                                         manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for File Share.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -203,12 +243,12 @@ class AzureRMFileShareFacts(AzureRMModuleBase):
             response = self.mgmt_client.file_shares.list_by_device(device_name=self.device_name,
                                                                    resource_group_name=self.resource_group,
                                                                    manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for File Share.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -55,6 +55,34 @@ options:
         description:
             - The manager name
         required: True
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Iscsi Server.
@@ -92,17 +120,20 @@ id:
     type: str
     sample: "/subscriptions/9eb689cd-7243-43b4-b6f6-5c65cb296641/resourceGroups/ResourceGroupForSDKTest/providers/Microsoft.StorSimple/managers/hAzureSDKOper
             ations/devices/HSDK-WSJQERQW3F/iscsiServers/HSDK-WSJQERQW3F"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.storsimple import StorSimpleManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -113,7 +144,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMIscsiServer(AzureRMModuleBase):
+class AzureRMIscsiServer(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Iscsi Server resource"""
 
     def __init__(self):
@@ -183,12 +214,10 @@ class AzureRMIscsiServer(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(StorSimpleManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storsimple.StorSimpleManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_iscsiserver()
+        old_response = self.cached_get(self.get_iscsiserver)
 
         if not old_response:
             self.log("Iscsi Server instance doesn't exist")
@@ -201,7 +230,7 @@ class AzureRMIscsiServer(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.iscsi_server, old_response, '', self.results)):
+                if (not self.compare_state(self.iscsi_server, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -209,6 +238,7 @@ class AzureRMIscsiServer(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.iscsi_server, old_response)
                 return self.results
 
             response = self.create_update_iscsiserver()
@@ -220,12 +250,11 @@ class AzureRMIscsiServer(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_iscsiserver()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_iscsiserver()
+            self.wait_for_delete(response, self.get_iscsiserver, 'Iscsi Server')
         else:
             self.log("Iscsi Server instance unchanged")
             self.results['changed'] = False
@@ -243,7 +272,7 @@ class AzureRMIscsiServer(AzureRMModuleBase):
 
         :return: deserialized Iscsi Server instance state dictionary
         '''
-        self.log("Creating / Updating the Iscsi Server instance {0}".format(self.name))
+        self.log("Creating / Updating the Iscsi Server instance {0}", self.name)
 
         try:
             response = self.mgmt_client.iscsi_servers.create_or_update(device_name=self.device_name,
@@ -263,9 +292,9 @@ class AzureRMIscsiServer(AzureRMModuleBase):
         '''
         Deletes specified Iscsi Server instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Iscsi Server instance {0}".format(self.name))
+        self.log("Deleting the Iscsi Server instance {0}", self.name)
         try:
             response = self.mgmt_client.iscsi_servers.delete(device_name=self.device_name,
                                                              iscsi_server_name=self.iscsi_server_name,
@@ -275,7 +304,7 @@ class AzureRMIscsiServer(AzureRMModuleBase):
             self.log('Error attempting to delete the Iscsi Server instance.')
             self.fail("Error deleting the Iscsi Server instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_iscsiserver(self):
         '''
@@ -283,7 +312,7 @@ class AzureRMIscsiServer(AzureRMModuleBase):
 
         :return: deserialized Iscsi Server instance state dictionary
         '''
-        self.log("Checking if the Iscsi Server instance {0} is present".format(self.name))
+        self.log("Checking if the Iscsi Server instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.iscsi_servers.get(device_name=self.device_name,
@@ -291,8 +320,8 @@ class AzureRMIscsiServer(AzureRMModuleBase):
                                                           resource_group_name=self.resource_group,
                                                           manager_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Iscsi Server instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Iscsi Server instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Iscsi Server instance.')
         if found is True:
@@ -301,49 +330,6 @@ class AzureRMIscsiServer(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMIscsiServer()
@@ -36,6 +36,29 @@ options:
         description:
             - The manager name
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -84,20 +107,25 @@ iscsi_servers:
             returned: always
             type: str
             sample: HSDK-WSJQERQW3F
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.storsimple import StorSimpleManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMIscsiServerFacts(AzureRMModuleBase):
+class AzureRMIscsiServerFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -125,14 +153,18 @@ class AzureRMIscsiServerFacts(AzureRMModuleBase):
         self.iscsi_server_name = None
         self.resource_group = None
         self.name = None
-        super(AzureRMIscsiServerFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMIscsiServerFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StorSimpleManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.storsimple.StorSimpleManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['iscsi_servers'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if (self.device_name is not None and
                 self.iscsi_server_name is not None):
             self.results['iscsi_servers'] = self.get()
@@ -150,7 +182,7 @@ class AzureRMIscsiServerFacts(AzureRMModuleBase):
                                                           iscsi_server_name=self.iscsi_server_name,
                                                           resource_group_name=self.resource_group,
                                                           manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Iscsi Server.')
 
@@ -159,6 +191,14 @@ class AzureRMIscsiServerFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.iscsi_servers, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_device(self):
         response = None
         results = []
@@ -166,12 +206,12 @@ class AzureRMIscsiServerFacts(AzureRMModuleBase):
             response = self.mgmt_client.iscsi_servers.list_by_device(device_name=self.device_name,
                                                                      resource_group_name=self.resource_group,
                                                                      manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Iscsi Server.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -182,12 +222,12 @@ class AzureRMIscsiServerFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.iscsi_servers.list_by_manager(resource_group_name=self.resource_group,
                                                                       manager_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Iscsi Server.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -37,6 +37,29 @@ options:
         description:
             - "The $select OData query parameter. This is a comma-separated list of structural properties to include in the response, or '*' to include all
                properties. By default, all properties are returned except diagnostics. Currently only accepts '*' as a valid value."
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -106,20 +129,25 @@ inputs:
                     returned: always
                     type: str
                     sample: Reference
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.streamingjobs import StreamAnalyticsManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMInputFacts(AzureRMModuleBase):
+class AzureRMInputFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -147,14 +175,18 @@ class AzureRMInputFacts(AzureRMModuleBase):
         self.job_name = None
         self.name = None
         self.select = None
-        super(AzureRMInputFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMInputFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(StreamAnalyticsManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.streamingjobs.StreamAnalyticsManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['inputs'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.name is not None:
             self.results['inputs'] = self.get()
         else:
@@ -168,7 +200,7 @@ class AzureRMInputFacts(AzureRMModuleBase):
             response = self.mgmt_client.inputs.get(resource_group_name=self.resource_group,
                                                    job_name=self.job_name,
                                                    input_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Input.')
 
@@ -177,18 +209,26 @@ class AzureRMInputFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.inputs, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def list_by_streaming_job(self):
         response = None
         results = []
         try:
             response = self.mgmt_client.inputs.list_by_streaming_job(resource_group_name=self.resource_group,
                                                                      job_name=self.job_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Input.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
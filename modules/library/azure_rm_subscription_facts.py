@@ -26,6 +26,16 @@ options:
         description:
             - The ID of the target subscription.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -62,18 +72,17 @@ subscriptions:
             sample: state
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.subscription import SubscriptionClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMSubscriptionFacts(AzureRMModuleBase):
+class AzureRMSubscriptionFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -88,14 +97,18 @@ class AzureRMSubscriptionFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.subscription_id = None
-        super(AzureRMSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMSubscriptionFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(SubscriptionClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.subscription.SubscriptionClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['subscriptions'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['subscriptions'] = self.get()
         return self.results
 
@@ -104,7 +117,7 @@ class AzureRMSubscriptionFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.subscriptions.get(subscription_id=self.subscription_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Subscription.')
 
@@ -113,6 +126,14 @@ class AzureRMSubscriptionFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.subscriptions, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -41,6 +41,34 @@ options:
         description:
             - Constant filled by server.
             - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Event Source.
@@ -76,17 +104,20 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.TimeSeriesInsights/Environments/env1/eventSources/es1
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.timeseriesinsights import TimeSeriesInsightsClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -97,7 +128,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMEventSource(AzureRMModuleBase):
+class AzureRMEventSource(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Event Source resource"""
 
     def __init__(self):
@@ -153,15 +184,10 @@ class AzureRMEventSource(AzureRMModuleBase):
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(TimeSeriesInsightsClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.timeseriesinsights.TimeSeriesInsightsClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_eventsource()
+        old_response = self.cached_get(self.get_eventsource)
 
         if not old_response:
             self.log("Event Source instance doesn't exist")
@@ -174,14 +200,16 @@ class AzureRMEventSource(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Event Source instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_eventsource()
@@ -193,12 +221,11 @@ class AzureRMEventSource(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_eventsource()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_eventsource()
+            self.wait_for_delete(response, self.get_eventsource, 'Event Source')
         else:
             self.log("Event Source instance unchanged")
             self.results['changed'] = False
@@ -216,7 +243,7 @@ class AzureRMEventSource(AzureRMModuleBase):
 
         :return: deserialized Event Source instance state dictionary
         '''
-        self.log("Creating / Updating the Event Source instance {0}".format(self.name))
+        self.log("Creating / Updating the Event Source instance {0}", self.name)
 
         try:
             response = self.mgmt_client.event_sources.create_or_update(resource_group_name=self.resource_group,
@@ -235,9 +262,9 @@ class AzureRMEventSource(AzureRMModuleBase):
         '''
         Deletes specified Event Source instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Event Source instance {0}".format(self.name))
+        self.log("Deleting the Event Source instance {0}", self.name)
         try:
             response = self.mgmt_client.event_sources.delete(resource_group_name=self.resource_group,
                                                              environment_name=self.environment_name,
@@ -246,7 +273,7 @@ class AzureRMEventSource(AzureRMModuleBase):
             self.log('Error attempting to delete the Event Source instance.')
             self.fail("Error deleting the Event Source instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_eventsource(self):
         '''
@@ -254,15 +281,15 @@ class AzureRMEventSource(AzureRMModuleBase):
 
         :return: deserialized Event Source instance state dictionary
         '''
-        self.log("Checking if the Event Source instance {0} is present".format(self.name))
+        self.log("Checking if the Event Source instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.event_sources.get(resource_group_name=self.resource_group,
                                                           environment_name=self.environment_name,
                                                           event_source_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Event Source instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Event Source instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Event Source instance.')
         if found is True:
@@ -271,49 +298,6 @@ class AzureRMEventSource(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
 def main():
     """Main execution"""
     AzureRMEventSource()
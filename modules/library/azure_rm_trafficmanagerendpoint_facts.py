@@ -38,6 +38,16 @@ options:
         description:
             - The name of the Traffic Manager endpoint.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -99,18 +109,17 @@ endpoints:
             sample: 1
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.trafficmanager import TrafficManagerManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMEndpointFacts(AzureRMModuleBase):
+class AzureRMEndpointFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -140,14 +149,18 @@ class AzureRMEndpointFacts(AzureRMModuleBase):
         self.profile_name = None
         self.endpoint_type = None
         self.name = None
-        super(AzureRMEndpointFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMEndpointFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(TrafficManagerManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.trafficmanager.TrafficManagerManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['endpoints'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['endpoints'] = self.get()
         return self.results
 
@@ -159,7 +172,7 @@ class AzureRMEndpointFacts(AzureRMModuleBase):
                                                       profile_name=self.profile_name,
                                                       endpoint_type=self.endpoint_type,
                                                       endpoint_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Endpoint.')
 
@@ -168,6 +181,14 @@ class AzureRMEndpointFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.endpoints, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -40,6 +40,16 @@ options:
     bot_right:
         description:
             - The bottom right latitude,longitude pair of the rectangular viewport to query for.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -88,18 +98,17 @@ heat_map:
             contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.trafficmanager import TrafficManagerManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMHeatMapFacts(AzureRMModuleBase):
+class AzureRMHeatMapFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -132,14 +141,18 @@ class AzureRMHeatMapFacts(AzureRMModuleBase):
         self.heat_map_type = None
         self.top_left = None
         self.bot_right = None
-        super(AzureRMHeatMapFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMHeatMapFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(TrafficManagerManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.trafficmanager.TrafficManagerManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['heat_map'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['heat_map'] = self.get()
         return self.results
 
@@ -150,7 +163,7 @@ class AzureRMHeatMapFacts(AzureRMModuleBase):
             response = self.mgmt_client.heat_map.get(resource_group_name=self.resource_group,
                                                      profile_name=self.name,
                                                      heat_map_type=self.heat_map_type)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Heat Map.')
 
@@ -159,6 +172,14 @@ class AzureRMHeatMapFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.heat_map, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -220,6 +220,34 @@ options:
     max_return:
         description:
             - Maximum number of I(endpoints) to be returned for C(multi_value) routing I(type).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Profile.
@@ -267,16 +295,20 @@ id:
     type: str
     sample: "/subscriptions/{subscription-id}/resourceGroups/azuresdkfornetautoresttrafficmanager2583/providers/Microsoft.Network/trafficManagerProfiles/azur
             esdkfornetautoresttrafficmanager6192"
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
-import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.trafficmanager import TrafficManagerManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -287,7 +319,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMProfile(AzureRMModuleBase):
+class AzureRMProfile(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Profile resource"""
 
     def __init__(self):
@@ -368,25 +400,22 @@ class AzureRMProfile(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_map(self.parameters, ['profile_status'], {True: 'Enabled', False: 'Disabled'})
-        dict_camelize(self.parameters, ['traffic_routing_method'], True)
-        dict_camelize(self.parameters, ['monitor_config', 'profile_monitor_status'], True)
-        dict_upper(self.parameters, ['monitor_config', 'protocol'])
-        dict_map(self.parameters, ['endpoints', 'endpoint_status'], {True: 'Enabled', False: 'Disabled'})
-        dict_camelize(self.parameters, ['endpoints', 'endpoint_monitor_status'], True)
-        dict_map(self.parameters, ['traffic_view_enrollment_status'], {True: 'Enabled', False: 'Disabled'})
+        transform = DictTransform()
+        transform.map(['profile_status'], {True: 'Enabled', False: 'Disabled'})
+        transform.camelize(['traffic_routing_method'], True)
+        transform.camelize(['monitor_config', 'profile_monitor_status'], True)
+        transform.upper(['monitor_config', 'protocol'])
+        transform.map(['endpoints', 'endpoint_status'], {True: 'Enabled', False: 'Disabled'})
+        transform.camelize(['endpoints', 'endpoint_monitor_status'], True)
+        transform.map(['traffic_view_enrollment_status'], {True: 'Enabled', False: 'Disabled'})
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(TrafficManagerManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.trafficmanager.TrafficManagerManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_profile()
+        old_response = self.cached_get(self.get_profile)
 
         if not old_response:
             self.log("Profile instance doesn't exist")
@@ -399,14 +428,16 @@ class AzureRMProfile(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Profile instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_profile()
@@ -418,13 +449,11 @@ class AzureRMProfile(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_profile()
-            # make sure instance is actually deleted, for some Azure resources, instance is hanging around
-            # for some time after deletion -- this should be really fixed in Azure.
-            while self.get_profile():
-                time.sleep(20)
+            response = self.delete_profile()
+            self.wait_for_delete(response, self.get_profile, 'Profile')
         else:
             self.log("Profile instance unchanged")
             self.results['changed'] = False
@@ -440,7 +469,7 @@ class AzureRMProfile(AzureRMModuleBase):
 
         :return: deserialized Profile instance state dictionary
         '''
-        self.log("Creating / Updating the Profile instance {0}".format(self.name))
+        self.log("Creating / Updating the Profile instance {0}", self.name)
 
         try:
             response = self.mgmt_client.profiles.create_or_update(resource_group_name=self.resource_group,
@@ -458,9 +487,9 @@ class AzureRMProfile(AzureRMModuleBase):
         '''
         Deletes specified Profile instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Profile instance {0}".format(self.name))
+        self.log("Deleting the Profile instance {0}", self.name)
         try:
             response = self.mgmt_client.profiles.delete(resource_group_name=self.resource_group,
                                                         profile_name=self.name)
@@ -468,7 +497,7 @@ class AzureRMProfile(AzureRMModuleBase):
             self.log('Error attempting to delete the Profile instance.')
             self.fail("Error deleting the Profile instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_profile(self):
         '''
@@ -476,14 +505,14 @@ class AzureRMProfile(AzureRMModuleBase):
 
         :return: deserialized Profile instance state dictionary
         '''
-        self.log("Checking if the Profile instance {0} is present".format(self.name))
+        self.log("Checking if the Profile instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.profiles.get(resource_group_name=self.resource_group,
                                                      profile_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Profile instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Profile instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Profile instance.')
         if found is True:
@@ -498,130 +527,6 @@ class AzureRMProfile(AzureRMModuleBase):
         return d
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + new + ' != ' + old
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_upper(d, path):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_upper(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = old_value.upper()
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_upper(sd, path[1:])
-
-
-def dict_rename(d, path, new_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_rename(d[i], path, new_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[new_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_rename(sd, path[1:], new_name)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
-def _snake_to_camel(snake, capitalize_first=False):
-    if capitalize_first:
-        return ''.join(x.capitalize() or '_' for x in snake.split('_'))
-    else:
-        return snake.split('_')[0] + ''.join(x.capitalize() or '_' for x in snake.split('_')[1:])
-
-
 def main():
     """Main execution"""
     AzureRMProfile()
@@ -22,6 +22,16 @@ description:
     - Get facts of Azure Traffic Manager User Metrics Key.
 
 options:
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -63,18 +73,17 @@ traffic_manager_user_metrics_keys:
             sample: 9ea056eb38f145a0891b5d5dc15e9aa2
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.trafficmanager import TrafficManagerManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMTrafficManagerUserMetricsKeyFacts(AzureRMModuleBase):
+class AzureRMTrafficManagerUserMetricsKeyFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -84,14 +93,18 @@ class AzureRMTrafficManagerUserMetricsKeyFacts(AzureRMModuleBase):
             changed=False
         )
         self.mgmt_client = None
-        super(AzureRMTrafficManagerUserMetricsKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMTrafficManagerUserMetricsKeyFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(TrafficManagerManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.trafficmanager.TrafficManagerManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['traffic_manager_user_metrics_keys'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['traffic_manager_user_metrics_keys'] = self.get()
         return self.results
 
@@ -100,7 +113,7 @@ class AzureRMTrafficManagerUserMetricsKeyFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.traffic_manager_user_metrics_keys.get()
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Traffic Manager User Metrics Key.')
 
@@ -109,6 +122,14 @@ class AzureRMTrafficManagerUserMetricsKeyFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.traffic_manager_user_metrics_keys, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
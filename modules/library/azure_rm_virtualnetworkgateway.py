@@ -189,6 +189,34 @@ options:
     resource_guid:
         description:
             - The resource GUID property of the VirtualNetworkGateway resource.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Virtual Network Gateway.
@@ -222,17 +250,21 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -243,7 +275,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
+class AzureRMVirtualNetworkGateway(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Virtual Network Gateway resource"""
 
     def __init__(self):
@@ -442,30 +474,27 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_resource_id(self.parameters, ['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['ip_configurations', 'private_ip_allocation_method'], True)
-        dict_resource_id(self.parameters, ['ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['gateway_type'], True)
-        dict_camelize(self.parameters, ['vpn_type'], True)
-        dict_resource_id(self.parameters, ['gateway_default_site', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['sku', 'name'], True)
-        dict_camelize(self.parameters, ['sku', 'tier'], True)
-        dict_resource_id(self.parameters, ['vpn_client_configuration', 'vpn_client_root_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['vpn_client_configuration', 'vpn_client_revoked_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform = DictTransform()
+        transform.resource_id(['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['ip_configurations', 'private_ip_allocation_method'], True)
+        transform.resource_id(['ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['gateway_type'], True)
+        transform.camelize(['vpn_type'], True)
+        transform.resource_id(['gateway_default_site', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['sku', 'name'], True)
+        transform.camelize(['sku', 'tier'], True)
+        transform.resource_id(['vpn_client_configuration', 'vpn_client_root_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['vpn_client_configuration', 'vpn_client_revoked_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_virtualnetworkgateway()
+        old_response = self.cached_get(self.get_virtualnetworkgateway)
 
         if not old_response:
             self.log("Virtual Network Gateway instance doesn't exist")
@@ -478,14 +507,16 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Virtual Network Gateway instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_virtualnetworkgateway()
@@ -497,12 +528,11 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_virtualnetworkgateway()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_virtualnetworkgateway()
+            self.wait_for_delete(response, self.get_virtualnetworkgateway, 'Virtual Network Gateway')
         else:
             self.log("Virtual Network Gateway instance unchanged")
             self.results['changed'] = False
@@ -520,7 +550,7 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway instance state dictionary
         '''
-        self.log("Creating / Updating the Virtual Network Gateway instance {0}".format(self.name))
+        self.log("Creating / Updating the Virtual Network Gateway instance {0}", self.name)
 
         try:
             response = self.mgmt_client.virtual_network_gateways.create_or_update(resource_group_name=self.resource_group,
@@ -538,9 +568,9 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
         '''
         Deletes specified Virtual Network Gateway instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Virtual Network Gateway instance {0}".format(self.name))
+        self.log("Deleting the Virtual Network Gateway instance {0}", self.name)
         try:
             response = self.mgmt_client.virtual_network_gateways.delete(resource_group_name=self.resource_group,
                                                                         virtual_network_gateway_name=self.name)
@@ -548,7 +578,7 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
             self.log('Error attempting to delete the Virtual Network Gateway instance.')
             self.fail("Error deleting the Virtual Network Gateway instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_virtualnetworkgateway(self):
         '''
@@ -556,14 +586,14 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway instance state dictionary
         '''
-        self.log("Checking if the Virtual Network Gateway instance {0} is present".format(self.name))
+        self.log("Checking if the Virtual Network Gateway instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.virtual_network_gateways.get(resource_group_name=self.resource_group,
                                                                      virtual_network_gateway_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Virtual Network Gateway instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Virtual Network Gateway instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Virtual Network Gateway instance.')
         if found is True:
@@ -572,85 +602,6 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMVirtualNetworkGateway()
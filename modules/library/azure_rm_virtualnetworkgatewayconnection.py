@@ -516,6 +516,34 @@ options:
     resource_guid:
         description:
             - The resource GUID property of the VirtualNetworkGatewayConnection resource.
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Virtual Network Gateway Connection.
@@ -549,17 +577,21 @@ id:
     returned: always
     type: str
     sample: id
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -570,7 +602,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
+class AzureRMVirtualNetworkGatewayConnection(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Virtual Network Gateway Connection resource"""
 
     def __init__(self):
@@ -1082,56 +1114,53 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.parameters[key] = kwargs[key]
 
-        dict_resource_id(self.parameters, ['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway1', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway1', 'ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['virtual_network_gateway1', 'ip_configurations', 'private_ip_allocation_method'], True)
-        dict_resource_id(self.parameters, ['virtual_network_gateway1', 'ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway1', 'ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['virtual_network_gateway1', 'gateway_type'], True)
-        dict_camelize(self.parameters, ['virtual_network_gateway1', 'vpn_type'], True)
-        dict_resource_id(self.parameters, ['virtual_network_gateway1', 'gateway_default_site', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['virtual_network_gateway1', 'sku', 'name'], True)
-        dict_camelize(self.parameters, ['virtual_network_gateway1', 'sku', 'tier'], True)
-        dict_resource_id(self.parameters, ['virtual_network_gateway1', 'vpn_client_configuration', 'vpn_client_root_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway1', 'vpn_client_configuration', 'vpn_client_revoked_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway2', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway2', 'ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['virtual_network_gateway2', 'ip_configurations', 'private_ip_allocation_method'], True)
-        dict_resource_id(self.parameters, ['virtual_network_gateway2', 'ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway2', 'ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['virtual_network_gateway2', 'gateway_type'], True)
-        dict_camelize(self.parameters, ['virtual_network_gateway2', 'vpn_type'], True)
-        dict_resource_id(self.parameters, ['virtual_network_gateway2', 'gateway_default_site', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['virtual_network_gateway2', 'sku', 'name'], True)
-        dict_camelize(self.parameters, ['virtual_network_gateway2', 'sku', 'tier'], True)
-        dict_resource_id(self.parameters, ['virtual_network_gateway2', 'vpn_client_configuration', 'vpn_client_root_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['virtual_network_gateway2', 'vpn_client_configuration', 'vpn_client_revoked_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.parameters, ['local_network_gateway2', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.parameters, ['connection_type'], True)
-        dict_map(self.parameters, ['connection_type'], {'ipsec': 'IPsec', 'vpn_client': 'VPNClient'})
-        dict_resource_id(self.parameters, ['peer', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_upper(self.parameters, ['ipsec_policies', 'ipsec_encryption'])
-        dict_map(self.parameters, ['ipsec_policies', 'ipsec_encryption'], {'none': 'None'})
-        dict_upper(self.parameters, ['ipsec_policies', 'ipsec_integrity'])
-        dict_upper(self.parameters, ['ipsec_policies', 'ike_encryption'])
-        dict_upper(self.parameters, ['ipsec_policies', 'ike_integrity'])
-        dict_upper(self.parameters, ['ipsec_policies', 'dh_group'])
-        dict_map(self.parameters, ['ipsec_policies', 'dh_group'], {'none': 'None', 'dh_group1': 'DHGroup1', 'dh_group2': 'DHGroup2', 'dh_group14': 'DHGroup14', 'dh_group2048': 'DHGroup2048', 'dh_group24': 'DHGroup24'})
-        dict_upper(self.parameters, ['ipsec_policies', 'pfs_group'])
-        dict_map(self.parameters, ['ipsec_policies', 'pfs_group'], {'none': 'None'})
+        transform = DictTransform()
+        transform.resource_id(['id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway1', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway1', 'ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['virtual_network_gateway1', 'ip_configurations', 'private_ip_allocation_method'], True)
+        transform.resource_id(['virtual_network_gateway1', 'ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway1', 'ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['virtual_network_gateway1', 'gateway_type'], True)
+        transform.camelize(['virtual_network_gateway1', 'vpn_type'], True)
+        transform.resource_id(['virtual_network_gateway1', 'gateway_default_site', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['virtual_network_gateway1', 'sku', 'name'], True)
+        transform.camelize(['virtual_network_gateway1', 'sku', 'tier'], True)
+        transform.resource_id(['virtual_network_gateway1', 'vpn_client_configuration', 'vpn_client_root_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway1', 'vpn_client_configuration', 'vpn_client_revoked_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway2', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway2', 'ip_configurations', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['virtual_network_gateway2', 'ip_configurations', 'private_ip_allocation_method'], True)
+        transform.resource_id(['virtual_network_gateway2', 'ip_configurations', 'subnet', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway2', 'ip_configurations', 'public_ip_address', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['virtual_network_gateway2', 'gateway_type'], True)
+        transform.camelize(['virtual_network_gateway2', 'vpn_type'], True)
+        transform.resource_id(['virtual_network_gateway2', 'gateway_default_site', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['virtual_network_gateway2', 'sku', 'name'], True)
+        transform.camelize(['virtual_network_gateway2', 'sku', 'tier'], True)
+        transform.resource_id(['virtual_network_gateway2', 'vpn_client_configuration', 'vpn_client_root_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['virtual_network_gateway2', 'vpn_client_configuration', 'vpn_client_revoked_certificates', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['local_network_gateway2', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['connection_type'], True)
+        transform.map(['connection_type'], {'ipsec': 'IPsec', 'vpn_client': 'VPNClient'})
+        transform.resource_id(['peer', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.upper(['ipsec_policies', 'ipsec_encryption'])
+        transform.map(['ipsec_policies', 'ipsec_encryption'], {'none': 'None'})
+        transform.upper(['ipsec_policies', 'ipsec_integrity'])
+        transform.upper(['ipsec_policies', 'ike_encryption'])
+        transform.upper(['ipsec_policies', 'ike_integrity'])
+        transform.upper(['ipsec_policies', 'dh_group'])
+        transform.map(['ipsec_policies', 'dh_group'], {'none': 'None', 'dh_group1': 'DHGroup1', 'dh_group2': 'DHGroup2', 'dh_group14': 'DHGroup14', 'dh_group2048': 'DHGroup2048', 'dh_group24': 'DHGroup24'})
+        transform.upper(['ipsec_policies', 'pfs_group'])
+        transform.map(['ipsec_policies', 'pfs_group'], {'none': 'None'})
+        transform.apply(self.parameters)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        if "location" not in self.parameters:
-            self.parameters["location"] = resource_group.location
-
-        old_response = self.get_virtualnetworkgatewayconnection()
+        old_response = self.cached_get(self.get_virtualnetworkgatewayconnection)
 
         if not old_response:
             self.log("Virtual Network Gateway Connection instance doesn't exist")
@@ -1144,14 +1173,16 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.parameters, old_response, '', self.results)):
+                if (not self.compare_state(self.parameters, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Virtual Network Gateway Connection instance")
+            self.default_location(old_response)
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.parameters, old_response)
                 return self.results
 
             response = self.create_update_virtualnetworkgatewayconnection()
@@ -1163,12 +1194,11 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_virtualnetworkgatewayconnection()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_virtualnetworkgatewayconnection()
+            self.wait_for_delete(response, self.get_virtualnetworkgatewayconnection, 'Virtual Network Gateway Connection')
         else:
             self.log("Virtual Network Gateway Connection instance unchanged")
             self.results['changed'] = False
@@ -1186,7 +1216,7 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway Connection instance state dictionary
         '''
-        self.log("Creating / Updating the Virtual Network Gateway Connection instance {0}".format(self.name))
+        self.log("Creating / Updating the Virtual Network Gateway Connection instance {0}", self.name)
 
         try:
             response = self.mgmt_client.virtual_network_gateway_connections.create_or_update(resource_group_name=self.resource_group,
@@ -1204,9 +1234,9 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
         '''
         Deletes specified Virtual Network Gateway Connection instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Virtual Network Gateway Connection instance {0}".format(self.name))
+        self.log("Deleting the Virtual Network Gateway Connection instance {0}", self.name)
         try:
             response = self.mgmt_client.virtual_network_gateway_connections.delete(resource_group_name=self.resource_group,
                                                                                    virtual_network_gateway_connection_name=self.name)
@@ -1214,7 +1244,7 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
             self.log('Error attempting to delete the Virtual Network Gateway Connection instance.')
             self.fail("Error deleting the Virtual Network Gateway Connection instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_virtualnetworkgatewayconnection(self):
         '''
@@ -1222,14 +1252,14 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway Connection instance state dictionary
         '''
-        self.log("Checking if the Virtual Network Gateway Connection instance {0} is present".format(self.name))
+        self.log("Checking if the Virtual Network Gateway Connection instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.virtual_network_gateway_connections.get(resource_group_name=self.resource_group,
                                                                                 virtual_network_gateway_connection_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Virtual Network Gateway Connection instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Virtual Network Gateway Connection instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Virtual Network Gateway Connection instance.')
         if found is True:
@@ -1238,115 +1268,6 @@ class AzureRMVirtualNetworkGatewayConnection(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_upper(d, path):
-   if isinstance(d, list):
-        for i in range(len(d)):
-            dict_upper(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = old_value.upper()
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_upper(sd, path[1:])
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMVirtualNetworkGatewayConnection()
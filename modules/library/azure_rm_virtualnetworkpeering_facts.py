@@ -34,6 +34,16 @@ options:
         description:
             - The name of the virtual network peering.
         required: True
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
 
 extends_documentation_fragment:
     - azure
@@ -71,18 +81,17 @@ virtual_network_peerings:
             sample: peer
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.network import NetworkManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMVirtualNetworkPeeringFacts(AzureRMModuleBase):
+class AzureRMVirtualNetworkPeeringFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -107,14 +116,18 @@ class AzureRMVirtualNetworkPeeringFacts(AzureRMModuleBase):
         self.resource_group = None
         self.virtual_network_name = None
         self.name = None
-        super(AzureRMVirtualNetworkPeeringFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMVirtualNetworkPeeringFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.network.NetworkManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['virtual_network_peerings'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         self.results['virtual_network_peerings'] = self.get()
         return self.results
 
@@ -125,7 +138,7 @@ class AzureRMVirtualNetworkPeeringFacts(AzureRMModuleBase):
             response = self.mgmt_client.virtual_network_peerings.get(resource_group_name=self.resource_group,
                                                                      virtual_network_name=self.virtual_network_name,
                                                                      virtual_network_peering_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Virtual Network Peering.')
 
@@ -134,6 +147,14 @@ class AzureRMVirtualNetworkPeeringFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.virtual_network_peerings, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -584,6 +584,34 @@ options:
                     - Type of managed service identity.
                 choices:
                     - 'system_assigned'
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Web App.
@@ -622,17 +650,21 @@ state:
     returned: always
     type: str
     sample: state
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.web import WebSiteManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -643,7 +675,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMWebApp(AzureRMModuleBase):
+class AzureRMWebApp(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Web App resource"""
 
     def __init__(self):
@@ -1215,27 +1247,27 @@ class AzureRMWebApp(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.site_envelope[key] = kwargs[key]
 
-        dict_camelize(self.site_envelope, ['host_name_ssl_states', 'ssl_state'], True)
-        dict_camelize(self.site_envelope, ['host_name_ssl_states', 'host_type'], True)
-        dict_camelize(self.site_envelope, ['site_config', 'connection_strings', 'type'], True)
-        dict_map(self.site_envelope, ['site_config', 'connection_strings', 'type'], {'sql_server': 'SQLServer', 'sql_azure': 'SQLAzure', 'postgre_sql': 'PostgreSQL'})
-        dict_camelize(self.site_envelope, ['site_config', 'scm_type'], True)
-        dict_map(self.site_envelope, ['site_config', 'scm_type'], {'vso': 'VSO'})
-        dict_camelize(self.site_envelope, ['site_config', 'managed_pipeline_mode'], True)
-        dict_camelize(self.site_envelope, ['site_config', 'load_balancing'], True)
-        dict_camelize(self.site_envelope, ['site_config', 'auto_heal_rules', 'actions', 'action_type'], True)
-        dict_resource_id(self.site_envelope, ['hosting_environment_profile', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_resource_id(self.site_envelope, ['snapshot_info', 'recovery_target', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_camelize(self.site_envelope, ['identity', 'type'], True)
+        transform = DictTransform()
+        transform.camelize(['host_name_ssl_states', 'ssl_state'], True)
+        transform.camelize(['host_name_ssl_states', 'host_type'], True)
+        transform.camelize(['site_config', 'connection_strings', 'type'], True)
+        transform.map(['site_config', 'connection_strings', 'type'], {'sql_server': 'SQLServer', 'sql_azure': 'SQLAzure', 'postgre_sql': 'PostgreSQL'})
+        transform.camelize(['site_config', 'scm_type'], True)
+        transform.map(['site_config', 'scm_type'], {'vso': 'VSO'})
+        transform.camelize(['site_config', 'managed_pipeline_mode'], True)
+        transform.camelize(['site_config', 'load_balancing'], True)
+        transform.camelize(['site_config', 'auto_heal_rules', 'actions', 'action_type'], True)
+        transform.resource_id(['hosting_environment_profile', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.resource_id(['snapshot_info', 'recovery_target', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.camelize(['identity', 'type'], True)
+        transform.apply(self.site_envelope)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(WebSiteManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.web.WebSiteManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_webapp()
+        old_response = self.cached_get(self.get_webapp)
 
         if not old_response:
             self.log("Web App instance doesn't exist")
@@ -1248,7 +1280,7 @@ class AzureRMWebApp(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.site_envelope, old_response, '', self.results)):
+                if (not self.compare_state(self.site_envelope, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -1256,6 +1288,7 @@ class AzureRMWebApp(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.site_envelope, old_response)
                 return self.results
 
             response = self.create_update_webapp()
@@ -1267,12 +1300,11 @@ class AzureRMWebApp(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_webapp()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_webapp()
+            self.wait_for_delete(response, self.get_webapp, 'Web App')
         else:
             self.log("Web App instance unchanged")
             self.results['changed'] = False
@@ -1291,7 +1323,7 @@ class AzureRMWebApp(AzureRMModuleBase):
 
         :return: deserialized Web App instance state dictionary
         '''
-        self.log("Creating / Updating the Web App instance {0}".format(self.name))
+        self.log("Creating / Updating the Web App instance {0}", self.name)
 
         try:
             response = self.mgmt_client.web_apps.create_or_update(resource_group_name=self.resource_group,
@@ -1309,9 +1341,9 @@ class AzureRMWebApp(AzureRMModuleBase):
         '''
         Deletes specified Web App instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Web App instance {0}".format(self.name))
+        self.log("Deleting the Web App instance {0}", self.name)
         try:
             response = self.mgmt_client.web_apps.delete(resource_group_name=self.resource_group,
                                                         name=self.name)
@@ -1319,7 +1351,7 @@ class AzureRMWebApp(AzureRMModuleBase):
             self.log('Error attempting to delete the Web App instance.')
             self.fail("Error deleting the Web App instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_webapp(self):
         '''
@@ -1327,14 +1359,14 @@ class AzureRMWebApp(AzureRMModuleBase):
 
         :return: deserialized Web App instance state dictionary
         '''
-        self.log("Checking if the Web App instance {0} is present".format(self.name))
+        self.log("Checking if the Web App instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.web_apps.get(resource_group_name=self.resource_group,
                                                      name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Web App instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Web App instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Web App instance.')
         if found is True:
@@ -1343,100 +1375,6 @@ class AzureRMWebApp(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_map(d, path, map):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_map(d[i], path, map)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = map.get(old_value, old_value)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_map(sd, path[1:], map)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMWebApp()
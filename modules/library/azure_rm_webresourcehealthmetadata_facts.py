@@ -32,6 +32,24 @@ options:
     slot:
         description:
             - Name of web app slot. If not specified then will default to production slot.
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -64,20 +82,25 @@ resource_health_metadata:
     returned: always
     type: complex
     contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.web import WebSiteManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMResourceHealthMetadataFacts(AzureRMModuleBase):
+class AzureRMResourceHealthMetadataFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -100,12 +123,12 @@ class AzureRMResourceHealthMetadataFacts(AzureRMModuleBase):
         self.resource_group = None
         self.name = None
         self.slot = None
-        super(AzureRMResourceHealthMetadataFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMResourceHealthMetadataFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(WebSiteManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.web.WebSiteManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
         if (self.name is not None and
@@ -124,12 +147,12 @@ class AzureRMResourceHealthMetadataFacts(AzureRMModuleBase):
             response = self.mgmt_client.resource_health_metadata.list_by_site_slot(resource_group_name=self.resource_group,
                                                                                    name=self.name,
                                                                                    slot=self.slot)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Resource Health Metadata.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -140,12 +163,12 @@ class AzureRMResourceHealthMetadataFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.resource_health_metadata.list_by_site(resource_group_name=self.resource_group,
                                                                               name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Resource Health Metadata.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -155,12 +178,12 @@ class AzureRMResourceHealthMetadataFacts(AzureRMModuleBase):
         results = []
         try:
             response = self.mgmt_client.resource_health_metadata.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Resource Health Metadata.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -177,6 +177,34 @@ options:
         description:
             - Constant filled by server.
             - Required when C(state) is I(present).
+    wait_for_completion:
+        description:
+            - Wait for a create, update or delete to complete before returning.
+            - When C(no), the module returns as soon as Azure has accepted the operation, with its URL in
+              I(operation_url). Many such operations can then be awaited at once with M(azure_rm_async_wait).
+        type: bool
+        default: yes
+        aliases:
+            - wait
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for a create, update or delete to complete.
+        type: int
+        default: 1800
+    poll_interval:
+        description:
+            - Seconds between status requests of long running operations, unless Azure asks for a different interval.
+        type: int
+        default: 5
+    trust_cache_for:
+        description:
+            - Seconds a run of the same task that changed nothing stays trusted, when the state cache named by
+              the C(AZURE_RM_STATE_CACHE) environment variable is used.
+            - Within that time the module only checks that the ETag of the instance did not change, and returns the
+              result of that run if so.
+            - C(0) always runs the task in full.
+        type: int
+        default: 0
     state:
       description:
         - Assert the state of the Web Service.
@@ -269,17 +297,21 @@ id:
     returned: always
     type: str
     sample: TheWebServiceId
+operation_url:
+    description:
+        - URL reporting the status of the create, update or delete operation.
+    returned: when the instance was changed with I(wait_for_completion=no), or waiting for it timed out
+    type: str
 '''
 
 import time
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.azure_rm_base import AzureRMResourceModuleBase
+from ansible.module_utils.azure_rm_diff import DictTransform
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.polling import LROPoller
     from msrestazure.azure_operation import AzureOperationPoller
-    from azure.mgmt.webservices import AzureMLWebServicesManagementClient
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
@@ -290,7 +322,7 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
-class AzureRMWebService(AzureRMModuleBase):
+class AzureRMWebService(AzureRMResourceModuleBase):
     """Configuration class for an Azure RM Web Service resource"""
 
     def __init__(self):
@@ -475,36 +507,36 @@ class AzureRMWebService(AzureRMModuleBase):
             elif kwargs[key] is not None:
                 self.create_or_update_payload[key] = kwargs[key]
 
-        dict_expand(self.create_or_update_payload, ['title'])
-        dict_expand(self.create_or_update_payload, ['description'])
-        dict_expand(self.create_or_update_payload, ['keys'])
-        dict_expand(self.create_or_update_payload, ['read_only'])
-        dict_expand(self.create_or_update_payload, ['expose_sample_data'])
-        dict_expand(self.create_or_update_payload, ['realtime_configuration'])
-        dict_camelize(self.create_or_update_payload, ['diagnostics', 'level'], True)
-        dict_expand(self.create_or_update_payload, ['diagnostics'])
-        dict_expand(self.create_or_update_payload, ['storage_account'])
-        dict_resource_id(self.create_or_update_payload, ['machine_learning_workspace', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_expand(self.create_or_update_payload, ['machine_learning_workspace'])
-        dict_resource_id(self.create_or_update_payload, ['commitment_plan', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
-        dict_expand(self.create_or_update_payload, ['commitment_plan'])
-        dict_expand(self.create_or_update_payload, ['input'])
-        dict_expand(self.create_or_update_payload, ['output'])
-        dict_expand(self.create_or_update_payload, ['example_request'])
-        dict_expand(self.create_or_update_payload, ['assets'])
-        dict_expand(self.create_or_update_payload, ['parameters'])
-        dict_expand(self.create_or_update_payload, ['payloads_in_blob_storage'])
-        dict_expand(self.create_or_update_payload, ['payloads_location'])
-        dict_expand(self.create_or_update_payload, ['package_type'])
+        transform = DictTransform()
+        transform.expand(['title'], 'properties')
+        transform.expand(['description'], 'properties')
+        transform.expand(['keys'], 'properties')
+        transform.expand(['read_only'], 'properties')
+        transform.expand(['expose_sample_data'], 'properties')
+        transform.expand(['realtime_configuration'], 'properties')
+        transform.camelize(['diagnostics', 'level'], True)
+        transform.expand(['diagnostics'], 'properties')
+        transform.expand(['storage_account'], 'properties')
+        transform.resource_id(['machine_learning_workspace', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.expand(['machine_learning_workspace'], 'properties')
+        transform.resource_id(['commitment_plan', 'id'], subscription_id=self.subscription_id, resource_group=self.resource_group)
+        transform.expand(['commitment_plan'], 'properties')
+        transform.expand(['input'], 'properties')
+        transform.expand(['output'], 'properties')
+        transform.expand(['example_request'], 'properties')
+        transform.expand(['assets'], 'properties')
+        transform.expand(['parameters'], 'properties')
+        transform.expand(['payloads_in_blob_storage'], 'properties')
+        transform.expand(['payloads_location'], 'properties')
+        transform.expand(['package_type'], 'properties')
+        transform.apply(self.create_or_update_payload)
 
         response = None
 
-        self.mgmt_client = self.get_mgmt_svc_client(AzureMLWebServicesManagementClient,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.webservices.AzureMLWebServicesManagementClient',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
-        old_response = self.get_webservice()
+        old_response = self.cached_get(self.get_webservice)
 
         if not old_response:
             self.log("Web Service instance doesn't exist")
@@ -517,7 +549,7 @@ class AzureRMWebService(AzureRMModuleBase):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             elif self.state == 'present':
-                if (not default_compare(self.create_or_update_payload, old_response, '', self.results)):
+                if (not self.compare_state(self.create_or_update_payload, old_response)):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -525,6 +557,7 @@ class AzureRMWebService(AzureRMModuleBase):
 
             if self.check_mode:
                 self.results['changed'] = True
+                self.plan_diff(self.create_or_update_payload, old_response)
                 return self.results
 
             response = self.create_update_webservice()
@@ -536,12 +569,11 @@ class AzureRMWebService(AzureRMModuleBase):
             self.results['changed'] = True
 
             if self.check_mode:
+                self.plan_diff(None, old_response)
                 return self.results
 
-            self.delete_webservice()
-            # This currently doesnt' work as there is a bug in SDK / Service
-            if isinstance(response, LROPoller) or isinstance(response, AzureOperationPoller):
-                response = self.get_poller_result(response)
+            response = self.delete_webservice()
+            self.wait_for_delete(response, self.get_webservice, 'Web Service')
         else:
             self.log("Web Service instance unchanged")
             self.results['changed'] = False
@@ -559,7 +591,7 @@ class AzureRMWebService(AzureRMModuleBase):
 
         :return: deserialized Web Service instance state dictionary
         '''
-        self.log("Creating / Updating the Web Service instance {0}".format(self.))
+        self.log("Creating / Updating the Web Service instance {0}".format(self.name))
 
         try:
             response = self.mgmt_client.web_services.create_or_update(resource_group_name=self.resource_group,
@@ -577,16 +609,16 @@ class AzureRMWebService(AzureRMModuleBase):
         '''
         Deletes specified Web Service instance in the specified subscription and resource group.
 
-        :return: True
+        :return: poller of the delete operation, None if the service deleted the instance synchronously
         '''
-        self.log("Deleting the Web Service instance {0}".format(self.))
+        self.log("Deleting the Web Service instance {0}".format(self.name))
         try:
             response = self.mgmt_client.web_services.delete()
         except CloudError as e:
             self.log('Error attempting to delete the Web Service instance.')
             self.fail("Error deleting the Web Service instance: {0}".format(str(e)))
 
-        return True
+        return response
 
     def get_webservice(self):
         '''
@@ -594,14 +626,14 @@ class AzureRMWebService(AzureRMModuleBase):
 
         :return: deserialized Web Service instance state dictionary
         '''
-        self.log("Checking if the Web Service instance {0} is present".format(self.))
+        self.log("Checking if the Web Service instance {0} is present".format(self.name))
         found = False
         try:
             response = self.mgmt_client.web_services.get(resource_group_name=self.resource_group,
                                                          web_service_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Web Service instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Web Service instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Web Service instance.')
         if found is True:
@@ -610,101 +642,6 @@ class AzureRMWebService(AzureRMModuleBase):
         return False
 
 
-def default_compare(new, old, path, result):
-    if new is None:
-        return True
-    elif isinstance(new, dict):
-        if not isinstance(old, dict):
-            result['compare'] = 'changed [' + path + '] old dict is null'
-            return False
-        for k in new.keys():
-            if not default_compare(new.get(k), old.get(k, None), path + '/' + k, result):
-                return False
-        return True
-    elif isinstance(new, list):
-        if not isinstance(old, list) or len(new) != len(old):
-            result['compare'] = 'changed [' + path + '] length is different or null'
-            return False
-        if isinstance(old[0], dict):
-            key = None
-            if 'id' in old[0] and 'id' in new[0]:
-                key = 'id'
-            elif 'name' in old[0] and 'name' in new[0]:
-                key = 'name'
-            else:
-                key = list(old[0])[0]
-            new = sorted(new, key=lambda x: x.get(key, None))
-            old = sorted(old, key=lambda x: x.get(key, None))
-        else:
-            new = sorted(new)
-            old = sorted(old)
-        for i in range(len(new)):
-            if not default_compare(new[i], old[i], path + '/*', result):
-                return False
-        return True
-    else:
-        if path == '/location':
-            new = new.replace(' ', '').lower()
-            old = new.replace(' ', '').lower()
-        if new == old:
-            return True
-        else:
-            result['compare'] = 'changed [' + path + '] ' + str(new) + ' != ' + str(old)
-            return False
-
-
-def dict_camelize(d, path, camelize_first):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_camelize(d[i], path, camelize_first)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                d[path[0]] = _snake_to_camel(old_value, camelize_first)
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_camelize(sd, path[1:], camelize_first)
-
-
-def dict_expand(d, path, outer_dict_name):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_expand(d[i], path, outer_dict_name)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.pop(path[0], None)
-            if old_value is not None:
-                d[outer_dict_name] = d.get(outer_dict_name, {})
-                d[outer_dict_name] = old_value
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_expand(sd, path[1:], outer_dict_name)
-
-
-def dict_resource_id(d, path, **kwargs):
-    if isinstance(d, list):
-        for i in range(len(d)):
-            dict_resource_id(d[i], path)
-    elif isinstance(d, dict):
-        if len(path) == 1:
-            old_value = d.get(path[0], None)
-            if old_value is not None:
-                if isinstance(old_value, dict):
-                    resource_id = format_resource_id(val=self.target['name'],
-                                                    subscription_id=self.target.get('subscription_id') or self.subscription_id,
-                                                    namespace=self.target['namespace'],
-                                                    types=self.target['types'],
-                                                    resource_group=self.target.get('resource_group') or self.resource_group)
-                    d[path[0]] = resource_id
-        else:
-            sd = d.get(path[0], None)
-            if sd is not None:
-                dict_resource_id(sd, path[1:])
-
-
 def main():
     """Main execution"""
     AzureRMWebService()
@@ -62,6 +62,29 @@ options:
     component_id:
         description:
             - Component Id.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -130,20 +153,25 @@ components:
             type: complex
             sample: children
             contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.workloadmonitor import WorkloadMonitorAPI
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMComponentFacts(AzureRMModuleBase):
+class AzureRMComponentFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -205,14 +233,18 @@ class AzureRMComponentFacts(AzureRMModuleBase):
         self.top = None
         self.skiptoken = None
         self.component_id = None
-        super(AzureRMComponentFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMComponentFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(WorkloadMonitorAPI,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.workloadmonitor.WorkloadMonitorAPI',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['components'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.component_id is not None:
             self.results['components'] = self.get()
         else:
@@ -227,12 +259,12 @@ class AzureRMComponentFacts(AzureRMModuleBase):
                                                                     resource_namespace=self.resource_namespace,
                                                                     resource_type=self.resource_type,
                                                                     resource_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Component.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -246,7 +278,7 @@ class AzureRMComponentFacts(AzureRMModuleBase):
                                                        resource_type=self.resource_type,
                                                        resource_name=self.name,
                                                        component_id=self.component_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Component.')
 
@@ -255,6 +287,14 @@ class AzureRMComponentFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.components, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
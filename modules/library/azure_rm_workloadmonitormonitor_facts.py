@@ -47,6 +47,29 @@ options:
     monitor_id:
         description:
             - Monitor Id.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -121,20 +144,25 @@ monitors:
             returned: always
             type: int
             sample: 15
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.workloadmonitor import WorkloadMonitorAPI
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMMonitorFacts(AzureRMModuleBase):
+class AzureRMMonitorFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -176,14 +204,18 @@ class AzureRMMonitorFacts(AzureRMModuleBase):
         self.filter = None
         self.skiptoken = None
         self.monitor_id = None
-        super(AzureRMMonitorFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMMonitorFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(WorkloadMonitorAPI,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.workloadmonitor.WorkloadMonitorAPI',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['monitors'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.monitor_id is not None:
             self.results['monitors'] = self.get()
         else:
@@ -198,12 +230,12 @@ class AzureRMMonitorFacts(AzureRMModuleBase):
                                                                   resource_namespace=self.resource_namespace,
                                                                   resource_type=self.resource_type,
                                                                   resource_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Monitor.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -217,7 +249,7 @@ class AzureRMMonitorFacts(AzureRMModuleBase):
                                                      resource_type=self.resource_type,
                                                      resource_name=self.name,
                                                      monitor_id=self.monitor_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Monitor.')
 
@@ -226,6 +258,14 @@ class AzureRMMonitorFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.monitors, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
@@ -62,6 +62,29 @@ options:
     monitor_instance_id:
         description:
             - MonitorInstance Id.
+    ids:
+        description:
+            - List of resource IDs to get, fetched together with ARM batch requests.
+            - When given, no other option is required.
+        type: list
+    select:
+        description:
+            - List of attributes to return for each instance instead of the default fields.
+            - Nested attributes are written with dots, e.g. C(sku.name). Only the selected attributes are serialized.
+        type: list
+    page_size:
+        description:
+            - Maximum number of instances to read from list operations in this task.
+            - When more instances remain, I(next_link) is returned to continue in another task.
+        type: int
+    max_items:
+        description:
+            - Maximum number of instances to read from list operations, in total over the tasks continued with I(next_link).
+        type: int
+    next_link:
+        description:
+            - Continuation token returned by a previous task with the same options, to read the next instances.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -130,20 +153,25 @@ monitor_instances:
             type: complex
             sample: children
             contains:
+next_link:
+    description:
+        - Token to pass as I(next_link) to read the next instances, when I(page_size) or I(max_items) stopped the listing.
+    returned: when more instances remain
+    type: str
+    sample: WyJodHRwczovL21hbmFnZW1lbnQuYXp1cmUuY29tLyIsIDAsIDEwMF0=
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_base import AzureRMFactsModuleBase
 
 try:
     from msrestazure.azure_exceptions import CloudError
-    from azure.mgmt.workloadmonitor import WorkloadMonitorAPI
     from msrest.serialization import Model
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
-class AzureRMMonitorInstanceFacts(AzureRMModuleBase):
+class AzureRMMonitorInstanceFacts(AzureRMFactsModuleBase):
     def __init__(self):
         # define user inputs into argument
         self.module_arg_spec = dict(
@@ -205,14 +233,18 @@ class AzureRMMonitorInstanceFacts(AzureRMModuleBase):
         self.top = None
         self.skiptoken = None
         self.monitor_instance_id = None
-        super(AzureRMMonitorInstanceFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMMonitorInstanceFacts, self).__init__(self.module_arg_spec, supports_tags=False, supports_ids=True, supports_paging=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
-        self.mgmt_client = self.get_mgmt_svc_client(WorkloadMonitorAPI,
+        self.mgmt_client = self.get_mgmt_svc_client('azure.mgmt.workloadmonitor.WorkloadMonitorAPI',
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
+        if kwargs['ids'] is not None:
+            self.results['monitor_instances'] = self.get_by_ids(kwargs['ids'])
+            return self.results
+
         if self.monitor_instance_id is not None:
             self.results['monitor_instances'] = self.get()
         else:
@@ -227,12 +259,12 @@ class AzureRMMonitorInstanceFacts(AzureRMModuleBase):
                                                                            resource_namespace=self.resource_namespace,
                                                                            resource_type=self.resource_type,
                                                                            resource_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Monitor Instance.')
 
         if response is not None:
-            for item in response:
+            for item in self.paged(response):
                 results.append(self.format_response(item))
 
         return results
@@ -246,7 +278,7 @@ class AzureRMMonitorInstanceFacts(AzureRMModuleBase):
                                                               resource_type=self.resource_type,
                                                               resource_name=self.name,
                                                               monitor_instance_id=self.monitor_instance_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
             self.log('Could not get facts for Monitor Instance.')
 
@@ -255,6 +287,14 @@ class AzureRMMonitorInstanceFacts(AzureRMModuleBase):
 
         return results
 
+    def get_by_ids(self, ids):
+        results = []
+        for response in self.batch_get(self.mgmt_client.monitor_instances, ids):
+            if response is not None:
+                results.append(self.format_response(response))
+
+        return results
+
     def format_response(self, item):
         d = item.as_dict()
         d = {
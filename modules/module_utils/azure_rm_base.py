@@ -0,0 +1,998 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Base classes for the azure_rm_* modules in this repository, on top of Ansible's AzureRMModuleBase.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import copy
+import datetime
+import importlib
+import json
+import os
+import re
+import threading
+import time
+import traceback
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
+
+from ansible.module_utils.basic import missing_required_lib
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.six import string_types
+from ansible.module_utils.azure_rm_batch import batch_get
+from ansible.module_utils.azure_rm_broker import attach
+from ansible.module_utils.azure_rm_diff import TransformError, record_changes, structural_diff
+from ansible.module_utils.azure_rm_etag import NotModified, attach as attach_etag_tracker, etag_tracker, fingerprint
+from ansible.module_utils.azure_rm_graph import build_query, query_resources, resource_type, select_columns
+from ansible.module_utils.azure_rm_logging import ModuleLogger
+from ansible.module_utils.azure_rm_resources import CHANGED_TIME_SKEW, list_resources, odata_string, parse_time, tag_filter
+from ansible.module_utils.azure_rm_sink import FORMATS, HAS_PYARROW, model_columns, open_sink
+from ansible.module_utils.azure_rm_snapshot import load_snapshot, store_snapshot
+from ansible.module_utils.azure_rm_state_cache import HAS_SQLITE3, STATE_CACHE_ENV, desired_key, state_cache
+from ansible.module_utils.azure_rm_throttle import attach as attach_throttle, throttle
+from ansible.module_utils.azure_rm_token_cache import use_token_cache
+from ansible.module_utils.azure_rm_wait import DEFAULT_POLL_INTERVAL, DEFAULT_WAIT_TIMEOUT, accepted_resource, operation_url, wait_for_deletion
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+
+AZURE_ASYNC_ARGS = dict(
+    wait_for_completion=dict(
+        type='bool',
+        default=True,
+        aliases=['wait']
+    ),
+    wait_timeout=dict(
+        type='int',
+        default=DEFAULT_WAIT_TIMEOUT
+    ),
+    poll_interval=dict(
+        type='int',
+        default=DEFAULT_POLL_INTERVAL
+    )
+)
+
+AZURE_STATE_CACHE_ARGS = dict(
+    trust_cache_for=dict(
+        type='int',
+        default=0
+    )
+)
+
+DEFAULT_CONCURRENCY = 10
+
+# seconds a resource group location stays in the shared cache (AZURE_TOKEN_CACHE)
+RESOURCE_GROUP_TTL = 3600
+
+ResourceGroupInfo = namedtuple('ResourceGroupInfo', ['id', 'name', 'location'])
+
+# resource groups fetched by this process, by (resource manager, subscription, lower case name)
+_resource_groups = {}
+_resource_groups_lock = threading.Lock()
+
+
+class ItemFailed(Exception):
+    pass
+
+
+class AzureRMRunMixin(object):
+    '''
+    Logging, failing and throttling counters shared by the base classes below and by modules that
+    derive from AzureRMModuleBase directly. Classes using it set self._throttle (see
+    azure_rm_throttle) before the module can fail.
+    '''
+
+    def log(self, msg, *args, **kwargs):
+        '''
+        Log msg at the level keyword (debug by default), formatting it with args only when that
+        level is enabled (see azure_rm_logging).
+        '''
+        logger = self.__dict__.get('_logger')
+        if logger is None:
+            logger = self._logger = ModuleLogger(self.module)
+        logger.log(msg, args, **kwargs)
+
+    def fail(self, msg, **kwargs):
+        self.module.fail_json(msg=msg, **self.add_throttling(kwargs))
+
+    def add_throttling(self, res):
+        '''
+        Add the throttling counters of the run to res under "throttling", when the shared rate
+        limiter is on or requests were retried (see azure_rm_throttle).
+        '''
+        if self._throttle.active():
+            res['throttling'] = self._throttle.stats()
+        return res
+
+
+class AzureRMResourceModuleBase(AzureRMRunMixin, AzureRMModuleBase):
+    '''
+    Base class of resource (create / update / delete) modules.
+
+    Adds the wait_for_completion, wait_timeout and poll_interval options, which control how long
+    running operations started by the module are awaited (see get_poller_result() and
+    wait_for_delete()). Modules created with supports_items also
+    get the items and concurrency options, to manage many instances in one task.
+
+    Service principal tokens come from the on-disk cache named by AZURE_TOKEN_CACHE, when it is set
+    (see azure_rm_token_cache). Resource groups are fetched at most once per run and kept in that
+    cache too, see get_resource_group().
+
+    With AZURE_RM_ETAG_CACHE set, resources are read with conditional GETs and written with If-Match
+    (see azure_rm_etag, cached_get() and compare_state()). With AZURE_RM_STATE_CACHE set, tasks that
+    converged without changes are recorded and the trust_cache_for option lets repeat runs return
+    the recorded result after probing the ETag of the resource, see converge().
+
+    Requests that get 429 or 503 are retried after Retry-After; with AZURE_RM_RATE_LIMIT set module
+    runs also share the request quota ARM reports (see azure_rm_throttle).
+    '''
+
+    def __init__(self, derived_arg_spec, supports_items=False, skip_exec=False, **kwargs):
+        merged_arg_spec = dict(AZURE_ASYNC_ARGS)
+        merged_arg_spec.update(AZURE_STATE_CACHE_ARGS)
+        if supports_items:
+            # pristine copy of the attributes set by the derived class, every item starts from it
+            self._item_state = copy.deepcopy(self.__dict__)
+            self._item_arg_spec = derived_arg_spec
+            merged_arg_spec.update(items_arg_spec(derived_arg_spec))
+            # required options may come from the items, they are checked once merged
+            derived_arg_spec = without_required(derived_arg_spec)
+        merged_arg_spec.update(derived_arg_spec)
+
+        self._mgmt_clients = {}
+        self._mgmt_clients_lock = threading.Lock()
+
+        self._shared_cache = use_token_cache()
+        self._throttle = throttle()
+        self._not_modified = None
+        self._resource_key = None
+        self._state_cache = None
+        super(AzureRMResourceModuleBase, self).__init__(derived_arg_spec=merged_arg_spec, skip_exec=True, **kwargs)
+
+        if os.environ.get(STATE_CACHE_ENV):
+            if not HAS_SQLITE3:
+                self.fail(missing_required_lib('sqlite3'))
+            self._state_cache = state_cache()
+        self._etags = etag_tracker(track=self._state_cache is not None)
+
+        if not skip_exec:
+            if supports_items and self.module.params['items']:
+                res = self.exec_items()
+            else:
+                if supports_items:
+                    self.check_required(self.module.params)
+                try:
+                    res = self.converge(self.module.params)
+                except TransformError as exc:
+                    self.fail("Cannot build the request body: {0}".format(exc))
+            self.module.exit_json(**self.add_throttling(res))
+
+    def get_mgmt_svc_client(self, client_type, *args, **kwargs):
+        '''
+        Return a management client, shared by all items of the module, sending its requests through
+        the connection broker named by AZURE_RM_BROKER when that is set (see azure_rm_broker), and
+        through the rate limiter (see azure_rm_throttle).
+
+        :param client_type: client class, or its import path (see import_client_type)
+        '''
+        client_type = import_client_type(client_type, self.fail)
+        key = (client_type, args, tuple(sorted(kwargs.items())))
+        with self._mgmt_clients_lock:
+            client = self._mgmt_clients.get(key)
+            if client is None:
+                client = super(AzureRMResourceModuleBase, self).get_mgmt_svc_client(client_type, *args, **kwargs)
+                # pollers wait this long between status requests unless the service sends Retry-After
+                client.config.long_running_operation_timeout = self.module.params['poll_interval']
+                client = attach(client)
+                if self._etags is not None:
+                    client = attach_etag_tracker(client, self._etags)
+                client = attach_throttle(client, self._throttle)
+                self._mgmt_clients[key] = client
+            return client
+
+    def get_resource_group(self, resource_group):
+        '''
+        Fetch a resource group, at most once per run; with AZURE_TOKEN_CACHE set the result is also
+        shared by module runs for RESOURCE_GROUP_TTL seconds.
+
+        :param resource_group: name of a resource group
+        :return: ResourceGroupInfo with id, name and location
+        '''
+        key = (self._cloud_environment.endpoints.resource_manager, self.subscription_id, resource_group.lower())
+        with _resource_groups_lock:
+            info = _resource_groups.get(key)
+        if info is not None:
+            return info
+        if self._shared_cache is not None:
+            value = self._shared_cache.get_or_acquire(json.dumps(key), lambda: self._fetch_resource_group(resource_group),
+                                                      section='resource_groups')
+            info = ResourceGroupInfo(value['id'], value['name'], value['location'])
+        else:
+            info = ResourceGroupInfo(**self._fetch_resource_group(resource_group, expires=False))
+        with _resource_groups_lock:
+            _resource_groups[key] = info
+        return info
+
+    def _fetch_resource_group(self, resource_group, expires=True):
+        group = super(AzureRMResourceModuleBase, self).get_resource_group(resource_group)
+        value = dict(id=group.id, name=group.name, location=group.location)
+        if expires:
+            value['expires_on'] = time.time() + RESOURCE_GROUP_TTL
+        return value
+
+    def default_location(self, old_response):
+        '''
+        Default the location parameter, when the task does not set it, to the location of the
+        existing resource or else to that of its resource group. Called only before a create or
+        update, so runs that change nothing do not fetch the resource group; check mode never does.
+        '''
+        if 'location' in self.parameters or (self.check_mode and not old_response):
+            return
+        if old_response and old_response.get('location'):
+            self.parameters['location'] = old_response['location']
+        else:
+            self.parameters['location'] = self.get_resource_group(self.resource_group).location
+
+    def cached_get(self, get):
+        '''
+        Call get, the get_<resource>() method of the module, through the ETag cache.
+
+        When the service answers 304 the state the module returned the last time is returned
+        without deserializing anything, otherwise the state get returns is cached with its ETag.
+
+        :return: what get returns
+        '''
+        self._not_modified = None
+        if self._etags is None:
+            return get()
+        try:
+            state = get()
+        except NotModified as exc:
+            self._not_modified = exc.entry
+            self._resource_key = exc.key
+            return exc.entry['state']
+        key = self._resource_key = self._etags.last_get
+        if state and key in self._etags.etags and self._etags.cache:
+            self._etags.cache.store(key, dict(etag=self._etags.etags[key], state=state))
+        return state
+
+    def compare_state(self, desired, current):
+        '''
+        default_compare() of the desired and current state, skipped when current is an unmodified
+        resource (see cached_get()) that already matched the same desired state. In check mode the
+        changes are also returned in results['changes'], see azure_rm_diff.structural_diff().
+
+        :return: True when current matches desired
+        '''
+        if self._etags is None or self._etags.cache is None:
+            return self._compare(desired, current)
+        desired_fingerprint = fingerprint([type(self).__name__, desired])
+        entry = self._not_modified
+        if entry is not None and entry.get('desired') == desired_fingerprint:
+            return True
+        same = self._compare(desired, current)
+        key = self._etags.last_get
+        if same and key in self._etags.etags:
+            self._etags.cache.store(key, dict(etag=self._etags.etags[key], state=current, desired=desired_fingerprint))
+        return same
+
+    def _compare(self, desired, current):
+        changes = structural_diff(desired, current)
+        record_changes(changes, self.results)
+        if changes and self.check_mode:
+            self.results['changes'] = changes
+        return not changes
+
+    def plan_diff(self, desired, current):
+        '''
+        Describe the create (no current state) or delete (desired is None) check mode skipped, in
+        results['changes'] and, for --diff, results['diff']. Updates are described by compare_state().
+        '''
+        if desired is None:
+            changes = [dict(path='', op='remove', before=current, after=None)]
+        elif not current:
+            changes = [dict(path='', op='add', before=None, after=desired)]
+        else:
+            return
+        self.results['changes'] = changes
+        self.results['diff'] = dict(before=current or {}, after=desired or {})
+
+    def converge(self, params):
+        '''
+        Run exec_module, unless the state cache (AZURE_RM_STATE_CACHE) holds a run of the same task
+        that converged without changes less than trust_cache_for seconds ago and the ETag of the
+        resource is still the same; then return the result of that run.
+
+        Runs that change nothing are recorded, other runs drop the record of the task.
+
+        :return: results of the module
+        '''
+        if self._state_cache is None or params.get('state', 'present') != 'present':
+            return self.exec_module(**params)
+        key = desired_key(type(self).__name__, params)
+        if params['trust_cache_for'] > 0:
+            entry = self._state_cache.get(key, params['trust_cache_for'])
+            if entry is not None and self.probe_etag(entry['url'], entry['etag']):
+                return entry['result']
+        res = self.exec_module(**params)
+        resource = self._resource_key
+        if not res.get('changed') and resource in self._etags.etags:
+            self._state_cache.put(key, self._etags.urls[resource], self._etags.etags[resource], res)
+        else:
+            self._state_cache.drop(key)
+        return res
+
+    def probe_etag(self, url, etag):
+        '''
+        Conditional GET of url with etag; the service sends no body when the ETag still matches.
+
+        :return: True when the resource still has etag
+        '''
+        client = self.rm_client._client
+        try:
+            response = client.send(client.get(url), headers={'If-None-Match': etag}, stream=False)
+        except NotModified:
+            # answered from the ETag cache
+            return True
+        except Exception as exc:
+            self.log('ETag probe of {0} failed: {1}', url, exc)
+            return False
+        return response.status_code == 304
+
+    def check_required(self, params):
+        missing = missing_required(self._item_arg_spec, params)
+        if missing:
+            self.fail("missing required arguments: {0}".format(', '.join(missing)))
+
+    def exec_items(self):
+        '''
+        Run exec_module once per element of the items option, on a bounded thread pool.
+
+        Every item is processed by a copy of the module, so the per instance state of the
+        generated modules (parameters, results, to_do...) is not shared. Management clients
+        are shared, so all items use one connection pool and one token.
+
+        :return: results with changed and one result per item under "items", in input order
+        '''
+        items = self.module.params['items']
+        pool = ThreadPool(max(1, min(self.module.params['concurrency'], len(items))))
+        try:
+            results = pool.map(self._exec_item, items)
+        finally:
+            pool.close()
+            pool.join()
+        res = dict(changed=any(r['changed'] for r in results), items=results)
+        failed = len([r for r in results if r.get('failed')])
+        if failed:
+            self.fail("{0} of {1} items failed".format(failed, len(results)), **res)
+        return res
+
+    def _exec_item(self, item):
+        worker = copy.copy(self)
+        worker.__dict__.update(copy.deepcopy(self._item_state))
+        worker.fail = worker._fail_item
+
+        params = dict(self.module.params)
+        params.update((k, v) for k, v in item.items() if v is not None)
+        result = dict(item=dict((k, v) for k, v in item.items() if v is not None and not self._item_arg_spec[k].get('no_log')))
+        try:
+            worker.check_required(params)
+            result.update(worker.exec_module(**params))
+        except ItemFailed as exc:
+            result.update(worker.results, failed=True, msg=str(exc))
+        except TransformError as exc:
+            result.update(worker.results, failed=True, msg="Cannot build the request body: {0}".format(exc))
+        except Exception as exc:
+            result.update(worker.results, failed=True, msg=str(exc), exception=traceback.format_exc())
+        return result
+
+    def _fail_item(self, msg, **kwargs):
+        raise ItemFailed(msg)
+
+    def get_poller_result(self, poller, wait=5):
+        '''
+        Return the result of a long running create, update or action, awaited for at most
+        wait_timeout seconds.
+
+        Without wait_for_completion the operation is not awaited: its URL is returned in
+        results['operation_url'], to be awaited later with azure_rm_async_wait, and the result is
+        the resource as Azure accepted it.
+        '''
+        url = operation_url(poller)
+        if not self.module.params['wait_for_completion'] and url:
+            self.results['operation_url'] = url
+            return accepted_resource(poller)
+        timeout = self.module.params['wait_timeout']
+        deadline = time.time() + timeout
+        while not poller.done():
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                # the operation goes on, it can still be awaited with azure_rm_async_wait
+                self.fail("Timed out after {0} seconds waiting for the operation to complete".format(timeout), operation_url=url)
+            self.log("Waiting for {0} sec", min(wait, remaining))
+            poller.wait(timeout=min(wait, remaining))
+        return poller.result()
+
+    def wait_for_delete(self, poller, exists, title):
+        '''
+        Await a delete according to the module options.
+
+        With wait_for_completion the delete poller is followed and the resource probed until it is
+        gone (see azure_rm_wait.wait_for_deletion), otherwise the URL of the delete operation is
+        returned in results['operation_url'] so it can be awaited later.
+
+        :param poller: result of the SDK delete call
+        :param exists: callable returning a truthy value while the resource still exists
+        :param title: resource name used in error messages, e.g. 'SQL Server'
+        '''
+        if not self.module.params['wait_for_completion']:
+            url = operation_url(poller)
+            if url:
+                self.results['operation_url'] = url
+            return
+        timeout = self.module.params['wait_timeout']
+        try:
+            gone = wait_for_deletion(poller, exists, timeout, interval=self.module.params['poll_interval'])
+        except CloudError as exc:
+            self.fail("Error deleting the {0} instance: {1}".format(title, str(exc)))
+        if not gone:
+            self.fail("Timed out after {0} seconds waiting for the {1} instance to be deleted".format(timeout, title))
+
+
+AZURE_IDS_ARGS = dict(
+    ids=dict(
+        type='list'
+    )
+)
+
+AZURE_BACKEND_ARGS = dict(
+    backend=dict(
+        type='str',
+        default='sdk',
+        choices=['sdk', 'resource_graph']
+    )
+)
+
+AZURE_CHANGED_ARGS = dict(
+    changed_since=dict(
+        type='str'
+    ),
+    snapshot_file=dict(
+        type='path'
+    )
+)
+
+AZURE_SELECT_ARGS = dict(
+    select=dict(
+        type='list'
+    )
+)
+
+AZURE_PAGING_ARGS = dict(
+    page_size=dict(
+        type='int'
+    ),
+    max_items=dict(
+        type='int'
+    ),
+    next_link=dict(
+        type='str'
+    )
+)
+
+AZURE_OUTPUT_ARGS = dict(
+    output_file=dict(
+        type='path'
+    ),
+    output_format=dict(
+        type='str',
+        default='ndjson',
+        choices=list(FORMATS)
+    )
+)
+
+# facts module options Resource Graph queries and the resources API can filter on
+GRAPH_FILTERS = ('resource_group', 'name', 'location', 'tags')
+
+
+class AzureRMFactsModuleBase(AzureRMRunMixin, AzureRMModuleBase):
+    '''
+    Base class of facts modules.
+
+    Modules created with supports_ids get the ids option, a list of resource ids that are fetched
+    with ARM batch requests instead of one get() per resource. The other required options are then
+    only required when ids is not given.
+
+    Modules created with supports_resource_graph get the backend option, to list resources with an
+    Azure Resource Graph query instead of the SDK list operations. Their tag filters are also sent
+    to the resources API, so only tagged instances are read. They also get the changed_since and
+    snapshot_file options, to only fetch the instances changed since a time or since the previous
+    run (see list_changed()).
+
+    Modules created with supports_paging get the page_size, max_items and next_link options, to
+    read long lists in bounded pieces over several tasks (see paged()).
+
+    Modules created with supports_output get the output_file and output_format options, to write the
+    instances to a file as they are read instead of returning them (see write_output()); only a
+    summary of the file is returned.
+
+    All facts modules get the select option, a list of model attributes to return instead of the
+    fields picked by their format_response or format_item. Tokens are cached and requests throttled
+    like for resource modules.
+    '''
+
+    def __init__(self, derived_arg_spec, supports_ids=False, supports_resource_graph=False, supports_paging=False, supports_output=False,
+                 skip_exec=False, **kwargs):
+        self._facts_arg_spec = derived_arg_spec
+        merged_arg_spec = dict(AZURE_SELECT_ARGS)
+        if supports_ids:
+            merged_arg_spec.update(AZURE_IDS_ARGS)
+            derived_arg_spec = without_required(derived_arg_spec)
+        if supports_resource_graph:
+            merged_arg_spec.update(AZURE_BACKEND_ARGS)
+            merged_arg_spec.update(AZURE_CHANGED_ARGS)
+        if supports_paging:
+            merged_arg_spec.update(AZURE_PAGING_ARGS)
+        if supports_output:
+            merged_arg_spec.update(AZURE_OUTPUT_ARGS)
+        merged_arg_spec.update(derived_arg_spec)
+
+        # tags of facts modules are a list of filters, not a dictionary
+        kwargs.setdefault('facts_module', True)
+        use_token_cache()
+        self._throttle = throttle()
+        self._sink = None
+        self._sink_lock = threading.Lock()
+        super(AzureRMFactsModuleBase, self).__init__(merged_arg_spec, skip_exec=True, **kwargs)
+
+        if self.module.params.get('output_format') == 'parquet' and self.module.params.get('output_file') and not HAS_PYARROW:
+            self.fail(missing_required_lib('pyarrow'))
+
+        if self.module.params['select']:
+            # every format_response or format_item call site returns the projection instead
+            for name in ('format_response', 'format_item'):
+                if hasattr(self, name):
+                    setattr(self, name, self.select_response)
+
+        if not skip_exec:
+            if supports_ids and self.module.params['ids'] is None:
+                missing = missing_required(self._facts_arg_spec, self.module.params)
+                if missing:
+                    self.fail("missing required arguments: {0}".format(', '.join(missing)))
+            res = self.exec_module(**self.module.params)
+            self.module.exit_json(**self.add_throttling(self.close_output(res)))
+
+    def paged(self, response):
+        '''
+        Iterate over the instances of an SDK pager one service page at a time, within the limits
+        of the page_size and max_items options.
+
+        Instances are never collected beyond the current service page. When page_size stops the
+        iteration before the end of the list, results['next_link'] is set to a token that resumes
+        right after the last instance read, when passed back as next_link with the same options.
+
+        With output_file, instances having the tags of the tags option are written to the file
+        instead of being yielded.
+
+        :param response: Paged object returned by an SDK list operation, or a list
+        '''
+        params = self.module.params
+        page_size, max_items = params.get('page_size'), params.get('max_items')
+        try:
+            link, skip, read = decode_next_link(params.get('next_link'))
+        except (TypeError, ValueError):
+            self.fail("Invalid next_link {0}".format(params.get('next_link')))
+        pager = response if hasattr(response, 'advance_page') else None
+        if pager is not None:
+            pager.next_link = link
+        count = 0
+        while True:
+            if pager is None:
+                # operations returning a plain list have a single page
+                page, next_page = response, None
+            else:
+                page = pager.advance_page()
+                next_page = pager.next_link
+            for index, item in enumerate(page):
+                if index < skip:
+                    continue
+                if (page_size is not None and count >= page_size) or (max_items is not None and read >= max_items):
+                    self._set_next_link(link, index, read)
+                    return
+                count += 1
+                read += 1
+                if self.output_enabled():
+                    if self.has_tags(getattr(item, 'tags', None), params.get('tags')):
+                        self.write_output(item)
+                    continue
+                yield item
+            if next_page is None:
+                return
+            if (page_size is not None and count >= page_size) or (max_items is not None and read >= max_items):
+                self._set_next_link(next_page, 0, read)
+                return
+            link, skip = next_page, 0
+
+    def _set_next_link(self, link, skip, read):
+        max_items = self.module.params.get('max_items')
+        if max_items is None or read < max_items:
+            self.results['next_link'] = encode_next_link(link, skip, read)
+
+    def batch_get(self, operations, ids):
+        '''
+        Get resources by id with ARM batch requests.
+
+        Responses are deserialized into the model returned by operations.get(), so they can be
+        formatted exactly like its result.
+
+        :param operations: SDK operations group whose get() returns the resource type, e.g. self.mgmt_client.virtual_machines
+        :param ids: list of resource ids
+        :return: list of models in the order of ids, None for resources that could not be read
+        '''
+        model = get_model_name(operations)
+        if model is None:
+            self.fail("Getting {0} by id is not supported".format(type(operations).__name__))
+        try:
+            responses = batch_get(self.mgmt_client, ids, operations.api_version)
+        except CloudError as exc:
+            self.fail("Error in ARM batch request: {0}".format(str(exc)))
+        results = []
+        for resource_id, (status, content) in zip(ids, responses):
+            if status == 200 and content:
+                results.append(operations._deserialize(model, content))
+            else:
+                self.log("Could not get {0}: {1} {2}", resource_id, status, content)
+                results.append(None)
+        return results
+
+    def get_mgmt_svc_client(self, client_type, *args, **kwargs):
+        '''
+        Return a management client, sending its requests through the connection broker named by
+        AZURE_RM_BROKER when that is set, and through the rate limiter (see azure_rm_throttle).
+
+        :param client_type: client class, or its import path (see import_client_type)
+        '''
+        client_type = import_client_type(client_type, self.fail)
+        client = attach(super(AzureRMFactsModuleBase, self).get_mgmt_svc_client(client_type, *args, **kwargs))
+        return attach_throttle(client, self._throttle)
+
+    def fail(self, msg, **kwargs):
+        if self._sink is not None:
+            self._sink.abort()
+            self._sink = None
+        super(AzureRMFactsModuleBase, self).fail(msg, **kwargs)
+
+    def output_enabled(self):
+        return bool(self.module.params.get('output_file'))
+
+    def write_output(self, item):
+        '''
+        Write an instance (a model or a dictionary) to output_file, whole or the attributes of the
+        select option. The file is opened with the first instance, CSV and Parquet columns are the
+        attributes of its model (see azure_rm_sink.model_columns). Safe to call from several threads.
+        '''
+        fields = self.module.params['select']
+        with self._sink_lock:
+            if self._sink is None:
+                self._sink = self._open_output(model_columns(item, fields))
+        self._sink.write(select_fields(item, fields) if fields else _serialize(item))
+
+    def close_output(self, res):
+        '''
+        Move output_file in place and return the summary of it in res: output_file, count (instances
+        written) and bytes. Does nothing without output_file.
+        '''
+        if not self.output_enabled():
+            return res
+        if self._sink is None:
+            # nothing was found, the file is still replaced
+            self._sink = self._open_output(model_columns({}, self.module.params['select']))
+        summary = self._sink.close()
+        self._sink = None
+        res.update(output_file=summary['path'], count=summary['count'], bytes=summary['bytes'])
+        return res
+
+    def _open_output(self, columns):
+        params = self.module.params
+        try:
+            return open_sink(params['output_file'], params['output_format'], columns)
+        except (IOError, OSError) as exc:
+            self.fail("Cannot write {0}: {1}".format(params['output_file'], str(exc)))
+
+    def select_response(self, item):
+        '''
+        Project the attributes listed in the select option out of a model, serializing only them.
+        '''
+        return select_fields(item, self.module.params['select'])
+
+    def list_filtered(self, operations):
+        '''
+        List resources of the type returned by operations.get() with a server side filter: only
+        the changed ones with changed_since or snapshot_file, a Resource Graph query with
+        backend=resource_graph, otherwise a tag filtered resources API listing when tags are given.
+
+        The listings are complete, they are paged here in resource id order, within the limits of
+        the page_size and max_items options (see paged()).
+
+        :param operations: SDK operations group whose get() returns the resource type
+        :return: list of models, or None when the SDK list operations should be used
+        '''
+        params = self.module.params
+        if params.get('changed_since') or params.get('snapshot_file'):
+            response = self.list_changed(operations)
+        else:
+            response = None
+            if params.get('backend') == 'resource_graph':
+                response = self.query_resource_graph(operations)
+            if response is None:
+                response = self.list_by_tag(operations)
+        if response is None:
+            return None
+        return list(self.paged(sorted(response, key=lambda item: (getattr(item, 'id', None) or '').lower())))
+
+    def list_changed(self, operations):
+        '''
+        List resources of the type returned by operations.get() changed since a time.
+
+        The resources API lists the ids and changedTime of all resources of the type in the
+        resource group or subscription; only those changed since changed_since are fetched, with
+        ARM batch requests. With snapshot_file the ARM documents of all resources are kept in a
+        local snapshot: resources changed since its checkpoint (or changed_since) are fetched
+        again, the others taken from it, deleted ones dropped. The summary of the update is set in
+        results['snapshot'].
+
+        The resource_group, name, location and tags options are applied to the result.
+
+        :param operations: SDK operations group whose get() returns the resource type
+        :return: list of models, all those of the snapshot with snapshot_file
+        '''
+        params = self.module.params
+        model = get_model_name(operations)
+        rtype = resource_type((getattr(operations.get, 'metadata', None) or {}).get('url'))
+        other = [k for k in self._facts_arg_spec if k not in GRAPH_FILTERS and params.get(k) is not None]
+        if model is None or rtype is None or other:
+            self.fail("changed_since and snapshot_file can only be combined with options {0}".format(', '.join(GRAPH_FILTERS)))
+        since = None
+        if params.get('changed_since'):
+            try:
+                since = parse_time(params['changed_since'])
+            except ValueError:
+                self.fail("Invalid changed_since {0}, expected an ISO 8601 timestamp".format(params['changed_since']))
+        path = params.get('snapshot_file')
+        scope = dict(type=rtype.lower(), subscription=self.subscription_id.lower(), api_version=operations.api_version,
+                     resource_group=(params.get('resource_group') or '').lower() or None)
+        snapshot = load_snapshot(path, scope) if path else None
+        previous = snapshot['resources'] if snapshot else {}
+        if since is None and snapshot is not None:
+            since = snapshot['checkpoint'] - CHANGED_TIME_SKEW
+
+        checkpoint = time.time()
+        odata_filter = 'resourceType eq {0}'.format(odata_string(rtype))
+        self.log("Listing resources with $filter={0} changed since {1}", odata_filter, since)
+        resources = {}
+        stale = []
+        try:
+            for resource in list_resources(self.mgmt_client, self.subscription_id, params.get('resource_group'), odata_filter,
+                                           expand='changedTime'):
+                key = resource['id'].lower()
+                changed = resource.get('changedTime')
+                if since is None or not changed or parse_time(changed) >= since:
+                    stale.append(resource['id'])
+                elif key in previous:
+                    resources[key] = previous[key]
+                elif not path:
+                    # unchanged, and not returned without a snapshot
+                    continue
+                else:
+                    # missing from the snapshot
+                    stale.append(resource['id'])
+        except CloudError as exc:
+            self.fail("Error listing resources: {0}".format(str(exc)))
+
+        fetched = 0
+        if stale:
+            try:
+                responses = batch_get(self.mgmt_client, stale, operations.api_version)
+            except CloudError as exc:
+                self.fail("Error in ARM batch request: {0}".format(str(exc)))
+            for resource_id, (status, content) in zip(stale, responses):
+                if status == 200 and content:
+                    resources[resource_id.lower()] = content
+                    fetched += 1
+                else:
+                    # deleted since the listing
+                    self.log("Could not get {0}: {1} {2}", resource_id, status, content)
+        if path:
+            store_snapshot(path, scope, checkpoint, resources)
+            self.results['snapshot'] = dict(path=os.path.expanduser(path), fetched=fetched, count=len(resources),
+                                            removed=len(set(previous) - set(resources)),
+                                            checkpoint=datetime.datetime.utcfromtimestamp(checkpoint).strftime('%Y-%m-%dT%H:%M:%SZ'))
+
+        name = (params.get('name') or '').lower()
+        location = (params.get('location') or '').replace(' ', '').lower()
+        items = []
+        for key in sorted(resources):
+            body = resources[key]
+            if name and (body.get('name') or '').lower() != name:
+                continue
+            if location and (body.get('location') or '').replace(' ', '').lower() != location:
+                continue
+            item = operations._deserialize(model, body)
+            if self.has_tags(getattr(item, 'tags', None), params.get('tags')):
+                items.append(item)
+        return items
+
+    def list_by_tag(self, operations):
+        '''
+        List tagged resources of the type returned by operations.get().
+
+        The first tag filter is sent as $filter=tagName eq ... and tagValue eq ... to the resources
+        API of the resource group or subscription, which returns the ids of the matching resources
+        of every type. Those of this type are read with ARM batch requests and the remaining
+        filters (location, other tags) applied to them.
+
+        :param operations: SDK operations group whose get() returns the resource type
+        :return: list of models, or None when no tags are given or other options are set
+        '''
+        params = self.module.params
+        rtype = resource_type((getattr(operations.get, 'metadata', None) or {}).get('url'))
+        other = [k for k in self._facts_arg_spec if k not in GRAPH_FILTERS and params.get(k) is not None]
+        if not params.get('tags') or params.get('name') is not None or rtype is None or other:
+            return None
+        location = (params.get('location') or '').replace(' ', '').lower()
+        odata_filter = tag_filter(params['tags'][0])
+        self.log("Listing resources with $filter={0}", odata_filter)
+        try:
+            ids = [r['id'] for r in list_resources(self.mgmt_client, self.subscription_id, params.get('resource_group'), odata_filter)
+                   if (r.get('type') or '').lower() == rtype and
+                   (not location or (r.get('location') or '').replace(' ', '').lower() == location)]
+        except CloudError as exc:
+            self.fail("Error listing resources: {0}".format(str(exc)))
+        if not ids:
+            return []
+        return [item for item in self.batch_get(operations, ids) if item is not None and self.has_tags(item.tags, params['tags'])]
+
+    def query_resource_graph(self, operations):
+        '''
+        List resources of the type returned by operations.get() with one Resource Graph query.
+
+        The resource_group, name, location and tags options are translated into KQL filters and
+        only the ARM resource properties, or the columns holding the selected attributes, are
+        projected. All pages are read.
+
+        :param operations: SDK operations group whose get() returns the resource type
+        :return: list of models, or None when Resource Graph cannot answer the query (child
+                 resource types, or other filtering options set) and the SDK should be used
+        '''
+        model = get_model_name(operations)
+        rtype = resource_type((getattr(operations.get, 'metadata', None) or {}).get('url'))
+        params = self.module.params
+        other = [k for k in self._facts_arg_spec if k not in GRAPH_FILTERS and params.get(k) is not None]
+        if model is None or rtype is None or other:
+            self.log("Resource Graph cannot answer this query, using the SDK")
+            return None
+        columns = select_columns(params['select']) if params.get('select') else None
+        query = build_query(rtype, name=params.get('name'), resource_group=params.get('resource_group'),
+                            location=params.get('location'), tags=params.get('tags'), columns=columns)
+        self.log("Resource Graph query: {0}", query)
+        try:
+            return [operations._deserialize(model, row) for row in query_resources(self.mgmt_client, [self.subscription_id], query)]
+        except CloudError as exc:
+            self.fail("Error querying Resource Graph: {0}".format(str(exc)))
+
+
+def import_client_type(client_type, fail):
+    '''
+    Management client class for an import path such as 'azure.mgmt.sql.SqlManagementClient'.
+
+    Modules name their client by path so the SDK package is only imported once exec_module needs
+    a client. A path may name an API version package (e.g. azure.mgmt.network.v2018_08_01) to load
+    only that version's models. Classes are returned unchanged.
+    '''
+    if not isinstance(client_type, string_types):
+        return client_type
+    module_name, dummy, class_name = client_type.rpartition('.')
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        # pip package, e.g. azure-mgmt-rdbms for azure.mgmt.rdbms.mysql
+        fail(missing_required_lib('-'.join(module_name.split('.')[:3])), exception=traceback.format_exc())
+
+
+def get_model_name(operations):
+    '''
+    Name of the model returned by operations.get(), taken from its documented return type.
+    '''
+    match = re.search(r':rtype:\s*~?(?:[\w]+\.)*(\w+)', getattr(operations.get, '__doc__', None) or '')
+    return match.group(1) if match else None
+
+
+def select_fields(item, fields):
+    '''
+    Dictionary of the attributes of a model (or dictionary) named in fields. Nested attributes are
+    written with dots, e.g. 'hardware_profile.vm_size', and are applied to every element of lists.
+    Only the selected values are serialized.
+    '''
+    tree = {}
+    for field in fields:
+        node = tree
+        for part in field.split('.'):
+            node = node.setdefault(part, {})
+    return _project(item, tree)
+
+
+def _project(value, tree):
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [_project(v, tree) for v in value]
+    if not tree:
+        return _serialize(value)
+    if isinstance(value, dict):
+        return dict((k, _project(value.get(k), sub)) for k, sub in tree.items())
+    return dict((k, _project(getattr(value, k, None), sub)) for k, sub in tree.items())
+
+
+def _serialize(value):
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    if isinstance(value, dict):
+        return dict((k, _serialize(v)) for k, v in value.items())
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    # enums
+    return getattr(value, 'value', value)
+
+
+def encode_next_link(link, skip, read):
+    '''
+    Continuation token: the link of a service page, how many instances of it to skip and how many
+    instances were read before.
+    '''
+    return base64.urlsafe_b64encode(json.dumps([link, skip, read]).encode('utf-8')).decode('ascii')
+
+
+def decode_next_link(token):
+    '''
+    Link, skip and read count of a continuation token, ('', 0, 0) to start from the first page.
+    '''
+    if not token:
+        return '', 0, 0
+    link, skip, read = json.loads(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+    return link, skip, read
+
+
+def without_required(arg_spec):
+    return dict((k, dict((o, v) for o, v in spec.items() if o != 'required')) for k, spec in arg_spec.items())
+
+
+def missing_required(arg_spec, params):
+    return sorted(k for k, spec in arg_spec.items() if spec.get('required') and params.get(k) is None)
+
+
+def items_arg_spec(derived_arg_spec):
+    '''
+    Argument spec of the items and concurrency options for a module argument spec.
+
+    Item options have no defaults and are not required, values missing in an item are taken from
+    the module options.
+    '''
+    item_options = dict((k, dict((o, v) for o, v in spec.items() if o not in ('required', 'default')))
+                        for k, spec in derived_arg_spec.items())
+    return dict(
+        items=dict(
+            type='list',
+            elements='dict',
+            options=item_options
+        ),
+        concurrency=dict(
+            type='int',
+            default=DEFAULT_CONCURRENCY
+        )
+    )
@@ -0,0 +1,96 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Azure Resource Manager batch requests (POST /batch), many resource requests per HTTP round trip.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import time
+import uuid
+from multiprocessing.pool import ThreadPool
+
+from ansible.module_utils.azure_rm_wait import DEFAULT_WAIT_TIMEOUT, backoff_delays, retry_after_header
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+BATCH_API_VERSION = '2015-11-01'
+BATCH_SIZE = 20
+BATCH_CONCURRENCY = 4
+BATCH_POLL_INTERVAL = 2
+
+
+def batch_get(client, resource_ids, api_version, batch_size=BATCH_SIZE, concurrency=BATCH_CONCURRENCY, timeout=DEFAULT_WAIT_TIMEOUT):
+    '''
+    GET many resources by id through the ARM batch endpoint.
+
+    Ids are sent in batches of batch_size, up to concurrency batches at a time, over the
+    connection and credentials of an existing management client.
+
+    :param client: management client (SDKClient), provides the pipeline, base_url and credentials
+    :param resource_ids: list of resource ids
+    :param api_version: api-version of the resource type
+    :param timeout: seconds a batch processed asynchronously is awaited
+    :return: list of (status_code, content) tuples in the order of resource_ids
+    '''
+    requests = [dict(httpMethod='GET', url='{0}?api-version={1}'.format(resource_id, api_version))
+                for resource_id in resource_ids]
+    return send_batch(client, requests, batch_size, concurrency, timeout)
+
+
+def send_batch(client, requests, batch_size=BATCH_SIZE, concurrency=BATCH_CONCURRENCY, timeout=DEFAULT_WAIT_TIMEOUT):
+    '''
+    Send requests ({httpMethod, url[, content]}) through the ARM batch endpoint.
+
+    Batches Azure accepts with 202 are polled at their Location URL with backoff, for at most
+    timeout seconds; CloudError is raised when one is not finished by then.
+
+    :return: list of (status_code, content) tuples in the order of requests
+    '''
+    chunks = [requests[i:i + batch_size] for i in range(0, len(requests), batch_size)]
+    if len(chunks) <= 1:
+        responses = [_send_chunk(client, chunk, timeout) for chunk in chunks]
+    else:
+        pool = ThreadPool(min(concurrency, len(chunks)))
+        try:
+            responses = pool.map(lambda chunk: _send_chunk(client, chunk, timeout), chunks)
+        finally:
+            pool.close()
+            pool.join()
+    return [response for chunk in responses for response in chunk]
+
+
+def _send_chunk(client, chunk, timeout):
+    names = [str(uuid.uuid4()) for r in chunk]
+    body = dict(requests=[dict(r, name=name) for r, name in zip(chunk, names)])
+    url = client.config.base_url.rstrip('/') + '/batch'
+    request = client._client.post(url, {'api-version': BATCH_API_VERSION})
+    # the pipeline serializes content to JSON
+    response = client._client.send(request, headers={'Content-Type': 'application/json; charset=utf-8'}, content=body)
+    # large batches may be accepted and processed asynchronously
+    deadline = time.time() + timeout
+    delays = backoff_delays(initial=BATCH_POLL_INTERVAL)
+    while response.status_code == 202:
+        location = response.headers.get('Location')
+        if not location:
+            raise CloudError(response, error='Batch request accepted without a Location to poll')
+        delay = max(retry_after_header(response.headers), next(delays))
+        if time.time() + delay > deadline:
+            raise CloudError(response, error='Batch request not finished after {0} seconds'.format(timeout))
+        time.sleep(delay)
+        response = client._client.send(client._client.get(location))
+    if response.status_code != 200:
+        raise CloudError(response)
+    responses = response.json().get('responses', [])
+    by_name = dict((r.get('name'), r) for r in responses)
+    if not all(name in by_name for name in names):
+        # responses without names are in request order
+        by_name = dict(zip(names, responses))
+    results = []
+    for name in names:
+        r = by_name.get(name) or {}
+        results.append((r.get('httpStatusCode', 500), r.get('content')))
+    return results
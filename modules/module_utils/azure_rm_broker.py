@@ -0,0 +1,338 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Local connection broker: a long lived process that sends the HTTP requests of many module
+# invocations over one pool of keep-alive connections.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import errno
+import fcntl
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+from io import BytesIO
+
+try:
+    from socketserver import StreamRequestHandler, ThreadingMixIn, UnixStreamServer
+except ImportError:
+    from SocketServer import StreamRequestHandler, ThreadingMixIn, UnixStreamServer
+
+try:
+    import requests
+    from requests.adapters import BaseAdapter, HTTPAdapter
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+except ImportError:
+    # This is handled in azure_rm_common
+    BaseAdapter = object
+
+try:
+    from msrest.universal_http.requests import ClientRetryPolicy
+except ImportError:
+    ClientRetryPolicy = None
+
+# environment variable naming the broker socket, the broker is not used when it is not set
+BROKER_ENV = 'AZURE_RM_BROKER'
+# seconds without requests after which the broker exits
+BROKER_IDLE_ENV = 'AZURE_RM_BROKER_IDLE'
+DEFAULT_IDLE_TIMEOUT = 300
+START_TIMEOUT = 10
+POOL_SIZE = 32
+
+# runs this file as a top level module, it only needs the standard library and requests
+BROKER_MAIN = '''
+import sys
+from azure_rm_broker import serve
+serve(sys.argv[1], float(sys.argv[2]))
+'''
+
+
+def send_frame(sock, message):
+    payload = json.dumps(message).encode('utf-8')
+    sock.sendall(struct.pack('>I', len(payload)) + payload)
+
+
+def recv_frame(sock):
+    header = _recv_exactly(sock, 4)
+    if header is None:
+        return None
+    payload = _recv_exactly(sock, struct.unpack('>I', header)[0])
+    if payload is None:
+        return None
+    return json.loads(payload.decode('utf-8'))
+
+
+def _recv_exactly(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 16))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _encode(body):
+    if body is None:
+        return None
+    if not isinstance(body, bytes):
+        body = body.encode('utf-8')
+    return base64.b64encode(body).decode('ascii')
+
+
+def _decode(body):
+    return base64.b64decode(body) if body else b''
+
+
+def retrying_adapter(**kwargs):
+    '''
+    HTTPAdapter retrying like the SDK clients do by default, except for 429 and 503.
+    '''
+    if ClientRetryPolicy is not None:
+        retry = ClientRetryPolicy()()
+        # the modules retry these themselves, within their retry budget (see azure_rm_throttle)
+        retry.status_forcelist = [c for c in retry.status_forcelist if c not in (429, 503)]
+        retry.respect_retry_after_header = False
+        kwargs['max_retries'] = retry
+    return HTTPAdapter(**kwargs)
+
+
+# client side
+
+class BrokerAdapter(BaseAdapter):
+    '''
+    requests transport adapter that hands requests to the broker listening on path.
+
+    The broker is started when nobody listens on path yet. Each thread keeps its own connection to
+    the broker; when the broker cannot be reached requests are sent directly.
+    '''
+
+    def __init__(self, path, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        super(BrokerAdapter, self).__init__()
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.direct = retrying_adapter()
+        self._local = threading.local()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if cert is not None or not isinstance(request.body, (type(None), bytes, type(u''))):
+            # client certificates stay in this process, streamed bodies are not forwarded
+            return self.direct.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        message = dict(method=request.method, url=request.url, headers=dict(request.headers), body=_encode(request.body),
+                       timeout=list(timeout) if isinstance(timeout, tuple) else timeout, verify=verify, proxies=proxies or {})
+        try:
+            reply = self._exchange(message)
+        except (IOError, OSError, ValueError):
+            self._close_connection()
+            reply = None
+        if reply is None:
+            return self.direct.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        if reply.get('error'):
+            raise requests.ConnectionError(reply['error'], request=request)
+        return self.build_response(request, reply)
+
+    def build_response(self, request, reply):
+        response = requests.Response()
+        response.status_code = reply['status']
+        response.reason = reply.get('reason')
+        response.headers = CaseInsensitiveDict(reply.get('headers') or {})
+        response.encoding = get_encoding_from_headers(response.headers)
+        content = _decode(reply.get('body'))
+        response.raw = BytesIO(content)
+        response._content = content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        self._close_connection()
+        self.direct.close()
+
+    def _exchange(self, message):
+        sock = getattr(self._local, 'sock', None)
+        if sock is None:
+            sock = self._local.sock = connect(self.path, self.idle_timeout)
+            if sock is None:
+                return None
+        send_frame(sock, message)
+        reply = recv_frame(sock)
+        if reply is None:
+            raise IOError(errno.ECONNRESET, 'broker closed the connection')
+        return reply
+
+    def _close_connection(self):
+        sock = getattr(self._local, 'sock', None)
+        self._local.sock = None
+        if sock is not None:
+            sock.close()
+
+
+def connect(path, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    '''
+    Connect to the broker on path, starting it first if nobody listens there.
+
+    :return: connected socket, None when the broker could not be started
+    '''
+    sock = _try_connect(path)
+    if sock is not None:
+        return sock
+    # one process starts the broker, the others wait for it
+    lock = os.open(path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        sock = _try_connect(path)
+        if sock is not None:
+            return sock
+        start_broker(path, idle_timeout)
+        deadline = time.time() + START_TIMEOUT
+        while sock is None and time.time() < deadline:
+            time.sleep(0.05)
+            sock = _try_connect(path)
+        return sock
+    finally:
+        fcntl.flock(lock, fcntl.LOCK_UN)
+        os.close(lock)
+
+
+def _try_connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        return sock
+    except (IOError, OSError):
+        sock.close()
+        return None
+
+
+def start_broker(path, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    '''
+    Start a detached broker process listening on path.
+    '''
+    env = dict(os.environ)
+    # the directory of this file may be inside the module zip, zipimport handles that
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.abspath(__file__))] + [p for p in sys.path if p])
+    with open(os.devnull, 'r+b') as devnull:
+        subprocess.Popen([sys.executable, '-c', BROKER_MAIN, path, str(idle_timeout)], env=env, close_fds=True,
+                         stdin=devnull, stdout=devnull, stderr=devnull, preexec_fn=os.setsid)
+
+
+def attach(client, path=None):
+    '''
+    Route the requests of a management client through the broker on path, or the one named by
+    AZURE_RM_BROKER. Nothing changes when neither is set.
+    '''
+    path = path or os.environ.get(BROKER_ENV)
+    if not path:
+        return client
+    adapter = _adapter(path)
+    configure = client.config.session_configuration_callback
+
+    def session_configuration(session, global_config, local_config, **kwargs):
+        if session.get_adapter('https://') is not adapter:
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        return configure(session, global_config, local_config, **kwargs)
+
+    client.config.session_configuration_callback = session_configuration
+    return client
+
+
+_adapters = {}
+_adapters_lock = threading.Lock()
+
+
+def _adapter(path):
+    with _adapters_lock:
+        if path not in _adapters:
+            _adapters[path] = BrokerAdapter(path, float(os.environ.get(BROKER_IDLE_ENV) or DEFAULT_IDLE_TIMEOUT))
+        return _adapters[path]
+
+
+# broker side
+
+class BrokerServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, idle_timeout):
+        UnixStreamServer.__init__(self, path, BrokerRequestHandler)
+        self.idle_timeout = idle_timeout
+        self.last_activity = time.time()
+        self.active = 0
+        self.lock = threading.Lock()
+        self.session = requests.Session()
+        # proxies and CA bundles come resolved from the clients
+        self.session.trust_env = False
+        adapter = retrying_adapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def forward(self, message):
+        timeout = message.get('timeout')
+        try:
+            response = self.session.request(message['method'], message['url'], headers=message.get('headers'),
+                                            data=_decode(message.get('body')) if message.get('body') else None,
+                                            timeout=tuple(timeout) if isinstance(timeout, list) else timeout,
+                                            verify=message.get('verify', True), proxies=message.get('proxies'),
+                                            allow_redirects=False)
+        except requests.RequestException as exc:
+            return dict(error=str(exc))
+        return dict(status=response.status_code, reason=response.reason, headers=dict(response.headers),
+                    body=_encode(response.content))
+
+    def busy(self, delta):
+        with self.lock:
+            self.active += delta
+            self.last_activity = time.time()
+
+    def idle(self):
+        with self.lock:
+            return self.active == 0 and time.time() - self.last_activity > self.idle_timeout
+
+
+class BrokerRequestHandler(StreamRequestHandler):
+    def handle(self):
+        while True:
+            message = recv_frame(self.request)
+            if message is None:
+                return
+            self.server.busy(1)
+            try:
+                reply = self.server.forward(message)
+            finally:
+                self.server.busy(-1)
+            send_frame(self.request, reply)
+
+
+def serve(path, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    '''
+    Run the broker on path until it has been idle for idle_timeout seconds.
+    '''
+    if os.path.exists(path):
+        # left behind by a broker that did not exit cleanly, nobody answered on it
+        os.unlink(path)
+    old_umask = os.umask(0o177)
+    try:
+        server = BrokerServer(path, idle_timeout)
+    finally:
+        os.umask(old_umask)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        while not server.idle():
+            time.sleep(min(1.0, idle_timeout))
+    finally:
+        server.shutdown()
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
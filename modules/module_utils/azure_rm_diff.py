@@ -0,0 +1,374 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Shared parameter transformation and comparison helpers for azure_rm_* resource modules.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.common.dict_transformations import _snake_to_camel
+from ansible.module_utils.six import string_types
+
+
+class TransformError(ValueError):
+    '''Raised when the rules registered on a DictTransform cannot describe a valid request body.'''
+    pass
+
+
+class DictTransform(object):
+    '''
+    Path based transformation pipeline for module parameter envelopes.
+
+    Rules are registered in the same order the legacy dict_* helpers were called. On first use
+    all rules are compiled into a single tree keyed by path segment, so the envelope is walked
+    once regardless of the number of rules instead of once per rule.
+
+    Example:
+        transform = DictTransform()
+        transform.camelize(['sku', 'name'], True)
+        transform.map(['sku', 'name'], {'waf_medium': 'WAF_Medium'})
+        transform.apply(self.parameters)
+    '''
+
+    def __init__(self):
+        self._rules = []
+        self._compiled = None
+
+    def camelize(self, path, camelize_first):
+        return self._add(path, _camelize_leaf, camelize_first)
+
+    def map(self, path, map):
+        return self._add(path, _map_leaf, map)
+
+    def upper(self, path):
+        return self._add(path, _upper_leaf)
+
+    def resource_id(self, path, **kwargs):
+        return self._add(path, _resource_id_leaf, kwargs)
+
+    def rename(self, path, new_name):
+        return self._add(path, _rename_leaf, new_name, structural=True)
+
+    def expand(self, path, outer_dict_name=None):
+        return self._add(path, _expand_leaf, outer_dict_name, structural=True)
+
+    def apply(self, d):
+        '''
+        Apply all registered rules to d in place.
+
+        :param d: parameter envelope (dict or list of dicts)
+        :return: d
+        '''
+        if self._compiled is None:
+            self._compiled = self._compile()
+        _walk(self._compiled, d)
+        return d
+
+    def _add(self, path, leaf, arg=None, structural=False):
+        self._rules.append((list(path), leaf, arg, structural))
+        self._compiled = None
+        return self
+
+    def _compile(self):
+        root = _Node()
+        for path, leaf, arg, structural in self._rules:
+            if leaf is _expand_leaf and arg is None:
+                # without a target the value would silently stay out of the request body
+                raise TransformError("expand of {0} needs the name of the dictionary to move it into".format('.'.join(path)))
+            node = root
+            for key in path[:-1]:
+                node = node.entry(key).descend()
+            node.entry(path[-1]).actions.append((leaf, arg))
+            if structural:
+                # keys after a rename / expand may refer to the moved value, so they must not be
+                # merged into entries that run before it
+                node.seal()
+        return root.freeze()
+
+
+class _Node(object):
+    def __init__(self):
+        self.entries = []
+        self.index = {}
+
+    def entry(self, key):
+        entry = self.index.get(key)
+        if entry is None:
+            entry = _Entry(key)
+            self.entries.append(entry)
+            self.index[key] = entry
+        return entry
+
+    def seal(self):
+        self.index = {}
+
+    def freeze(self):
+        return [(entry.key, [(leaf, arg.freeze() if isinstance(arg, _Node) else arg) for leaf, arg in entry.actions])
+                for entry in self.entries]
+
+
+class _Entry(object):
+    def __init__(self, key):
+        self.key = key
+        self.actions = []
+
+    def descend(self):
+        if self.actions and self.actions[-1][0] is _walk_key:
+            return self.actions[-1][1]
+        node = _Node()
+        self.actions.append((_walk_key, node))
+        return node
+
+
+def _walk(steps, d):
+    if isinstance(d, list):
+        for item in d:
+            _walk(steps, item)
+    elif isinstance(d, dict):
+        for key, actions in steps:
+            for leaf, arg in actions:
+                leaf(d, key, arg)
+
+
+def _walk_key(d, key, steps):
+    sd = d.get(key, None)
+    if sd is not None:
+        _walk(steps, sd)
+
+
+def _camelize_leaf(d, key, camelize_first):
+    old_value = d.get(key, None)
+    if old_value is not None:
+        d[key] = _snake_to_camel(old_value, camelize_first)
+
+
+def _map_leaf(d, key, map):
+    old_value = d.get(key, None)
+    if old_value is not None:
+        d[key] = map.get(old_value, old_value)
+
+
+def _upper_leaf(d, key, arg):
+    old_value = d.get(key, None)
+    if old_value is not None:
+        d[key] = old_value.upper()
+
+
+def _resource_id_leaf(d, key, kwargs):
+    old_value = d.get(key, None)
+    if isinstance(old_value, dict) and old_value.get('namespace') and old_value.get('types'):
+        from ansible.module_utils.azure_rm_common import format_resource_id
+        d[key] = format_resource_id(val=old_value['name'],
+                                    subscription_id=old_value.get('subscription_id') or kwargs.get('subscription_id'),
+                                    namespace=old_value['namespace'],
+                                    types=old_value['types'],
+                                    resource_group=old_value.get('resource_group') or kwargs.get('resource_group'))
+
+
+def _rename_leaf(d, key, new_name):
+    old_value = d.pop(key, None)
+    if old_value is not None:
+        d[new_name] = old_value
+
+
+def _expand_leaf(d, key, outer_dict_name):
+    old_value = d.pop(key, None)
+    if old_value is not None:
+        d.setdefault(outer_dict_name, {})[key] = old_value
+
+
+def dict_camelize(d, path, camelize_first):
+    DictTransform().camelize(path, camelize_first).apply(d)
+
+
+def dict_map(d, path, map):
+    DictTransform().map(path, map).apply(d)
+
+
+def dict_upper(d, path):
+    DictTransform().upper(path).apply(d)
+
+
+def dict_resource_id(d, path, **kwargs):
+    DictTransform().resource_id(path, **kwargs).apply(d)
+
+
+def dict_rename(d, path, new_name):
+    DictTransform().rename(path, new_name).apply(d)
+
+
+def dict_expand(d, path, outer_dict_name=None):
+    DictTransform().expand(path, outer_dict_name).apply(d)
+
+
+def dict_flatten(d, outer_dict_name='properties'):
+    '''
+    Return a copy of d with the keys of d[outer_dict_name] moved up to the top level.
+
+    For calls whose SDK model flattens its properties (e.g. ServerUpdateParameters), where the keys
+    expanded into outer_dict_name for the create call would otherwise be dropped from the body.
+    '''
+    flat = dict((key, value) for key, value in d.items() if key != outer_dict_name)
+    flat.update(d.get(outer_dict_name) or {})
+    return flat
+
+
+def structural_diff(new, old, path=''):
+    '''
+    Compare desired state against the current state of a resource in a single walk.
+
+    Only values present in "new" are compared, values set to None are ignored. Lists of
+    dictionaries are matched by "id" or "name" through a dictionary, so the order of elements
+    does not matter. Lists of scalars are compared as multisets.
+
+    :param new: desired state (module parameters)
+    :param old: current state (deserialized resource)
+    :param path: JSON pointer of new / old within the whole document
+    :return: list of changes, each a dict with "path" (JSON pointer), "op" (add, replace or remove),
+             "before" and "after". List indexes in "add" / "replace" paths refer to the desired
+             state, indexes in "remove" paths refer to the current state.
+    '''
+    changes = []
+    _diff(new, old, [path], changes)
+    return changes
+
+
+def diff_summary(changes):
+    '''
+    Convert a change list into the before / after form used by the Ansible diff callback.
+    '''
+    return {
+        'before': dict((c['path'], c['before']) for c in changes if c['op'] != 'add'),
+        'after': dict((c['path'], c['after']) for c in changes if c['op'] != 'remove')
+    }
+
+
+def _pointer(parts):
+    # parts are kept unescaped while walking, the pointer is only rendered for a change
+    return parts[0] + ''.join('/' + str(p).replace('~', '~0').replace('/', '~1') for p in parts[1:])
+
+
+def _change(parts, op, before, after):
+    return dict(path=_pointer(parts), op=op, before=before, after=after)
+
+
+def _diff(new, old, parts, changes):
+    if isinstance(new, dict):
+        if not isinstance(old, dict):
+            changes.append(_change(parts, 'add' if old is None else 'replace', old, new))
+            return
+        for k, v in new.items():
+            if v is None:
+                continue
+            o = old.get(k, None)
+            if v == o and not isinstance(v, (dict, list)):
+                continue
+            parts.append(k)
+            _diff(v, o, parts, changes)
+            parts.pop()
+    elif isinstance(new, list):
+        if not isinstance(old, list):
+            changes.append(_change(parts, 'add' if old is None else 'replace', old, new))
+        elif new and isinstance(new[0], dict) and old and isinstance(old[0], dict):
+            _diff_keyed_list(new, old, parts, changes)
+        elif not _same_items(new, old):
+            changes.append(_change(parts, 'replace', old, new))
+    elif new is not None and new != old:
+        if (len(parts) == 2 and parts[0] == '' and parts[1] == 'location' and
+                isinstance(new, string_types) and isinstance(old, string_types) and
+                new.replace(' ', '').lower() == old.replace(' ', '').lower()):
+            return
+        changes.append(_change(parts, 'add' if old is None else 'replace', old, new))
+
+
+def _list_key(new, old):
+    for key in ('id', 'name'):
+        old_keys = set()
+        for x in old:
+            if not isinstance(x, dict) or key not in x:
+                break
+            old_keys.add(_hashable(x[key]))
+        else:
+            if len(old_keys) == len(old) and all(isinstance(x, dict) and key in x for x in new):
+                return key
+    return None
+
+
+def _diff_keyed_list(new, old, parts, changes):
+    key = _list_key(new, old)
+    if key is None:
+        # no usable identity, fall back to comparing elements in sorted order
+        if len(new) != len(old):
+            changes.append(_change(parts, 'replace', old, new))
+            return
+        sort_key = next(iter(old[0]))
+        new_sorted = sorted(enumerate(new), key=lambda x: _sort_value(x[1].get(sort_key) if isinstance(x[1], dict) else x[1]))
+        old_sorted = sorted(old, key=lambda x: _sort_value(x.get(sort_key) if isinstance(x, dict) else x))
+        for (i, n), o in zip(new_sorted, old_sorted):
+            parts.append(i)
+            _diff(n, o, parts, changes)
+            parts.pop()
+        return
+    old_by_key = dict((_hashable(x[key]), (i, x)) for i, x in enumerate(old))
+    matched = set()
+    for i, n in enumerate(new):
+        k = _hashable(n[key])
+        parts.append(i)
+        if k in old_by_key:
+            matched.add(k)
+            _diff(n, old_by_key[k][1], parts, changes)
+        else:
+            changes.append(_change(parts, 'add', None, n))
+        parts.pop()
+    for k, (i, o) in old_by_key.items():
+        if k not in matched:
+            parts.append(i)
+            changes.append(_change(parts, 'remove', o, None))
+            parts.pop()
+
+
+def _hashable(value):
+    # resource ids are case insensitive
+    return value.lower() if isinstance(value, string_types) and value.startswith('/subscriptions/') else value
+
+
+def _sort_value(value):
+    return (value is None, str(value))
+
+
+def _same_items(new, old):
+    if len(new) != len(old):
+        return False
+    try:
+        counts = {}
+        for x in new:
+            counts[x] = counts.get(x, 0) + 1
+        for x in old:
+            if not counts.get(x):
+                return False
+            counts[x] -= 1
+        return True
+    except TypeError:
+        return sorted(new, key=_sort_value) == sorted(old, key=_sort_value)
+
+
+def default_compare(new, old, path, result):
+    '''
+    Compare desired state against current state.
+
+    All differences are collected in one walk (see structural_diff). Paths of changed values are
+    stored in result['compare'] and their before / after values in result['diff'].
+
+    :return: True if no difference was found.
+    '''
+    changes = structural_diff(new, old, path)
+    record_changes(changes, result)
+    return not changes
+
+
+def record_changes(changes, result):
+    '''
+    Store the paths of changes in result['compare'] and their before / after values in result['diff'].
+    '''
+    if changes:
+        result['compare'] = [c['path'] for c in changes]
+        result['diff'] = diff_summary(changes)
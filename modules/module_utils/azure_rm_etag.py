@@ -0,0 +1,193 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# ETag cache: conditional GETs (If-None-Match) of resources seen in earlier runs and If-Match on
+# the PUT / PATCH that follows a GET.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlparse
+
+try:
+    from requests.adapters import BaseAdapter
+except ImportError:
+    # This is handled in azure_rm_common
+    BaseAdapter = object
+
+# environment variable naming the cache directory, the cache is off when it is not set
+ETAG_CACHE_ENV = 'AZURE_RM_ETAG_CACHE'
+
+
+class NotModified(Exception):
+    '''
+    Raised from the transport when the service answers a conditional GET with 304; entry is the
+    cache entry of the resource.
+    '''
+
+    def __init__(self, key, entry):
+        super(NotModified, self).__init__('{0} not modified'.format(key))
+        self.key = key
+        self.entry = entry
+
+
+def resource_key(url):
+    '''
+    Cache key of a request URL: the lower case path (resource ids are case insensitive) and the
+    api-version, which decides the shape of the body.
+    '''
+    parsed = urlparse(url)
+    api_version = parse_qs(parsed.query).get('api-version', [''])[0]
+    return '{0}?api-version={1}'.format(parsed.path.rstrip('/').lower(), api_version)
+
+
+class ETagCache(object):
+    '''
+    One JSON file per resource in a directory: the ETag of the resource, its state as the module
+    last saw it and the fingerprint of the desired state it last matched.
+
+    Files are replaced atomically and only readable by their owner, states may hold secrets.
+    '''
+
+    def __init__(self, directory):
+        self.directory = os.path.expanduser(directory)
+
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+    def load(self, key):
+        try:
+            with open(self.path(key)) as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        # a hash collision or a file of another version
+        return entry if entry.get('key') == key else None
+
+    def store(self, key, entry):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, 0o700)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.etag')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(dict(entry, key=key), f)
+            os.rename(tmp, self.path(key))
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def drop(self, key):
+        try:
+            os.unlink(self.path(key))
+        except OSError:
+            pass
+
+
+class ETagTracker(object):
+    '''
+    State of one module run: the cache (None to only track ETags), the ETags and URLs of the GETs
+    of the run and, per thread, the key of the last GET.
+    '''
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.etags = {}
+        self.urls = {}
+        self._local = threading.local()
+
+    @property
+    def last_get(self):
+        return getattr(self._local, 'last_get', None)
+
+    @last_get.setter
+    def last_get(self, key):
+        self._local.last_get = key
+
+
+class ETagAdapter(BaseAdapter):
+    '''
+    requests transport adapter in front of another one.
+
+    GETs of resources with a cache entry carry If-None-Match; a 304 raises NotModified, which
+    passes through the SDK to AzureRMResourceModuleBase.cached_get(). PUTs and PATCHes carry
+    If-Match with the ETag the run got from its GET, unless the module set one; they and DELETEs
+    drop the cache entry.
+    '''
+
+    def __init__(self, inner, tracker):
+        super(ETagAdapter, self).__init__()
+        self.inner = inner
+        self.tracker = tracker
+
+    def send(self, request, **kwargs):
+        key = resource_key(request.url)
+        entry = None
+        cache = self.tracker.cache
+        if request.method == 'GET':
+            self.tracker.last_get = key
+            self.tracker.urls[key] = request.url
+            entry = cache.load(key) if cache else None
+            if entry and 'If-None-Match' not in request.headers:
+                request.headers['If-None-Match'] = entry['etag']
+        elif request.method in ('PUT', 'PATCH') and key in self.tracker.etags and 'If-Match' not in request.headers:
+            request.headers['If-Match'] = self.tracker.etags[key]
+
+        response = self.inner.send(request, **kwargs)
+
+        if request.method == 'GET':
+            if response.status_code == 304 and entry:
+                self.tracker.etags[key] = entry['etag']
+                raise NotModified(key, entry)
+            if response.status_code == 200 and response.headers.get('ETag'):
+                self.tracker.etags[key] = response.headers['ETag']
+        elif request.method in ('PUT', 'PATCH', 'DELETE') and cache:
+            cache.drop(key)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+def attach(client, tracker):
+    '''
+    Route the requests of a management client through an ETagAdapter of tracker, in front of
+    whatever adapter the session has (see azure_rm_broker.attach).
+    '''
+    configure = client.config.session_configuration_callback
+    # by inner adapter, callbacks before this one may mount theirs again for every request
+    wrappers = {}
+
+    def session_configuration(session, global_config, local_config, **kwargs):
+        result = configure(session, global_config, local_config, **kwargs)
+        for prefix in ('https://', 'http://'):
+            adapter = session.get_adapter(prefix)
+            if not isinstance(adapter, ETagAdapter):
+                if adapter not in wrappers:
+                    wrappers[adapter] = ETagAdapter(adapter, tracker)
+                session.mount(prefix, wrappers[adapter])
+        return result
+
+    client.config.session_configuration_callback = session_configuration
+    return client
+
+
+def etag_tracker(directory=None, track=False):
+    '''
+    ETagTracker for the cache in directory, or the one named by AZURE_RM_ETAG_CACHE.
+
+    :param track: track ETags even without a cache
+    :return: ETagTracker, None when no directory is set and track is False
+    '''
+    directory = directory or os.environ.get(ETAG_CACHE_ENV)
+    if not directory:
+        return ETagTracker(None) if track else None
+    return ETagTracker(ETagCache(directory))
+
+
+def fingerprint(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
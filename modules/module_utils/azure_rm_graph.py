@@ -0,0 +1,120 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Azure Resource Graph queries for facts modules.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import re
+
+from ansible.module_utils.six import string_types
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+GRAPH_API_VERSION = '2019-04-01'
+GRAPH_PAGE_SIZE = 1000
+
+# top level ARM properties of a resource, everything a model can be deserialized from
+RESOURCE_COLUMNS = ['id', 'name', 'type', 'location', 'resourceGroup', 'tags', 'kind', 'sku', 'plan',
+                    'identity', 'zones', 'managedBy', 'properties']
+
+
+def resource_type(url_template):
+    '''
+    Resource type of a top level resource URL template, e.g.
+    /subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Compute/virtualMachines/{vmName}
+    gives microsoft.compute/virtualmachines. Child resources, which Resource Graph does not index,
+    give None.
+    '''
+    match = re.match(r'^/subscriptions/[^/]+(?:/resourceGroups/[^/]+)?/providers/([^/{}]+)/([^/{}]+)/[^/]+$', url_template or '')
+    if not match:
+        return None
+    return '{0}/{1}'.format(match.group(1), match.group(2)).lower()
+
+
+def select_columns(fields):
+    '''
+    Columns needed to deserialize the model attributes in fields, e.g. ['name', 'hardware_profile.vm_size']
+    gives ['id', 'name', 'properties']. Attributes that are not top level ARM properties are flattened
+    from properties.
+    '''
+    top = dict((re.sub(r'([A-Z])', r'_\1', c).lower(), c) for c in RESOURCE_COLUMNS)
+    columns = ['id']
+    for field in fields:
+        column = top.get(field.split('.')[0], 'properties')
+        if column not in columns:
+            columns.append(column)
+    return columns
+
+
+def kql_string(value):
+    return "'" + str(value).replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def build_query(resource_type, name=None, resource_group=None, location=None, tags=None, columns=None):
+    '''
+    KQL query for resources of one type, filtered like the facts modules filter.
+
+    :param tags: list of 'key' or 'key:value' strings, as accepted by has_tags
+    :param columns: columns to project, RESOURCE_COLUMNS by default
+    '''
+    clauses = ['Resources', 'where type =~ {0}'.format(kql_string(resource_type))]
+    if resource_group:
+        clauses.append('where resourceGroup =~ {0}'.format(kql_string(resource_group)))
+    if name:
+        clauses.append('where name =~ {0}'.format(kql_string(name)))
+    if location:
+        clauses.append('where location =~ {0}'.format(kql_string(location.replace(' ', '').lower())))
+    for tag in tags or []:
+        key, sep, value = tag.partition(':')
+        if sep:
+            clauses.append('where tags[{0}] == {1}'.format(kql_string(key), kql_string(value)))
+        else:
+            clauses.append('where isnotnull(tags[{0}])'.format(kql_string(key)))
+    clauses.append('project ' + ', '.join(columns or RESOURCE_COLUMNS))
+    return ' | '.join(clauses)
+
+
+def build_types_query(resource_types, resource_groups=None, columns=None):
+    '''
+    KQL query for all resources of several types, optionally only in some resource groups.
+    '''
+    clauses = ['Resources', 'where type in~ ({0})'.format(', '.join(kql_string(t) for t in resource_types))]
+    if resource_groups:
+        clauses.append('where resourceGroup in~ ({0})'.format(', '.join(kql_string(g) for g in resource_groups)))
+    clauses.append('project ' + ', '.join(columns or RESOURCE_COLUMNS))
+    return ' | '.join(clauses)
+
+
+def query_resources(client, subscriptions, query, page_size=GRAPH_PAGE_SIZE):
+    '''
+    Run a Resource Graph query over the pipeline of a management client and yield the rows of all
+    pages, following $skipToken.
+    '''
+    url = client.config.base_url.rstrip('/') + '/providers/Microsoft.ResourceGraph/resources'
+    skip_token = None
+    while True:
+        options = {'$top': page_size, 'resultFormat': 'objectArray'}
+        if skip_token:
+            options['$skipToken'] = skip_token
+        request = client._client.post(url, {'api-version': GRAPH_API_VERSION})
+        # the pipeline serializes content to JSON
+        response = client._client.send(request, headers={'Content-Type': 'application/json; charset=utf-8'},
+                                       content=dict(subscriptions=subscriptions, query=query, options=options))
+        if response.status_code != 200:
+            raise CloudError(response)
+        page = response.json()
+        data = page.get('data') or []
+        if isinstance(data, dict):
+            # table result format
+            names = [c['name'] for c in data.get('columns', [])]
+            data = [dict(zip(names, row)) for row in data.get('rows', [])]
+        for row in data:
+            yield row
+        skip_token = page.get('$skipToken')
+        if not skip_token or not isinstance(skip_token, string_types):
+            return
@@ -0,0 +1,64 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Module logging with per module levels; messages are only formatted when their level is enabled.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import os
+
+# environment variable with the log levels, e.g. "info" or "warning,azure_rm_appgateway=debug"
+LOG_LEVEL_ENV = 'AZURE_RM_LOG_LEVEL'
+
+LEVELS = dict(debug=10, info=20, warning=30, off=100)
+
+
+def log_level(module_name, spec=None):
+    '''
+    Level of module_name in spec, or in AZURE_RM_LOG_LEVEL: comma separated entries, either a level
+    for all modules or module=level.
+
+    :return: numeric level, None when no entry applies
+    '''
+    spec = os.environ.get(LOG_LEVEL_ENV, '') if spec is None else spec
+    level = None
+    for entry in spec.split(','):
+        name, sep, value = entry.strip().rpartition('=')
+        value = value.strip().lower()
+        if value not in LEVELS:
+            continue
+        if not sep:
+            level = LEVELS[value] if level is None else level
+        elif name.strip() == module_name:
+            return LEVELS[value]
+    return level
+
+
+class ModuleLogger(object):
+    '''
+    Sends log messages of an AnsibleModule to syslog / journal (module.log) when AZURE_RM_LOG_LEVEL
+    enables their level. Without AZURE_RM_LOG_LEVEL messages go to module.debug, which writes them
+    only with ANSIBLE_DEBUG, as AzureRMModuleBase.log does.
+    '''
+
+    def __init__(self, module):
+        self.module = module
+        self.level = log_level(module._name)
+
+    def enabled(self, level='debug'):
+        if self.level is None:
+            return self.module._debug
+        return LEVELS[level] >= self.level
+
+    def log(self, msg, args=(), level='debug', pretty_print=False):
+        if not self.enabled(level):
+            return
+        if pretty_print:
+            msg = json.dumps(msg, indent=4, sort_keys=True)
+        elif args:
+            msg = msg.format(*args)
+        if self.level is None:
+            self.module.debug(msg)
+        else:
+            self.module.log('[{0}] {1}'.format(level, msg))
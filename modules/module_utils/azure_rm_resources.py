@@ -0,0 +1,98 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Generic resource listing (GET .../resources), which filters by tag on the server.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import calendar
+import re
+import time
+
+from ansible.module_utils.six.moves.urllib.parse import quote
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+RESOURCES_API_VERSION = '2019-05-01'
+
+# changedTime comes from the clock of Azure, resources changed this close to a checkpoint are fetched again
+CHANGED_TIME_SKEW = 300
+
+TIMESTAMP = re.compile(r'^(\d{4}-\d\d-\d\d)(?:[T ](\d\d:\d\d:\d\d)(\.\d+)?)?(Z|[+-]\d\d:?\d\d)?$', re.IGNORECASE)
+
+
+def odata_string(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def parse_time(value):
+    '''
+    Seconds since the epoch of an ISO 8601 timestamp such as the changedTime of ARM,
+    2019-03-01T10:20:30.1234567Z. Dates are midnight, times without offset UTC.
+
+    :raises ValueError: for anything else
+    '''
+    match = TIMESTAMP.match(value.strip())
+    if match is None:
+        raise ValueError('invalid timestamp {0}'.format(value))
+    date, clock, fraction, offset = match.groups()
+    seconds = calendar.timegm(time.strptime('{0}T{1}'.format(date, clock or '00:00:00'), '%Y-%m-%dT%H:%M:%S'))
+    if fraction:
+        seconds += float(fraction)
+    if offset and offset.upper() != 'Z':
+        sign = -1 if offset[0] == '+' else 1
+        digits = offset[1:].replace(':', '')
+        seconds += sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60)
+    return seconds
+
+
+def tag_filter(tag):
+    '''
+    OData $filter for one tag filter of a facts module, 'key' or 'key:value'.
+
+    ARM accepts a single tagName / tagValue pair per request, further tags have to be checked
+    on the results.
+    '''
+    key, sep, value = tag.partition(':')
+    result = 'tagName eq {0}'.format(odata_string(key))
+    if sep:
+        result += ' and tagValue eq {0}'.format(odata_string(value))
+    return result
+
+
+def list_resources(client, subscription_id, resource_group=None, odata_filter=None, expand=None):
+    '''
+    List the generic resources (id, name, type, location...) of a subscription or resource group
+    over the pipeline of a management client, following nextLink.
+
+    Resources listed with a tag filter come back without their tags.
+
+    :param client: management client (SDKClient), provides the pipeline, base_url and credentials
+    :param odata_filter: $filter expression, e.g. from tag_filter()
+    :param expand: $expand value, e.g. 'changedTime' to get the time of the last change of each resource
+    :return: generator of resource dictionaries
+    '''
+    url = '{0}/subscriptions/{1}'.format(client.config.base_url.rstrip('/'), subscription_id)
+    if resource_group:
+        url += '/resourceGroups/{0}'.format(quote(resource_group, safe=''))
+    url += '/resources'
+    params = {'api-version': RESOURCES_API_VERSION}
+    if odata_filter:
+        # the pipeline expects quoted query parameters
+        params['$filter'] = quote(odata_filter)
+    if expand:
+        params['$expand'] = quote(expand)
+    while url:
+        response = client._client.send(client._client.get(url, params))
+        if response.status_code != 200:
+            raise CloudError(response)
+        page = response.json()
+        for resource in page.get('value') or []:
+            yield resource
+        # the next link carries the query string
+        url = page.get('nextLink')
+        params = {}
@@ -0,0 +1,319 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Output files of facts modules that write their results to disk as they read them instead of
+# returning them: one JSON document per line (NDJSON), CSV or Parquet. Responses that hold all
+# instances in one document can be read one instance at a time with json_array_items.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import codecs
+import csv
+import datetime
+import json
+import os
+import sys
+import tempfile
+import threading
+
+from ansible.module_utils.six import StringIO, text_type
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+FORMATS = ('ndjson', 'csv', 'parquet')
+
+# msrest types of model attributes written as such, everything else is written as text
+SIMPLE_TYPES = dict(str='str', int='int', long='int', float='float', decimal='float', bool='bool')
+
+# rows buffered per Parquet row group
+ROW_GROUP_SIZE = 10000
+
+# bytes read at a time from streamed responses
+CHUNK_SIZE = 65536
+
+
+class FileSink(object):
+    '''
+    Records written to a temporary file next to path and renamed to path by close(). Readers never
+    see a partial file, and a failed run leaves the previous file in place. Files are only readable
+    by their owner, resources may hold secrets.
+
+    write() may be called from several threads; each record is written whole.
+    '''
+
+    def __init__(self, path):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, self.tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(self.path))
+        self.file = os.fdopen(fd, 'wb')
+        self.count = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        data = self.encode(record)
+        with self._lock:
+            self.file.write(data)
+            self.count += 1
+            self.bytes += len(data)
+
+    def encode(self, record):
+        raise NotImplementedError()
+
+    def close(self):
+        '''
+        Move the file in place.
+
+        :return: summary of the file, with path, count (records) and bytes
+        '''
+        self.file.close()
+        os.rename(self.tmp, self.path)
+        return dict(path=self.path, count=self.count, bytes=self.bytes)
+
+    def abort(self):
+        self.file.close()
+        try:
+            os.unlink(self.tmp)
+        except OSError:
+            pass
+
+
+class NdjsonSink(FileSink):
+    '''
+    One JSON document per line.
+    '''
+
+    def encode(self, record):
+        return (json.dumps(record, default=str) + '\n').encode('utf-8')
+
+
+class CsvSink(FileSink):
+    '''
+    One row per record with the values of columns (see model_columns), after a header row.
+    '''
+
+    def __init__(self, path, columns):
+        super(CsvSink, self).__init__(path)
+        self.columns = columns
+        header = self._line([name for name, dummy in columns])
+        self.file.write(header)
+        self.bytes += len(header)
+
+    def encode(self, record):
+        return self._line([text_value(column_value(record, name)) for name, dummy in self.columns])
+
+    def _line(self, values):
+        out = StringIO()
+        csv.writer(out).writerow([v.encode('utf-8') if sys.version_info[0] == 2 and isinstance(v, text_type) else v
+                                  for v in values])
+        value = out.getvalue()
+        return value.encode('utf-8') if isinstance(value, text_type) else value
+
+
+class ParquetSink(FileSink):
+    '''
+    A Parquet file with columns (see model_columns), written one row group of ROW_GROUP_SIZE
+    records at a time. Needs pyarrow.
+    '''
+
+    ARROW_TYPES = dict(str='string', int='int64', float='float64', bool='bool_')
+
+    def __init__(self, path, columns):
+        super(ParquetSink, self).__init__(path)
+        self.columns = columns
+        self.schema = pyarrow.schema([(name, getattr(pyarrow, self.ARROW_TYPES[kind])()) for name, kind in columns])
+        # pyarrow writes the file itself
+        self.file.close()
+        self.writer = pyarrow.parquet.ParquetWriter(self.tmp, self.schema)
+        self.rows = []
+
+    def write(self, record):
+        row = [convert(column_value(record, name), kind) for name, kind in self.columns]
+        with self._lock:
+            self.rows.append(row)
+            self.count += 1
+            if len(self.rows) >= ROW_GROUP_SIZE:
+                self._flush()
+
+    def _flush(self):
+        if self.rows:
+            arrays = [pyarrow.array([row[i] for row in self.rows], type=field.type) for i, field in enumerate(self.schema)]
+            self.writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+        self.bytes = os.path.getsize(self.tmp)
+        return super(ParquetSink, self).close()
+
+    def abort(self):
+        self.writer.close()
+        super(ParquetSink, self).abort()
+
+
+def open_sink(path, output_format='ndjson', columns=None):
+    '''
+    Sink writing records to path in output_format; csv and parquet need the columns of the records.
+    '''
+    if output_format == 'csv':
+        return CsvSink(path, columns)
+    if output_format == 'parquet':
+        return ParquetSink(path, columns)
+    return NdjsonSink(path)
+
+
+def model_columns(item, fields=None):
+    '''
+    Columns of the CSV or Parquet file of instances like item, as (name, type): the attributes of its
+    model, or the dotted fields of the select option. Types are str, int, float and bool; dates,
+    lists and nested models are written as text (JSON for lists and models).
+
+    :param item: SDK model, or a dictionary
+    '''
+    if fields:
+        return [(field, field_type(type(item), field)) for field in fields]
+    attribute_map = getattr(item, '_attribute_map', None)
+    if attribute_map is None:
+        return [(key, 'str') for key in sorted(item)]
+    return [(name, SIMPLE_TYPES.get(spec.get('type'), 'str')) for name, spec in attribute_map.items()]
+
+
+def field_type(model, field):
+    '''
+    Column type of a dotted field of model, following nested models through the models package of
+    the SDK.
+    '''
+    models = sys.modules.get(model.__module__.rpartition('.')[0])
+    kind = None
+    for part in field.split('.'):
+        spec = (getattr(model, '_attribute_map', None) or {}).get(part)
+        if spec is None:
+            return 'str'
+        kind = spec.get('type')
+        model = getattr(models, kind, None)
+    return SIMPLE_TYPES.get(kind, 'str')
+
+
+def column_value(record, name):
+    value = record
+    for part in name.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def text_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return text_type(value)
+
+
+def convert(value, kind):
+    if value is None:
+        return None
+    if kind == 'str':
+        return text_value(value)
+    try:
+        return dict(int=int, float=float, bool=bool)[kind](value)
+    except (TypeError, ValueError):
+        return None
+
+
+def json_array_items(chunks, key):
+    '''
+    Elements of the array member key of the JSON object read from chunks (bytes, e.g.
+    response.iter_content(CHUNK_SIZE)), decoded one at a time: only the element being read is held in
+    memory. Other members are decoded whole and dropped; reading stops at the end of the array.
+
+    :raises ValueError: when the document is not valid JSON
+    '''
+    reader = JsonReader(chunks)
+    reader.next('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        name = reader.value()
+        reader.next(':')
+        if name == key and reader.peek() == '[':
+            reader.next('[')
+            if reader.peek() == ']':
+                return
+            while True:
+                yield reader.value()
+                if reader.next(',]') == ']':
+                    return
+        reader.value()
+        if reader.next(',}') == '}':
+            return
+
+
+class JsonReader(object):
+    '''
+    Tokens and values of a JSON document arriving in chunks, read from a buffer holding only what was
+    not consumed yet.
+    '''
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self.json = json.JSONDecoder()
+        self.buffer = u''
+        self.pos = 0
+        self.eof = False
+
+    def _read(self):
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        for chunk in self.chunks:
+            if chunk:
+                self.buffer += self.decoder.decode(chunk)
+                return
+        self.buffer += self.decoder.decode(b'', True)
+        self.eof = True
+
+    def peek(self):
+        '''
+        Next character after white space, None at the end of the document.
+        '''
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in u' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                return None
+            self._read()
+
+    def next(self, expected):
+        char = self.peek()
+        if char is None or char not in expected:
+            raise ValueError('Expected one of {0!r} but found {1!r}'.format(expected, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.json.raw_decode(self.buffer, self.pos)
+                # a number could go on in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            self._read()
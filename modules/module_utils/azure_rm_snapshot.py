@@ -0,0 +1,51 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Local snapshots of the instances listed by facts modules, kept up to date by fetching only the
+# resources whose changedTime is later than the checkpoint of the snapshot.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+
+SNAPSHOT_VERSION = 1
+
+
+def load_snapshot(path, scope):
+    '''
+    Snapshot stored in path for scope, None when there is none or it was taken for another scope.
+
+    :param scope: dictionary identifying the listing, e.g. resource type, subscription, resource
+                  group and api-version
+    :return: dictionary with checkpoint (seconds since the epoch) and resources (ARM bodies by lower
+             case id)
+    '''
+    try:
+        with open(os.path.expanduser(path)) as f:
+            data = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if data.get('version') != SNAPSHOT_VERSION or data.get('scope') != scope:
+        return None
+    return data
+
+
+def store_snapshot(path, scope, checkpoint, resources):
+    '''
+    Replace the snapshot in path atomically. Snapshots are only readable by their owner, resources
+    may hold secrets.
+    '''
+    path = os.path.expanduser(path)
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, 0o700)
+    fd, tmp = tempfile.mkstemp(dir=directory or '.', prefix='.azure-snapshot')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(dict(version=SNAPSHOT_VERSION, scope=scope, checkpoint=checkpoint, resources=resources), f)
+        os.rename(tmp, path)
+    except Exception:
+        os.unlink(tmp)
+        raise
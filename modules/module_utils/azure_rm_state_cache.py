@@ -0,0 +1,99 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Desired-state cache: tasks that converged without changes, so repeat runs can trust them for a
+# while after probing the ETag of the resource.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import time
+
+try:
+    import sqlite3
+    HAS_SQLITE3 = True
+except ImportError:
+    HAS_SQLITE3 = False
+
+# environment variable naming the sqlite database, the cache is off when it is not set
+STATE_CACHE_ENV = 'AZURE_RM_STATE_CACHE'
+
+# options that do not change the desired state of a task
+VOLATILE_OPTIONS = ('trust_cache_for', 'wait_for_completion', 'wait_timeout', 'poll_interval')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS converged (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    converged_at REAL NOT NULL,
+    result TEXT NOT NULL
+)
+'''
+
+
+def desired_key(module_name, params):
+    '''
+    Hash of a module and the options of a task that describe the desired state.
+    '''
+    desired = dict((k, v) for k, v in params.items() if k not in VOLATILE_OPTIONS)
+    return hashlib.sha256(json.dumps([module_name, desired], sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class StateCache(object):
+    '''
+    sqlite table of converged tasks: the hash of the desired state (desired_key()), the URL and
+    ETag of the resource, when the task last converged and the result it returned.
+
+    The database is shared by concurrent module runs; sqlite serializes the writes.
+    '''
+
+    def __init__(self, path, clock=time.time):
+        self.path = os.path.expanduser(path)
+        self.clock = clock
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        if not os.path.exists(self.path):
+            # results may hold secrets
+            os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.execute(SCHEMA)
+        self.connection.commit()
+
+    def get(self, key, max_age):
+        '''
+        Entry for key converged at most max_age seconds ago.
+
+        :return: dictionary with url, etag, converged_at and result, None when there is none
+        '''
+        row = self.connection.execute('SELECT url, etag, converged_at, result FROM converged WHERE key = ?', (key,)).fetchone()
+        if row is None or self.clock() - row[2] > max_age:
+            return None
+        return dict(url=row[0], etag=row[1], converged_at=row[2], result=json.loads(row[3]))
+
+    def put(self, key, url, etag, result):
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO converged (key, url, etag, converged_at, result) VALUES (?, ?, ?, ?, ?)',
+                                    (key, url, etag, self.clock(), json.dumps(result, default=str)))
+
+    def drop(self, key):
+        with self.connection:
+            self.connection.execute('DELETE FROM converged WHERE key = ?', (key,))
+
+    def close(self):
+        self.connection.close()
+
+
+def state_cache(path=None):
+    '''
+    StateCache in path, or the one named by AZURE_RM_STATE_CACHE.
+
+    :return: StateCache, None when no path is set
+    '''
+    path = path or os.environ.get(STATE_CACHE_ENV)
+    if not path:
+        return None
+    return StateCache(path)
@@ -0,0 +1,1747 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Generated by tools/build_sweep_registry.py, do not edit.
+#
+# SWEEP_TARGETS: by facts module, the import path of its management client and its list
+# operations as (operations group, method, {SDK argument: module option}).
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+SWEEP_TARGETS = {'azure_rm_account_facts': ('azure.mgmt.maps.MapsManagementClient',
+                            [('accounts', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                             ('accounts', 'list_by_subscription', {})]),
+ 'azure_rm_accountcomputepolicy_facts': ('azure.mgmt.account.DataLakeAnalyticsAccountManagementClient',
+                                         [('compute_policies',
+                                           'list_by_account',
+                                           {'account_name': 'account_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_accountdatalakestoreaccount_facts': ('azure.mgmt.account.DataLakeAnalyticsAccountManagementClient',
+                                                [('data_lake_store_accounts',
+                                                  'list_by_account',
+                                                  {'account_name': 'account_name',
+                                                   'resource_group_name': 'resource_group'})]),
+ 'azure_rm_accountfirewallrule_facts': ('azure.mgmt.account.DataLakeAnalyticsAccountManagementClient',
+                                        [('firewall_rules',
+                                          'list_by_account',
+                                          {'account_name': 'account_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_accountstorageaccount_facts': ('azure.mgmt.account.DataLakeAnalyticsAccountManagementClient',
+                                          [('storage_accounts',
+                                            'list_by_account',
+                                            {'account_name': 'account_name',
+                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_advisorconfiguration_facts': ('azure.mgmt.advisor.AdvisorManagementClient',
+                                         [('configurations',
+                                           'list_by_resource_group',
+                                           {'resource_group': 'resource_group'}),
+                                          ('configurations', 'list_by_subscription', {})]),
+ 'azure_rm_apimanagementapidiagnostic_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                               [('api_diagnostic',
+                                                 'list_by_service',
+                                                 {'api_id': 'api_id',
+                                                  'resource_group_name': 'resource_group',
+                                                  'service_name': 'name'})]),
+ 'azure_rm_apimanagementapidiagnosticlogger_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                     [('api_diagnostic_logger',
+                                                       'list_by_service',
+                                                       {'api_id': 'api_id',
+                                                        'diagnostic_id': 'diagnostic_id',
+                                                        'resource_group_name': 'resource_group',
+                                                        'service_name': 'name'})]),
+ 'azure_rm_apimanagementapiissue_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                          [('api_issue',
+                                            'list_by_service',
+                                            {'api_id': 'api_id',
+                                             'resource_group_name': 'resource_group',
+                                             'service_name': 'name'})]),
+ 'azure_rm_apimanagementapiissueattachment_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                    [('api_issue_attachment',
+                                                      'list_by_service',
+                                                      {'api_id': 'api_id',
+                                                       'issue_id': 'issue_id',
+                                                       'resource_group_name': 'resource_group',
+                                                       'service_name': 'name'})]),
+ 'azure_rm_apimanagementapiissuecomment_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                 [('api_issue_comment',
+                                                   'list_by_service',
+                                                   {'api_id': 'api_id',
+                                                    'issue_id': 'issue_id',
+                                                    'resource_group_name': 'resource_group',
+                                                    'service_name': 'name'})]),
+ 'azure_rm_apimanagementapioperation_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                              [('api_operation',
+                                                'list_by_api',
+                                                {'api_id': 'api_id',
+                                                 'resource_group_name': 'resource_group',
+                                                 'service_name': 'name'})]),
+ 'azure_rm_apimanagementapioperationpolicy_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                    [('api_operation_policy',
+                                                      'list_by_operation',
+                                                      {'api_id': 'api_id',
+                                                       'operation_id': 'operation_id',
+                                                       'resource_group_name': 'resource_group',
+                                                       'service_name': 'name'})]),
+ 'azure_rm_apimanagementapipolicy_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                           [('api_policy',
+                                             'list_by_api',
+                                             {'api_id': 'api_id',
+                                              'resource_group_name': 'resource_group',
+                                              'service_name': 'name'})]),
+ 'azure_rm_apimanagementapiproduct_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                            [('api_product',
+                                              'list_by_apis',
+                                              {'api_id': 'api_id',
+                                               'resource_group_name': 'resource_group',
+                                               'service_name': 'name'})]),
+ 'azure_rm_apimanagementapischema_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                           [('api_schema',
+                                             'list_by_api',
+                                             {'api_id': 'api_id',
+                                              'resource_group_name': 'resource_group',
+                                              'service_name': 'name'})]),
+ 'azure_rm_apimanagementapiversionset_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                               [('api_version_set',
+                                                 'list_by_service',
+                                                 {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementauthorizationserver_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                     [('authorization_server',
+                                                       'list_by_service',
+                                                       {'resource_group_name': 'resource_group',
+                                                        'service_name': 'name'})]),
+ 'azure_rm_apimanagementbackend_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                         [('backend',
+                                           'list_by_service',
+                                           {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementcertificate_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                             [('certificate',
+                                               'list_by_service',
+                                               {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementdiagnostic_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                            [('diagnostic',
+                                              'list_by_service',
+                                              {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementdiagnosticlogger_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                  [('diagnostic_logger',
+                                                    'list_by_service',
+                                                    {'diagnostic_id': 'diagnostic_id',
+                                                     'resource_group_name': 'resource_group',
+                                                     'service_name': 'name'})]),
+ 'azure_rm_apimanagementemailtemplate_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                               [('email_template',
+                                                 'list_by_service',
+                                                 {'resource_group_name': 'resource_group',
+                                                  'service_name': 'service_name'})]),
+ 'azure_rm_apimanagementgroup_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                       [('group',
+                                         'list_by_service',
+                                         {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementidentityprovider_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                  [('identity_provider',
+                                                    'list_by_service',
+                                                    {'resource_group_name': 'resource_group',
+                                                     'service_name': 'service_name'})]),
+ 'azure_rm_apimanagementlogger_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                        [('logger',
+                                          'list_by_service',
+                                          {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementnetworkstatu_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                              [('network_status',
+                                                'list_by_location',
+                                                {'location_name': 'location_name',
+                                                 'resource_group_name': 'resource_group',
+                                                 'service_name': 'service_name'}),
+                                               ('network_status',
+                                                'list_by_service',
+                                                {'resource_group_name': 'resource_group',
+                                                 'service_name': 'service_name'})]),
+ 'azure_rm_apimanagementnetworkstatus_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                               [('network_status',
+                                                 'list_by_location',
+                                                 {'location_name': 'name',
+                                                  'resource_group_name': 'resource_group',
+                                                  'service_name': 'service_name'}),
+                                                ('network_status',
+                                                 'list_by_service',
+                                                 {'resource_group_name': 'resource_group',
+                                                  'service_name': 'service_name'})]),
+ 'azure_rm_apimanagementnotification_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                              [('notification',
+                                                'list_by_service',
+                                                {'resource_group_name': 'resource_group',
+                                                 'service_name': 'service_name'})]),
+ 'azure_rm_apimanagementnotificationrecipientemail_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                            [('notification_recipient_email',
+                                                              'list_by_notification',
+                                                              {'notification_name': 'name',
+                                                               'resource_group_name': 'resource_group',
+                                                               'service_name': 'service_name'})]),
+ 'azure_rm_apimanagementnotificationrecipientuser_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                           [('notification_recipient_user',
+                                                             'list_by_notification',
+                                                             {'notification_name': 'name',
+                                                              'resource_group_name': 'resource_group',
+                                                              'service_name': 'service_name'})]),
+ 'azure_rm_apimanagementopenidconnectprovider_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                       [('open_id_connect_provider',
+                                                         'list_by_service',
+                                                         {'resource_group_name': 'resource_group',
+                                                          'service_name': 'name'})]),
+ 'azure_rm_apimanagementoperation_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                           [('operation',
+                                             'list_by_tags',
+                                             {'api_id': 'api_id',
+                                              'resource_group_name': 'resource_group',
+                                              'service_name': 'name'})]),
+ 'azure_rm_apimanagementpolicy_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                        [('policy',
+                                          'list_by_service',
+                                          {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementpolicysnippet_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                               [('policy_snippets',
+                                                 'list_by_service',
+                                                 {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementproduct_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                         [('product',
+                                           'list_by_service',
+                                           {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementproductapi_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                            [('product_api',
+                                              'list_by_product',
+                                              {'product_id': 'product_id',
+                                               'resource_group_name': 'resource_group',
+                                               'service_name': 'name'})]),
+ 'azure_rm_apimanagementproductgroup_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                              [('product_group',
+                                                'list_by_product',
+                                                {'product_id': 'product_id',
+                                                 'resource_group_name': 'resource_group',
+                                                 'service_name': 'name'})]),
+ 'azure_rm_apimanagementproductpolicy_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                               [('product_policy',
+                                                 'list_by_product',
+                                                 {'product_id': 'product_id',
+                                                  'resource_group_name': 'resource_group',
+                                                  'service_name': 'name'})]),
+ 'azure_rm_apimanagementproperty_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                          [('property',
+                                            'list_by_service',
+                                            {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementquotabycounterkey_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                   [('quota_by_counter_keys',
+                                                     'list_by_service',
+                                                     {'quota_counter_key': 'quota_counter_key',
+                                                      'resource_group_name': 'resource_group',
+                                                      'service_name': 'name'})]),
+ 'azure_rm_apimanagementregion_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                        [('regions',
+                                          'list_by_service',
+                                          {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementservice_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                         [('api_management_service',
+                                           'list_by_resource_group',
+                                           {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_apimanagementtag_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                     [('tag',
+                                       'list_by_operation',
+                                       {'api_id': 'api_id',
+                                        'operation_id': 'operation_id',
+                                        'resource_group_name': 'resource_group',
+                                        'service_name': 'name'}),
+                                      ('tag',
+                                       'list_by_api',
+                                       {'api_id': 'api_id',
+                                        'resource_group_name': 'resource_group',
+                                        'service_name': 'name'}),
+                                      ('tag',
+                                       'list_by_product',
+                                       {'product_id': 'product_id',
+                                        'resource_group_name': 'resource_group',
+                                        'service_name': 'name'}),
+                                      ('tag',
+                                       'list_by_service',
+                                       {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementtagdescription_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                                [('tag_description',
+                                                  'list_by_api',
+                                                  {'api_id': 'api_id',
+                                                   'resource_group_name': 'resource_group',
+                                                   'service_name': 'name'})]),
+ 'azure_rm_apimanagementtagresource_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                             [('tag_resource',
+                                               'list_by_service',
+                                               {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_apimanagementuser_facts': ('azure.mgmt.apimanagement.ApiManagementClient',
+                                      [('user',
+                                        'list_by_service',
+                                        {'resource_group_name': 'resource_group', 'service_name': 'name'})]),
+ 'azure_rm_applicationinsightscomponent_facts': ('azure.mgmt.applicationinsights.ApplicationInsightsManagementClient',
+                                                 [('components',
+                                                   'list_by_resource_group',
+                                                   {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_applicationinsightswebtest_facts': ('azure.mgmt.applicationinsights.ApplicationInsightsManagementClient',
+                                               [('web_tests',
+                                                 'list_by_component',
+                                                 {'component_name': 'name', 'resource_group_name': 'resource_group'}),
+                                                ('web_tests',
+                                                 'list_by_resource_group',
+                                                 {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_armservicemapmachine_facts': ('azure.mgmt.armservicemap.ServiceMap',
+                                         [('machines',
+                                           'list_by_workspace',
+                                           {'resource_group_name': 'resource_group',
+                                            'workspace_name': 'workspace_name'})]),
+ 'azure_rm_armservicemapmachinegroup_facts': ('azure.mgmt.armservicemap.ServiceMap',
+                                              [('machine_groups',
+                                                'list_by_workspace',
+                                                {'resource_group_name': 'resource_group',
+                                                 'workspace_name': 'workspace_name'})]),
+ 'azure_rm_automationaccount_facts': ('azure.mgmt.automation.AutomationClient',
+                                      [('automation_account',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationactivity_facts': ('azure.mgmt.automation.AutomationClient',
+                                       [('activity',
+                                         'list_by_module',
+                                         {'automation_account_name': 'automation_account_name',
+                                          'module_name': 'module_name',
+                                          'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationcertificate_facts': ('azure.mgmt.automation.AutomationClient',
+                                          [('certificate',
+                                            'list_by_automation_account',
+                                            {'automation_account_name': 'automation_account_name',
+                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationconnection_facts': ('azure.mgmt.automation.AutomationClient',
+                                         [('connection',
+                                           'list_by_automation_account',
+                                           {'automation_account_name': 'automation_account_name',
+                                            'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationconnectiontype_facts': ('azure.mgmt.automation.AutomationClient',
+                                             [('connection_type',
+                                               'list_by_automation_account',
+                                               {'automation_account_name': 'automation_account_name',
+                                                'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationcredential_facts': ('azure.mgmt.automation.AutomationClient',
+                                         [('credential',
+                                           'list_by_automation_account',
+                                           {'automation_account_name': 'automation_account_name',
+                                            'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationdsccompilationjob_facts': ('azure.mgmt.automation.AutomationClient',
+                                                [('dsc_compilation_job',
+                                                  'list_by_automation_account',
+                                                  {'automation_account_name': 'automation_account_name',
+                                                   'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationdsccompilationjobstream_facts': ('azure.mgmt.automation.AutomationClient',
+                                                      [('dsc_compilation_job_stream',
+                                                        'list_by_job',
+                                                        {'automation_account_name': 'name',
+                                                         'job_id': 'job_id',
+                                                         'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationdscconfiguration_facts': ('azure.mgmt.automation.AutomationClient',
+                                               [('dsc_configuration',
+                                                 'list_by_automation_account',
+                                                 {'automation_account_name': 'automation_account_name',
+                                                  'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationdscnode_facts': ('azure.mgmt.automation.AutomationClient',
+                                      [('dsc_node',
+                                        'list_by_automation_account',
+                                        {'automation_account_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationdscnodeconfiguration_facts': ('azure.mgmt.automation.AutomationClient',
+                                                   [('dsc_node_configuration',
+                                                     'list_by_automation_account',
+                                                     {'automation_account_name': 'automation_account_name',
+                                                      'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationfield_facts': ('azure.mgmt.automation.AutomationClient',
+                                    [('fields',
+                                      'list_by_type',
+                                      {'automation_account_name': 'automation_account_name',
+                                       'module_name': 'module_name',
+                                       'resource_group_name': 'resource_group',
+                                       'type_name': 'name'})]),
+ 'azure_rm_automationhybridrunbookworkergroup_facts': ('azure.mgmt.automation.AutomationClient',
+                                                       [('hybrid_runbook_worker_group',
+                                                         'list_by_automation_account',
+                                                         {'automation_account_name': 'automation_account_name',
+                                                          'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationjob_facts': ('azure.mgmt.automation.AutomationClient',
+                                  [('job',
+                                    'list_by_automation_account',
+                                    {'automation_account_name': 'automation_account_name',
+                                     'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationjobschedule_facts': ('azure.mgmt.automation.AutomationClient',
+                                          [('job_schedule',
+                                            'list_by_automation_account',
+                                            {'automation_account_name': 'name',
+                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationjobstream_facts': ('azure.mgmt.automation.AutomationClient',
+                                        [('job_stream',
+                                          'list_by_job',
+                                          {'automation_account_name': 'automation_account_name',
+                                           'job_name': 'name',
+                                           'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationkey_facts': ('azure.mgmt.automation.AutomationClient',
+                                  [('keys',
+                                    'list_by_automation_account',
+                                    {'automation_account_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationmodule_facts': ('azure.mgmt.automation.AutomationClient',
+                                     [('module',
+                                       'list_by_automation_account',
+                                       {'automation_account_name': 'automation_account_name',
+                                        'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationnodereport_facts': ('azure.mgmt.automation.AutomationClient',
+                                         [('node_reports',
+                                           'list_by_node',
+                                           {'automation_account_name': 'name',
+                                            'node_id': 'node_id',
+                                            'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationpython2package_facts': ('azure.mgmt.automation.AutomationClient',
+                                             [('python2_package',
+                                               'list_by_automation_account',
+                                               {'automation_account_name': 'automation_account_name',
+                                                'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationrunbook_facts': ('azure.mgmt.automation.AutomationClient',
+                                      [('runbook',
+                                        'list_by_automation_account',
+                                        {'automation_account_name': 'automation_account_name',
+                                         'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationschedule_facts': ('azure.mgmt.automation.AutomationClient',
+                                       [('schedule',
+                                         'list_by_automation_account',
+                                         {'automation_account_name': 'automation_account_name',
+                                          'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationsourcecontrol_facts': ('azure.mgmt.automation.AutomationClient',
+                                            [('source_control',
+                                              'list_by_automation_account',
+                                              {'automation_account_name': 'automation_account_name',
+                                               'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationsourcecontrolsyncjob_facts': ('azure.mgmt.automation.AutomationClient',
+                                                   [('source_control_sync_job',
+                                                     'list_by_automation_account',
+                                                     {'automation_account_name': 'automation_account_name',
+                                                      'resource_group_name': 'resource_group',
+                                                      'source_control_name': 'name'})]),
+ 'azure_rm_automationsourcecontrolsyncjobstream_facts': ('azure.mgmt.automation.AutomationClient',
+                                                         [('source_control_sync_job_streams',
+                                                           'list_by_sync_job',
+                                                           {'automation_account_name': 'automation_account_name',
+                                                            'resource_group_name': 'resource_group',
+                                                            'source_control_name': 'name',
+                                                            'source_control_sync_job_id': 'source_control_sync_job_id'})]),
+ 'azure_rm_automationstatistic_facts': ('azure.mgmt.automation.AutomationClient',
+                                        [('statistics',
+                                          'list_by_automation_account',
+                                          {'automation_account_name': 'name',
+                                           'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationtestjobstream_facts': ('azure.mgmt.automation.AutomationClient',
+                                            [('test_job_streams',
+                                              'list_by_test_job',
+                                              {'automation_account_name': 'automation_account_name',
+                                               'resource_group_name': 'resource_group',
+                                               'runbook_name': 'name'})]),
+ 'azure_rm_automationusage_facts': ('azure.mgmt.automation.AutomationClient',
+                                    [('usages',
+                                      'list_by_automation_account',
+                                      {'automation_account_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationvariable_facts': ('azure.mgmt.automation.AutomationClient',
+                                       [('variable',
+                                         'list_by_automation_account',
+                                         {'automation_account_name': 'automation_account_name',
+                                          'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationwatcher_facts': ('azure.mgmt.automation.AutomationClient',
+                                      [('watcher',
+                                        'list_by_automation_account',
+                                        {'automation_account_name': 'automation_account_name',
+                                         'resource_group_name': 'resource_group'})]),
+ 'azure_rm_automationwebhook_facts': ('azure.mgmt.automation.AutomationClient',
+                                      [('webhook',
+                                        'list_by_automation_account',
+                                        {'automation_account_name': 'automation_account_name',
+                                         'resource_group_name': 'resource_group'})]),
+ 'azure_rm_batchaccount_facts': ('azure.mgmt.batch.BatchManagementClient',
+                                 [('batch_account',
+                                   'list_by_resource_group',
+                                   {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_batchaicluster_facts': ('azure.mgmt.batchai.BatchAIManagementClient',
+                                   [('clusters', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_batchaifileserver_facts': ('azure.mgmt.batchai.BatchAIManagementClient',
+                                      [('file_servers',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_batchaijob_facts': ('azure.mgmt.batchai.BatchAIManagementClient',
+                               [('jobs', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_batchcertificate_facts': ('azure.mgmt.batch.BatchManagementClient',
+                                     [('certificate',
+                                       'list_by_batch_account',
+                                       {'account_name': 'account_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_batchpool_facts': ('azure.mgmt.batch.BatchManagementClient',
+                              [('pool',
+                                'list_by_batch_account',
+                                {'account_name': 'account_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_botservicebot_facts': ('azure.mgmt.botservice.AzureBotService',
+                                  [('bots', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_botservicebotconnection_facts': ('azure.mgmt.botservice.AzureBotService',
+                                            [('bot_connection',
+                                              'list_by_bot_service',
+                                              {'resource_group_name': 'resource_group',
+                                               'resource_name': 'resource_name'})]),
+ 'azure_rm_botservicechannel_facts': ('azure.mgmt.botservice.AzureBotService',
+                                      [('channels',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group', 'resource_name': 'resource_name'})]),
+ 'azure_rm_botserviceenterprisechannel_facts': ('azure.mgmt.botservice.AzureBotService',
+                                                [('enterprise_channels',
+                                                  'list_by_resource_group',
+                                                  {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_cdncustomdomain_facts': ('azure.mgmt.cdn.CdnManagementClient',
+                                    [('custom_domains',
+                                      'list_by_endpoint',
+                                      {'endpoint_name': 'endpoint_name',
+                                       'profile_name': 'profile_name',
+                                       'resource_group_name': 'resource_group'})]),
+ 'azure_rm_cdnendpoint_facts': ('azure.mgmt.cdn.CdnManagementClient',
+                                [('endpoints',
+                                  'list_by_profile',
+                                  {'profile_name': 'profile_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_cdnorigin_facts': ('azure.mgmt.cdn.CdnManagementClient',
+                              [('origins',
+                                'list_by_endpoint',
+                                {'endpoint_name': 'endpoint_name',
+                                 'profile_name': 'profile_name',
+                                 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_cdnprofile_facts': ('azure.mgmt.cdn.CdnManagementClient',
+                               [('profiles', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_cognitiveservicesaccount_facts': ('azure.mgmt.cognitiveservices.CognitiveServicesManagementClient',
+                                             [('accounts',
+                                               'list_by_resource_group',
+                                               {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computeavailabilityset_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                           [('availability_sets', 'list_by_subscription', {})]),
+ 'azure_rm_computecontainerservice_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                            [('container_services',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computedisk_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                [('disks', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computegallery_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                   [('galleries',
+                                     'list_by_resource_group',
+                                     {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computegalleryimage_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                        [('gallery_images',
+                                          'list_by_gallery',
+                                          {'gallery_name': 'gallery_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computegalleryimageversion_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                               [('gallery_image_versions',
+                                                 'list_by_gallery_image',
+                                                 {'gallery_image_name': 'gallery_image_name',
+                                                  'gallery_name': 'gallery_name',
+                                                  'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computeimage_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                 [('images', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computesnapshot_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                    [('snapshots',
+                                      'list_by_resource_group',
+                                      {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_computevirtualmachine_facts': ('azure.mgmt.compute.ComputeManagementClient',
+                                          [('virtual_machines', 'list_by_location', {'location': 'location'})]),
+ 'azure_rm_consumptionbudget_facts': ('azure.mgmt.consumption.ConsumptionManagementClient',
+                                      [('budgets',
+                                        'list_by_resource_group_name',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_consumptioncharge_facts': ('azure.mgmt.consumption.ConsumptionManagementClient',
+                                      [('charges',
+                                        'list_by_enrollment_account',
+                                        {'billing_account_id': 'billing_account_id',
+                                         'enrollment_account_id': 'enrollment_account_id'}),
+                                       ('charges',
+                                        'list_by_department',
+                                        {'billing_account_id': 'billing_account_id',
+                                         'department_id': 'department_id'})]),
+ 'azure_rm_consumptionmarketplace_facts': ('azure.mgmt.consumption.ConsumptionManagementClient',
+                                           [('marketplaces', 'list_by_billing_period', {'billing_period_name': 'name'}),
+                                            ('marketplaces',
+                                             'list_by_billing_account',
+                                             {'billing_account_id': 'billing_account_id'}),
+                                            ('marketplaces', 'list_by_department', {'department_id': 'department_id'}),
+                                            ('marketplaces',
+                                             'list_by_enrollment_account',
+                                             {'enrollment_account_id': 'enrollment_account_id'})]),
+ 'azure_rm_consumptionreservationsdetail_facts': ('azure.mgmt.consumption.ConsumptionManagementClient',
+                                                  [('reservations_details',
+                                                    'list_by_reservation_order_and_reservation',
+                                                    {'filter': 'filter',
+                                                     'reservation_id': 'reservation_id',
+                                                     'reservation_order_id': 'reservation_order_id'}),
+                                                   ('reservations_details',
+                                                    'list_by_reservation_order',
+                                                    {'filter': 'filter',
+                                                     'reservation_order_id': 'reservation_order_id'})]),
+ 'azure_rm_consumptionreservationssummary_facts': ('azure.mgmt.consumption.ConsumptionManagementClient',
+                                                   [('reservations_summaries',
+                                                     'list_by_reservation_order_and_reservation',
+                                                     {'grain': 'grain',
+                                                      'reservation_id': 'reservation_id',
+                                                      'reservation_order_id': 'reservation_order_id'}),
+                                                    ('reservations_summaries',
+                                                     'list_by_reservation_order',
+                                                     {'grain': 'grain',
+                                                      'reservation_order_id': 'reservation_order_id'})]),
+ 'azure_rm_consumptionusagedetail_facts': ('azure.mgmt.consumption.ConsumptionManagementClient',
+                                           [('usage_details',
+                                             'list_by_billing_period',
+                                             {'billing_period_name': 'name'}),
+                                            ('usage_details',
+                                             'list_by_billing_account',
+                                             {'billing_account_id': 'billing_account_id'}),
+                                            ('usage_details', 'list_by_department', {'department_id': 'department_id'}),
+                                            ('usage_details',
+                                             'list_by_enrollment_account',
+                                             {'enrollment_account_id': 'enrollment_account_id'}),
+                                            ('usage_details',
+                                             'list_by_management_group',
+                                             {'management_group_id': 'management_group_id'})]),
+ 'azure_rm_containerinstance_facts': ('azure.mgmt.containerinstance.ContainerInstanceManagementClient',
+                                      [('container_groups',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_containerregistry_facts': ('azure.mgmt.containerregistry.ContainerRegistryManagementClient',
+                                      [('registries',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_containerservice_facts': ('azure.mgmt.containerservice.ContainerServiceClient',
+                                     [('container_services',
+                                       'list_by_resource_group',
+                                       {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_containerservicemanagedcluster_facts': ('azure.mgmt.containerservice.ContainerServiceClient',
+                                                   [('managed_clusters',
+                                                     'list_by_resource_group',
+                                                     {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_cosmosdbaccount_facts': ('azure.mgmt.cosmosdb.CosmosDB',
+                                    [('database_accounts',
+                                      'list_by_resource_group',
+                                      {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_costmanagementreportconfig_facts': ('azure.mgmt.costmanagement.CostManagementClient',
+                                               [('report_config',
+                                                 'list_by_resource_group_name',
+                                                 {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_csmaccount_facts': ('azure.mgmt.csm.VisualStudioResourceProviderClient',
+                               [('accounts', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_csmextension_facts': ('azure.mgmt.csm.VisualStudioResourceProviderClient',
+                                 [('extensions',
+                                   'list_by_account',
+                                   {'account_resource_name': 'account_resource_name',
+                                    'resource_group_name': 'resource_group'})]),
+ 'azure_rm_csmproject_facts': ('azure.mgmt.csm.VisualStudioResourceProviderClient',
+                               [('projects',
+                                 'list_by_resource_group',
+                                 {'resource_group_name': 'resource_group',
+                                  'root_resource_name': 'root_resource_name'})]),
+ 'azure_rm_customerinsightsauthorizationpolicy_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                                        [('authorization_policies',
+                                                          'list_by_hub',
+                                                          {'hub_name': 'hub_name',
+                                                           'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsconnector_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                              [('connectors',
+                                                'list_by_hub',
+                                                {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsconnectormapping_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                                     [('connector_mappings',
+                                                       'list_by_connector',
+                                                       {'connector_name': 'connector_name',
+                                                        'hub_name': 'hub_name',
+                                                        'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightshub_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                        [('hubs',
+                                          'list_by_resource_group',
+                                          {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsinteraction_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                                [('interactions',
+                                                  'list_by_hub',
+                                                  {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightskpi_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                        [('kpi',
+                                          'list_by_hub',
+                                          {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightslink_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                         [('links',
+                                           'list_by_hub',
+                                           {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsprediction_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                               [('predictions',
+                                                 'list_by_hub',
+                                                 {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsprofile_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                            [('profiles',
+                                              'list_by_hub',
+                                              {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsrelationship_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                                 [('relationships',
+                                                   'list_by_hub',
+                                                   {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsrelationshiplink_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                                     [('relationship_links',
+                                                       'list_by_hub',
+                                                       {'hub_name': 'hub_name',
+                                                        'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsrole_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                         [('roles',
+                                           'list_by_hub',
+                                           {'hub_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsroleassignment_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                                   [('role_assignments',
+                                                     'list_by_hub',
+                                                     {'hub_name': 'hub_name',
+                                                      'resource_group_name': 'resource_group'})]),
+ 'azure_rm_customerinsightsview_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                         [('views',
+                                           'list_by_hub',
+                                           {'hub_name': 'hub_name',
+                                            'resource_group_name': 'resource_group',
+                                            'user_id': 'user_id'})]),
+ 'azure_rm_customerinsightswidgettype_facts': ('azure.mgmt.customerinsights.CustomerInsightsManagementClient',
+                                               [('widget_types',
+                                                 'list_by_hub',
+                                                 {'hub_name': 'hub_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_databoxjob_facts': ('azure.mgmt.databox.DataBoxManagementClient',
+                               [('jobs', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_databricksworkspace_facts': ('azure.mgmt.databricks.DatabricksClient',
+                                        [('workspaces',
+                                          'list_by_resource_group',
+                                          {'resource_group_name': 'resource_group'}),
+                                         ('workspaces', 'list_by_subscription', {})]),
+ 'azure_rm_datafactorydataset_facts': ('azure.mgmt.datafactory.DataFactoryManagementClient',
+                                       [('datasets',
+                                         'list_by_factory',
+                                         {'factory_name': 'factory_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_datafactoryfactory_facts': ('azure.mgmt.datafactory.DataFactoryManagementClient',
+                                       [('factories',
+                                         'list_by_resource_group',
+                                         {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_datafactoryintegrationruntime_facts': ('azure.mgmt.datafactory.DataFactoryManagementClient',
+                                                  [('integration_runtimes',
+                                                    'list_by_factory',
+                                                    {'factory_name': 'factory_name',
+                                                     'resource_group_name': 'resource_group'})]),
+ 'azure_rm_datafactorylinkedservice_facts': ('azure.mgmt.datafactory.DataFactoryManagementClient',
+                                             [('linked_services',
+                                               'list_by_factory',
+                                               {'factory_name': 'factory_name',
+                                                'resource_group_name': 'resource_group'})]),
+ 'azure_rm_datafactorypipeline_facts': ('azure.mgmt.datafactory.DataFactoryManagementClient',
+                                        [('pipelines',
+                                          'list_by_factory',
+                                          {'factory_name': 'factory_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_datafactoryreruntrigger_facts': ('azure.mgmt.datafactory.DataFactoryManagementClient',
+                                            [('rerun_triggers',
+                                              'list_by_trigger',
+                                              {'factory_name': 'factory_name',
+                                               'resource_group_name': 'resource_group',
+                                               'trigger_name': 'name'})]),
+ 'azure_rm_datafactorytrigger_facts': ('azure.mgmt.datafactory.DataFactoryManagementClient',
+                                       [('triggers',
+                                         'list_by_factory',
+                                         {'factory_name': 'factory_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_datamigrationservice_facts': ('azure.mgmt.datamigration.DataMigrationServiceClient',
+                                         [('services', 'list_by_resource_group', {'group_name': 'group_name'})]),
+ 'azure_rm_dedicatedhsm_facts': ('azure.mgmt.dedicatedhsm.AzureDedicatedHSMResourceProvider',
+                                 [('dedicated_hsm',
+                                   'list_by_resource_group',
+                                   {'resource_group_name': 'resource_group'}),
+                                  ('dedicated_hsm', 'list_by_subscription', {})]),
+ 'azure_rm_devspacescontroller_facts': ('azure.mgmt.devspaces.DevSpacesManagementClient',
+                                        [('controllers',
+                                          'list_by_resource_group',
+                                          {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_devtestlabsglobalschedule_facts': ('azure.mgmt.devtestlabs.DevTestLabsClient',
+                                              [('global_schedules',
+                                                'list_by_resource_group',
+                                                {'resource_group_name': 'resource_group'}),
+                                               ('global_schedules', 'list_by_subscription', {})]),
+ 'azure_rm_devtestlabslab_facts': ('azure.mgmt.devtestlabs.DevTestLabsClient',
+                                   [('labs', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                                    ('labs', 'list_by_subscription', {})]),
+ 'azure_rm_dnsrecordset_facts': ('azure.mgmt.dns.DnsManagementClient',
+                                 [('record_sets',
+                                   'list_by_type',
+                                   {'record_type': 'record_type',
+                                    'resource_group_name': 'resource_group',
+                                    'zone_name': 'zone_name'}),
+                                  ('record_sets',
+                                   'list_by_dns_zone',
+                                   {'resource_group_name': 'resource_group', 'zone_name': 'zone_name'})]),
+ 'azure_rm_dnszone_facts': ('azure.mgmt.dns.DnsManagementClient',
+                            [('zones', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_domainservice_facts': ('azure.mgmt.domainservices.DomainServicesResourceProvider',
+                                  [('domain_services',
+                                    'list_by_resource_group',
+                                    {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_eventgriddomain_facts': ('azure.mgmt.eventgrid.EventGridManagementClient',
+                                    [('domains', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                                     ('domains', 'list_by_subscription', {})]),
+ 'azure_rm_eventgriddomaintopic_facts': ('azure.mgmt.eventgrid.EventGridManagementClient',
+                                         [('domain_topics',
+                                           'list_by_domain',
+                                           {'domain_name': 'domain_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_eventgrideventsubscription_facts': ('azure.mgmt.eventgrid.EventGridManagementClient',
+                                               [('event_subscriptions',
+                                                 'list_by_resource',
+                                                 {'provider_namespace': 'provider_namespace',
+                                                  'resource_group_name': 'resource_group',
+                                                  'resource_name': 'resource_name',
+                                                  'resource_type_name': 'resource_type_name'}),
+                                                ('event_subscriptions',
+                                                 'list_by_domain_topic',
+                                                 {'domain_name': 'domain_name',
+                                                  'resource_group_name': 'resource_group',
+                                                  'topic_name': 'topic_name'})]),
+ 'azure_rm_eventgridtopic_facts': ('azure.mgmt.eventgrid.EventGridManagementClient',
+                                   [('topics', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                                    ('topics', 'list_by_subscription', {})]),
+ 'azure_rm_eventhub_facts': ('azure.mgmt.eventhub.EventHubManagementClient',
+                             [('event_hubs',
+                               'list_by_namespace',
+                               {'namespace_name': 'namespace_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_eventhubconsumergroup_facts': ('azure.mgmt.eventhub.EventHubManagementClient',
+                                          [('consumer_groups',
+                                            'list_by_event_hub',
+                                            {'event_hub_name': 'event_hub_name',
+                                             'namespace_name': 'namespace_name',
+                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_eventhubnamespace_facts': ('azure.mgmt.eventhub.EventHubManagementClient',
+                                      [('namespaces',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_eventhubregion_facts': ('azure.mgmt.eventhub.EventHubManagementClient',
+                                   [('regions', 'list_by_sku', {'sku': 'sku'})]),
+ 'azure_rm_frontdoor_facts': ('azure.mgmt.frontdoor.FrontDoorManagementClient',
+                              [('front_doors', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_frontdoorbackendpool_facts': ('azure.mgmt.frontdoor.FrontDoorManagementClient',
+                                         [('backend_pools',
+                                           'list_by_front_door',
+                                           {'front_door_name': 'front_door_name',
+                                            'resource_group_name': 'resource_group'})]),
+ 'azure_rm_frontdoorfrontendendpoint_facts': ('azure.mgmt.frontdoor.FrontDoorManagementClient',
+                                              [('frontend_endpoints',
+                                                'list_by_front_door',
+                                                {'front_door_name': 'front_door_name',
+                                                 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_frontdoorhealthprobesetting_facts': ('azure.mgmt.frontdoor.FrontDoorManagementClient',
+                                                [('health_probe_settings',
+                                                  'list_by_front_door',
+                                                  {'front_door_name': 'front_door_name',
+                                                   'resource_group_name': 'resource_group'})]),
+ 'azure_rm_frontdoorloadbalancingsetting_facts': ('azure.mgmt.frontdoor.FrontDoorManagementClient',
+                                                  [('load_balancing_settings',
+                                                    'list_by_front_door',
+                                                    {'front_door_name': 'front_door_name',
+                                                     'resource_group_name': 'resource_group'})]),
+ 'azure_rm_frontdoorroutingrule_facts': ('azure.mgmt.frontdoor.FrontDoorManagementClient',
+                                         [('routing_rules',
+                                           'list_by_front_door',
+                                           {'front_door_name': 'front_door_name',
+                                            'resource_group_name': 'resource_group'})]),
+ 'azure_rm_hanaonazurehanainstance_facts': ('azure.mgmt.hanaonazure.HanaManagementClient',
+                                            [('hana_instances',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_hdinsightcluster_facts': ('azure.mgmt.hdinsight.HDInsightManagementClient',
+                                     [('clusters',
+                                       'list_by_resource_group',
+                                       {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_iotcentralapp_facts': ('azure.mgmt.iotcentral.IotCentralClient',
+                                  [('apps', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                                   ('apps', 'list_by_subscription', {})]),
+ 'azure_rm_iothubcertificate_facts': ('azure.mgmt.iothub.IotHubClient',
+                                      [('certificates',
+                                        'list_by_iot_hub',
+                                        {'resource_group_name': 'resource_group', 'resource_name': 'resource_name'})]),
+ 'azure_rm_iothubprovisioningservicesiotdpsresource_facts': ('azure.mgmt.iothubprovisioningservices.IotDpsClient',
+                                                             [('iot_dps_resource',
+                                                               'list_by_resource_group',
+                                                               {'resource_group_name': 'resource_group'}),
+                                                              ('iot_dps_resource', 'list_by_subscription', {})]),
+ 'azure_rm_iothubresource_facts': ('azure.mgmt.iothub.IotHubClient',
+                                   [('iot_hub_resource',
+                                     'list_by_resource_group',
+                                     {'resource_group_name': 'resource_group'}),
+                                    ('iot_hub_resource', 'list_by_subscription', {})]),
+ 'azure_rm_iotspace_facts': ('azure.mgmt.iotspaces.IoTSpacesClient',
+                             [('io_tspaces', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_keyvaultvault_facts': ('azure.mgmt.keyvault.KeyVaultManagementClient',
+                                  [('vaults', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                                   ('vaults', 'list_by_subscription', {})]),
+ 'azure_rm_kustocluster_facts': ('azure.mgmt.kusto.KustoManagementClient',
+                                 [('clusters', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_kustodatabase_facts': ('azure.mgmt.kusto.KustoManagementClient',
+                                  [('databases',
+                                    'list_by_cluster',
+                                    {'cluster_name': 'cluster_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_kustoeventhubconnection_facts': ('azure.mgmt.kusto.KustoManagementClient',
+                                            [('event_hub_connections',
+                                              'list_by_database',
+                                              {'cluster_name': 'cluster_name',
+                                               'database_name': 'database_name',
+                                               'resource_group_name': 'resource_group'})]),
+ 'azure_rm_loganalyticsdatasource_facts': ('azure.mgmt.loganalytics.OperationalInsightsManagementClient',
+                                           [('data_sources',
+                                             'list_by_workspace',
+                                             {'filter': 'filter',
+                                              'resource_group_name': 'resource_group',
+                                              'workspace_name': 'workspace_name'})]),
+ 'azure_rm_loganalyticslinkedservice_facts': ('azure.mgmt.loganalytics.OperationalInsightsManagementClient',
+                                              [('linked_services',
+                                                'list_by_workspace',
+                                                {'resource_group_name': 'resource_group',
+                                                 'workspace_name': 'workspace_name'})]),
+ 'azure_rm_loganalyticsworkspace_facts': ('azure.mgmt.loganalytics.OperationalInsightsManagementClient',
+                                          [('workspaces',
+                                            'list_by_resource_group',
+                                            {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_logicintegrationaccount_facts': ('azure.mgmt.logic.LogicManagementClient',
+                                            [('integration_accounts',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'}),
+                                             ('integration_accounts', 'list_by_subscription', {})]),
+ 'azure_rm_logicworkflow_facts': ('azure.mgmt.logic.LogicManagementClient',
+                                  [('workflows', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                                   ('workflows', 'list_by_subscription', {})]),
+ 'azure_rm_machinelearningcomputeoperationalizationcluster_facts': ('azure.mgmt.machinelearningcompute.MachineLearningComputeManagementClient',
+                                                                    [('operationalization_clusters',
+                                                                      'list_by_resource_group',
+                                                                      {'resource_group_name': 'resource_group'}),
+                                                                     ('operationalization_clusters',
+                                                                      'list_by_subscription_id',
+                                                                      {})]),
+ 'azure_rm_machinelearningexperimentationaccount_facts': ('azure.mgmt.machinelearningexperimentation.MLTeamAccountManagementClient',
+                                                          [('accounts',
+                                                            'list_by_resource_group',
+                                                            {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_machinelearningexperimentationproject_facts': ('azure.mgmt.machinelearningexperimentation.MLTeamAccountManagementClient',
+                                                          [('projects',
+                                                            'list_by_workspace',
+                                                            {'account_name': 'account_name',
+                                                             'resource_group_name': 'resource_group',
+                                                             'workspace_name': 'workspace_name'})]),
+ 'azure_rm_machinelearningexperimentationworkspace_facts': ('azure.mgmt.machinelearningexperimentation.MLTeamAccountManagementClient',
+                                                            [('workspaces',
+                                                              'list_by_accounts',
+                                                              {'account_name': 'account_name',
+                                                               'resource_group_name': 'resource_group'})]),
+ 'azure_rm_mariadbconfiguration_facts': ('azure.mgmt.mariadb.MariaDBManagementClient',
+                                         [('configurations',
+                                           'list_by_server',
+                                           {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_mariadbdatabase_facts': ('azure.mgmt.mariadb.MariaDBManagementClient',
+                                    [('databases',
+                                      'list_by_server',
+                                      {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_mariadbfirewallrule_facts': ('azure.mgmt.mariadb.MariaDBManagementClient',
+                                        [('firewall_rules',
+                                          'list_by_server',
+                                          {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_mariadblogfile_facts': ('azure.mgmt.mariadb.MariaDBManagementClient',
+                                   [('log_files',
+                                     'list_by_server',
+                                     {'resource_group_name': 'resource_group', 'server_name': 'name'})]),
+ 'azure_rm_mariadbserver_facts': ('azure.mgmt.mariadb.MariaDBManagementClient',
+                                  [('servers', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_mariadbvirtualnetworkrule_facts': ('azure.mgmt.mariadb.MariaDBManagementClient',
+                                              [('virtual_network_rules',
+                                                'list_by_server',
+                                                {'resource_group_name': 'resource_group',
+                                                 'server_name': 'server_name'})]),
+ 'azure_rm_mediaservice_facts': ('azure.mgmt.media.AzureMediaServices',
+                                 [('mediaservices', 'list_by_subscription', {})]),
+ 'azure_rm_monitoractiongroup_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                       [('action_groups',
+                                         'list_by_resource_group',
+                                         {'resource_group_name': 'resource_group'}),
+                                        ('action_groups', 'list_by_subscription_id', {})]),
+ 'azure_rm_monitoractivitylogalert_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                            [('activity_log_alerts',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'}),
+                                             ('activity_log_alerts', 'list_by_subscription_id', {})]),
+ 'azure_rm_monitoralertrule_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                     [('alert_rules',
+                                       'list_by_resource_group',
+                                       {'resource_group_name': 'resource_group'}),
+                                      ('alert_rules', 'list_by_subscription', {})]),
+ 'azure_rm_monitoralertruleincident_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                             [('alert_rule_incidents',
+                                               'list_by_alert_rule',
+                                               {'resource_group_name': 'resource_group', 'rule_name': 'rule_name'})]),
+ 'azure_rm_monitorautoscalesetting_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                            [('autoscale_settings',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'}),
+                                             ('autoscale_settings', 'list_by_subscription', {})]),
+ 'azure_rm_monitormetricalert_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                       [('metric_alerts',
+                                         'list_by_resource_group',
+                                         {'resource_group_name': 'resource_group'}),
+                                        ('metric_alerts', 'list_by_subscription', {})]),
+ 'azure_rm_monitormetricalertsstatu_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                             [('metric_alerts_status',
+                                               'list_by_name',
+                                               {'resource_group_name': 'resource_group',
+                                                'rule_name': 'rule_name',
+                                                'status_name': 'status_name'})]),
+ 'azure_rm_monitormetricalertsstatus_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                              [('metric_alerts_status',
+                                                'list_by_name',
+                                                {'resource_group_name': 'resource_group',
+                                                 'rule_name': 'rule_name',
+                                                 'status_name': 'name'})]),
+ 'azure_rm_monitorscheduledqueryrule_facts': ('azure.mgmt.monitor.MonitorManagementClient',
+                                              [('scheduled_query_rules',
+                                                'list_by_resource_group',
+                                                {'resource_group_name': 'resource_group'}),
+                                               ('scheduled_query_rules', 'list_by_subscription', {})]),
+ 'azure_rm_msiuserassignedidentity_facts': ('azure.mgmt.msi.ManagedServiceIdentityClient',
+                                            [('user_assigned_identities',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'}),
+                                             ('user_assigned_identities', 'list_by_subscription', {})]),
+ 'azure_rm_mysqlconfiguration_facts': ('azure.mgmt.rdbms.mysql.MySQLManagementClient',
+                                       [('configurations',
+                                         'list_by_server',
+                                         {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_mysqldatabase_facts': ('azure.mgmt.rdbms.mysql.MySQLManagementClient',
+                                  [('databases',
+                                    'list_by_server',
+                                    {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_mysqlfirewallrule_facts': ('azure.mgmt.rdbms.mysql.MySQLManagementClient',
+                                      [('firewall_rules',
+                                        'list_by_server',
+                                        {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_mysqllogfile_facts': ('azure.mgmt.rdbms.mysql.MySQLManagementClient',
+                                 [('log_files',
+                                   'list_by_server',
+                                   {'resource_group_name': 'resource_group', 'server_name': 'name'})]),
+ 'azure_rm_openshiftmanagedclusterscontainerservice_facts': ('azure.mgmt.openshiftmanagedclusters.ContainerServiceClient',
+                                                             [('container_services',
+                                                               'list_by_resource_group',
+                                                               {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_openshiftmanagedclustersmanagedcluster_facts': ('azure.mgmt.openshiftmanagedclusters.ContainerServiceClient',
+                                                           [('managed_clusters',
+                                                             'list_by_resource_group',
+                                                             {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_operationsmanagementmanagementconfiguration_facts': ('azure.mgmt.operationsmanagement.OperationsManagementClient',
+                                                                [('management_configurations',
+                                                                  'list_by_subscription',
+                                                                  {})]),
+ 'azure_rm_operationsmanagementsolution_facts': ('azure.mgmt.operationsmanagement.OperationsManagementClient',
+                                                 [('solutions',
+                                                   'list_by_resource_group',
+                                                   {'resource_group_name': 'resource_group'}),
+                                                  ('solutions', 'list_by_subscription', {})]),
+ 'azure_rm_postgresqlconfiguration_facts': ('azure.mgmt.rdbms.postgresql.PostgreSQLManagementClient',
+                                            [('configurations',
+                                              'list_by_server',
+                                              {'resource_group_name': 'resource_group',
+                                               'server_name': 'server_name'})]),
+ 'azure_rm_postgresqldatabase_facts': ('azure.mgmt.rdbms.postgresql.PostgreSQLManagementClient',
+                                       [('databases',
+                                         'list_by_server',
+                                         {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_postgresqlfirewallrule_facts': ('azure.mgmt.rdbms.postgresql.PostgreSQLManagementClient',
+                                           [('firewall_rules',
+                                             'list_by_server',
+                                             {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_postgresqllogfile_facts': ('azure.mgmt.rdbms.postgresql.PostgreSQLManagementClient',
+                                      [('log_files',
+                                        'list_by_server',
+                                        {'resource_group_name': 'resource_group', 'server_name': 'name'})]),
+ 'azure_rm_postgresqlserver_facts': ('azure.mgmt.rdbms.postgresql.PostgreSQLManagementClient',
+                                     [('servers',
+                                       'list_by_resource_group',
+                                       {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_powerbidedicatedcapacity_facts': ('azure.mgmt.powerbidedicated.PowerBIDedicatedManagementClient',
+                                             [('capacities',
+                                               'list_by_resource_group',
+                                               {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_powerbiembeddedworkspacecollection_facts': ('azure.mgmt.powerbiembedded.PowerBIEmbeddedManagementClient',
+                                                       [('workspace_collections',
+                                                         'list_by_resource_group',
+                                                         {'resource_group_name': 'resource_group'}),
+                                                        ('workspace_collections', 'list_by_subscription', {})]),
+ 'azure_rm_recoveryservicesusage_facts': ('azure.mgmt.recoveryservices.RecoveryServicesClient',
+                                          [('usages',
+                                            'list_by_vaults',
+                                            {'resource_group_name': 'resource_group', 'vault_name': 'name'})]),
+ 'azure_rm_recoveryservicesvault_facts': ('azure.mgmt.recoveryservices.RecoveryServicesClient',
+                                          [('vaults',
+                                            'list_by_resource_group',
+                                            {'resource_group_name': 'resource_group'}),
+                                           ('vaults', 'list_by_subscription_id', {})]),
+ 'azure_rm_redis_facts': ('azure.mgmt.redis.RedisManagementClient',
+                          [('redis', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_redisfirewallrule_facts': ('azure.mgmt.redis.RedisManagementClient',
+                                      [('firewall_rules',
+                                        'list_by_redis_resource',
+                                        {'cache_name': 'cache_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_redispatchschedule_facts': ('azure.mgmt.redis.RedisManagementClient',
+                                       [('patch_schedules',
+                                         'list_by_redis_resource',
+                                         {'cache_name': 'cache_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_relayhybridconnection_facts': ('azure.mgmt.relay.RelayManagementClient',
+                                          [('hybrid_connections',
+                                            'list_by_namespace',
+                                            {'namespace_name': 'namespace_name',
+                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_relaynamespace_facts': ('azure.mgmt.relay.RelayManagementClient',
+                                   [('namespaces',
+                                     'list_by_resource_group',
+                                     {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_relaywcfrelay_facts': ('azure.mgmt.relay.RelayManagementClient',
+                                  [('wcf_relays',
+                                    'list_by_namespace',
+                                    {'namespace_name': 'namespace_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_resourcehealthavailabilitystatus_facts': ('azure.mgmt.resourcehealth.MicrosoftResourceHealth',
+                                                     [('availability_statuses',
+                                                       'list_by_resource_group',
+                                                       {'resource_group_name': 'resource_group'}),
+                                                      ('availability_statuses', 'list_by_subscription_id', {})]),
+ 'azure_rm_resourcehealthavailabilitystatuse_facts': ('azure.mgmt.resourcehealth.MicrosoftResourceHealth',
+                                                      [('availability_statuses',
+                                                        'list_by_resource_group',
+                                                        {'resource_group_name': 'resource_group'}),
+                                                       ('availability_statuses', 'list_by_subscription_id', {})]),
+ 'azure_rm_routefilter_facts': ('azure.mgmt.network.NetworkManagementClient',
+                                [('route_filters',
+                                  'list_by_resource_group',
+                                  {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_routefilterrule_facts': ('azure.mgmt.network.NetworkManagementClient',
+                                    [('route_filter_rules',
+                                      'list_by_route_filter',
+                                      {'resource_group_name': 'resource_group',
+                                       'route_filter_name': 'route_filter_name'})]),
+ 'azure_rm_schedulerjobcollection_facts': ('azure.mgmt.scheduler.SchedulerManagementClient',
+                                           [('job_collections',
+                                             'list_by_resource_group',
+                                             {'resource_group_name': 'resource_group'}),
+                                            ('job_collections', 'list_by_subscription', {})]),
+ 'azure_rm_searchquerykey_facts': ('azure.mgmt.search.SearchManagementClient',
+                                   [('query_keys',
+                                     'list_by_search_service',
+                                     {'resource_group_name': 'resource_group', 'search_service_name': 'name'})]),
+ 'azure_rm_searchservice_facts': ('azure.mgmt.search.SearchManagementClient',
+                                  [('services', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_servicebuseventhub_facts': ('azure.mgmt.servicebus.ServiceBusManagementClient',
+                                       [('event_hubs',
+                                         'list_by_namespace',
+                                         {'namespace_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_servicebusnamespace_facts': ('azure.mgmt.servicebus.ServiceBusManagementClient',
+                                        [('namespaces',
+                                          'list_by_resource_group',
+                                          {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_servicebusqueue_facts': ('azure.mgmt.servicebus.ServiceBusManagementClient',
+                                    [('queues',
+                                      'list_by_namespace',
+                                      {'namespace_name': 'namespace_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_servicebusregion_facts': ('azure.mgmt.servicebus.ServiceBusManagementClient',
+                                     [('regions', 'list_by_sku', {'sku': 'sku'})]),
+ 'azure_rm_servicebusrule_facts': ('azure.mgmt.servicebus.ServiceBusManagementClient',
+                                   [('rules',
+                                     'list_by_subscriptions',
+                                     {'namespace_name': 'namespace_name',
+                                      'resource_group_name': 'resource_group',
+                                      'subscription_name': 'subscription_name',
+                                      'topic_name': 'topic_name'})]),
+ 'azure_rm_servicebussubscription_facts': ('azure.mgmt.servicebus.ServiceBusManagementClient',
+                                           [('subscriptions',
+                                             'list_by_topic',
+                                             {'namespace_name': 'namespace_name',
+                                              'resource_group_name': 'resource_group',
+                                              'topic_name': 'topic_name'})]),
+ 'azure_rm_servicebustopic_facts': ('azure.mgmt.servicebus.ServiceBusManagementClient',
+                                    [('topics',
+                                      'list_by_namespace',
+                                      {'namespace_name': 'namespace_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_servicefabricmeshapplication_facts': ('azure.mgmt.servicefabricmesh.ServiceFabricMeshManagementClient',
+                                                 [('application',
+                                                   'list_by_resource_group',
+                                                   {'resource_group_name': 'resource_group'}),
+                                                  ('application', 'list_by_subscription', {})]),
+ 'azure_rm_servicefabricmeshgateway_facts': ('azure.mgmt.servicefabricmesh.ServiceFabricMeshManagementClient',
+                                             [('gateway',
+                                               'list_by_resource_group',
+                                               {'resource_group_name': 'resource_group'}),
+                                              ('gateway', 'list_by_subscription', {})]),
+ 'azure_rm_servicefabricmeshnetwork_facts': ('azure.mgmt.servicefabricmesh.ServiceFabricMeshManagementClient',
+                                             [('network',
+                                               'list_by_resource_group',
+                                               {'resource_group_name': 'resource_group'}),
+                                              ('network', 'list_by_subscription', {})]),
+ 'azure_rm_servicefabricmeshsecret_facts': ('azure.mgmt.servicefabricmesh.ServiceFabricMeshManagementClient',
+                                            [('secret',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'}),
+                                             ('secret', 'list_by_subscription', {})]),
+ 'azure_rm_servicefabricmeshvolume_facts': ('azure.mgmt.servicefabricmesh.ServiceFabricMeshManagementClient',
+                                            [('volume',
+                                              'list_by_resource_group',
+                                              {'resource_group_name': 'resource_group'}),
+                                             ('volume', 'list_by_subscription', {})]),
+ 'azure_rm_signalr_facts': ('azure.mgmt.signalr.SignalRManagementClient',
+                            [('signal_r', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                             ('signal_r', 'list_by_subscription', {})]),
+ 'azure_rm_sqlbackuplongtermretentionpolicy_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                     [('backup_long_term_retention_policies',
+                                                       'list_by_database',
+                                                       {'database_name': 'database_name',
+                                                        'resource_group_name': 'resource_group',
+                                                        'server_name': 'server_name'})]),
+ 'azure_rm_sqlbackupshorttermretentionpolicy_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                      [('backup_short_term_retention_policies',
+                                                        'list_by_database',
+                                                        {'database_name': 'database_name',
+                                                         'resource_group_name': 'resource_group',
+                                                         'server_name': 'server_name'})]),
+ 'azure_rm_sqlcapability_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                  [('capabilities', 'list_by_location', {'location_name': 'name'})]),
+ 'azure_rm_sqldatabase_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                [('databases',
+                                  'list_by_elastic_pool',
+                                  {'elastic_pool_name': 'name',
+                                   'resource_group_name': 'resource_group',
+                                   'server_name': 'server_name'}),
+                                 ('databases',
+                                  'list_by_server',
+                                  {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqldatabaseoperation_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                         [('database_operations',
+                                           'list_by_database',
+                                           {'database_name': 'name',
+                                            'resource_group_name': 'resource_group',
+                                            'server_name': 'server_name'})]),
+ 'azure_rm_sqldatabaseusage_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                     [('database_usages',
+                                       'list_by_database',
+                                       {'database_name': 'name',
+                                        'resource_group_name': 'resource_group',
+                                        'server_name': 'server_name'})]),
+ 'azure_rm_sqldatabasevulnerabilityassessmentscan_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                           [('database_vulnerability_assessment_scans',
+                                                             'list_by_database',
+                                                             {'database_name': 'database_name',
+                                                              'resource_group_name': 'resource_group',
+                                                              'server_name': 'server_name',
+                                                              'vulnerability_assessment_name': 'name'})]),
+ 'azure_rm_sqldatamaskingrule_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                       [('data_masking_rules',
+                                         'list_by_database',
+                                         {'data_masking_policy_name': 'name',
+                                          'database_name': 'database_name',
+                                          'resource_group_name': 'resource_group',
+                                          'server_name': 'server_name'})]),
+ 'azure_rm_sqlelasticpool_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                   [('elastic_pools',
+                                     'list_by_server',
+                                     {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlelasticpoolactivity_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                           [('elastic_pool_activities',
+                                             'list_by_elastic_pool',
+                                             {'elastic_pool_name': 'name',
+                                              'resource_group_name': 'resource_group',
+                                              'server_name': 'server_name'})]),
+ 'azure_rm_sqlelasticpooldatabaseactivity_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                   [('elastic_pool_database_activities',
+                                                     'list_by_elastic_pool',
+                                                     {'elastic_pool_name': 'name',
+                                                      'resource_group_name': 'resource_group',
+                                                      'server_name': 'server_name'})]),
+ 'azure_rm_sqlelasticpooloperation_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                            [('elastic_pool_operations',
+                                              'list_by_elastic_pool',
+                                              {'elastic_pool_name': 'name',
+                                               'resource_group_name': 'resource_group',
+                                               'server_name': 'server_name'})]),
+ 'azure_rm_sqlencryptionprotector_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                           [('encryption_protectors',
+                                             'list_by_server',
+                                             {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlfailovergroup_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                     [('failover_groups',
+                                       'list_by_server',
+                                       {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlfirewallrule_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                    [('firewall_rules',
+                                      'list_by_server',
+                                      {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlgeobackuppolicy_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                       [('geo_backup_policies',
+                                         'list_by_database',
+                                         {'database_name': 'database_name',
+                                          'resource_group_name': 'resource_group',
+                                          'server_name': 'server_name'})]),
+ 'azure_rm_sqlinstancefailovergroup_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                             [('instance_failover_groups',
+                                               'list_by_location',
+                                               {'location_name': 'location_name',
+                                                'resource_group_name': 'resource_group'})]),
+ 'azure_rm_sqljob_facts': ('azure.mgmt.sql.SqlManagementClient',
+                           [('jobs',
+                             'list_by_agent',
+                             {'job_agent_name': 'job_agent_name',
+                              'resource_group_name': 'resource_group',
+                              'server_name': 'server_name'})]),
+ 'azure_rm_sqljobagent_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                [('job_agents',
+                                  'list_by_server',
+                                  {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqljobcredential_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                     [('job_credentials',
+                                       'list_by_agent',
+                                       {'job_agent_name': 'job_agent_name',
+                                        'resource_group_name': 'resource_group',
+                                        'server_name': 'server_name'})]),
+ 'azure_rm_sqljobexecution_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                    [('job_executions',
+                                      'list_by_job',
+                                      {'job_agent_name': 'job_agent_name',
+                                       'job_name': 'name',
+                                       'resource_group_name': 'resource_group',
+                                       'server_name': 'server_name'}),
+                                     ('job_executions',
+                                      'list_by_agent',
+                                      {'job_agent_name': 'job_agent_name',
+                                       'resource_group_name': 'resource_group',
+                                       'server_name': 'server_name'})]),
+ 'azure_rm_sqljobstep_facts': ('azure.mgmt.sql.SqlManagementClient',
+                               [('job_steps',
+                                 'list_by_version',
+                                 {'job_agent_name': 'job_agent_name',
+                                  'job_name': 'job_name',
+                                  'job_version': 'job_version',
+                                  'resource_group_name': 'resource_group',
+                                  'server_name': 'server_name'}),
+                                ('job_steps',
+                                 'list_by_job',
+                                 {'job_agent_name': 'job_agent_name',
+                                  'job_name': 'job_name',
+                                  'resource_group_name': 'resource_group',
+                                  'server_name': 'server_name'})]),
+ 'azure_rm_sqljobstepexecution_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                        [('job_step_executions',
+                                          'list_by_job_execution',
+                                          {'job_agent_name': 'job_agent_name',
+                                           'job_execution_id': 'job_execution_id',
+                                           'job_name': 'job_name',
+                                           'resource_group_name': 'resource_group',
+                                           'server_name': 'server_name'})]),
+ 'azure_rm_sqljobtargetexecution_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                          [('job_target_executions',
+                                            'list_by_step',
+                                            {'job_agent_name': 'job_agent_name',
+                                             'job_execution_id': 'job_execution_id',
+                                             'job_name': 'job_name',
+                                             'resource_group_name': 'resource_group',
+                                             'server_name': 'server_name',
+                                             'step_name': 'name'}),
+                                           ('job_target_executions',
+                                            'list_by_job_execution',
+                                            {'job_agent_name': 'job_agent_name',
+                                             'job_execution_id': 'job_execution_id',
+                                             'job_name': 'job_name',
+                                             'resource_group_name': 'resource_group',
+                                             'server_name': 'server_name'})]),
+ 'azure_rm_sqljobtargetgroup_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                      [('job_target_groups',
+                                        'list_by_agent',
+                                        {'job_agent_name': 'job_agent_name',
+                                         'resource_group_name': 'resource_group',
+                                         'server_name': 'server_name'})]),
+ 'azure_rm_sqljobversion_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                  [('job_versions',
+                                    'list_by_job',
+                                    {'job_agent_name': 'job_agent_name',
+                                     'job_name': 'name',
+                                     'resource_group_name': 'resource_group',
+                                     'server_name': 'server_name'})]),
+ 'azure_rm_sqllongtermretentionbackup_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                               [('long_term_retention_backups',
+                                                 'list_by_database',
+                                                 {'location_name': 'location_name',
+                                                  'long_term_retention_database_name': 'long_term_retention_database_name',
+                                                  'long_term_retention_server_name': 'long_term_retention_server_name'}),
+                                                ('long_term_retention_backups',
+                                                 'list_by_server',
+                                                 {'location_name': 'location_name',
+                                                  'long_term_retention_server_name': 'long_term_retention_server_name'}),
+                                                ('long_term_retention_backups',
+                                                 'list_by_location',
+                                                 {'location_name': 'location_name'})]),
+ 'azure_rm_sqlmanageddatabase_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                       [('managed_databases',
+                                         'list_by_instance',
+                                         {'managed_instance_name': 'managed_instance_name',
+                                          'resource_group_name': 'resource_group'})]),
+ 'azure_rm_sqlmanageddatabasevulnerabilityassessmentscan_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                                  [('managed_database_vulnerability_assessment_scans',
+                                                                    'list_by_database',
+                                                                    {'database_name': 'database_name',
+                                                                     'managed_instance_name': 'managed_instance_name',
+                                                                     'resource_group_name': 'resource_group',
+                                                                     'vulnerability_assessment_name': 'name'})]),
+ 'azure_rm_sqlmanagedinstance_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                       [('managed_instances',
+                                         'list_by_resource_group',
+                                         {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_sqlmanagedinstanceencryptionprotector_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                          [('managed_instance_encryption_protectors',
+                                                            'list_by_instance',
+                                                            {'managed_instance_name': 'managed_instance_name',
+                                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_sqlmanagedinstancekey_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                          [('managed_instance_keys',
+                                            'list_by_instance',
+                                            {'managed_instance_name': 'managed_instance_name',
+                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_sqlrecommendedelasticpool_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                              [('recommended_elastic_pools',
+                                                'list_by_server',
+                                                {'resource_group_name': 'resource_group',
+                                                 'server_name': 'server_name'})]),
+ 'azure_rm_sqlrecoverabledatabase_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                           [('recoverable_databases',
+                                             'list_by_server',
+                                             {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlreplicationlink_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                       [('replication_links',
+                                         'list_by_database',
+                                         {'database_name': 'name',
+                                          'resource_group_name': 'resource_group',
+                                          'server_name': 'server_name'})]),
+ 'azure_rm_sqlrestorabledroppeddatabase_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                 [('restorable_dropped_databases',
+                                                   'list_by_server',
+                                                   {'resource_group_name': 'resource_group', 'server_name': 'name'})]),
+ 'azure_rm_sqlrestorepoint_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                    [('restore_points',
+                                      'list_by_database',
+                                      {'database_name': 'database_name',
+                                       'resource_group_name': 'resource_group',
+                                       'server_name': 'server_name'})]),
+ 'azure_rm_sqlserver_facts': ('azure.mgmt.sql.SqlManagementClient',
+                              [('servers', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_sqlserverazureadadministrator_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                  [('server_azure_ad_administrators',
+                                                    'list_by_server',
+                                                    {'resource_group_name': 'resource_group',
+                                                     'server_name': 'server_name'})]),
+ 'azure_rm_sqlservercommunicationlink_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                               [('server_communication_links',
+                                                 'list_by_server',
+                                                 {'resource_group_name': 'resource_group',
+                                                  'server_name': 'server_name'})]),
+ 'azure_rm_sqlserverdnsaliase_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                       [('server_dns_aliases',
+                                         'list_by_server',
+                                         {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlserverkey_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                 [('server_keys',
+                                   'list_by_server',
+                                   {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlserverusage_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                   [('server_usages',
+                                     'list_by_server',
+                                     {'resource_group_name': 'resource_group', 'server_name': 'name'})]),
+ 'azure_rm_sqlserviceobjective_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                        [('service_objectives',
+                                          'list_by_server',
+                                          {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlservicetieradvisor_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                          [('service_tier_advisors',
+                                            'list_by_database',
+                                            {'database_name': 'database_name',
+                                             'resource_group_name': 'resource_group',
+                                             'server_name': 'server_name'})]),
+ 'azure_rm_sqlsubscriptionusage_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                         [('subscription_usages',
+                                           'list_by_location',
+                                           {'location_name': 'location_name'})]),
+ 'azure_rm_sqlsyncagent_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                 [('sync_agents',
+                                   'list_by_server',
+                                   {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_sqlsyncgroup_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                 [('sync_groups',
+                                   'list_by_database',
+                                   {'database_name': 'database_name',
+                                    'resource_group_name': 'resource_group',
+                                    'server_name': 'server_name'})]),
+ 'azure_rm_sqlsyncmember_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                  [('sync_members',
+                                    'list_by_sync_group',
+                                    {'database_name': 'database_name',
+                                     'resource_group_name': 'resource_group',
+                                     'server_name': 'server_name',
+                                     'sync_group_name': 'sync_group_name'})]),
+ 'azure_rm_sqltransparentdataencryptionactivity_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                                         [('transparent_data_encryption_activities',
+                                                           'list_by_configuration',
+                                                           {'database_name': 'database_name',
+                                                            'resource_group_name': 'resource_group',
+                                                            'server_name': 'server_name',
+                                                            'transparent_data_encryption_name': 'name'})]),
+ 'azure_rm_sqlvirtualnetworkrule_facts': ('azure.mgmt.sql.SqlManagementClient',
+                                          [('virtual_network_rules',
+                                            'list_by_server',
+                                            {'resource_group_name': 'resource_group', 'server_name': 'server_name'})]),
+ 'azure_rm_storagesynccloudendpoint_facts': ('azure.mgmt.storagesync.StorageSyncManagementClient',
+                                             [('cloud_endpoints',
+                                               'list_by_sync_group',
+                                               {'resource_group_name': 'resource_group',
+                                                'storage_sync_service_name': 'storage_sync_service_name',
+                                                'sync_group_name': 'sync_group_name'})]),
+ 'azure_rm_storagesyncregisteredserver_facts': ('azure.mgmt.storagesync.StorageSyncManagementClient',
+                                                [('registered_servers',
+                                                  'list_by_storage_sync_service',
+                                                  {'resource_group_name': 'resource_group',
+                                                   'storage_sync_service_name': 'name'})]),
+ 'azure_rm_storagesyncserverendpoint_facts': ('azure.mgmt.storagesync.StorageSyncManagementClient',
+                                              [('server_endpoints',
+                                                'list_by_sync_group',
+                                                {'resource_group_name': 'resource_group',
+                                                 'storage_sync_service_name': 'storage_sync_service_name',
+                                                 'sync_group_name': 'sync_group_name'})]),
+ 'azure_rm_storagesyncservice_facts': ('azure.mgmt.storagesync.StorageSyncManagementClient',
+                                       [('storage_sync_services',
+                                         'list_by_resource_group',
+                                         {'resource_group_name': 'resource_group'}),
+                                        ('storage_sync_services', 'list_by_subscription', {})]),
+ 'azure_rm_storagesyncsyncgroup_facts': ('azure.mgmt.storagesync.StorageSyncManagementClient',
+                                         [('sync_groups',
+                                           'list_by_storage_sync_service',
+                                           {'resource_group_name': 'resource_group',
+                                            'storage_sync_service_name': 'storage_sync_service_name'})]),
+ 'azure_rm_storagesyncworkflow_facts': ('azure.mgmt.storagesync.StorageSyncManagementClient',
+                                        [('workflows',
+                                          'list_by_storage_sync_service',
+                                          {'resource_group_name': 'resource_group',
+                                           'storage_sync_service_name': 'name'})]),
+ 'azure_rm_storageusage_facts': ('azure.mgmt.storage.StorageManagementClient',
+                                 [('usages', 'list_by_location', {'location': 'location'})]),
+ 'azure_rm_storeaccount_facts': ('azure.mgmt.store.DataLakeStoreAccountManagementClient',
+                                 [('accounts', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storefirewallrule_facts': ('azure.mgmt.store.DataLakeStoreAccountManagementClient',
+                                      [('firewall_rules',
+                                        'list_by_account',
+                                        {'account_name': 'account_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storetrustedidprovider_facts': ('azure.mgmt.store.DataLakeStoreAccountManagementClient',
+                                           [('trusted_id_providers',
+                                             'list_by_account',
+                                             {'account_name': 'account_name',
+                                              'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storevirtualnetworkrule_facts': ('azure.mgmt.store.DataLakeStoreAccountManagementClient',
+                                            [('virtual_network_rules',
+                                              'list_by_account',
+                                              {'account_name': 'account_name',
+                                               'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimpleaccesscontrolrecord_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                                  [('access_control_records',
+                                                    'list_by_manager',
+                                                    {'manager_name': 'name',
+                                                     'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplealert_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                    [('alerts',
+                                      'list_by_manager',
+                                      {'manager_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplebackup_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                     [('backups',
+                                       'list_by_device',
+                                       {'device_name': 'device_name',
+                                        'manager_name': 'name',
+                                        'resource_group_name': 'resource_group'}),
+                                      ('backups',
+                                       'list_by_manager',
+                                       {'manager_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplebackupschedulegroup_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                                  [('backup_schedule_groups',
+                                                    'list_by_device',
+                                                    {'device_name': 'device_name',
+                                                     'manager_name': 'name',
+                                                     'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplechapsetting_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                          [('chap_settings',
+                                            'list_by_device',
+                                            {'device_name': 'device_name',
+                                             'manager_name': 'name',
+                                             'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimpledevice_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                     [('devices',
+                                       'list_by_manager',
+                                       {'manager_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplefileserver_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                         [('file_servers',
+                                           'list_by_device',
+                                           {'device_name': 'device_name',
+                                            'manager_name': 'name',
+                                            'resource_group_name': 'resource_group'}),
+                                          ('file_servers',
+                                           'list_by_manager',
+                                           {'manager_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplefileshare_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                        [('file_shares',
+                                          'list_by_file_server',
+                                          {'device_name': 'device_name',
+                                           'file_server_name': 'file_server_name',
+                                           'manager_name': 'name',
+                                           'resource_group_name': 'resource_group'}),
+                                         ('file_shares',
+                                          'list_by_device',
+                                          {'device_name': 'device_name',
+                                           'manager_name': 'name',
+                                           'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimpleiscsidisk_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                        [('iscsi_disks',
+                                          'list_by_iscsi_server',
+                                          {'device_name': 'device_name',
+                                           'iscsi_server_name': 'iscsi_server_name',
+                                           'manager_name': 'name',
+                                           'resource_group_name': 'resource_group'}),
+                                         ('iscsi_disks',
+                                          'list_by_device',
+                                          {'device_name': 'device_name',
+                                           'manager_name': 'name',
+                                           'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimpleiscsiserver_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                          [('iscsi_servers',
+                                            'list_by_device',
+                                            {'device_name': 'device_name',
+                                             'manager_name': 'name',
+                                             'resource_group_name': 'resource_group'}),
+                                           ('iscsi_servers',
+                                            'list_by_manager',
+                                            {'manager_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplejob_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                  [('jobs',
+                                    'list_by_device',
+                                    {'device_name': 'device_name',
+                                     'manager_name': 'manager_name',
+                                     'resource_group_name': 'resource_group'}),
+                                   ('jobs',
+                                    'list_by_manager',
+                                    {'manager_name': 'manager_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplemanager_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                      [('managers',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplestorageaccountcredential_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                                       [('storage_account_credentials',
+                                                         'list_by_manager',
+                                                         {'manager_name': 'name',
+                                                          'resource_group_name': 'resource_group'})]),
+ 'azure_rm_storsimplestoragedomain_facts': ('azure.mgmt.storsimple.StorSimpleManagementClient',
+                                            [('storage_domains',
+                                              'list_by_manager',
+                                              {'manager_name': 'name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_streamingjob_facts': ('azure.mgmt.streamingjobs.StreamAnalyticsManagementClient',
+                                 [('streaming_jobs',
+                                   'list_by_resource_group',
+                                   {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_streamingjobsfunction_facts': ('azure.mgmt.streamingjobs.StreamAnalyticsManagementClient',
+                                          [('functions',
+                                            'list_by_streaming_job',
+                                            {'job_name': 'job_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_streamingjobsinput_facts': ('azure.mgmt.streamingjobs.StreamAnalyticsManagementClient',
+                                       [('inputs',
+                                         'list_by_streaming_job',
+                                         {'job_name': 'job_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_streamingjobsoutput_facts': ('azure.mgmt.streamingjobs.StreamAnalyticsManagementClient',
+                                        [('outputs',
+                                          'list_by_streaming_job',
+                                          {'job_name': 'job_name', 'resource_group_name': 'resource_group'})]),
+ 'azure_rm_timeseriesinsightsaccesspolicy_facts': ('azure.mgmt.timeseriesinsights.TimeSeriesInsightsClient',
+                                                   [('access_policies',
+                                                     'list_by_environment',
+                                                     {'environment_name': 'environment_name',
+                                                      'resource_group_name': 'resource_group'})]),
+ 'azure_rm_timeseriesinsightsenvironment_facts': ('azure.mgmt.timeseriesinsights.TimeSeriesInsightsClient',
+                                                  [('environments',
+                                                    'list_by_resource_group',
+                                                    {'resource_group_name': 'resource_group'}),
+                                                   ('environments', 'list_by_subscription', {})]),
+ 'azure_rm_timeseriesinsightseventsource_facts': ('azure.mgmt.timeseriesinsights.TimeSeriesInsightsClient',
+                                                  [('event_sources',
+                                                    'list_by_environment',
+                                                    {'environment_name': 'environment_name',
+                                                     'resource_group_name': 'resource_group'})]),
+ 'azure_rm_timeseriesinsightsreferencedataset_facts': ('azure.mgmt.timeseriesinsights.TimeSeriesInsightsClient',
+                                                       [('reference_data_sets',
+                                                         'list_by_environment',
+                                                         {'environment_name': 'environment_name',
+                                                          'resource_group_name': 'resource_group'})]),
+ 'azure_rm_trafficmanagerprofile_facts': ('azure.mgmt.trafficmanager.TrafficManagerManagementClient',
+                                          [('profiles',
+                                            'list_by_resource_group',
+                                            {'resource_group_name': 'resource_group'}),
+                                           ('profiles', 'list_by_subscription', {})]),
+ 'azure_rm_webapp_facts': ('azure.mgmt.web.WebSiteManagementClient',
+                           [('web_apps', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_webappservicecertificateorder_facts': ('azure.mgmt.web.WebSiteManagementClient',
+                                                  [('app_service_certificate_orders',
+                                                    'list_by_resource_group',
+                                                    {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_webappserviceenvironment_facts': ('azure.mgmt.web.WebSiteManagementClient',
+                                             [('app_service_environments',
+                                               'list_by_resource_group',
+                                               {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_webappserviceplan_facts': ('azure.mgmt.web.WebSiteManagementClient',
+                                      [('app_service_plans',
+                                        'list_by_resource_group',
+                                        {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_webcertificate_facts': ('azure.mgmt.web.WebSiteManagementClient',
+                                   [('certificates',
+                                     'list_by_resource_group',
+                                     {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_webdomain_facts': ('azure.mgmt.web.WebSiteManagementClient',
+                              [('domains', 'list_by_resource_group', {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_webresourcehealthmetadata_facts': ('azure.mgmt.web.WebSiteManagementClient',
+                                              [('resource_health_metadata',
+                                                'list_by_site_slot',
+                                                {'name': 'name',
+                                                 'resource_group_name': 'resource_group',
+                                                 'slot': 'slot'}),
+                                               ('resource_health_metadata',
+                                                'list_by_site',
+                                                {'name': 'name', 'resource_group_name': 'resource_group'}),
+                                               ('resource_health_metadata',
+                                                'list_by_resource_group',
+                                                {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_webservice_facts': ('azure.mgmt.webservices.AzureMLWebServicesManagementClient',
+                               [('web_services', 'list_by_resource_group', {'resource_group_name': 'resource_group'}),
+                                ('web_services', 'list_by_subscription_id', {})]),
+ 'azure_rm_windowsiotservicesservice_facts': ('azure.mgmt.windowsiotservices.DeviceServices',
+                                              [('services',
+                                                'list_by_resource_group',
+                                                {'resource_group_name': 'resource_group'})]),
+ 'azure_rm_workloadmonitorcomponent_facts': ('azure.mgmt.workloadmonitor.WorkloadMonitorAPI',
+                                             [('components',
+                                               'list_by_resource',
+                                               {'resource_group_name': 'resource_group',
+                                                'resource_name': 'name',
+                                                'resource_namespace': 'resource_namespace',
+                                                'resource_type': 'resource_type'})]),
+ 'azure_rm_workloadmonitormonitor_facts': ('azure.mgmt.workloadmonitor.WorkloadMonitorAPI',
+                                           [('monitors',
+                                             'list_by_resource',
+                                             {'resource_group_name': 'resource_group',
+                                              'resource_name': 'name',
+                                              'resource_namespace': 'resource_namespace',
+                                              'resource_type': 'resource_type'})]),
+ 'azure_rm_workloadmonitormonitorinstance_facts': ('azure.mgmt.workloadmonitor.WorkloadMonitorAPI',
+                                                   [('monitor_instances',
+                                                     'list_by_resource',
+                                                     {'resource_group_name': 'resource_group',
+                                                      'resource_name': 'name',
+                                                      'resource_namespace': 'resource_namespace',
+                                                      'resource_type': 'resource_type'})]),
+ 'azure_rm_workloadmonitornotificationsetting_facts': ('azure.mgmt.workloadmonitor.WorkloadMonitorAPI',
+                                                       [('notification_settings',
+                                                         'list_by_resource',
+                                                         {'resource_group_name': 'resource_group',
+                                                          'resource_name': 'name',
+                                                          'resource_namespace': 'resource_namespace',
+                                                          'resource_type': 'resource_type'})])}
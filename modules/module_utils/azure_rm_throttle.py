@@ -0,0 +1,321 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Client side throttling: a token bucket per subscription and request kind shared by module
+# invocations through a file, fed by the x-ms-ratelimit-remaining-* headers of ARM, and retries
+# of 429 / 503 responses within a time budget.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import fcntl
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import mktime_tz, parsedate_tz
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+try:
+    from requests.adapters import BaseAdapter
+except ImportError:
+    # This is handled in azure_rm_common
+    BaseAdapter = object
+
+# environment variable naming the shared bucket file, requests are not rate limited when it is not set
+RATE_LIMIT_ENV = 'AZURE_RM_RATE_LIMIT'
+# environment variable with the seconds a module run may spend waiting to retry throttled requests
+RETRY_BUDGET_ENV = 'AZURE_RM_RETRY_BUDGET'
+DEFAULT_RETRY_BUDGET = 300
+
+# responses retried after Retry-After, or after BACKOFF_BASE * 2 ** attempt seconds without it
+RETRY_STATUS = (429, 503)
+MAX_RETRIES = 5
+BACKOFF_BASE = 2
+BACKOFF_MAX = 60
+
+# ARM token buckets per subscription: size and refill per second, by request kind
+BUCKETS = dict(reads=(250, 25.0), writes=(200, 10.0), deletes=(200, 10.0))
+
+KINDS = dict(GET='reads', HEAD='reads', DELETE='deletes')
+
+
+def request_kind(method):
+    return KINDS.get(method, 'writes')
+
+
+def bucket_key(url, kind):
+    '''
+    Bucket of a request: the subscription in its URL (tenant for requests outside subscriptions)
+    and its kind, e.g. 00000000-0000-0000-0000-000000000000/reads.
+    '''
+    match = re.match(r'^/subscriptions/([^/]+)', urlparse(url).path, re.IGNORECASE)
+    return '{0}/{1}'.format(match.group(1).lower() if match else 'tenant', kind)
+
+
+def retry_after(response, attempt, clock=time.time):
+    '''
+    Seconds to wait before retrying response: its Retry-After header (seconds or an HTTP date), or
+    exponential backoff.
+    '''
+    value = response.headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            date = parsedate_tz(value)
+            if date is not None:
+                return max(0.0, mktime_tz(date) - clock())
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+
+
+def remaining_quota(response, kind):
+    '''
+    Requests of kind ARM still allows, from the x-ms-ratelimit-remaining-subscription-<kind> (or
+    tenant) header of response; None when it has neither.
+    '''
+    for scope in ('subscription', 'tenant'):
+        value = response.headers.get('x-ms-ratelimit-remaining-{0}-{1}'.format(scope, kind))
+        if value is not None:
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class SharedBuckets(object):
+    '''
+    Token buckets in a JSON file, one per bucket_key(): the tokens left, when they were counted and
+    until when a 429 blocks the bucket.
+
+    Every access holds an exclusive lock on <path>.lock, like the token cache. Tokens are reserved
+    before a request is sent, so a bucket may go negative; the reserving process then waits until
+    the refill covers its token, and processes after it wait longer.
+    '''
+
+    def __init__(self, path, clock=time.time):
+        self.path = os.path.expanduser(path)
+        self.clock = clock
+
+    @contextmanager
+    def lock(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def reserve(self, key, kind):
+        '''
+        Take a token from bucket key.
+
+        :return: seconds to wait before sending the request
+        '''
+        with self.lock():
+            data = self._read()
+            bucket = self._refill(data, key, kind)
+            bucket['tokens'] -= 1
+            self._write(data)
+        now = bucket['updated']
+        wait = -bucket['tokens'] / BUCKETS[kind][1] if bucket['tokens'] < 0 else 0.0
+        return max(wait, bucket.get('blocked_until', 0) - now)
+
+    def update(self, key, kind, remaining=None, blocked_for=None):
+        '''
+        Lower the tokens of bucket key to the quota ARM reported and block it for blocked_for seconds.
+        '''
+        with self.lock():
+            data = self._read()
+            bucket = self._refill(data, key, kind)
+            if remaining is not None:
+                bucket['tokens'] = min(bucket['tokens'], remaining)
+            if blocked_for:
+                bucket['tokens'] = min(bucket['tokens'], 0)
+                bucket['blocked_until'] = max(bucket.get('blocked_until', 0), bucket['updated'] + blocked_for)
+            self._write(data)
+
+    def _refill(self, data, key, kind):
+        size, rate = BUCKETS[kind]
+        now = self.clock()
+        bucket = data.setdefault(key, dict(tokens=size, updated=now))
+        bucket['tokens'] = min(size, bucket['tokens'] + max(0.0, now - bucket['updated']) * rate)
+        bucket['updated'] = now
+        if bucket.get('blocked_until', 0) <= now:
+            bucket.pop('blocked_until', None)
+        return bucket
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write(self, data):
+        # replace the file atomically, readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or '.', prefix='.rate-limit')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.rename(tmp, self.path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+
+class Throttle(object):
+    '''
+    Throttling state of one module run: the shared buckets (None without AZURE_RM_RATE_LIMIT), the
+    retry budget in seconds and the counters returned in the module results (see stats()).
+    '''
+
+    def __init__(self, buckets=None, budget=DEFAULT_RETRY_BUDGET, sleep=time.sleep):
+        self.buckets = buckets
+        self.budget = budget
+        self.sleep = sleep
+        self.counters = dict(requests=0, retries=0, throttled=0, unavailable=0, waited=0.0)
+        self.remaining = {}
+        self._lock = threading.Lock()
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def wait(self, seconds):
+        if seconds > 0:
+            self.sleep(seconds)
+            self.count('waited', seconds)
+
+    def spend(self, seconds):
+        '''
+        Take seconds from the retry budget.
+
+        :return: False when the budget does not cover them
+        '''
+        with self._lock:
+            if seconds > self.budget:
+                return False
+            self.budget -= seconds
+            return True
+
+    def observe(self, key, remaining):
+        with self._lock:
+            self.remaining[key] = min(remaining, self.remaining.get(key, remaining))
+
+    def stats(self):
+        '''
+        Counters of the run: requests sent, retries, 429 and 503 responses, seconds waited, and the
+        lowest remaining quota ARM reported per bucket.
+        '''
+        with self._lock:
+            return dict(self.counters, waited=round(self.counters['waited'], 3), remaining=dict(self.remaining))
+
+    def active(self):
+        '''
+        Whether the counters are worth returning: the shared limiter is on or something was retried.
+        '''
+        return self.buckets is not None or self.counters['throttled'] or self.counters['unavailable']
+
+
+class ThrottleAdapter(BaseAdapter):
+    '''
+    requests transport adapter in front of another one.
+
+    Requests take a token of their bucket first and wait when the bucket is empty or blocked.
+    429 and 503 responses are retried after their Retry-After, at most MAX_RETRIES times and while
+    the retry budget of the run lasts; a 429 blocks the bucket for all module invocations sharing it.
+    The last response is returned as it is, so modules report errors as before.
+    '''
+
+    def __init__(self, inner, throttle):
+        super(ThrottleAdapter, self).__init__()
+        self.inner = inner
+        self.throttle = throttle
+
+    def send(self, request, **kwargs):
+        kind = request_kind(request.method)
+        key = bucket_key(request.url, kind)
+        buckets = self.throttle.buckets
+        attempt = 0
+        while True:
+            if buckets is not None:
+                self.throttle.wait(buckets.reserve(key, kind))
+            self.throttle.count('requests')
+            response = self.inner.send(request, **kwargs)
+
+            remaining = remaining_quota(response, kind)
+            if remaining is not None:
+                self.throttle.observe(key, remaining)
+            if response.status_code not in RETRY_STATUS:
+                if buckets is not None and remaining is not None:
+                    buckets.update(key, kind, remaining=remaining)
+                return response
+
+            self.throttle.count('throttled' if response.status_code == 429 else 'unavailable')
+            delay = retry_after(response, attempt)
+            if buckets is not None and response.status_code == 429:
+                buckets.update(key, kind, remaining=remaining, blocked_for=delay)
+            # streamed bodies cannot be sent again
+            if attempt >= MAX_RETRIES or hasattr(request.body, 'read') or not self.throttle.spend(delay):
+                return response
+            # read the error body so the connection goes back to the pool
+            response.content
+            response.close()
+            attempt += 1
+            self.throttle.count('retries')
+            if buckets is None or response.status_code != 429:
+                # with shared buckets reserve() waits for the block
+                self.throttle.wait(delay)
+
+    def close(self):
+        self.inner.close()
+
+
+def attach(client, throttle):
+    '''
+    Route the requests of a management client through a ThrottleAdapter of throttle, in front of
+    whatever adapter the session has (see azure_rm_etag.attach). 429 and 503 are left to it rather
+    than to the retry policy of the SDK, so they are counted and share the budget.
+    '''
+    retry = client.config.retry_policy.policy
+    retry.status_forcelist = [c for c in retry.status_forcelist if c not in RETRY_STATUS]
+    # urllib3 would still retry them when they carry Retry-After
+    retry.respect_retry_after_header = False
+    configure = client.config.session_configuration_callback
+    # by inner adapter, callbacks before this one may mount theirs again for every request
+    wrappers = {}
+
+    def session_configuration(session, global_config, local_config, **kwargs):
+        result = configure(session, global_config, local_config, **kwargs)
+        for prefix in ('https://', 'http://'):
+            adapter = session.get_adapter(prefix)
+            if not isinstance(adapter, ThrottleAdapter):
+                if adapter not in wrappers:
+                    wrappers[adapter] = ThrottleAdapter(adapter, throttle)
+                session.mount(prefix, wrappers[adapter])
+        return result
+
+    client.config.session_configuration_callback = session_configuration
+    return client
+
+
+def throttle(path=None, budget=None):
+    '''
+    Throttle sharing the buckets in path, or in the file named by AZURE_RM_RATE_LIMIT, with the
+    retry budget given or named by AZURE_RM_RETRY_BUDGET.
+
+    :return: Throttle, without shared buckets when no path is set
+    '''
+    path = path or os.environ.get(RATE_LIMIT_ENV)
+    if budget is None:
+        budget = float(os.environ.get(RETRY_BUDGET_ENV) or DEFAULT_RETRY_BUDGET)
+    return Throttle(SharedBuckets(path) if path else None, budget)
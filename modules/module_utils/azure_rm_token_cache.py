@@ -0,0 +1,160 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# On-disk AAD token cache shared by module invocations.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+try:
+    from msrestazure.azure_active_directory import ServicePrincipalCredentials
+except ImportError:
+    # This is handled in azure_rm_common
+    ServicePrincipalCredentials = object
+
+# environment variable naming the cache file, the cache is off when it is not set
+TOKEN_CACHE_ENV = 'AZURE_TOKEN_CACHE'
+
+# tokens this close to expiry are not used
+EXPIRY_MARGIN = 300
+
+
+class TokenCache(object):
+    '''
+    Access tokens in a JSON file, keyed by authority, tenant, client and resource.
+
+    Every access holds an exclusive lock on <path>.lock, so concurrent module invocations (Ansible
+    forks) that miss the cache wait for the first one to acquire the token instead of all asking
+    for one. The file also counts token hits and misses, see stats().
+    '''
+
+    def __init__(self, path, margin=EXPIRY_MARGIN, clock=time.time):
+        self.path = os.path.expanduser(path)
+        self.margin = margin
+        self.clock = clock
+
+    @staticmethod
+    def key(authority, tenant, client_id, resource, secret):
+        # the secret is part of the key so a wrong secret never gets a cached token
+        secret_hash = hashlib.sha256((secret or '').encode('utf-8')).hexdigest()
+        return hashlib.sha256(json.dumps([authority, tenant, client_id, resource, secret_hash]).encode('utf-8')).hexdigest()
+
+    @contextmanager
+    def lock(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def valid(self, token):
+        try:
+            return bool(token) and float(token.get('expires_on')) - self.clock() > self.margin
+        except (TypeError, ValueError):
+            return False
+
+    def get_or_acquire(self, key, acquire, section='tokens'):
+        '''
+        Return the cached token for key if it is valid, otherwise call acquire() and cache the
+        token it returns. Both happen under the lock.
+
+        Other sections of the file hold other values shared by module invocations, with an
+        expires_on like tokens; only tokens are counted in the stats.
+        '''
+        with self.lock():
+            data = self._read()
+            entries = data.setdefault(section, {})
+            token = entries.get(key)
+            if self.valid(token):
+                outcome = 'hits'
+            else:
+                token = acquire()
+                outcome = 'misses'
+                entries[key] = token
+            if section == 'tokens':
+                data['stats'][outcome] += 1
+            data[section] = dict((k, v) for k, v in entries.items() if self.valid(v))
+            self._write(data)
+            return token
+
+    def stats(self):
+        '''
+        Hit and miss counters since the cache file was created, with the hit rate.
+        '''
+        with self.lock():
+            stats = self._read()['stats']
+        total = stats['hits'] + stats['misses']
+        return dict(stats, hit_rate=float(stats['hits']) / total if total else None)
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            data = {}
+        data.setdefault('tokens', {})
+        data.setdefault('stats', {})
+        data['stats'].setdefault('hits', 0)
+        data['stats'].setdefault('misses', 0)
+        return data
+
+    def _write(self, data):
+        # replace the file atomically, readers never see a partial cache
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or '.', prefix='.token-cache')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.rename(tmp, self.path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+
+class CachedServicePrincipalCredentials(ServicePrincipalCredentials):
+    '''
+    Service principal credentials that take their token from the TokenCache in cache.
+
+    The token is also kept for the life of the object, the SDK asks for it before every request.
+    '''
+
+    cache = None
+
+    def set_token(self):
+        if self.cache is None:
+            return super(CachedServicePrincipalCredentials, self).set_token()
+        if self.cache.valid(self.token):
+            return
+        key = self.cache.key(self.cloud_environment.endpoints.active_directory, self._tenant, self.id, self.resource, self.secret)
+        self.token = self.cache.get_or_acquire(key, self._acquire_token)
+
+    def _acquire_token(self):
+        super(CachedServicePrincipalCredentials, self).set_token()
+        return self.token
+
+
+def use_token_cache(path=None):
+    '''
+    Make Ansible's Azure authentication use CachedServicePrincipalCredentials for service
+    principals, with the cache file path, or the one named by AZURE_TOKEN_CACHE.
+
+    :return: the TokenCache, None when no path is set
+    '''
+    path = path or os.environ.get(TOKEN_CACHE_ENV)
+    if not path:
+        return None
+    from ansible.module_utils import azure_rm_common
+    CachedServicePrincipalCredentials.cache = TokenCache(path)
+    azure_rm_common.ServicePrincipalCredentials = CachedServicePrincipalCredentials
+    return CachedServicePrincipalCredentials.cache
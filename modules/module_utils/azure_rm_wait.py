@@ -0,0 +1,166 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Waiting for asynchronous Azure Resource Manager operations.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import random
+import time
+from multiprocessing.pool import ThreadPool
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+DEFAULT_WAIT_TIMEOUT = 1800
+DEFAULT_POLL_INTERVAL = 5
+INITIAL_DELAY = 1
+MAX_DELAY = 30
+
+# final status of operations, as reported by Azure-AsyncOperation URLs
+TERMINAL_STATUSES = ('Succeeded', 'Failed', 'Canceled')
+
+
+def backoff_delays(initial=INITIAL_DELAY, maximum=MAX_DELAY, minimum=0):
+    '''
+    Generate exponentially growing delays with jitter.
+
+    Every delay is drawn from the upper half of the current backoff window, so concurrent callers
+    spread out without ever polling in a tight loop.
+
+    :param initial: first backoff window in seconds
+    :param maximum: cap of the backoff window in seconds
+    :param minimum: lower bound for every delay, e.g. a Retry-After value
+    '''
+    window = initial
+    while True:
+        yield max(minimum, window / 2.0 + random.uniform(0, window / 2.0))
+        window = min(window * 2, maximum)
+
+
+def retry_after(poller):
+    '''
+    Return the Retry-After value (seconds) of the last response seen by a poller, 0 if there is none.
+    '''
+    # msrest LROPoller keeps responses in its polling method, msrestazure AzureOperationPoller on itself
+    response = getattr(getattr(poller, '_polling_method', poller), '_response', None)
+    return retry_after_header(getattr(response, 'headers', None))
+
+
+def retry_after_header(headers):
+    '''
+    Return the Retry-After value (seconds) of response headers, 0 if there is none.
+    '''
+    headers = headers or {}
+    try:
+        return max(0, int(headers.get('retry-after') or headers.get('Retry-After') or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def operation_url(poller):
+    '''
+    Return the URL that reports the status of the operation behind a poller, None if there is none.
+    '''
+    operation = getattr(getattr(poller, '_polling_method', poller), '_operation', None)
+    return getattr(operation, 'async_url', None) or getattr(operation, 'location_url', None)
+
+
+class AcceptedResource(dict):
+    '''
+    Resource of an operation that is not awaited, when Azure accepted it without a response body:
+    only its id. Stands in for the SDK model, which modules read with as_dict().
+    '''
+
+    def as_dict(self):
+        return dict(self)
+
+
+def accepted_resource(poller):
+    '''
+    Return the resource as Azure accepted the operation behind a poller, before it completes.
+    '''
+    operation = getattr(getattr(poller, '_polling_method', poller), '_operation', None)
+    resource = getattr(operation, 'resource', None)
+    if resource is not None:
+        return resource
+    response = getattr(operation, 'initial_response', None) or getattr(poller, '_response', None)
+    url = getattr(getattr(response, 'request', None), 'url', None)
+    return AcceptedResource(id=urlparse(url).path if url else None)
+
+
+def wait_for_deletion(poller, exists, timeout=DEFAULT_WAIT_TIMEOUT, interval=INITIAL_DELAY, sleep=time.sleep, clock=time.time):
+    '''
+    Wait until a deleted resource is gone.
+
+    The delete poller is followed first, since it completes as soon as Azure reports the
+    operation finished. Some resources keep answering GET for a while after that, so the
+    resource is then probed with exponential backoff and jitter, never more often than the
+    Retry-After of the last operation response asks for.
+
+    :param poller: LROPoller / AzureOperationPoller returned by the SDK delete call, or None
+    :param exists: callable returning a truthy value while the resource still exists
+    :param timeout: overall time limit in seconds
+    :param interval: first backoff window in seconds
+    :return: True when the resource is gone, False on timeout
+    '''
+    deadline = clock() + timeout
+    if poller is not None and hasattr(poller, 'done'):
+        poller.wait(timeout=max(0, deadline - clock()))
+        if not poller.done():
+            return False
+    if not exists():
+        return True
+    for delay in backoff_delays(initial=interval, minimum=retry_after(poller)):
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return False
+        sleep(min(delay, remaining))
+        if not exists():
+            return True
+
+
+def wait_for_operations(urls, poll, timeout=DEFAULT_WAIT_TIMEOUT, interval=INITIAL_DELAY, concurrency=10, sleep=time.sleep,
+                        clock=time.time):
+    '''
+    Wait until many operations are finished.
+
+    Operations are polled at most concurrency at a time. Each one has its own exponential backoff
+    with jitter, never shorter than the Retry-After of its last response, so the operations still
+    running are polled less and less often while the others finish.
+
+    :param urls: operation URLs (Azure-AsyncOperation or Location)
+    :param poll: callable taking a URL and returning (status, Retry-After seconds, error message);
+                 status is one of TERMINAL_STATUSES once the operation is finished
+    :param timeout: overall time limit in seconds
+    :param interval: first backoff window in seconds
+    :return: one dictionary per URL, in order, with url, status (TimedOut for the operations still
+             running at the time limit), polls, seconds and error when the operation reported one
+    '''
+    start = clock()
+    deadline = start + timeout
+    states = [dict(url=url, status=None, polls=0, due=start, delays=backoff_delays(initial=interval)) for url in urls]
+    pool = ThreadPool(max(1, min(concurrency, len(states))))
+    try:
+        while True:
+            pending = [s for s in states if s['status'] not in TERMINAL_STATUSES]
+            if not pending:
+                break
+            now = clock()
+            if now >= deadline:
+                for state in pending:
+                    state.update(status='TimedOut', seconds=round(now - start, 1))
+                break
+            due = [s for s in pending if s['due'] <= now]
+            for state, (status, delay, error) in zip(due, pool.map(lambda s: poll(s['url']), due)):
+                now = clock()
+                state.update(status=status, polls=state['polls'] + 1, seconds=round(now - start, 1))
+                if error:
+                    state['error'] = error
+                state['due'] = now + max(delay, next(state['delays']))
+            waiting = [s['due'] for s in states if s['status'] not in TERMINAL_STATUSES]
+            if waiting:
+                sleep(max(0, min(min(waiting), deadline) - clock()))
+    finally:
+        pool.close()
+        pool.join()
+    return [dict((k, v) for k, v in s.items() if k not in ('due', 'delays')) for s in states]
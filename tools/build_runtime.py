@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Build runtime variants of the modules for shipping: DOCUMENTATION, EXAMPLES and RETURN are
+# emptied and the multi-line dict(...) argument spec of each module becomes a one-line literal.
+# Everything else, including line structure outside those blocks, is left as it is. Modules that
+# do not compile are copied unchanged and listed on stderr.
+#
+#   python tools/build_runtime.py [--output build/library] [module ...]
+#
+# Point Ansible's module path (ANSIBLE_LIBRARY / -M) at the output directory to run tasks with the
+# variants; ansible-doc needs the documented sources in modules/library. Needs Python 3.8+ (for
+# end_lineno) to build, the variants themselves run wherever the sources do.
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import ast
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(ROOT, 'modules', 'library')
+DEFAULT_OUTPUT = os.path.join(ROOT, 'build', 'library')
+
+DOC_VARIABLES = ('DOCUMENTATION', 'EXAMPLES', 'RETURN')
+
+
+class NotConstant(Exception):
+    pass
+
+
+def constant(node):
+    '''
+    Value of an expression built from literals and dict(key=...) calls, NotConstant for anything else.
+    '''
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'dict' and not node.args:
+        if any(kw.arg is None for kw in node.keywords):
+            raise NotConstant()
+        return dict((kw.arg, constant(kw.value)) for kw in node.keywords)
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise NotConstant()
+
+
+def runtime_source(source, path='<source>'):
+    '''
+    Return the runtime variant of a module source.
+
+    The source is compiled first: ast.parse() accepts some sources the compiler rejects (e.g. a
+    repeated keyword argument in the argument spec, which the literal would silently drop), and
+    variants must not compile where their sources do not.
+
+    :raises SyntaxError: when the source does not compile
+    '''
+    compile(source, path, 'exec')
+    tree = ast.parse(source)
+    lines = source.splitlines(True)
+    replacements = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if isinstance(target, ast.Name) and target.id in DOC_VARIABLES and node.col_offset == 0:
+            replacements.append((node, "{0} = ''\n".format(target.id)))
+        elif isinstance(target, ast.Attribute) and target.attr == 'module_arg_spec':
+            try:
+                spec = constant(node.value)
+            except NotConstant:
+                continue
+            replacements.append((node, '{0}self.module_arg_spec = {1!r}\n'.format(' ' * node.col_offset, spec)))
+    # keep the line count, so tracebacks of the variants point at the same lines as the sources
+    for node, text in sorted(replacements, key=lambda r: r[0].lineno, reverse=True):
+        count = node.end_lineno - node.lineno + 1
+        lines[node.lineno - 1:node.end_lineno] = [text] + ['\n'] * (count - 1)
+    result = ''.join(lines)
+    compile(result, '<runtime>', 'exec')
+    return result
+
+
+def build(modules, output):
+    '''
+    Write the runtime variants of modules (names without .py) to the output directory.
+
+    Modules that do not compile are copied unchanged.
+
+    :return: list of (module, source bytes, variant bytes), list of (module, error) of the modules
+             that do not compile
+    '''
+    if not os.path.isdir(output):
+        os.makedirs(output)
+    sizes = []
+    failed = []
+    for module in modules:
+        path = os.path.join(LIBRARY, module + '.py')
+        with open(path) as f:
+            source = f.read()
+        try:
+            variant = runtime_source(source, path)
+        except SyntaxError as exc:
+            failed.append((module, exc))
+            variant = source
+        with open(os.path.join(output, module + '.py'), 'w') as f:
+            f.write(variant)
+        sizes.append((module, len(source.encode('utf-8')), len(variant.encode('utf-8'))))
+    return sizes, failed
+
+
+def all_modules():
+    return sorted(name[:-3] for name in os.listdir(LIBRARY) if name.endswith('.py'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build runtime variants of the modules without documentation.')
+    parser.add_argument('modules', nargs='*', help='module names, all of modules/library by default')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='output directory (default %(default)s)')
+    args = parser.parse_args()
+
+    if sys.version_info < (3, 8):
+        parser.error('building needs Python 3.8 or later')
+    sizes, failed = build(args.modules or all_modules(), args.output)
+    for module, exc in failed:
+        print('{0}: does not compile, copied unchanged: {1} (line {2})'.format(module, exc.msg, exc.lineno), file=sys.stderr)
+    source = sum(s[1] for s in sizes)
+    variant = sum(s[2] for s in sizes)
+    print('{0} modules written to {1}: {2} -> {3} bytes ({4:.0%}), {5} copied unchanged'.format(
+        len(sizes), args.output, source, variant, float(variant) / source if source else 0, len(failed)))
+
+
+if __name__ == '__main__':
+    main()
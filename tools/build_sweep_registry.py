@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Build modules/module_utils/azure_rm_sweep_registry.py, the list operations azure_rm_facts_sweep
+# can run for each facts module: the management client the module uses and every
+# self.mgmt_client.<operations>.list*(...) call whose arguments are module options.
+#
+#   python tools/build_sweep_registry.py [--output modules/module_utils/azure_rm_sweep_registry.py]
+#
+# Run it again after adding or regenerating facts modules. Modules that do not compile are left out.
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import ast
+import os
+import pprint
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(ROOT, 'modules', 'library')
+DEFAULT_OUTPUT = os.path.join(ROOT, 'modules', 'module_utils', 'azure_rm_sweep_registry.py')
+
+HEADER = '''# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Generated by tools/build_sweep_registry.py, do not edit.
+#
+# SWEEP_TARGETS: by facts module, the import path of its management client and its list
+# operations as (operations group, method, {SDK argument: module option}).
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+'''
+
+
+def self_attribute(node, *names):
+    '''
+    Attribute names of a self.a.b... expression, None for anything else.
+    '''
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name) or node.id != 'self':
+        return None
+    return list(reversed(parts))
+
+
+def list_calls(tree):
+    '''
+    The client path and the list operations of a parsed facts module.
+    '''
+    client = None
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        target = self_attribute(node.func)
+        if target == ['get_mgmt_svc_client'] and client is None and node.args:
+            if isinstance(node.args[0], ast.Str):
+                client = node.args[0].s
+            continue
+        if not target or len(target) != 3 or target[0] != 'mgmt_client' or not target[2].startswith('list'):
+            continue
+        arguments = {}
+        for keyword in node.keywords:
+            option = self_attribute(keyword.value)
+            if keyword.arg is None or not option or len(option) != 1:
+                arguments = None
+                break
+            arguments[keyword.arg] = option[0]
+        if arguments is not None and node.args == [] and (target[1], target[2], arguments) not in calls:
+            calls.append((target[1], target[2], arguments))
+    return client, calls
+
+
+def build_registry():
+    '''
+    :return: dict of facts module name to (client path, list of list operations)
+    '''
+    registry = {}
+    for name in sorted(os.listdir(LIBRARY)):
+        if not name.endswith('_facts.py'):
+            continue
+        path = os.path.join(LIBRARY, name)
+        with open(path) as f:
+            source = f.read()
+        try:
+            # ast.parse() alone accepts sources the compiler rejects, e.g. repeated keyword arguments
+            compile(source, path, 'exec')
+        except SyntaxError:
+            continue
+        tree = ast.parse(source)
+        client, calls = list_calls(tree)
+        if client and calls:
+            registry[name[:-3]] = (client, calls)
+    return registry
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the list operations registry of azure_rm_facts_sweep.')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='output file (default %(default)s)')
+    args = parser.parse_args()
+
+    registry = build_registry()
+    with open(args.output, 'w') as f:
+        f.write(HEADER)
+        f.write('SWEEP_TARGETS = ')
+        f.write(pprint.pformat(registry, width=120))
+        f.write('\n')
+    print('{0} facts modules written to {1}'.format(len(registry), args.output))
+
+
+if __name__ == '__main__':
+    main()
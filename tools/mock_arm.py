@@ -0,0 +1,845 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Local stand-in for Azure Resource Manager.
+#
+# Implements enough of ARM, generically by resource ID, to run azure_rm_* modules offline:
+#
+#   - GET / PUT / PATCH / DELETE / HEAD on any resource ID, collection GET with nextLink paging
+#   - ETag on every resource, If-Match / If-None-Match preconditions (412 / 304)
+#   - ARM batch endpoint (POST /batch)
+#   - generic resource listing (GET .../resources) with tagName / tagValue / resourceType $filter
+#   - Resource Graph queries, for the KQL subset the facts modules generate
+#   - the price sheet, paged with $top / $skiptoken, and the rate card (stored like resources)
+#   - long running operations with Azure-AsyncOperation and Location headers and Retry-After
+#   - per subscription request quotas (--rate-limit): x-ms-ratelimit-remaining-subscription-* headers
+#     and 429 with Retry-After once a quota is used up
+#   - deleted resources that stay readable for a while (--delete-linger)
+#   - cloud metadata endpoint, so cloud_environment can point at the server
+#   - AAD token endpoint returning fake bearer tokens (--token-lifetime)
+#   - request / byte / connection counters at /_mock/stats, reset with POST /_mock/reset
+#   - optional TLS with a generated self-signed certificate (adal only talks to https
+#     authorities; point REQUESTS_CA_BUNDLE at the certificate)
+#
+# Run standalone:
+#
+#   python tools/mock_arm.py --port 8443 --tls /tmp/mock-arm [--lro-polls 2] [--page-size 50] [--seed resources.json]
+#
+# or in process:
+#
+#   server = start_server(lro_polls=2)
+#   ... server.url ...
+#   server.shutdown()
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import copy
+import datetime
+import json
+import math
+import os
+import re
+import ssl
+import subprocess
+import threading
+import time
+import uuid
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlencode, urlparse
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urllib import urlencode
+    from urlparse import parse_qs, urlparse
+
+
+RESOURCE_GRAPH_PATH = '/providers/microsoft.resourcegraph/resources'
+OPERATIONS_PATH = '/providers/mock.arm/operations/'
+OPERATION_RESULTS_PATH = '/providers/mock.arm/operationresults/'
+GENERIC_RESOURCES_PATH = r'^/subscriptions/[^/]+(/resourcegroups/[^/]+)?/resources$'
+PRICE_SHEET_PATH = r'^/subscriptions/[^/]+/providers/microsoft\.consumption/pricesheets/default$'
+RATE_CARD_PATH = r'^/subscriptions/[^/]+/providers/microsoft\.commerce/ratecard$'
+
+
+class ArmState(object):
+    '''
+    Resource store and counters shared by all request handler threads.
+    '''
+
+    def __init__(self, page_size=100, lro_polls=0, lro_seconds=None, retry_after=0, delete_linger=0, token_lifetime=3600,
+                 rate_limit=None, rate_burst=None):
+        self.page_size = page_size
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst or rate_limit
+        self.quotas = {}
+        self.token_lifetime = token_lifetime
+        self.lro_polls = lro_polls
+        self.lro_seconds = lro_seconds
+        self.retry_after = retry_after
+        self.delete_linger = delete_linger
+        self.lock = threading.RLock()
+        self.resources = {}
+        # time of the last PUT / PATCH of each resource, listed as changedTime
+        self.changed = {}
+        self.operations = {}
+        self.lingering = {}
+        self.etag_counter = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats = dict(requests=0, bytes_in=0, bytes_out=0, token_requests=0, batched_requests=0, connections=0,
+                              throttled=0, by_method={})
+
+    def count(self, method, bytes_in, bytes_out):
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_in'] += bytes_in
+            self.stats['bytes_out'] += bytes_out
+            self.stats['by_method'][method] = self.stats['by_method'].get(method, 0) + 1
+
+    def take_quota(self, subscription, kind):
+        '''
+        Take a request from the quota of a subscription, a token bucket of rate_burst requests
+        refilled with rate_limit per second.
+
+        :return: (requests remaining, seconds until one is available when none is)
+        '''
+        with self.lock:
+            now = time.time()
+            tokens, updated = self.quotas.get((subscription, kind), (self.rate_burst, now))
+            tokens = min(self.rate_burst, tokens + (now - updated) * self.rate_limit)
+            if tokens < 1:
+                self.quotas[(subscription, kind)] = (tokens, now)
+                self.stats['throttled'] += 1
+                return 0, (1 - tokens) / self.rate_limit
+            self.quotas[(subscription, kind)] = (tokens - 1, now)
+            return int(tokens - 1), 0
+
+    def next_etag(self):
+        with self.lock:
+            self.etag_counter += 1
+            return 'W/"{0}"'.format(self.etag_counter)
+
+    def put(self, resource_id, body):
+        body = copy.deepcopy(body) if isinstance(body, dict) else {}
+        segments = resource_id.strip('/').split('/')
+        body['id'] = resource_id
+        body['name'] = segments[-1]
+        body['type'] = resource_type(segments)
+        if isinstance(body.get('properties'), dict):
+            body['properties']['provisioningState'] = 'Succeeded'
+        body['etag'] = self.next_etag()
+        with self.lock:
+            self.resources[resource_id.lower()] = body
+            self.changed[resource_id.lower()] = time.time()
+            self.lingering.pop(resource_id.lower(), None)
+        return body
+
+    def seed(self, resources):
+        '''
+        Store resources, each with an "id", as unchanged since the epoch: only later PUTs and PATCHes
+        show up in changedTime.
+        '''
+        for resource in resources:
+            self.put(resource['id'], resource)
+            with self.lock:
+                self.changed[resource['id'].lower()] = 0
+
+    def get(self, resource_id):
+        with self.lock:
+            return copy.deepcopy(self.resources.get(resource_id.lower()))
+
+    def delete(self, resource_id):
+        '''
+        Delete a resource. With delete_linger the resource stays readable for that many seconds,
+        like some Azure resources do after their delete operation has finished.
+        '''
+        with self.lock:
+            key = resource_id.lower()
+            if key not in self.resources:
+                return False
+            if self.delete_linger:
+                self.lingering.setdefault(key, time.time() + self.delete_linger)
+            else:
+                del self.resources[key]
+            return True
+
+    def children(self, collection_path):
+        '''
+        Return resources directly under a collection path. Subscription scoped collections also
+        match resources in any resource group, "locations/<name>" segments filter by location.
+        '''
+        path = collection_path.rstrip('/').lower()
+        location = None
+        match = re.match(r'^(.*/providers/[^/]+)/locations/([^/]+)(/.*)$', path)
+        if match:
+            path = match.group(1) + match.group(3)
+            location = match.group(2)
+        subscription_scope = '/resourcegroups/' not in path and '/providers/' in path
+        with self.lock:
+            items = []
+            for key in sorted(self.resources):
+                parent = key.rsplit('/', 1)[0]
+                if subscription_scope:
+                    parent = re.sub(r'/resourcegroups/[^/]+', '', parent, count=1)
+                if parent != path:
+                    continue
+                body = self.resources[key]
+                if location and (body.get('location') or '').replace(' ', '').lower() != location:
+                    continue
+                items.append(copy.deepcopy(body))
+            return items
+
+    def generic_resources(self, scope):
+        '''
+        Return the resources of every type under a subscription or resource group path.
+        '''
+        prefix = scope.rstrip('/').lower() + '/'
+        with self.lock:
+            return [copy.deepcopy(r) for k, r in sorted(self.resources.items())
+                    if k.startswith(prefix) and '/providers/' in k]
+
+    def start_operation(self, resource_id, on_complete=None):
+        operation_id = str(uuid.uuid4())
+        with self.lock:
+            self.operations[operation_id] = dict(resource_id=resource_id, polls_left=self.lro_polls,
+                                                 deadline=time.time() + self.lro_seconds if self.lro_seconds is not None else None,
+                                                 on_complete=on_complete)
+        return operation_id
+
+    def poll_operation(self, operation_id):
+        '''
+        Advance an operation by one poll and return its status, None if unknown.
+        '''
+        with self.lock:
+            operation = self.operations.get(operation_id)
+            if operation is None:
+                return None
+            if operation['polls_left'] > 0:
+                operation['polls_left'] -= 1
+                if operation['polls_left'] > 0 or operation['deadline'] is None or time.time() < operation['deadline']:
+                    return 'InProgress'
+            self._complete(operation)
+            return 'Succeeded'
+
+    def settle(self):
+        '''
+        Complete operations whose lro_seconds have passed, whether or not anybody polled them, and
+        drop deleted resources whose linger time is over.
+        '''
+        now = time.time()
+        with self.lock:
+            for operation in self.operations.values():
+                if operation['deadline'] is not None and operation['deadline'] <= now:
+                    self._complete(operation)
+            for key, gone_at in list(self.lingering.items()):
+                if gone_at <= now:
+                    self.resources.pop(key, None)
+                    del self.lingering[key]
+
+    def _complete(self, operation):
+        operation['polls_left'] = 0
+        if operation['on_complete'] is not None:
+            operation['on_complete']()
+            operation['on_complete'] = None
+
+
+def resource_type(segments):
+    lowered = [s.lower() for s in segments]
+    if 'providers' in lowered:
+        index = len(lowered) - 1 - lowered[::-1].index('providers')
+        rest = segments[index + 1:]
+        return '/'.join([rest[0]] + rest[1::2])
+    if len(segments) == 4 and lowered[2] == 'resourcegroups':
+        return 'Microsoft.Resources/resourceGroups'
+    return segments[-2] if len(segments) > 1 else ''
+
+
+def is_collection(path):
+    segments = path.strip('/').split('/')
+    lowered = [s.lower() for s in segments]
+    if 'providers' in lowered:
+        index = len(lowered) - 1 - lowered[::-1].index('providers')
+        return len(segments[index + 2:]) % 2 == 1
+    return len(segments) % 2 == 1
+
+
+class ArmRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'MockARM/1.0'
+    _capturing = False
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        # one handler per accepted connection, keep-alive requests reuse it
+        with self.state.lock:
+            self.state.stats['connections'] += 1
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_HEAD(self):
+        self._dispatch('HEAD')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        self.query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        self._bytes_in = len(raw)
+        self.body = None
+        if raw:
+            try:
+                self.body = json.loads(raw.decode('utf-8'))
+            except ValueError:
+                self.body = raw.decode('utf-8', 'replace')
+        path = url.path
+        self.state.settle()
+
+        if path.startswith('/_mock/'):
+            return self._mock_control(method, path)
+        if path.startswith('/metadata/endpoints'):
+            return self._send(200, self._metadata())
+        if re.match(r'^/[^/]+/oauth2/(v2\.0/)?token$', path):
+            with self.state.lock:
+                self.state.stats['token_requests'] += 1
+            return self._send(200, self._token())
+        self._quota_headers = {}
+        match = re.match(r'^/subscriptions/([^/]+)', path, re.IGNORECASE)
+        if match and self.state.rate_limit:
+            kind = dict(GET='reads', HEAD='reads', DELETE='deletes').get(method, 'writes')
+            remaining, wait = self.state.take_quota(match.group(1).lower(), kind)
+            self._quota_headers['x-ms-ratelimit-remaining-subscription-' + kind] = str(remaining)
+            if wait:
+                return self._error(429, 'TooManyRequests', 'The request is being throttled.',
+                                   headers={'Retry-After': str(int(math.ceil(wait)))})
+        if path.rstrip('/').lower() == '/batch' and method == 'POST':
+            return self._batch()
+        if path.rstrip('/').lower() == RESOURCE_GRAPH_PATH and method == 'POST':
+            return self._resource_graph()
+        if OPERATIONS_PATH in path.lower():
+            return self._operation_status(path)
+        if OPERATION_RESULTS_PATH in path.lower():
+            return self._operation_result(path)
+        handler = getattr(self, '_resource_' + method.lower(), None)
+        if handler is None:
+            return self._error(405, 'MethodNotAllowed', 'Method {0} is not supported on {1}'.format(method, path))
+        return handler(path.rstrip('/'))
+
+    # resources
+
+    def _resource_get(self, path):
+        if re.match(RATE_CARD_PATH, path.lower()):
+            return self._rate_card(path)
+        if is_collection(path):
+            return self._list(path)
+        resource = self.state.get(path)
+        if resource is None:
+            return self._not_found(path)
+        if re.match(PRICE_SHEET_PATH, path.lower()):
+            return self._price_sheet(path, resource)
+        if self.headers.get('If-None-Match') == resource['etag']:
+            return self._send(304, None, headers={'ETag': resource['etag']})
+        return self._send(200, resource, headers={'ETag': resource['etag']})
+
+    def _resource_head(self, path):
+        resource = self.state.get(path)
+        if resource is None:
+            return self._send(404, None)
+        return self._send(204, None, headers={'ETag': resource['etag']})
+
+    def _resource_put(self, path):
+        existing = self.state.get(path)
+        if not self._preconditions(existing):
+            return
+        resource = self.state.put(path, self.body)
+        status = 200 if existing else 201
+        if self.state.lro_polls:
+            operation_id = self.state.start_operation(path)
+            return self._send(status, resource, headers=self._operation_headers(path, operation_id, location=False))
+        return self._send(status, resource, headers={'ETag': resource['etag']})
+
+    def _resource_patch(self, path):
+        existing = self.state.get(path)
+        if existing is None:
+            return self._not_found(path)
+        if not self._preconditions(existing):
+            return
+        merged = merge(existing, self.body if isinstance(self.body, dict) else {})
+        resource = self.state.put(path, merged)
+        return self._send(200, resource, headers={'ETag': resource['etag']})
+
+    def _resource_delete(self, path):
+        existing = self.state.get(path)
+        if existing is None:
+            return self._send(204, None)
+        if not self._preconditions(existing):
+            return
+        if self.state.lro_polls:
+            operation_id = self.state.start_operation(path, on_complete=lambda: self.state.delete(path))
+            return self._send(202, None, headers=self._operation_headers(path, operation_id, location=True))
+        self.state.delete(path)
+        return self._send(200, None)
+
+    def _resource_post(self, path):
+        # actions (listKeys, restart, ...) succeed with an empty body
+        return self._send(200, {})
+
+    # resource graph
+
+    def _resource_graph(self):
+        '''
+        Resource Graph query endpoint for the KQL the facts modules generate:
+        Resources | where <column> =~ / == '<value>' | where <column> in~ ('<value>', ...)
+                  | where isnotnull(tags['<key>']) | project <columns>
+        '''
+        body = self.body if isinstance(self.body, dict) else {}
+        options = body.get('options') or {}
+        subscriptions = [s.lower() for s in body.get('subscriptions') or []]
+        try:
+            filters, columns = parse_kql(body.get('query', ''))
+        except ValueError as exc:
+            return self._error(400, 'InvalidQuery', str(exc))
+        with self.state.lock:
+            resources = [copy.deepcopy(r) for k, r in sorted(self.state.resources.items())
+                         if '/providers/' in k and k.split('/')[2] in subscriptions]
+        rows = []
+        for resource in resources:
+            row = graph_row(resource)
+            if all(f(row) for f in filters):
+                rows.append(dict((c, row.get(c)) for c in columns) if columns else row)
+        start = int(options.get('$skipToken') or 0)
+        top = int(options.get('$top') or 100)
+        page = dict(totalRecords=len(rows), count=len(rows[start:start + top]), data=rows[start:start + top],
+                    resultTruncated='false')
+        if start + top < len(rows):
+            page['$skipToken'] = str(start + top)
+        return self._send(200, page)
+
+    # batch
+
+    def _batch(self):
+        '''
+        ARM batch endpoint: run every request of the body and answer all of them at once.
+        '''
+        requests = (self.body or {}).get('requests', []) if isinstance(self.body, dict) else []
+        responses = []
+        saved = self.query, self.body
+        self._capturing = True
+        try:
+            for request in requests:
+                url = urlparse(request.get('url', ''))
+                self.query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+                self.body = request.get('content')
+                self._captured = None
+                handler = getattr(self, '_resource_' + request.get('httpMethod', 'GET').lower(), None)
+                if handler is None:
+                    self._error(405, 'MethodNotAllowed', 'Method {0} is not supported'.format(request.get('httpMethod')))
+                else:
+                    handler(url.path.rstrip('/'))
+                status, body, headers = self._captured
+                responses.append(dict(name=request.get('name'), httpStatusCode=status, headers=headers or {},
+                                      content=body, contentLength=len(json.dumps(body)) if body is not None else 0))
+        finally:
+            self.query, self.body = saved
+            self._capturing = False
+        with self.state.lock:
+            self.state.stats['batched_requests'] += len(requests)
+        return self._send(200, dict(responses=responses))
+
+    def _list(self, path):
+        if re.match(GENERIC_RESOURCES_PATH, path.lower()):
+            return self._generic_list(path)
+        items = self.state.children(path)
+        return self._send_page(path, items)
+
+    def _generic_list(self, path):
+        '''
+        Resources API listing. Like ARM, a tag filter is only combined with its tag value, and
+        resources listed with a tag filter are returned without tags. $expand=changedTime adds the
+        time of the last PUT / PATCH.
+        '''
+        try:
+            conditions = parse_odata_filter(self.query.get('$filter', ''))
+        except ValueError as exc:
+            return self._error(400, 'InvalidFilter', str(exc))
+        if 'tagName' in conditions and set(conditions) - set(['tagName', 'tagValue']):
+            return self._error(400, 'InvalidFilter', 'tagName cannot be combined with other filters.')
+        items = []
+        for resource in self.state.generic_resources(path[:-len('/resources')]):
+            tags = resource.get('tags') or {}
+            if 'resourceType' in conditions and resource.get('type', '').lower() != conditions['resourceType'].lower():
+                continue
+            if 'tagName' in conditions:
+                if conditions['tagName'] not in tags:
+                    continue
+                if 'tagValue' in conditions and tags[conditions['tagName']] != conditions['tagValue']:
+                    continue
+            item = dict((k, resource[k]) for k in ('id', 'name', 'type', 'location', 'kind', 'sku', 'tags') if k in resource)
+            if 'changedtime' in self.query.get('$expand', '').lower():
+                changed = datetime.datetime.utcfromtimestamp(self.state.changed.get(resource['id'].lower(), 0))
+                item['changedTime'] = changed.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+            if 'tagName' in conditions:
+                item.pop('tags', None)
+            items.append(item)
+        return self._send_page(path, items)
+
+    def _send_page(self, path, items):
+        skip = int(self.query.get('$skiptoken') or 0)
+        top = int(self.query.get('$top') or self.state.page_size)
+        page = items[skip:skip + top]
+        result = dict(value=page)
+        if skip + top < len(items):
+            query = dict(self.query)
+            query['$skiptoken'] = str(skip + top)
+            result['nextLink'] = '{0}{1}?{2}'.format(self.server.url, path, urlencode(query))
+        return self._send(200, result)
+
+    def _price_sheet(self, path, resource):
+        '''
+        The price sheet seeded at path, with one page of its properties.pricesheets and the nextLink
+        of the next one in properties.
+        '''
+        properties = resource.setdefault('properties', {})
+        entries = properties.get('pricesheets') or []
+        skip = int(self.query.get('$skiptoken') or 0)
+        top = int(self.query.get('$top') or self.state.page_size)
+        properties['pricesheets'] = entries[skip:skip + top]
+        if skip + top < len(entries):
+            query = dict(self.query)
+            query['$skiptoken'] = str(skip + top)
+            properties['nextLink'] = '{0}{1}?{2}'.format(self.server.url, path, urlencode(query))
+        return self._send(200, resource)
+
+    def _rate_card(self, path):
+        '''
+        The rate card seeded at path, whatever the $filter; it is a plain document, not a resource.
+        '''
+        resource = self.state.get(path)
+        if resource is None:
+            return self._not_found(path)
+        return self._send(200, dict((k, v) for k, v in resource.items() if k not in ('id', 'name', 'type', 'etag')))
+
+    def _preconditions(self, existing):
+        if_match = self.headers.get('If-Match')
+        if_none_match = self.headers.get('If-None-Match')
+        etag = existing['etag'] if existing else None
+        if if_match and (etag is None or (if_match != '*' and if_match != etag)):
+            self._error(412, 'PreconditionFailed', 'The condition specified using HTTP conditional header(s) is not met.')
+            return False
+        if if_none_match == '*' and existing is not None:
+            self._error(412, 'PreconditionFailed', 'The resource already exists.')
+            return False
+        return True
+
+    # long running operations
+
+    def _operation_headers(self, path, operation_id, location):
+        subscription = '/'.join(path.split('/')[:3])
+        headers = {
+            'Azure-AsyncOperation': '{0}{1}{2}{3}?api-version=mock'.format(self.server.url, subscription, OPERATIONS_PATH, operation_id),
+            'Retry-After': str(self.state.retry_after)
+        }
+        if location:
+            headers['Location'] = '{0}{1}{2}{3}?api-version=mock'.format(self.server.url, subscription, OPERATION_RESULTS_PATH, operation_id)
+        return headers
+
+    def _operation_status(self, path):
+        operation_id = path.rstrip('/').split('/')[-1]
+        status = self.state.poll_operation(operation_id)
+        if status is None:
+            return self._not_found(path)
+        return self._send(200, dict(name=operation_id, status=status), headers={'Retry-After': str(self.state.retry_after)})
+
+    def _operation_result(self, path):
+        operation_id = path.rstrip('/').split('/')[-1]
+        status = self.state.poll_operation(operation_id)
+        if status is None:
+            return self._not_found(path)
+        if status == 'InProgress':
+            return self._send(202, None, headers={'Location': self.server.url + path, 'Retry-After': str(self.state.retry_after)})
+        return self._send(204, None)
+
+    # auth, metadata and control
+
+    def _metadata(self):
+        return {
+            'galleryEndpoint': self.server.url + '/',
+            'graphEndpoint': self.server.url + '/',
+            'portalEndpoint': self.server.url + '/',
+            'authentication': {
+                # msrestazure skips adal authority validation (a call to the public cloud) for ADFS
+                'loginEndpoint': self.server.url + '/adfs',
+                'audiences': [self.server.url + '/']
+            }
+        }
+
+    def _token(self):
+        now = int(time.time())
+        lifetime = self.state.token_lifetime
+        return {
+            'token_type': 'Bearer',
+            'access_token': 'mock-' + str(uuid.uuid4()),
+            'expires_in': str(lifetime),
+            'expires_on': str(now + lifetime),
+            'not_before': str(now),
+            'resource': self.server.url + '/'
+        }
+
+    def _mock_control(self, method, path):
+        if path == '/_mock/stats' and method == 'GET':
+            with self.state.lock:
+                stats = copy.deepcopy(self.state.stats)
+            return self._send(200, stats, count=False)
+        if path == '/_mock/reset' and method == 'POST':
+            self.state.reset_stats()
+            return self._send(204, None, count=False)
+        if path == '/_mock/resources' and method == 'GET':
+            with self.state.lock:
+                resources = sorted(r['id'] for r in self.state.resources.values())
+            return self._send(200, dict(value=resources), count=False)
+        if path == '/_mock/resources' and method == 'PUT':
+            self.state.seed(self.body or [])
+            return self._send(204, None, count=False)
+        if path == '/_mock/resources' and method == 'DELETE':
+            with self.state.lock:
+                self.state.resources.clear()
+                self.state.lingering.clear()
+            return self._send(204, None, count=False)
+        return self._error(404, 'NotFound', path, count=False)
+
+    # responses
+
+    def _not_found(self, path):
+        return self._error(404, 'ResourceNotFound', "The resource '{0}' was not found.".format(path))
+
+    def _error(self, status, code, message, count=True, headers=None):
+        return self._send(status, dict(error=dict(code=code, message=message)), headers=headers, count=count)
+
+    def _send(self, status, body, headers=None, count=True):
+        if self._capturing:
+            # response of a request inside a batch
+            self._captured = (status, body, headers)
+            return
+        payload = b'' if body is None else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('x-ms-request-id', str(uuid.uuid4()))
+        if body is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for name, value in getattr(self, '_quota_headers', {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if payload and self.command != 'HEAD':
+            self.wfile.write(payload)
+        if count:
+            self.state.count(self.command, self._bytes_in, len(payload))
+
+
+def graph_row(resource):
+    segments = resource['id'].strip('/').split('/')
+    row = dict(resource)
+    row['type'] = resource.get('type', '').lower()
+    row['subscriptionId'] = segments[1]
+    row['resourceGroup'] = segments[3].lower() if len(segments) > 3 and segments[2].lower() == 'resourcegroups' else ''
+    row['location'] = (resource.get('location') or '').replace(' ', '').lower()
+    row.pop('etag', None)
+    return row
+
+
+def parse_kql(query):
+    '''
+    Parse the small KQL subset used by the facts modules into row predicates and projected columns.
+    '''
+    clauses = [c.strip() for c in query.split('|')]
+    if not clauses or clauses[0].lower() != 'resources':
+        raise ValueError('only queries on the Resources table are supported')
+    filters = []
+    columns = None
+    string = r"'((?:[^'\\]|\\.)*)'"
+    for clause in clauses[1:]:
+        match = re.match(r"^where (\w+)(?:\[" + string + r"\])? (=~|==) " + string + r"$", clause)
+        if match:
+            column, key, op, value = match.group(1), match.group(2), match.group(3), unescape(match.group(4))
+            filters.append(kql_compare(column, unescape(key) if key is not None else None, op, value))
+            continue
+        match = re.match(r"^where (\w+) in~ \(((?:\s*" + string + r"\s*,?)+)\)$", clause)
+        if match:
+            column, values = match.group(1), set(unescape(v).lower() for v in re.findall(string, match.group(2)))
+            filters.append(lambda row, column=column, values=values: (row.get(column) or '').lower() in values)
+            continue
+        match = re.match(r"^where isnotnull\(tags\[" + string + r"\]\)$", clause)
+        if match:
+            key = unescape(match.group(1))
+            filters.append(lambda row, key=key: key in (row.get('tags') or {}))
+            continue
+        match = re.match(r"^project (.+)$", clause)
+        if match:
+            columns = [c.strip() for c in match.group(1).split(',')]
+            continue
+        raise ValueError('unsupported clause: {0}'.format(clause))
+    return filters, columns
+
+
+def parse_odata_filter(expression):
+    '''
+    Parse a $filter of "<name> eq '<value>'" conditions joined with "and" into a dictionary.
+    '''
+    conditions = {}
+    for condition in re.split(r'\s+and\s+', expression.strip()) if expression.strip() else []:
+        match = re.match(r"^(tagName|tagValue|resourceType) eq '((?:[^']|'')*)'$", condition.strip())
+        if not match:
+            raise ValueError('unsupported filter: {0}'.format(condition))
+        conditions[match.group(1)] = match.group(2).replace("''", "'")
+    return conditions
+
+
+def unescape(value):
+    return re.sub(r'\\(.)', r'\1', value)
+
+
+def kql_compare(column, key, op, value):
+    def predicate(row):
+        actual = row.get(column)
+        if key is not None:
+            actual = (actual or {}).get(key)
+        if actual is None:
+            return False
+        return actual.lower() == value.lower() if op == '=~' else actual == value
+    return predicate
+
+
+def merge(target, patch):
+    result = copy.deepcopy(target)
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = merge(result[key], value)
+        else:
+            result[key] = copy.deepcopy(value)
+    return result
+
+
+class MockArmServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, state, verbose=False, certificate=None):
+        HTTPServer.__init__(self, address, ArmRequestHandler)
+        self.state = state
+        self.verbose = verbose
+        scheme = 'http'
+        if certificate:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certificate[0], certificate[1])
+            self.socket = context.wrap_socket(self.socket, server_side=True)
+            scheme = 'https'
+        self.url = '{0}://{1}:{2}'.format(scheme, self.server_address[0], self.server_address[1])
+
+
+def self_signed_certificate(directory):
+    '''
+    Create (once) a self-signed certificate for 127.0.0.1 / localhost in directory using the
+    openssl command line and return (certfile, keyfile).
+    '''
+    certfile = os.path.join(directory, 'mock-arm.crt')
+    keyfile = os.path.join(directory, 'mock-arm.key')
+    if not (os.path.exists(certfile) and os.path.exists(keyfile)):
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        subprocess.check_call(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '30',
+                               '-subj', '/CN=127.0.0.1', '-addext', 'subjectAltName=IP:127.0.0.1,DNS:localhost',
+                               '-keyout', keyfile, '-out', certfile],
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return certfile, keyfile
+
+
+def start_server(host='127.0.0.1', port=0, seed=None, verbose=False, certificate=None, **options):
+    '''
+    Start the mock server on a background thread and return it; call shutdown() to stop.
+
+    :param certificate: optional (certfile, keyfile) to serve https
+    :param options: ArmState options (page_size, lro_polls, lro_seconds, retry_after, delete_linger, token_lifetime,
+                    rate_limit, rate_burst)
+    '''
+    server = MockArmServer((host, port), ArmState(**options), verbose=verbose, certificate=certificate)
+    server.state.seed(seed or [])
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for Azure Resource Manager.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--page-size', type=int, default=100, help='items per page of collection GETs')
+    parser.add_argument('--lro-polls', type=int, default=0,
+                        help='number of InProgress polls before an operation succeeds, 0 for synchronous PUT / DELETE')
+    parser.add_argument('--delete-linger', type=float, default=0,
+                        help='seconds a deleted resource stays readable after its delete has completed')
+    parser.add_argument('--lro-seconds', type=float,
+                        help='operations also complete after this many seconds, even if nobody polls them')
+    parser.add_argument('--retry-after', type=int, default=0, help='Retry-After value sent with operation responses')
+    parser.add_argument('--token-lifetime', type=int, default=3600, help='lifetime in seconds of the tokens issued')
+    parser.add_argument('--rate-limit', type=float,
+                        help='requests per second each subscription may send per kind (reads, writes, deletes), unlimited by default')
+    parser.add_argument('--rate-burst', type=int, help='requests a subscription may send at once, --rate-limit by default')
+    parser.add_argument('--seed', help='JSON file with a list of resources (each with an "id") to preload')
+    parser.add_argument('--tls', metavar='DIR', help='serve https with a self-signed certificate kept in DIR')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    seed = None
+    if args.seed:
+        with open(args.seed) as f:
+            seed = json.load(f)
+    certificate = self_signed_certificate(args.tls) if args.tls else None
+    server = MockArmServer((args.host, args.port), ArmState(page_size=args.page_size,
+                                                             lro_polls=args.lro_polls,
+                                                             lro_seconds=args.lro_seconds,
+                                                             retry_after=args.retry_after,
+                                                             delete_linger=args.delete_linger,
+                                                             token_lifetime=args.token_lifetime,
+                                                             rate_limit=args.rate_limit,
+                                                             rate_burst=args.rate_burst),
+                           verbose=args.verbose, certificate=certificate)
+    server.state.seed(seed or [])
+    print('Mock ARM listening on {0}'.format(server.url))
+    if certificate:
+        print('Set REQUESTS_CA_BUNDLE={0} for clients'.format(certificate[0]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
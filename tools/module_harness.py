@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Run azure_rm_* modules against the local ARM stand-in (tools/mock_arm.py) and record
+# wall time, HTTP calls, bytes transferred and peak RSS of every run.
+#
+# Single module, repeated:
+#
+#   python tools/module_harness.py azure_rm_sqlfirewallrule \
+#       -a '{"resource_group": "rg", "server_name": "srv", "name": "rule", "start_ip_address": "10.0.0.1", "end_ip_address": "10.0.0.1"}' \
+#       --repeat 3
+#
+# Scenario file (JSON):
+#
+#   {
+#     "server": {"lro_polls": 2, "page_size": 10},
+#     "seed": [{"id": "/subscriptions/.../resourceGroups/rg", "location": "westeurope"}],
+#     "steps": [
+#       {"module": "azure_rm_sqlfirewallrule", "args": {...}, "expect": {"changed": true}},
+#       {"module": "azure_rm_sqlfirewallrule_facts", "args": {...}, "repeat": 5},
+#       {"module": "azure_rm_sqlserver_facts", "args": {"page_size": 10}, "follow": "next_link"}
+#     ]
+#   }
+#
+#   python tools/module_harness.py --scenario scenario.json --output results.json
+#
+# Modules run in a child Python with modules/module_utils on the ansible.module_utils path,
+# so Ansible and the Azure SDK must be installed; no Azure account is needed. Steps with
+# "expect" that do not match make the harness exit non-zero, so scenarios double as offline
+# regression tests for LRO and paging behaviour. A step with "follow" runs again with that result
+# key passed back as the option of the same name until the result no longer has it. A step with
+# "register": "name" keeps its result, and later argument values "@name.key" (dotted keys allowed)
+# are replaced by values of it, e.g. to pass an operation_url on to azure_rm_async_wait. A step with
+# "expect_output" checks the output_file of its result (see check_output).
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    from urllib.request import Request, urlopen
+except ImportError:
+    from urllib2 import Request, urlopen
+
+import mock_arm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(ROOT, 'modules', 'library')
+MODULE_UTILS = os.path.join(ROOT, 'modules', 'module_utils')
+INVENTORY_PLUGINS = os.path.join(ROOT, 'modules', 'inventory_plugins')
+
+sys.path.insert(0, MODULE_UTILS)
+from azure_rm_broker import BROKER_ENV  # noqa: E402
+from azure_rm_token_cache import TOKEN_CACHE_ENV, TokenCache  # noqa: E402
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+# (certfile, keyfile) of the mock server, the Azure SDK only authenticates against https
+CERTIFICATE = None
+
+# token cache file shared by the module runs, None to authenticate in every run
+TOKEN_CACHE = None
+
+# connection broker socket used by the module runs, None to connect directly
+BROKER = None
+
+# directory the modules are run from, None for modules/library
+MODULE_LIBRARY = None
+
+BOOTSTRAP = '''
+import runpy, sys
+import ansible.module_utils
+ansible.module_utils.__path__.insert(0, sys.argv[1])
+sys.argv = sys.argv[2:]
+runpy.run_path(sys.argv[0], run_name='__main__')
+'''
+
+
+def module_env(server_url, extra=None):
+    env = dict(os.environ)
+    if CERTIFICATE:
+        env['REQUESTS_CA_BUNDLE'] = CERTIFICATE[0]
+    if TOKEN_CACHE:
+        env[TOKEN_CACHE_ENV] = TOKEN_CACHE
+    if BROKER:
+        env[BROKER_ENV] = BROKER
+    env.update({
+        'AZURE_SUBSCRIPTION_ID': SUBSCRIPTION_ID,
+        'AZURE_CLIENT_ID': 'mock-client',
+        'AZURE_SECRET': 'mock-secret',
+        'AZURE_TENANT': 'mock-tenant',
+        'AZURE_CLOUD_ENVIRONMENT': server_url,
+    })
+    env.update(extra or {})
+    return env
+
+
+def mock_request(server_url, method, path, body=None):
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    request = Request(server_url + path, data=data)
+    request.get_method = lambda: method
+    if data is not None:
+        request.add_header('Content-Type', 'application/json')
+    context = None
+    if server_url.startswith('https'):
+        context = ssl.create_default_context(cafile=CERTIFICATE[0] if CERTIFICATE else os.environ.get('REQUESTS_CA_BUNDLE'))
+    response = urlopen(request, context=context)
+    payload = response.read()
+    return json.loads(payload.decode('utf-8')) if payload else None
+
+
+def run_child(command, server_url, env):
+    '''
+    Run a child process against the mock server.
+
+    :return: (return code, stdout, stderr, wall seconds, resource usage, mock stats)
+    '''
+    mock_request(server_url, 'POST', '/_mock/reset')
+    with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+        start = time.time()
+        process = subprocess.Popen(command, stdout=stdout_file, stderr=stderr_file, env=module_env(server_url, env))
+        # wait4 reports the resource usage of this child only
+        pid, status, usage = os.wait4(process.pid, 0)
+        wall = time.time() - start
+        rc = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        stdout = stdout_file.read()
+        stderr = stderr_file.read()
+    return rc, stdout, stderr, wall, usage, mock_request(server_url, 'GET', '/_mock/stats')
+
+
+def run_module(module, args, server_url, env=None):
+    '''
+    Run one module invocation and return its measurements and parsed result.
+    '''
+    path = module if os.path.isfile(module) else os.path.join(MODULE_LIBRARY or LIBRARY, module + '.py')
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        # as Ansible does, so per module settings such as AZURE_RM_LOG_LEVEL apply
+        json.dump({'ANSIBLE_MODULE_ARGS': dict(args, _ansible_module_name=os.path.basename(path)[:-3])}, f)
+        args_file = f.name
+    try:
+        rc, stdout, stderr, wall, usage, stats = run_child([sys.executable, '-c', BOOTSTRAP, MODULE_UTILS, path, args_file],
+                                                           server_url, env)
+    finally:
+        os.unlink(args_file)
+
+    try:
+        result = json.loads(stdout.decode('utf-8'))
+    except ValueError:
+        result = dict(failed=True, msg='module did not return JSON', stdout=stdout.decode('utf-8', 'replace'),
+                      stderr=stderr.decode('utf-8', 'replace'))
+    return make_measurement(os.path.basename(path)[:-3], rc, result, wall, usage, stats)
+
+
+def run_inventory(config, server_url, env=None, flush_cache=False):
+    '''
+    Run ansible-inventory with the azure_rm_inventory plugin and config (the options of its YAML file),
+    after removing the file at its cache_path with flush_cache.
+
+    :return: measurements, with the result holding hosts (host variables by host name) and groups
+             (host names by group)
+    '''
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'harness.azure_rm_inventory.yml')
+    with open(path, 'w') as f:
+        # JSON is YAML
+        json.dump(dict(config, plugin='azure_rm_inventory'), f)
+    command = [sys.executable, os.path.join(os.path.dirname(sys.executable), 'ansible-inventory'), '-i', path, '--list']
+    if flush_cache and config.get('cache_path') and os.path.exists(config['cache_path']):
+        # ansible-inventory has no --flush-cache before Ansible 2.10
+        os.unlink(config['cache_path'])
+    env = dict(env or {}, ANSIBLE_INVENTORY_PLUGINS=INVENTORY_PLUGINS, ANSIBLE_INVENTORY_ENABLED='azure_rm_inventory',
+               ANSIBLE_INVENTORY_UNPARSED_FAILED='true')
+    try:
+        rc, stdout, stderr, wall, usage, stats = run_child(command, server_url, env)
+    finally:
+        os.unlink(path)
+        os.rmdir(directory)
+
+    try:
+        listing = json.loads(stdout.decode('utf-8'))
+        groups = dict((name, sorted(group.get('hosts', []))) for name, group in listing.items() if name != '_meta')
+        result = dict(hosts=listing['_meta']['hostvars'], groups=groups)
+    except (ValueError, KeyError):
+        lines = stderr.decode('utf-8', 'replace').strip().splitlines()
+        result = dict(failed=True, msg=lines[-1] if lines else 'ansible-inventory returned no inventory')
+    return make_measurement('azure_rm_inventory', rc, result, wall, usage, stats)
+
+
+def make_measurement(name, rc, result, wall, usage, stats):
+    return dict(
+        module=name,
+        rc=rc,
+        changed=result.get('changed'),
+        failed=bool(result.get('failed')),
+        msg=result.get('msg'),
+        wall_ms=round(wall * 1000, 1),
+        http_calls=stats['requests'],
+        token_requests=stats['token_requests'],
+        # less the connection of the stats request itself
+        connections=stats['connections'] - 1,
+        bytes_in=stats['bytes_in'],
+        bytes_out=stats['bytes_out'],
+        peak_rss_kb=peak_rss_kb(usage),
+        result=result
+    )
+
+
+def peak_rss_kb(usage):
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+
+
+def check_expect(measurement, expect):
+    failures = []
+    for key, value in (expect or {}).items():
+        # key|length compares the length of a list or dictionary of the result
+        length = key.endswith('|length')
+        path = key[:-len('|length')] if length else key
+        actual = measurement['result'].get(path, measurement.get(path))
+        if actual is None and '.' in path:
+            # dotted keys compare a value nested in the result, e.g. snapshot.fetched or items.0.name
+            actual = measurement['result']
+            for part in path.split('.'):
+                if isinstance(actual, list) and part.isdigit():
+                    actual = actual[int(part)] if int(part) < len(actual) else None
+                else:
+                    actual = actual.get(part) if isinstance(actual, dict) else None
+        if length:
+            actual = len(actual) if actual is not None else None
+        if actual != value:
+            failures.append('{0}: expected {1!r}, got {2!r}'.format(key, value, actual))
+    return failures
+
+
+def check_output(result, expect):
+    '''
+    Compare the output_file of a result with expect: its size must be the bytes of the result, and
+    lines and first_line (NDJSON, CSV) or rows and columns (Parquet, read with pyarrow) must match.
+    '''
+    if not expect:
+        return []
+    path = result.get('output_file')
+    if not path or not os.path.exists(path):
+        return ['output_file: {0!r} does not exist'.format(path)]
+    failures = []
+    size = os.path.getsize(path)
+    if size != result.get('bytes'):
+        failures.append('output_file: {0} bytes, the result says {1!r}'.format(size, result.get('bytes')))
+    if 'rows' in expect or 'columns' in expect:
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(path)
+        actual = dict(rows=table.num_rows, columns=table.column_names)
+    else:
+        with open(path, 'rb') as f:
+            lines = f.read().decode('utf-8').splitlines()
+        actual = dict(lines=len(lines), first_line=lines[0] if lines else None)
+    for key, value in expect.items():
+        if actual.get(key) != value:
+            failures.append('output_file {0}: expected {1!r}, got {2!r}'.format(key, value, actual.get(key)))
+    return failures
+
+
+def resolve_args(value, registered):
+    '''
+    Replace "@name.key" strings in value by the values of registered results.
+    '''
+    if isinstance(value, dict):
+        return dict((k, resolve_args(v, registered)) for k, v in value.items())
+    if isinstance(value, list):
+        return [resolve_args(v, registered) for v in value]
+    if isinstance(value, str) and value.startswith('@') and value[1:].split('.')[0] in registered:
+        parts = value[1:].split('.')
+        value = registered[parts[0]]
+        for part in parts[1:]:
+            value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def seed_resource_groups(steps, server_url):
+    '''
+    Create the resource groups referenced by steps, so scenarios only need to seed the resources
+    they are about.
+    '''
+    names = set(step.get('args', {}).get('resource_group') for step in steps) - set([None])
+    resources = [dict(id='/subscriptions/{0}/resourceGroups/{1}'.format(SUBSCRIPTION_ID, name), location='westeurope')
+                 for name in sorted(names)]
+    mock_request(server_url, 'PUT', '/_mock/resources', resources)
+
+
+def run_steps(steps, server_url):
+    measurements = []
+    failures = 0
+    registered = {}
+    for step in steps:
+        for i in range(step.get('repeat', 1)):
+            args = resolve_args(dict(step.get('args', {})), registered)
+            while True:
+                if 'inventory' in step:
+                    measurement = run_inventory(resolve_args(step['inventory'], registered), server_url, env=step.get('env'),
+                                                flush_cache=step.get('flush_cache', False))
+                else:
+                    measurement = run_module(step['module'], args, server_url, env=step.get('env'))
+                problems = check_expect(measurement, step.get('expect'))
+                problems += check_output(measurement['result'], step.get('expect_output'))
+                measurement['expect_failures'] = problems
+                failures += 1 if problems else 0
+                measurements.append(measurement)
+                print_row(measurement)
+                if step.get('register'):
+                    registered[step['register']] = measurement['result']
+                follow = step.get('follow')
+                if not follow or measurement['result'].get(follow) is None:
+                    break
+                args[follow] = measurement['result'][follow]
+    return measurements, failures
+
+
+def print_header():
+    print('{0:<48} {1:>3} {2:>7} {3:>10} {4:>6} {5:>6} {6:>10} {7:>10} {8:>10}'.format(
+        'module', 'rc', 'changed', 'wall ms', 'calls', 'conns', 'bytes in', 'bytes out', 'rss kb'))
+
+
+def print_row(m):
+    print('{0:<48} {1:>3} {2:>7} {3:>10} {4:>6} {5:>6} {6:>10} {7:>10} {8:>10}{9}'.format(
+        m['module'], m['rc'], str(m['changed']), m['wall_ms'], m['http_calls'], m['connections'], m['bytes_in'], m['bytes_out'],
+        m['peak_rss_kb'], '  ' + '; '.join(m['expect_failures']) if m['expect_failures'] else
+        ('  ' + str(m['msg']) if m['failed'] else '')))
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run azure_rm_* modules against a local ARM stand-in.')
+    parser.add_argument('module', nargs='?', help='module name (modules/library/<name>.py) or path')
+    parser.add_argument('-a', '--args', default='{}', help='module arguments as JSON')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--scenario', help='JSON scenario file with "server", "seed" and "steps"')
+    parser.add_argument('--server', help='URL of an already running mock server (set REQUESTS_CA_BUNDLE for https); '
+                                         'one is started otherwise')
+    parser.add_argument('--cert-dir', default=os.path.join(tempfile.gettempdir(), 'mock-arm'),
+                        help='directory for the self-signed certificate of the started server')
+    parser.add_argument('--lro-polls', type=int, default=0)
+    parser.add_argument('--lro-seconds', type=float)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--token-cache', metavar='PATH',
+                        help='token cache file for the modules (AZURE_TOKEN_CACHE), its hit rate is reported at the end')
+    parser.add_argument('--broker', metavar='PATH',
+                        help='connection broker socket for the modules (AZURE_RM_BROKER), started by the first run')
+    parser.add_argument('--library',
+                        help='directory of the modules instead of modules/library, e.g. the runtime variants '
+                             'of tools/build_runtime.py')
+    parser.add_argument('--output', help='write all measurements as JSON to this file')
+    args = parser.parse_args()
+
+    if args.scenario:
+        with open(args.scenario) as f:
+            scenario = json.load(f)
+    elif args.module:
+        scenario = dict(steps=[dict(module=args.module, args=json.loads(args.args), repeat=args.repeat)])
+    else:
+        parser.error('either a module or --scenario is required')
+
+    global CERTIFICATE, TOKEN_CACHE, BROKER, MODULE_LIBRARY
+    MODULE_LIBRARY = args.library
+    TOKEN_CACHE = args.token_cache
+    BROKER = args.broker
+    server = None
+    server_url = args.server
+    if not server_url:
+        options = dict(lro_polls=args.lro_polls, lro_seconds=args.lro_seconds, page_size=args.page_size)
+        options.update(scenario.get('server', {}))
+        CERTIFICATE = mock_arm.self_signed_certificate(args.cert_dir)
+        server = mock_arm.start_server(certificate=CERTIFICATE, **options)
+        server_url = server.url
+    seed_resource_groups(scenario['steps'], server_url)
+    if scenario.get('seed'):
+        mock_request(server_url, 'PUT', '/_mock/resources', scenario['seed'])
+
+    print_header()
+    try:
+        measurements, failures = run_steps(scenario['steps'], server_url)
+    finally:
+        if server:
+            server.shutdown()
+    if TOKEN_CACHE:
+        stats = TokenCache(TOKEN_CACHE).stats()
+        print('token cache: {0} hits, {1} misses, hit rate {2}'.format(
+            stats['hits'], stats['misses'], '-' if stats['hit_rate'] is None else '{0:.0%}'.format(stats['hit_rate'])))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(measurements, f, indent=2)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()